@@ -6,16 +6,68 @@ A simple Flask API that provides phonetic encoding using Metaphone3 algorithm.
 
 Endpoints:
 - POST /encode - Encode a single word or list of words
-- GET /health - Health check endpoint
+- GET/POST /search - Find indexed words that sound like a word
+- POST /rank - Rank candidates by spelling and phonetic distance to a word
+- GET/POST /index - Phonetic index statistics / add and remove words
+- GET /metrics - Request, encoder stage, cache and worker pool metrics in the
+  Prometheus text format
+- GET /health - Health and readiness check; 503 until the encoder is warm
 
 Requirements:
 - Flask
 - metaphone3_wrapper.py
-- Metaphone3.js
-- Node.js
+- metaphone3.py
+- Metaphone3.js and Node.js (only with METAPHONE3_BACKEND=node)
+
+Configuration:
+- METAPHONE3_BACKEND: "python" (default) to encode in-process, or "node" to
+  run Metaphone3.js through Node.js. The default used to be "node"; both
+  give the same keys (see README.md), but the Docker image no longer has
+  Node.js
+- METAPHONE3_CACHE_SIZE: number of encodings kept in the LRU cache, 0 to
+  disable (default: 10000)
+- METAPHONE3_DICTIONARY: precomputed dictionary built with
+  "python metaphone3_dictionary.py build ..." (default:
+  metaphone3_dictionary.bin, used if present)
+- METAPHONE3_DISK_CACHE: SQLite file of an encoding cache shared by all
+  worker processes and instances using the same path and kept across
+  restarts; the LRU cache is filled from it at startup (default: unset)
+- METAPHONE3_DISK_CACHE_SIZE: maximum number of encodings in the disk cache
+  (default: 1000000)
+- METAPHONE3_COALESCE_WINDOW_MS: gather concurrent single-word /encode
+  requests for up to this many milliseconds and encode them as one batch
+  (default: unset, no coalescing)
+- METAPHONE3_COALESCE_MAX_BATCH: dispatch a gathered batch as soon as it
+  holds this many words (default: 64)
+- METAPHONE3_INDEX: phonetic index file for /search, loaded at startup if it
+  exists and rewritten in the background after changes through POST /index,
+  at most once per METAPHONE3_INDEX_SAVE_INTERVAL_MS and on exit (default:
+  unset, index kept in memory only)
+- METAPHONE3_INDEX_SAVE_INTERVAL_MS: time changes to the index are gathered
+  before they are written (default: 1000)
+- METAPHONE3_INDEX_CORPUS: word list the index is seeded from when there is
+  no index file (default: the shipped word list, if present)
+- METAPHONE3_STARTUP_BUDGET_MS: startup time (encoder, warm-up and index)
+  above which a warning is logged and /health reports within_budget false
+  (default: 10000)
+- METAPHONE3_MAX_REQUEST_BYTES: largest request body, before and after gzip
+  decompression (default: 16 MiB)
+- METAPHONE3_MAX_REQUEST_SECONDS: default and longest deadline of a request,
+  from arrival and including time spent queueing (default: 30). Clients ask
+  for a shorter one with an X-Request-Timeout header in seconds. Encoders
+  stop working on requests past their deadline, which are answered 504.
+- METAPHONE3_MAX_CONCURRENT: requests encoded at once (default: 8)
+- METAPHONE3_MAX_QUEUE: requests waiting for their turn beyond that; more
+  are rejected at once with 429 and Retry-After (default: 64)
+- METAPHONE3_QUEUE_TIMEOUT_MS: time a request may wait for its turn before
+  it is rejected with 503 and Retry-After (default: 1000)
 
 Usage:
-    python metaphone3_api.py
+    python app.py
+
+    # Under a WSGI server; each worker process builds and warms the encoder
+    # when it imports the module, so "app:app" serves a ready app as well
+    gunicorn --bind :8080 "app:create_app()"
 
 API Examples:
     # Single word
@@ -32,25 +84,74 @@ API Examples:
     curl -X POST http://localhost:5000/encode \
          -H "Content-Type: application/json" \
          -d '{"word": "smith", "encode_vowels": true, "encode_exact": true}'
+    
+    # Under all four encode_vowels / encode_exact combinations at once
+    curl -X POST http://localhost:5000/encode \
+         -H "Content-Type: application/json" \
+         -d '{"words": ["smith", "schmidt"], "variants": true}'
+    
+    # Multi-token names, with per-token and combined keys
+    curl -X POST http://localhost:5000/encode \
+         -H "Content-Type: application/json" \
+         -d '{"words": ["Mary Ann Smith-Jones", "Jean-Luc Picard"], "phrase": true}'
+    
+    # Compact batch, one word per line, streamed back as gzip-compressed TSV
+    gzip -c names.txt | curl -X POST "http://localhost:5000/encode?key_length=12" \
+         -H "Content-Type: text/plain" -H "Content-Encoding: gzip" \
+         -H "Accept: text/tab-separated-values" --compressed --data-binary @-
 """
 
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, g
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+import atexit
+import functools
 import logging
 import os
 import sys
+import time
+import zlib
+from contextlib import nullcontext
 from datetime import datetime
 import json
 
 # Import our Metaphone3 wrapper
 try:
-    from metaphone3_wrapper import Metaphone3Wrapper, Metaphone3Error
+    from metaphone3_wrapper import (
+        Metaphone3Wrapper, Metaphone3Error, Metaphone3DeadlineError, EncodeOptions, DEFAULT_CACHE_SIZE, ALL_VARIANTS
+    )
+    from metaphone3_admission import (
+        AdmissionController, AdmissionRejected, DEFAULT_MAX_CONCURRENT, DEFAULT_MAX_QUEUE, DEFAULT_QUEUE_TIMEOUT
+    )
+    from metaphone3_dictionary import DEFAULT_DICTIONARY_PATH
+    from metaphone3_http import (
+        DEADLINE_MESSAGE, MAX_REQUEST_BYTES, REQUEST_TIMEOUT_HEADER, TOO_LARGE_MESSAGE, deadline_error,
+        encoding_result, parse_deadline, validate_word
+    )
+    from metaphone3_disk_cache import DEFAULT_DISK_CACHE_SIZE
+    from metaphone3_coalescer import EncodeCoalescer, DEFAULT_MAX_BATCH
+    from metaphone3_index import PhoneticIndex, DEFAULT_SAVE_INTERVAL
+    from metaphone3_ranking import rank
+    from metaphone3_metrics import MetricsRegistry, CONTENT_TYPE as METRICS_CONTENT_TYPE
 except ImportError:
     print("Error: metaphone3_wrapper.py not found. Make sure it's in the same directory.")
     sys.exit(1)
 
+# Words encoded per step of a batch; the deadline is checked and compact
+# responses are streamed between steps
+BATCH_CHUNK_SIZE = 4096
+
+# Compact batch format: requests carry one word per line, responses one
+# tab-separated record per line
+COMPACT_REQUEST_TYPE = "text/plain"
+COMPACT_RESPONSE_TYPE = "text/tab-separated-values"
+
+# Tabs and line breaks inside words would break compact records
+COMPACT_FIELD_ESCAPES = str.maketrans("\t\r\n", "   ")
+
 # Initialize Flask app
 app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES
 CORS(app)  # Enable CORS for web frontend usage
 
 # Configure logging
@@ -60,31 +161,245 @@ logger = logging.getLogger(__name__)
 # Global Metaphone3 wrapper instance
 m3_wrapper = None
 
+# Optional micro-batching front end for single-word requests
+m3_coalescer = None
+
+# Phonetic index backing /search
+m3_index = None
+
+# Bounded work queue in front of the encoding routes
+m3_admission = AdmissionController(
+    max_concurrent=int(os.environ.get("METAPHONE3_MAX_CONCURRENT", DEFAULT_MAX_CONCURRENT)),
+    max_queue=int(os.environ.get("METAPHONE3_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+    queue_timeout=float(os.environ.get("METAPHONE3_QUEUE_TIMEOUT_MS", 1000 * DEFAULT_QUEUE_TIMEOUT)) / 1000
+)
+
+# Word list shipped with the service
+DEFAULT_CORPUS = "large_word_list_output_3_21_15_DEFAULT_ENCODING.txt"
+
+# Startup time allowed before a warning, in milliseconds
+DEFAULT_STARTUP_BUDGET_MS = 10000
+
+# Set by create_app() once the encoder is built and warm
+m3_ready = False
+
+# Startup phases in seconds and the budget, reported by /health
+m3_startup = {}
+
+# Per-route request metrics; the wrapper keeps its own encoder metrics
+http_metrics = MetricsRegistry()
+http_requests = http_metrics.counter(
+    "metaphone3_http_requests_total",
+    "HTTP requests by route, method and status",
+    ["route", "method", "status"]
+)
+http_latency = http_metrics.histogram(
+    "metaphone3_http_request_seconds",
+    "HTTP request latency in seconds by route and method",
+    ["route", "method"]
+)
+http_metrics.gauge(
+    "metaphone3_admission_active",
+    "Requests holding an encoder slot",
+    function=lambda: m3_admission.stats()['active']
+)
+http_metrics.gauge(
+    "metaphone3_admission_queued",
+    "Requests waiting for an encoder slot",
+    function=lambda: m3_admission.stats()['queued']
+)
+http_metrics.counter(
+    "metaphone3_admission_rejected_total",
+    "Requests rejected because the queue was full (429) or no slot freed up in time (503)",
+    ["reason"],
+    function=lambda: {
+        ("queue_full",): m3_admission.stats()['rejected_queue_full'],
+        ("timeout",): m3_admission.stats()['rejected_timeout']
+    }
+)
+
 def initialize_metaphone3():
     """Initialize the Metaphone3 wrapper."""
-    global m3_wrapper
+    global m3_wrapper, m3_coalescer
+    dictionary_path = os.environ.get("METAPHONE3_DICTIONARY")
+    if dictionary_path is None and os.path.exists(DEFAULT_DICTIONARY_PATH):
+        dictionary_path = DEFAULT_DICTIONARY_PATH
     try:
-        m3_wrapper = Metaphone3Wrapper()
+        m3_wrapper = Metaphone3Wrapper(
+            backend=os.environ.get("METAPHONE3_BACKEND", "python"),
+            cache_size=int(os.environ.get("METAPHONE3_CACHE_SIZE", DEFAULT_CACHE_SIZE)),
+            dictionary_path=dictionary_path,
+            disk_cache_path=os.environ.get("METAPHONE3_DISK_CACHE"),
+            disk_cache_size=int(os.environ.get("METAPHONE3_DISK_CACHE_SIZE", DEFAULT_DISK_CACHE_SIZE))
+        )
+        window_ms = os.environ.get("METAPHONE3_COALESCE_WINDOW_MS")
+        if window_ms:
+            m3_coalescer = EncodeCoalescer(
+                m3_wrapper,
+                window=float(window_ms) / 1000,
+                max_batch=int(os.environ.get("METAPHONE3_COALESCE_MAX_BATCH", DEFAULT_MAX_BATCH))
+            )
+            logger.info(f"Coalescing single-word requests over {window_ms} ms")
         logger.info("Metaphone3 wrapper initialized successfully")
         return True
-    except Metaphone3Error as e:
+    except (Metaphone3Error, ValueError) as e:
         logger.error(f"Failed to initialize Metaphone3 wrapper: {e}")
         return False
 
-def validate_word(word):
-    """Validate that the word is a non-empty string."""
-    return isinstance(word, str) and word.strip()
+def initialize_index():
+    """Load the phonetic index, or seed it from a word list."""
+    global m3_index
+    index_path = os.environ.get("METAPHONE3_INDEX")
+    corpus = os.environ.get("METAPHONE3_INDEX_CORPUS", DEFAULT_CORPUS)
+    try:
+        if index_path and os.path.exists(index_path):
+            m3_index = PhoneticIndex.load(m3_wrapper, index_path)
+        elif corpus and os.path.exists(corpus):
+            m3_index = PhoneticIndex.from_word_list(m3_wrapper, corpus)
+        else:
+            m3_index = PhoneticIndex(m3_wrapper)
+        if index_path:
+            # Saved off the request path; changes made since the last save are written on exit
+            interval = float(os.environ.get("METAPHONE3_INDEX_SAVE_INTERVAL_MS", 1000 * DEFAULT_SAVE_INTERVAL)) / 1000
+            m3_index.autosave(index_path, interval)
+            atexit.register(m3_index.close)
+        logger.info(f"Phonetic index ready with {len(m3_index)} words")
+        return True
+    except (Metaphone3Error, OSError) as e:
+        logger.error(f"Failed to initialize phonetic index: {e}")
+        return False
+
+@app.before_request
+def start_request_timer():
+    """Remember when the request started."""
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    """Count the request and record its latency under its route pattern."""
+    start = g.get('request_start')
+    if start is not None:
+        # Route patterns, not raw paths, keep the label set bounded
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        http_requests.inc(route=route, method=request.method, status=response.status_code)
+        http_latency.observe(time.perf_counter() - start, route=route, method=request.method)
+    return response
+
+def create_app():
+    """
+    Application factory: build the encoder, warm it up and load the index
+    before the app serves traffic, and mark it ready for /health.
+    
+    Calling it again after a successful startup returns the app unchanged.
+    
+    Returns:
+        Flask: The application
+    """
+    global m3_ready
+    if m3_ready:
+        return app
+    
+    budget = float(os.environ.get("METAPHONE3_STARTUP_BUDGET_MS", DEFAULT_STARTUP_BUDGET_MS)) / 1000
+    m3_startup.clear()
+    m3_startup['budget_seconds'] = budget
+    start = time.perf_counter()
+    
+    if m3_wrapper is None and not initialize_metaphone3():
+        m3_startup['error'] = "Failed to initialize Metaphone3 wrapper"
+        return app
+    m3_startup['encoder_seconds'] = time.perf_counter() - start
+    
+    # Start every worker and run a batch through it, so no request pays a cold start
+    try:
+        m3_startup['warmup_seconds'] = m3_wrapper.warm_up()
+    except Metaphone3Error as e:
+        logger.error(f"Failed to warm up Metaphone3 wrapper: {e}")
+        m3_startup['error'] = f"Warm-up failed: {e}"
+        return app
+    
+    # The API still encodes without an index, so only /search is affected
+    index_start = time.perf_counter()
+    if m3_index is None:
+        initialize_index()
+    m3_startup['index_seconds'] = time.perf_counter() - index_start
+    
+    elapsed = time.perf_counter() - start
+    m3_startup['seconds'] = elapsed
+    m3_startup['within_budget'] = elapsed <= budget
+    if elapsed > budget:
+        logger.warning(f"Startup took {1000 * elapsed:.0f} ms, over the budget of {1000 * budget:.0f} ms")
+    else:
+        logger.info(f"Startup took {1000 * elapsed:.0f} ms")
+    
+    m3_ready = True
+    return app
+
+def request_deadline():
+    """
+    Get the deadline of the current request: MAX_REQUEST_SECONDS from now,
+    or sooner if the client sent a shorter X-Request-Timeout.
+    
+    Returns:
+        float: time.monotonic() value
+    
+    Raises:
+        ValueError: If the header is not a positive number of seconds
+    """
+    return parse_deadline(request.headers.get(REQUEST_TIMEOUT_HEADER))
+
+def admitted(view):
+    """
+    Run an encoding route under admission control and its request deadline.
+    
+    The request waits for a slot in m3_admission and is answered 429 or 503
+    with Retry-After when the server is saturated. While it runs, wrapper
+    calls give up at the deadline, stored in g.deadline. Streamed responses
+    keep their slot until the client has read them.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        try:
+            deadline = request_deadline()
+        except ValueError as e:
+            return jsonify({
+                "error": str(e),
+                "success": False
+            }), 400
+        
+        try:
+            admission = m3_admission.acquire(deadline)
+        except AdmissionRejected as e:
+            response = jsonify({
+                "error": str(e),
+                "success": False
+            })
+            response.status_code = e.status
+            response.headers['Retry-After'] = str(e.retry_after)
+            return response
+        
+        g.deadline = deadline
+        try:
+            with m3_wrapper.deadline(deadline) if m3_wrapper is not None else nullcontext():
+                response = app.make_response(view(*args, **kwargs))
+        except BaseException:
+            admission.release()
+            raise
+        
+        if response.is_streamed:
+            response.call_on_close(admission.release)
+        else:
+            admission.release()
+        return response
+    
+    return wrapper
 
 def encode_single_word(word, encode_vowels=False, encode_exact=False, key_length=8):
     """Encode a single word with given options."""
     try:
-        # Configure wrapper
-        m3_wrapper.set_encode_vowels(encode_vowels)
-        m3_wrapper.set_encode_exact(encode_exact)
-        m3_wrapper.set_key_length(key_length)
-        
-        # Encode the word
-        primary, alternate = m3_wrapper.encode(word)
+        # Options travel with the call, so concurrent requests don't race
+        options = EncodeOptions(encode_vowels, encode_exact, key_length)
+        encoder = m3_coalescer if m3_coalescer is not None else m3_wrapper
+        primary, alternate = encoder.encode(word, options)
         
         return {
             "word": word,
@@ -92,6 +407,8 @@ def encode_single_word(word, encode_vowels=False, encode_exact=False, key_length
             "alternate": alternate if alternate != primary else None,
             "success": True
         }
+    except Metaphone3DeadlineError:
+        raise
     except Exception as e:
         logger.error(f"Error encoding word '{word}': {e}")
         return {
@@ -100,15 +417,291 @@ def encode_single_word(word, encode_vowels=False, encode_exact=False, key_length
             "success": False
         }
 
+def encode_word_list(words, encode_vowels=False, encode_exact=False, key_length=8):
+    """Encode a list of words with given options in a single batch."""
+    options = EncodeOptions(encode_vowels, encode_exact, key_length)
+    return [encoding_result(*encoded) for encoded in m3_wrapper.encode_list(words, options)]
+
+def deadline_exceeded(udf=False):
+    """504 response for a request that ran past its deadline."""
+    return jsonify(deadline_error(udf)), 504
+
+def encode_chunks(words, options, deadline):
+    """
+    Encode a batch in steps of BATCH_CHUNK_SIZE words under the request
+    deadline, checking it after each step.
+    
+    Yields:
+        list: (word, primary, alternate) per word of the step, as returned
+        by encode_list(), or (word, None, None) for invalid words
+    
+    Raises:
+        Metaphone3DeadlineError: If the deadline passes before the batch is done
+    """
+    for start in range(0, len(words), BATCH_CHUNK_SIZE):
+        chunk = words[start:start + BATCH_CHUNK_SIZE]
+        # Streamed responses are encoded after the route returned, outside its deadline block
+        with m3_wrapper.deadline(deadline):
+            encoded = m3_wrapper.encode_list([word.strip() for word in chunk if validate_word(word)], options)
+        if time.monotonic() >= deadline:
+            raise Metaphone3DeadlineError("Deadline exceeded")
+        encoded = iter(encoded)
+        yield [next(encoded) if validate_word(word) else (word, None, None) for word in chunk]
+
+def read_body():
+    """
+    Read the request body within MAX_REQUEST_BYTES, decompressing it when it
+    was sent with Content-Encoding: gzip.
+    
+    Raises:
+        RequestEntityTooLarge: If the body is too large, compressed or not
+        ValueError: If a gzip body is corrupt
+    """
+    data = request.get_data(cache=True)
+    if (request.content_encoding or "").lower() == "gzip":
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            # Stop one byte past the limit, so a gzip bomb is never inflated
+            data = decompressor.decompress(data, MAX_REQUEST_BYTES + 1)
+        except zlib.error as e:
+            raise ValueError(f"Invalid gzip body: {e}")
+        if len(data) > MAX_REQUEST_BYTES:
+            raise RequestEntityTooLarge()
+    return data
+
+def read_json_body():
+    """Parse the request body as JSON, or return None if it is not valid JSON."""
+    try:
+        return json.loads(read_body())
+    except ValueError:
+        return None
+
+def is_compact_request():
+    """Whether the request body is a compact batch, one word per line."""
+    return request.mimetype == COMPACT_REQUEST_TYPE
+
+def read_compact_words():
+    """
+    Read the words of a compact batch request.
+    
+    Raises:
+        ValueError: If the body is not valid (gzip-compressed) UTF-8
+    """
+    return read_body().decode("utf-8").splitlines()
+
+def wants_compact_response():
+    """Whether the client asked for a compact response in its Accept header."""
+    best = request.accept_mimetypes.best_match(["application/json", COMPACT_RESPONSE_TYPE])
+    return best == COMPACT_RESPONSE_TYPE
+
+def options_from_args(args):
+    """
+    Read the encode settings of a compact request from its query string.
+    
+    Raises:
+        ValueError: If key_length is not an integer between 1 and 32
+    """
+    def flag(name):
+        return args.get(name, "false").lower() in ("1", "true", "yes")
+    
+    try:
+        key_length = int(args.get('key_length', 8))
+    except ValueError:
+        raise ValueError("key_length must be between 1 and 32")
+    return EncodeOptions(flag('encode_vowels'), flag('encode_exact'), key_length)
+
+def compact_field(value):
+    """Make a value safe to write as one field of a compact record."""
+    return str(value).translate(COMPACT_FIELD_ESCAPES)
+
+def compact_response(lines, error_prefix=""):
+    """
+    Stream compact response text as it is produced, gzip-compressed when the
+    client accepts it.
+    
+    A batch that fails or runs past its deadline part way ends the stream
+    with a record of error_prefix followed by "Error: ...".
+    
+    Args:
+        lines (Iterator[str]): Newline-terminated records, one string per step
+        error_prefix (str): Fields preceding the error message in the final
+            record of a failed stream
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if request.accept_encodings['gzip'] else None
+    
+    def encode(text):
+        data = text.encode("utf-8")
+        if compressor is None:
+            return data
+        # Flush each step, so clients can decode records as they arrive
+        return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    def generate():
+        try:
+            for text in lines:
+                yield encode(text)
+        except Metaphone3DeadlineError:
+            yield encode(f"{error_prefix}Error: {DEADLINE_MESSAGE}\n")
+        except Exception as e:
+            logger.error(f"Error streaming response: {e}")
+            yield encode(f"{error_prefix}Error: Internal server error\n")
+        if compressor is not None:
+            yield compressor.flush()
+    
+    headers = {"Vary": "Accept-Encoding"}
+    if compressor is not None:
+        headers["Content-Encoding"] = "gzip"
+    return Response(generate(), mimetype=COMPACT_RESPONSE_TYPE, headers=headers)
+
+def encoded_lines(words, options, deadline):
+    """Compact "word<TAB>primary<TAB>alternate" records of a batch, one string per step."""
+    for chunk in encode_chunks(words, options, deadline):
+        records = []
+        for word, primary, alternate in chunk:
+            if primary is None:
+                primary, alternate = "", "Error: Invalid word"
+            records.append(f"{compact_field(word)}\t{primary}\t{compact_field(alternate)}\n")
+        yield "".join(records)
+
+def encode_batch_response(words, options, deadline):
+    """Answer a batch /encode request with a streamed compact response or with JSON."""
+    if wants_compact_response():
+        return compact_response(encoded_lines(words, options, deadline), error_prefix="\t\t")
+    
+    results = []
+    for chunk in encode_chunks(words, options, deadline):
+        for word, primary, alternate in chunk:
+            if primary is None:
+                results.append({
+                    "word": str(word),
+                    "error": "Invalid word",
+                    "success": False
+                })
+            else:
+                results.append(encoding_result(word, primary, alternate))
+    
+    return jsonify({
+        "results": results,
+        "success": True,
+        "total": len(results)
+    })
+
+def udf_reply(primary, alternate):
+    """BigQuery UDF reply for one encode_chunks() result."""
+    if primary is None:
+        return "INVALID|INVALID"
+    if not primary and alternate.startswith("Error: "):
+        return "INVALID"
+    return primary
+
+def udf_lines(words, deadline):
+    """Compact UDF replies, one per line and one string per step."""
+    for chunk in encode_chunks(words, EncodeOptions(), deadline):
+        yield "".join(udf_reply(primary, alternate) + "\n" for _, primary, alternate in chunk)
+
+def parse_variants(variants, key_length=8):
+    """
+    Turn the "variants" field of an /encode request into EncodeOptions.
+    
+    true selects all four encode_vowels / encode_exact combinations at
+    key_length; a list selects the settings objects it holds, whose missing
+    fields default to false and key_length.
+    
+    Raises:
+        ValueError: If the field is malformed or a key_length is out of range
+    """
+    if variants is True:
+        return [EncodeOptions(options.encode_vowels, options.encode_exact, key_length) for options in ALL_VARIANTS]
+    if not isinstance(variants, list) or not variants or not all(isinstance(item, dict) for item in variants):
+        raise ValueError("variants must be true or a non-empty list of settings objects")
+    
+    parsed = []
+    for item in variants:
+        length = item.get('key_length', key_length)
+        if not isinstance(length, int) or isinstance(length, bool):
+            raise ValueError("key_length must be between 1 and 32")
+        parsed.append(EncodeOptions(item.get('encode_vowels', False), item.get('encode_exact', False), length))
+    return parsed
+
+def encode_word_variants(words, variants):
+    """Encode a list of words under several settings in a single batch."""
+    results = []
+    for word, encodings in m3_wrapper.encode_list_variants(words, variants):
+        encoded = []
+        error = None
+        for options, (primary, alternate) in encodings.items():
+            if not primary and alternate.startswith("Error: "):
+                error = alternate[len("Error: "):]
+                break
+            encoded.append({
+                "encode_vowels": options.encode_vowels,
+                "encode_exact": options.encode_exact,
+                "key_length": options.key_length,
+                "primary": primary,
+                "alternate": alternate if alternate != primary else None
+            })
+        
+        if error is not None:
+            logger.error(f"Error encoding word '{word}': {error}")
+            results.append({
+                "word": word,
+                "error": error,
+                "success": False
+            })
+        else:
+            results.append({
+                "word": word,
+                "variants": encoded,
+                "success": True
+            })
+    return results
+
+def encode_word_phrases(phrases, options, deadline):
+    """
+    Encode a list of names or phrases token by token in a single batch.
+    
+    Raises:
+        Metaphone3DeadlineError: If the deadline passed before the batch was done
+    """
+    encoded = m3_wrapper.encode_phrases(phrases, options)
+    if time.monotonic() >= deadline:
+        raise Metaphone3DeadlineError("Deadline exceeded")
+    
+    results = []
+    for phrase, tokens, primary, alternate in encoded:
+        result = encoding_result(phrase, primary, alternate)
+        if result['success']:
+            result['tokens'] = [{
+                "token": token,
+                "primary": token_primary,
+                "alternate": token_alternate if token_alternate != token_primary else None
+            } for token, token_primary, token_alternate in tokens]
+        results.append(result)
+    return results
+
 @app.route('/health', methods=['GET'])
 def health_check():
-    """Health check endpoint."""
+    """
+    Health and readiness check.
+    
+    Answers 200 once create_app() has built and warmed up the encoder, and
+    503 while it is starting or if startup failed.
+    """
+    if m3_ready:
+        status = "healthy"
+    elif 'error' in m3_startup:
+        status = "unhealthy"
+    else:
+        status = "starting"
+    
     return jsonify({
-        "status": "healthy",
+        "status": status,
+        "ready": m3_ready,
         "service": "Metaphone3 API",
         "timestamp": datetime.now().isoformat(),
-        "wrapper_initialized": m3_wrapper is not None
-    })
+        "wrapper_initialized": m3_wrapper is not None,
+        "startup": m3_startup
+    }), 200 if m3_ready else 503
 
 # @app.route('/', methods=['POST'])
 # def encode_words():
@@ -223,6 +816,7 @@ def health_check():
 #             "success": False
 #         }), 500
 @app.route('/', methods=['POST'])
+@admitted
 def encode_words_udf():
     """
     BigQuery UDF compatible endpoint for Metaphone3 encoding.
@@ -232,6 +826,11 @@ def encode_words_udf():
     
     Returns JSON with:
     - replies (list): List of encodings in format "primary|alternate" or "INVALID|INVALID"
+    
+    A text/plain body with one word per line is answered with one reply per
+    line instead, streamed as it is encoded. Either body may be sent with
+    Content-Encoding: gzip, and the compact response is gzip-compressed when
+    the client accepts it.
     """
     if not m3_wrapper:
         return jsonify({
@@ -239,8 +838,11 @@ def encode_words_udf():
         }), 500
     
     try:
+        if is_compact_request():
+            return compact_response(udf_lines(read_compact_words(), g.deadline))
+        
         # Parse JSON payload
-        data = request.get_json()
+        data = read_json_body()
         if not data:
             return jsonify({
                 "error": "No JSON data provided"
@@ -258,56 +860,31 @@ def encode_words_udf():
                 "error": "'calls' must be a list"
             }), 400
         
-        # Process each call
+        # Each call should be a list with one parameter (the word); anything
+        # else is answered as invalid
+        words = [call[0] if isinstance(call, list) and len(call) == 1 else None for call in calls]
+        
+        # Encode with default settings; encode_list dedupes repeated words and
+        # spreads the rest over the encoder pool
         replies = []
-        for call in calls:
-            try:
-                # Each call should be a list with one parameter (the word)
-                if not isinstance(call, list) or len(call) != 1:
-                    replies.append("INVALID|INVALID")
-                    continue
-                
-                word = call[0]
-                
-                # Handle empty or invalid words
-                if not word or not isinstance(word, str) or not word.strip():
-                    replies.append("INVALID|INVALID")
-                    continue
-                
-                # Clean the word
-                word = word.strip()
-                
-                # Validate word (assuming you have a validate_word function)
-                if not validate_word(word):
-                    replies.append("INVALID|INVALID")
-                    continue
-                
-                # Encode the word using default settings
-                # You can adjust these parameters as needed
-                result = encode_single_word(
-                    word,
-                    encode_vowels=False,  # Default setting
-                    encode_exact=False,   # Default setting
-                    key_length=8          # Default setting
-                )
-                
-                if result['success']:
-                    # Format as primary|alternate (without quotes)
-                    primary = result.get('primary', 'INVALID')
-                    alternate = result.get('alternate', 'INVALID')
-                    replies.append(f"{primary}")
-                else:
-                    replies.append("INVALID")
-                    
-            except Exception as e:
-                logger.error(f"Error processing call {call}: {e}")
-                replies.append("INVALID")
+        for chunk in encode_chunks(words, EncodeOptions(), g.deadline):
+            replies.extend(udf_reply(primary, alternate) for _, primary, alternate in chunk)
         
         # Return in BigQuery UDF format
         return jsonify({
             "replies": replies
         })
-            
+    
+    except RequestEntityTooLarge:
+        return jsonify({
+            "error": TOO_LARGE_MESSAGE
+        }), 413
+    except Metaphone3DeadlineError:
+        return deadline_exceeded(udf=True)
+    except ValueError as e:
+        return jsonify({
+            "error": str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error processing UDF request: {e}")
         return jsonify({
@@ -317,6 +894,7 @@ def encode_words_udf():
 
 # Keep the original endpoint for backwards compatibility
 @app.route('/encode', methods=['POST'])
+@admitted
 def encode_words_original():
     """
     Original encoding endpoint (for backwards compatibility).
@@ -327,8 +905,27 @@ def encode_words_original():
     - encode_vowels (bool, optional): Whether to encode vowels (default: false)
     - encode_exact (bool, optional): Whether to use exact encoding (default: false)
     - key_length (int, optional): Maximum key length 1-32 (default: 8)
+    - variants (optional): true to encode under all four encode_vowels /
+      encode_exact combinations at key_length, or a list of settings objects;
+      each result then holds a "variants" list instead of primary/alternate
+    - phrase (bool, optional): Encode each word as a multi-token name or
+      phrase, split at whitespace and hyphens (apostrophes are ignored, so
+      "O'Brien" is one token); each result then also holds a "tokens" list
+      of the tokens as sent with their keys, and primary/alternate are the
+      combined keys of the tokens
     
     Returns JSON with phonetic encodings.
+    
+    Batches are limited by METAPHONE3_MAX_REQUEST_BYTES of request body and
+    METAPHONE3_MAX_REQUEST_SECONDS of encoding rather than by word count.
+    
+    Compact batches: a text/plain body holds one word per line, with the
+    settings in the query string (?encode_vowels=true&key_length=12). With
+    Accept: text/tab-separated-values the result is streamed as one
+    "word<TAB>primary<TAB>alternate" line per word, "word<TAB><TAB>Error: ..."
+    for words that fail, so the whole result is never held in memory. Request
+    bodies may be gzip-compressed (Content-Encoding: gzip), and compact
+    responses are compressed for clients sending Accept-Encoding: gzip.
     """
     if not m3_wrapper:
         return jsonify({
@@ -337,8 +934,12 @@ def encode_words_original():
         }), 500
     
     try:
+        if is_compact_request():
+            options = options_from_args(request.args)
+            return encode_batch_response(read_compact_words(), options, g.deadline)
+        
         # Parse JSON payload
-        data = request.get_json()
+        data = read_json_body()
         if not data:
             return jsonify({
                 "error": "No JSON data provided",
@@ -357,6 +958,27 @@ def encode_words_original():
                 "success": False
             }), 400
         
+        # Several settings at once, in one engine round trip
+        variants = data.get('variants')
+        if variants is not None and variants is not False:
+            try:
+                variants = parse_variants(variants, key_length)
+            except ValueError as e:
+                return jsonify({
+                    "error": str(e),
+                    "success": False
+                }), 400
+        else:
+            variants = None
+        
+        # Multi-token names, encoded token by token
+        phrase = data.get('phrase', False) is True
+        if phrase and variants is not None:
+            return jsonify({
+                "error": "phrase and variants cannot be combined",
+                "success": False
+            }), 400
+        
         # Handle single word
         if 'word' in data:
             word = data['word']
@@ -366,12 +988,18 @@ def encode_words_original():
                     "success": False
                 }), 400
             
-            result = encode_single_word(
-                word.strip(), 
-                encode_vowels, 
-                encode_exact, 
-                key_length
-            )
+            if variants is not None:
+                result = encode_word_variants([word.strip()], variants)[0]
+            elif phrase:
+                options = EncodeOptions(encode_vowels, encode_exact, key_length)
+                result = encode_word_phrases([word.strip()], options, g.deadline)[0]
+            else:
+                result = encode_single_word(
+                    word.strip(), 
+                    encode_vowels, 
+                    encode_exact, 
+                    key_length
+                )
             
             if result['success']:
                 return jsonify(result)
@@ -387,22 +1015,27 @@ def encode_words_original():
                     "success": False
                 }), 400
             
-            if len(words) > 100:  # Limit batch size
+            options = EncodeOptions(encode_vowels, encode_exact, key_length)
+            if variants is None and not phrase:
+                return encode_batch_response(words, options, g.deadline)
+            
+            if wants_compact_response():
                 return jsonify({
-                    "error": "Maximum 100 words per request",
+                    "error": f"{'variants are' if variants is not None else 'phrases are'} only available as JSON",
                     "success": False
                 }), 400
             
+            # Encode all valid words in one batch
+            valid_words = [word.strip() for word in words if validate_word(word)]
+            if variants is not None:
+                encoded = iter(encode_word_variants(valid_words, variants))
+            else:
+                encoded = iter(encode_word_phrases(valid_words, options, g.deadline))
+            
             results = []
             for word in words:
                 if validate_word(word):
-                    result = encode_single_word(
-                        word.strip(), 
-                        encode_vowels, 
-                        encode_exact, 
-                        key_length
-                    )
-                    results.append(result)
+                    results.append(next(encoded))
                 else:
                     results.append({
                         "word": str(word),
@@ -421,7 +1054,19 @@ def encode_words_original():
                 "error": "Either 'word' or 'words' must be provided",
                 "success": False
             }), 400
-            
+    
+    except RequestEntityTooLarge:
+        return jsonify({
+            "error": TOO_LARGE_MESSAGE,
+            "success": False
+        }), 413
+    except Metaphone3DeadlineError:
+        return deadline_exceeded()
+    except ValueError as e:
+        return jsonify({
+            "error": str(e),
+            "success": False
+        }), 400
     except Exception as e:
         logger.error(f"Error processing request: {e}")
         return jsonify({
@@ -429,6 +1074,198 @@ def encode_words_original():
             "success": False
         }), 500
     
+@app.route('/search', methods=['GET', 'POST'])
+@admitted
+def search_words():
+    """
+    Sounds-like search in the phonetic index.
+    
+    Accepts the query as GET parameters or a JSON payload with:
+    - word (string): Word to search for
+    - limit (int, optional): Maximum number of matches returned
+    
+    Returns JSON with the word's keys and the indexed words sharing a key with it.
+    """
+    if m3_index is None:
+        return jsonify({
+            "error": "Phonetic index not initialized",
+            "success": False
+        }), 500
+    
+    try:
+        data = request.get_json(silent=True) if request.method == 'POST' else request.args
+        data = data or {}
+        
+        word = data.get('word')
+        if not validate_word(word):
+            return jsonify({
+                "error": "Invalid word. Must be a non-empty string.",
+                "success": False
+            }), 400
+        
+        limit = data.get('limit')
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                limit = -1
+            if limit < 0:
+                return jsonify({
+                    "error": "limit must be a non-negative integer",
+                    "success": False
+                }), 400
+        
+        result = m3_index.search(word.strip(), limit)
+        return jsonify({
+            "word": word.strip(),
+            "primary": result['primary'],
+            "alternate": result['alternate'] if result['alternate'] != result['primary'] else None,
+            "matches": result['matches'],
+            "total": result['total'],
+            "success": True
+        })
+    
+    except Metaphone3DeadlineError:
+        return deadline_exceeded()
+    except Exception as e:
+        logger.error(f"Error processing search request: {e}")
+        return jsonify({
+            "error": "Internal server error",
+            "success": False
+        }), 500
+
+@app.route('/rank', methods=['POST'])
+@admitted
+def rank_candidates():
+    """
+    Rank candidates as ResultRanking.js does.
+    
+    Accepts JSON payload with:
+    - word (string): Word to rank against
+    - candidates (list): Candidate strings
+    - top_k (int, optional): Return only the k best candidates
+    
+    Returns JSON with the candidates as {"key": candidate, "value": score},
+    lowest (best) score first.
+    """
+    if not m3_wrapper:
+        return jsonify({
+            "error": "Metaphone3 wrapper not initialized",
+            "success": False
+        }), 500
+    
+    try:
+        data = request.get_json(silent=True)
+        if not data:
+            return jsonify({
+                "error": "No JSON data provided",
+                "success": False
+            }), 400
+        
+        word = data.get('word')
+        if not validate_word(word):
+            return jsonify({
+                "error": "Invalid word. Must be a non-empty string.",
+                "success": False
+            }), 400
+        
+        candidates = data.get('candidates')
+        if not isinstance(candidates, list) or not all(isinstance(candidate, str) for candidate in candidates):
+            return jsonify({
+                "error": "candidates must be a list of strings",
+                "success": False
+            }), 400
+        
+        top_k = data.get('top_k')
+        if top_k is not None and (not isinstance(top_k, int) or top_k < 0):
+            return jsonify({
+                "error": "top_k must be a non-negative integer",
+                "success": False
+            }), 400
+        
+        ranked = rank(m3_wrapper, word.strip(), candidates, top_k)
+        return jsonify({
+            "word": word.strip(),
+            "results": [{"key": candidate, "value": score} for candidate, score in ranked],
+            "total": len(candidates),
+            "success": True
+        })
+    
+    except Metaphone3DeadlineError:
+        return deadline_exceeded()
+    except Exception as e:
+        logger.error(f"Error processing rank request: {e}")
+        return jsonify({
+            "error": "Internal server error",
+            "success": False
+        }), 500
+
+@app.route('/index', methods=['GET', 'POST'])
+@admitted
+def update_index():
+    """
+    Phonetic index maintenance.
+    
+    GET returns index statistics. POST accepts JSON payload with:
+    - add (list, optional): Words to add
+    - remove (list, optional): Words to remove
+    
+    Changes are all or nothing: if a word to add fails to encode, nothing is
+    added or removed. They are saved to METAPHONE3_INDEX in the background
+    when it is set.
+    """
+    if m3_index is None:
+        return jsonify({
+            "error": "Phonetic index not initialized",
+            "success": False
+        }), 500
+    
+    if request.method == 'GET':
+        return jsonify({
+            "index": m3_index.stats(),
+            "success": True
+        })
+    
+    try:
+        data = request.get_json(silent=True)
+        if not data:
+            return jsonify({
+                "error": "No JSON data provided",
+                "success": False
+            }), 400
+        
+        add = data.get('add', [])
+        remove = data.get('remove', [])
+        if not isinstance(add, list) or not isinstance(remove, list):
+            return jsonify({
+                "error": "add and remove must be lists",
+                "success": False
+            }), 400
+        
+        added = m3_index.add_many(word.strip() for word in add if validate_word(word))
+        removed = sum(m3_index.remove(word.strip()) for word in remove if validate_word(word))
+        
+        return jsonify({
+            "added": added,
+            "removed": removed,
+            "index": m3_index.stats(),
+            "success": True
+        })
+    
+    except Metaphone3DeadlineError:
+        return deadline_exceeded()
+    except Metaphone3Error as e:
+        return jsonify({
+            "error": f"{e}; the index was not changed",
+            "success": False
+        }), 400
+    except Exception as e:
+        logger.error(f"Error processing index request: {e}")
+        return jsonify({
+            "error": "Internal server error",
+            "success": False
+        }), 500
+
 @app.route('/settings', methods=['GET'])
 def get_settings():
     """Get current Metaphone3 settings."""
@@ -440,9 +1277,20 @@ def get_settings():
     
     return jsonify({
         "settings": m3_wrapper.get_settings(),
+        "cache": m3_wrapper.get_cache_stats(),
+        "coalescer": m3_coalescer.stats() if m3_coalescer is not None else None,
+        "admission": m3_admission.stats(),
         "success": True
     })
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Request and encoder metrics in the Prometheus text format."""
+    text = http_metrics.render()
+    if m3_wrapper is not None:
+        text += m3_wrapper.metrics.render()
+    return Response(text, content_type=METRICS_CONTENT_TYPE)
+
 # @app.route('/', methods=['GET'])
 # def root():
 #     """Root endpoint with API documentation."""
@@ -511,26 +1359,32 @@ def internal_error(error):
         "success": False
     }), 500
 
+# Build and warm up the encoder at import, so a WSGI server serving "app:app"
+# never sees m3_wrapper unset; /health answers 503 if this failed
+create_app()
+
 if __name__ == '__main__':
     print("Starting Metaphone3 API...")
     
-    # Initialize Metaphone3 wrapper
-    if not initialize_metaphone3():
-        print("Failed to initialize Metaphone3 wrapper. Exiting.")
+    if not m3_ready:
+        print(f"Failed to start Metaphone3 API: {m3_startup.get('error')}. Exiting.")
         sys.exit(1)
     
-    print("Metaphone3 API is ready!")
+    print(f"Metaphone3 API is ready in {1000 * m3_startup['seconds']:.0f} ms!")
     print("\nAPI Endpoints:")
     print("  GET  /          - API documentation")
     print("  POST /encode    - Encode words")
+    print("  GET  /search    - Sounds-like search")
+    print("  POST /index     - Add or remove indexed words")
+    print("  POST /rank      - Rank candidates against a word")
+    print("  GET  /metrics   - Prometheus metrics")
     print("  GET  /health    - Health check")
     print("  GET  /settings  - Current settings")
-    print(f"\nServer starting on http://localhost:5000")
+    print(f"\nServer starting on http://localhost:8080")
     
     # Start the Flask development server
     app.run(
         host='0.0.0.0',
         port=8080,
-        debug=True,
         threaded=True
     )
@@ -0,0 +1,622 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 ASGI API
+
+An asyncio serving mode for the routes of app.py. Requests never block a
+thread: words are answered from the wrapper's cache and dictionary on the event
+loop, and everything else is sent to a bounded pool of persistent encoder
+worker processes over asyncio streams. A single process can therefore keep
+thousands of requests in flight while at most pool_size batches are
+being encoded; the rest wait in the pool's queue.
+
+Endpoints:
+- POST / - BigQuery remote function endpoint
+- POST /encode - Encode a single word or list of words
+- GET /health - Health check endpoint
+- GET /settings - Current settings, cache and worker pool statistics
+
+Requirements:
+- An ASGI server such as uvicorn
+- metaphone3_wrapper.py
+- metaphone3.py
+- Metaphone3.js and Node.js (only with METAPHONE3_BACKEND=node)
+
+Configuration:
+- METAPHONE3_BACKEND, METAPHONE3_CACHE_SIZE, METAPHONE3_DICTIONARY: as for app.py
+- METAPHONE3_MAX_REQUEST_BYTES, METAPHONE3_MAX_REQUEST_SECONDS: as for app.py;
+  larger bodies are answered 413, and requests still running at their
+  deadline (shortened by an X-Request-Timeout header) 504
+- METAPHONE3_POOL_SIZE: number of encoder worker processes (default: number
+  of CPUs). The "pool" section of GET /settings reports how long requests
+  waited for a worker, which shows when the pool is too small.
+
+Usage:
+    uvicorn async_app:app --host 0.0.0.0 --port 8080
+
+    # or
+    python async_app.py
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from dataclasses import asdict
+from typing import Optional, Tuple
+
+from metaphone3_wrapper import (
+    Metaphone3Wrapper, Metaphone3Error, EncodeOptions, DEFAULT_CACHE_SIZE, MIN_SHARD_SIZE
+)
+from metaphone3_dictionary import DEFAULT_DICTIONARY_PATH
+from metaphone3_http import (
+    MAX_REQUEST_BYTES, REQUEST_TIMEOUT_HEADER, TOO_LARGE_MESSAGE, deadline_error, encoding_result,
+    parse_deadline, validate_word
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Longest response line accepted from a worker (large batches are one line)
+MAX_LINE_BYTES = 64 * 1024 * 1024
+
+
+class AsyncWorkerPool:
+    """
+    Bounded pool of persistent encoder processes driven through asyncio streams.
+
+    Workers speak the newline-delimited JSON protocol of
+    Metaphone3Wrapper.worker_command() and are started lazily. Each worker
+    serves one request at a time; callers beyond pool_size wait in a queue and
+    the time they wait is recorded.
+    """
+
+    def __init__(self, command: list, size: int, timeout: float = 30):
+        """
+        Initialize the pool.
+
+        Args:
+            command (list): Program and arguments of a worker process
+            size (int): Maximum number of worker processes
+            timeout (float): Seconds to wait for a free worker, and for a
+                worker to answer (default: 30)
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.command = command
+        self.size = size
+        self.timeout = timeout
+        self._slots = None
+        self._workers = set()
+        self.requests = 0
+        self.waiting = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+
+    def _slot_queue(self) -> asyncio.LifoQueue:
+        """Create the slot queue on first use, inside the running event loop."""
+        if self._slots is None:
+            self._slots = asyncio.LifoQueue()
+            for _ in range(self.size):
+                self._slots.put_nowait(None)
+        return self._slots
+
+    async def _start_worker(self) -> asyncio.subprocess.Process:
+        """Start a worker process and wait until it is ready."""
+        try:
+            worker = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=MAX_LINE_BYTES
+            )
+        except OSError as e:
+            raise Metaphone3Error(f"Failed to start encoder worker: {e}")
+
+        self._workers.add(worker)
+        try:
+            output = json.loads(await self._read_line(worker))
+        except json.JSONDecodeError:
+            output = {}
+        if not output.get('ready'):
+            self._stop_worker(worker)
+            raise Metaphone3Error("Encoder worker did not start properly")
+        return worker
+
+    async def _read_line(self, worker: asyncio.subprocess.Process) -> bytes:
+        """Read one response line from a worker, honouring the timeout."""
+        try:
+            line = await asyncio.wait_for(worker.stdout.readline(), self.timeout)
+        except asyncio.TimeoutError:
+            raise Metaphone3Error("Timeout while waiting for encoder worker")
+        except ValueError as e:
+            raise Metaphone3Error(f"Encoder worker output too long: {e}")
+        if not line:
+            raise Metaphone3Error("Encoder worker exited")
+        return line
+
+    def _stop_worker(self, worker: asyncio.subprocess.Process) -> None:
+        """Kill a worker process."""
+        self._workers.discard(worker)
+        if worker.returncode is None:
+            try:
+                worker.kill()
+            except ProcessLookupError:
+                pass
+
+    async def request(self, request: dict) -> dict:
+        """
+        Send one request to a free worker and return its response.
+
+        Args:
+            request (dict): JSON-serializable request
+
+        Returns:
+            dict: Parsed JSON response
+
+        Raises:
+            Metaphone3Error: If no worker frees up within the timeout, or the
+                worker fails or answers with invalid JSON
+        """
+        slots = self._slot_queue()
+        queued = time.perf_counter()
+        self.waiting += 1
+        try:
+            worker = await asyncio.wait_for(slots.get(), self.timeout)
+        except asyncio.TimeoutError:
+            raise Metaphone3Error("Timeout while waiting for an encoder worker")
+        finally:
+            self.waiting -= 1
+
+        waited = time.perf_counter() - queued
+        self.requests += 1
+        self.queue_wait_total += waited
+        self.queue_wait_max = max(self.queue_wait_max, waited)
+
+        try:
+            if worker is None or worker.returncode is not None:
+                worker = None
+                worker = await self._start_worker()
+            worker.stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+            await worker.stdin.drain()
+            line = await self._read_line(worker)
+        except OSError as e:
+            if worker is not None:
+                self._stop_worker(worker)
+                worker = None
+            raise Metaphone3Error(f"Encoder worker failed: {e}")
+        except (Metaphone3Error, asyncio.CancelledError):
+            # A failed or abandoned worker may still answer later, so replace it
+            if worker is not None:
+                self._stop_worker(worker)
+                worker = None
+            raise
+        finally:
+            # A stopped worker may not have exited yet; an empty slot starts a fresh one
+            slots.put_nowait(worker)
+
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            raise Metaphone3Error(f"Invalid JSON output: {line!r}")
+
+    def stats(self) -> dict:
+        """
+        Get pool statistics.
+
+        Returns:
+            dict: size, running and busy workers, waiting requests, and the
+            number of requests with their average and maximum queueing delay
+        """
+        idle = self._slots.qsize() if self._slots is not None else self.size
+        return {
+            'size': self.size,
+            'running': len(self._workers),
+            'busy': self.size - idle,
+            'waiting': self.waiting,
+            'requests': self.requests,
+            'queue_wait_avg_ms': 1000 * self.queue_wait_total / self.requests if self.requests else 0.0,
+            'queue_wait_max_ms': 1000 * self.queue_wait_max
+        }
+
+    async def close(self) -> None:
+        """Stop all worker processes."""
+        workers = list(self._workers)
+        for worker in workers:
+            self._stop_worker(worker)
+        for worker in workers:
+            await worker.wait()
+
+
+class AsyncMetaphone3:
+    """
+    Asynchronous Metaphone3 encoder.
+
+    Uses a Metaphone3Wrapper for settings, cache and dictionary, and an
+    AsyncWorkerPool of its backend's worker processes for encoding.
+    """
+
+    def __init__(self, wrapper: Metaphone3Wrapper, pool_size: Optional[int] = None):
+        """
+        Initialize the encoder.
+
+        Args:
+            wrapper (Metaphone3Wrapper): Wrapper providing backend, settings,
+                cache and dictionary
+            pool_size (int): Number of worker processes (default: number of CPUs)
+        """
+        self.wrapper = wrapper
+        self.pool = AsyncWorkerPool(wrapper.worker_command(), pool_size or os.cpu_count() or 1,
+                                    wrapper.timeout)
+
+    async def encode(self, word: str, options: Optional[EncodeOptions] = None) -> Tuple[str, str]:
+        """
+        Encode a word using Metaphone3 algorithm.
+
+        Args:
+            word (str): Word to encode
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
+
+        Returns:
+            Tuple[str, str]: Primary and alternate phonetic encodings
+
+        Raises:
+            Metaphone3Error: If encoding fails
+        """
+        if not word or not isinstance(word, str):
+            return "", ""
+        if options is None:
+            options = self.wrapper.default_options()
+
+        result = self.wrapper.lookup(word, options)
+        if result is not None:
+            return result
+
+        output = await self.pool.request(dict(asdict(options), word=word))
+        if not output.get('success'):
+            raise Metaphone3Error(f"Encoding error: {output.get('error', 'Unknown error')}")
+        result = output.get('primary', ''), output.get('alternate', '')
+        self.wrapper.remember(word, options, result)
+        return result
+
+    async def _encode_shard(self, words: list, options: EncodeOptions) -> list:
+        """Encode a batch of words with one worker request."""
+        output = await self.pool.request(dict(asdict(options), words=words))
+        if not output.get('success'):
+            raise Metaphone3Error(f"Encoding error: {output.get('error', 'Unknown error')}")
+        results = output.get('results')
+        if not isinstance(results, list) or len(results) != len(words):
+            raise Metaphone3Error("Invalid batch output from encoder worker")
+        return results
+
+    async def encode_list(self, words: list, options: Optional[EncodeOptions] = None) -> list:
+        """
+        Encode a list of words.
+
+        Distinct words missing from the cache and dictionary are encoded by
+        the pool, split into shards of at least MIN_SHARD_SIZE words that run
+        on different workers concurrently.
+
+        Args:
+            words (list): List of words to encode
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
+
+        Returns:
+            list: List of tuples containing (word, primary, alternate), as
+            returned by Metaphone3Wrapper.encode_list()
+        """
+        if options is None:
+            options = self.wrapper.default_options()
+
+        encoded = {}
+        missing = {}
+        for word in words:
+            if not word or not isinstance(word, str):
+                continue
+            key = word.upper()
+            if key in encoded or key in missing:
+                continue
+            cached = self.wrapper.lookup(word, options)
+            if cached is not None:
+                encoded[key] = cached
+            else:
+                missing[key] = word
+
+        errors = {}
+        if missing:
+            pending = list(missing.values())
+            shard_count = max(1, min(self.pool.size, len(pending) // MIN_SHARD_SIZE))
+            shard_size = -(-len(pending) // shard_count)
+            try:
+                shards = await asyncio.gather(*(
+                    self._encode_shard(pending[i:i + shard_size], options)
+                    for i in range(0, len(pending), shard_size)
+                ))
+            except Metaphone3Error as e:
+                errors = dict.fromkeys(missing, f"Error: {e}")
+            else:
+                outputs = [output for shard in shards for output in shard]
+                for (key, word), output in zip(missing.items(), outputs):
+                    if output.get('success'):
+                        encoded[key] = (output.get('primary', ''), output.get('alternate', ''))
+                        self.wrapper.remember(word, options, encoded[key])
+                    else:
+                        errors[key] = f"Error: Encoding error: {output.get('error', 'Unknown error')}"
+
+        results = []
+        for word in words:
+            if not word or not isinstance(word, str):
+                results.append((word, "", ""))
+                continue
+
+            key = word.upper()
+            if key in encoded:
+                results.append((word,) + encoded[key])
+            else:
+                results.append((word, "", errors[key]))
+        return results
+
+    async def close(self) -> None:
+        """Stop the worker processes and release the wrapper."""
+        await self.pool.close()
+        self.wrapper.close()
+
+
+# Global asynchronous encoder instance
+m3_async = None
+
+def initialize_metaphone3():
+    """Initialize the asynchronous Metaphone3 encoder."""
+    global m3_async
+    dictionary_path = os.environ.get("METAPHONE3_DICTIONARY")
+    if dictionary_path is None and os.path.exists(DEFAULT_DICTIONARY_PATH):
+        dictionary_path = DEFAULT_DICTIONARY_PATH
+    try:
+        wrapper = Metaphone3Wrapper(
+            backend=os.environ.get("METAPHONE3_BACKEND", "python"),
+            cache_size=int(os.environ.get("METAPHONE3_CACHE_SIZE", DEFAULT_CACHE_SIZE)),
+            dictionary_path=dictionary_path
+        )
+        pool_size = os.environ.get("METAPHONE3_POOL_SIZE")
+        m3_async = AsyncMetaphone3(wrapper, int(pool_size) if pool_size else None)
+        logger.info(f"Metaphone3 async encoder initialized with {m3_async.pool.size} workers")
+        return True
+    except (Metaphone3Error, ValueError) as e:
+        logger.error(f"Failed to initialize Metaphone3 async encoder: {e}")
+        return False
+
+async def encode_words_udf(data):
+    """BigQuery UDF compatible endpoint, see app.encode_words_udf."""
+    if not data:
+        return 400, {"error": "No JSON data provided"}
+    if 'calls' not in data:
+        return 400, {"error": "Missing 'calls' field"}
+
+    calls = data['calls']
+    if not isinstance(calls, list):
+        return 400, {"error": "'calls' must be a list"}
+
+    replies = []
+    positions = []
+    words = []
+    for call in calls:
+        if not isinstance(call, list) or len(call) != 1 or not validate_word(call[0]):
+            replies.append("INVALID|INVALID")
+            continue
+        positions.append(len(replies))
+        words.append(call[0].strip())
+        replies.append(None)
+
+    for position, (word, primary, alternate) in zip(positions, await m3_async.encode_list(words)):
+        replies[position] = encoding_result(word, primary, alternate).get('primary', "INVALID")
+
+    return 200, {"replies": replies}
+
+async def encode_words_original(data):
+    """Encoding endpoint, see app.encode_words_original."""
+    if not data:
+        return 400, {"error": "No JSON data provided", "success": False}
+
+    key_length = data.get('key_length', 8)
+    if not isinstance(key_length, int) or not (1 <= key_length <= 32):
+        return 400, {"error": "key_length must be between 1 and 32", "success": False}
+    options = EncodeOptions(data.get('encode_vowels', False), data.get('encode_exact', False), key_length)
+
+    if 'word' in data:
+        word = data['word']
+        if not validate_word(word):
+            return 400, {"error": "Invalid word. Must be a non-empty string.", "success": False}
+
+        word = word.strip()
+        try:
+            primary, alternate = await m3_async.encode(word, options)
+        except Metaphone3Error as e:
+            logger.error(f"Error encoding word '{word}': {e}")
+            return 500, {"word": word, "error": str(e), "success": False}
+        return 200, encoding_result(word, primary, alternate)
+
+    elif 'words' in data:
+        words = data['words']
+        if not isinstance(words, list):
+            return 400, {"error": "words must be a list", "success": False}
+
+        encoded = iter(await m3_async.encode_list(
+            [word.strip() for word in words if validate_word(word)], options))
+        results = []
+        for word in words:
+            if validate_word(word):
+                results.append(encoding_result(*next(encoded)))
+            else:
+                results.append({"word": str(word), "error": "Invalid word", "success": False})
+
+        return 200, {"results": results, "success": True, "total": len(results)}
+
+    return 400, {"error": "Either 'word' or 'words' must be provided", "success": False}
+
+async def health_check(data):
+    """Health check endpoint."""
+    return 200, {
+        "status": "healthy",
+        "service": "Metaphone3 API",
+        "timestamp": datetime.now().isoformat(),
+        "wrapper_initialized": m3_async is not None
+    }
+
+async def get_settings(data):
+    """Get current Metaphone3 settings, cache and worker pool statistics."""
+    return 200, {
+        "settings": dict(m3_async.wrapper.get_settings(), pool_size=m3_async.pool.size),
+        "cache": m3_async.wrapper.get_cache_stats(),
+        "pool": m3_async.pool.stats(),
+        "success": True
+    }
+
+# (method, path) -> handler(data) returning (status, JSON body)
+ROUTES = {
+    ('POST', '/'): encode_words_udf,
+    ('POST', '/encode'): encode_words_original,
+    ('GET', '/health'): health_check,
+    ('GET', '/settings'): get_settings,
+}
+
+def request_deadline(headers):
+    """
+    Get the deadline of a request: MAX_REQUEST_SECONDS from now, or sooner
+    if the client sent a shorter X-Request-Timeout.
+
+    Args:
+        headers (list): ASGI (name, value) header pairs
+
+    Returns:
+        float: time.monotonic() value
+
+    Raises:
+        ValueError: If the header is not a positive number of seconds
+    """
+    header = REQUEST_TIMEOUT_HEADER.lower().encode("latin-1")
+    values = [value for name, value in headers if name.lower() == header]
+    return parse_deadline(values[0].decode("latin-1") if values else None)
+
+async def read_request_body(scope, receive):
+    """
+    Read a request body of at most MAX_REQUEST_BYTES.
+
+    Returns:
+        Optional[bytes]: The body, or None if it is too large
+    """
+    for name, value in scope['headers']:
+        if name == b'content-length' and value.isdigit() and int(value) > MAX_REQUEST_BYTES:
+            return None
+
+    body = b''
+    while True:
+        message = await receive()
+        body += message.get('body', b'')
+        if len(body) > MAX_REQUEST_BYTES:
+            return None
+        if not message.get('more_body'):
+            return body
+
+async def send_json(send, status, body, extra_headers=()):
+    """Send a complete JSON response."""
+    payload = json.dumps(body).encode("utf-8")
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(payload)).encode()),
+            (b'access-control-allow-origin', b'*'),
+            *extra_headers
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': payload})
+
+async def handle_lifespan(receive, send):
+    """Start the encoder with the server and stop its workers on shutdown."""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            if m3_async is not None or initialize_metaphone3():
+                await send({'type': 'lifespan.startup.complete'})
+            else:
+                await send({'type': 'lifespan.startup.failed',
+                            'message': "Failed to initialize Metaphone3 async encoder"})
+        elif message['type'] == 'lifespan.shutdown':
+            if m3_async is not None:
+                await m3_async.close()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def app(scope, receive, send):
+    """ASGI application serving the Metaphone3 API."""
+    if scope['type'] == 'lifespan':
+        await handle_lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    method = scope['method']
+    path = scope['path']
+    if method == 'OPTIONS':
+        # CORS preflight
+        await send_json(send, 200, {}, [
+            (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
+            (b'access-control-allow-headers', b'Content-Type')
+        ])
+        return
+
+    handler = ROUTES.get((method, path))
+    if handler is None:
+        if any(route_path == path for _, route_path in ROUTES):
+            await send_json(send, 405, {"error": "Method not allowed", "success": False})
+        else:
+            await send_json(send, 404, {"error": "Endpoint not found", "success": False})
+        return
+
+    if handler in (encode_words_udf, encode_words_original, get_settings) and m3_async is None:
+        await send_json(send, 500, {"error": "Metaphone3 wrapper not initialized", "success": False})
+        return
+
+    try:
+        deadline = request_deadline(scope['headers'])
+    except ValueError as e:
+        await send_json(send, 400, {"error": str(e), "success": False})
+        return
+
+    body = await read_request_body(scope, receive)
+    if body is None:
+        await send_json(send, 413, {"error": TOO_LARGE_MESSAGE, "success": False})
+        return
+
+    try:
+        data = json.loads(body) if method == 'POST' and body else None
+    except ValueError:
+        data = None
+
+    try:
+        # Cancelling the handler stops the workers of its requests
+        status, response = await asyncio.wait_for(handler(data), max(deadline - time.monotonic(), 0.0))
+    except asyncio.TimeoutError:
+        status, response = 504, deadline_error(udf=handler is encode_words_udf)
+    except Exception as e:
+        logger.error(f"Error processing request: {e}")
+        status, response = 500, {"error": "Internal server error", "success": False}
+    await send_json(send, status, response)
+
+
+if __name__ == '__main__':
+    try:
+        import uvicorn
+    except ImportError:
+        print("Error: uvicorn is required to run the ASGI app (pip install uvicorn).")
+        sys.exit(1)
+
+    print("Starting Metaphone3 async API...")
+    uvicorn.run(app, host='0.0.0.0', port=8080)
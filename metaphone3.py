@@ -0,0 +1,5643 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 in Python
+
+This module is a line-by-line port of Metaphone3.js (Metaphone 3, version 2.5.4,
+copyright 2015 by Lawrence Philips) that runs in-process, without Node.js. It
+produces exactly the same keys as the JavaScript engine and is checked against
+large_word_list_output_3_21_15_DEFAULT_ENCODING.txt.
+
+Metaphone 3 returns an *approximate* phonetic key (and an alternate key when
+appropriate) that should be the same for English words, and most names
+familiar in the United States, that are pronounced *similarly*. See the
+header of Metaphone3.js for a full description of the encoding rules and the
+"Exact" and "Encode Vowels" settings.
+
+Usage:
+    from metaphone3 import Metaphone3
+    
+    m3 = Metaphone3()
+    primary, alternate = m3.encode("hello")
+    
+    m3.set_encode_vowels(True)
+    m3.set_encode_exact(True)
+    primary, alternate = m3.encode("hello")
+
+Verify the port against the shipped word list with:
+    python metaphone3.py large_word_list_output_3_21_15_DEFAULT_ENCODING.txt
+"""
+
+import json
+import sys
+import time
+from typing import Iterator, TextIO, Tuple
+
+
+# Default size of key storage allocation
+MAX_KEY_ALLOCATION = 32
+
+# Default maximum length of encoded key
+DEFAULT_MAX_KEY_LENGTH = 8
+
+# Words a worker encodes between checks of a request's timeout_ms
+DEADLINE_CHECK_INTERVAL = 64
+
+# key_length under which caches file complete keys, see keys_complete()
+ANY_KEY_LENGTH = 0
+
+# Metaphone3.js spells its accented letters ('À', 'Ç', 'Ñ', 'ß', ...) as Latin-1
+# bytes, which Node.js decodes to U+FFFD when it loads the file as UTF-8. The
+# JavaScript engine therefore never matches the real accented letters and
+# treats U+FFFD as all of them at once. These tables reproduce that behaviour
+# so both engines return the same keys for any input.
+REPLACEMENT_CHAR = "\ufffd"
+FRONT_VOWELS = frozenset("EIY" + REPLACEMENT_CHAR)
+VOWELS = frozenset("AEIOUY" + REPLACEMENT_CHAR)
+
+
+class Metaphone3:
+    """
+    Metaphone 3 phonetic encoder.
+    
+    One instance encodes one word at a time and is not thread-safe; create one
+    instance per thread. Settings mirror Metaphone3Wrapper.
+    """
+    
+    def __init__(self, encode_vowels: bool = False, encode_exact: bool = False,
+                 key_length: int = DEFAULT_MAX_KEY_LENGTH):
+        """
+        Initialize the encoder.
+        
+        Args:
+            encode_vowels (bool): Encode non-initial vowels (default: False)
+            encode_exact (bool): Encode consonants exactly (default: False)
+            key_length (int): Maximum key length 1-32 (default: 8)
+        """
+        self.encode_vowels = bool(encode_vowels)
+        self.encode_exact = bool(encode_exact)
+        self.key_length = DEFAULT_MAX_KEY_LENGTH
+        self.set_key_length(key_length)
+        
+        # Encoding state for the word currently being encoded
+        self._word = ""
+        self._length = 0
+        self._current = 0
+        self._last = 0
+        self._primary = ""
+        self._secondary = ""
+        self._flag_al_inversion = False
+        
+        self._encoders = {
+            "B": self._encode_b,
+            "C": self._encode_c,
+            "D": self._encode_d,
+            "F": self._encode_f,
+            "G": self._encode_g,
+            "H": self._encode_h,
+            "J": self._encode_j,
+            "K": self._encode_k,
+            "L": self._encode_l,
+            "M": self._encode_m,
+            "N": self._encode_n,
+            "P": self._encode_p,
+            "Q": self._encode_q,
+            "R": self._encode_r,
+            "S": self._encode_s,
+            "T": self._encode_t,
+            "V": self._encode_v,
+            "W": self._encode_w,
+            "X": self._encode_x,
+            "Z": self._encode_z,
+        }
+    
+    def set_encode_vowels(self, encode_vowels: bool) -> None:
+        """
+        Set whether to encode non-initial vowels.
+        
+        Args:
+            encode_vowels (bool): True to encode vowels, False otherwise
+        """
+        self.encode_vowels = bool(encode_vowels)
+    
+    def set_encode_exact(self, encode_exact: bool) -> None:
+        """
+        Set whether to encode consonants exactly.
+        
+        Args:
+            encode_exact (bool): True for exact encoding, False for approximate
+        """
+        self.encode_exact = bool(encode_exact)
+    
+    def set_key_length(self, length: int) -> None:
+        """
+        Set maximum length of encoded keys.
+        
+        Args:
+            length (int): Maximum key length (1-32)
+        """
+        if 1 <= length <= MAX_KEY_ALLOCATION:
+            self.key_length = length
+        else:
+            raise ValueError("Key length must be between 1 and 32")
+    
+    def get_settings(self) -> dict:
+        """
+        Get current settings.
+        
+        Returns:
+            dict: Current configuration settings
+        """
+        return {
+            'encode_vowels': self.encode_vowels,
+            'encode_exact': self.encode_exact,
+            'key_length': self.key_length
+        }
+    
+    def encode(self, word: str) -> Tuple[str, str]:
+        """
+        Encode a word using Metaphone3 algorithm.
+        
+        Args:
+            word (str): Word to encode
+            
+        Returns:
+            Tuple[str, str]: Primary and alternate phonetic encodings
+        """
+        if not word or not isinstance(word, str):
+            return "", ""
+        
+        self._word = word.upper()
+        self._length = len(self._word)
+        self._last = self._length - 1
+        self._current = 0
+        self._primary = ""
+        self._secondary = ""
+        self._flag_al_inversion = False
+        
+        encoders = self._encoders
+        key_length = self.key_length
+        
+        # main loop
+        while len(self._primary) <= key_length and len(self._secondary) <= key_length:
+            if self._current >= self._length:
+                break
+            
+            char = self._word[self._current]
+            encoder = encoders.get(char)
+            if encoder is not None:
+                encoder()
+            elif char == REPLACEMENT_CHAR:
+                # first matching case for the accented letters, see VOWELS
+                self._metaph_add("S")
+                self._current += 1
+            elif char in VOWELS:
+                self._encode_vowels()
+            else:
+                self._current += 1
+        
+        # only give back key_length number of chars in each key
+        primary = self._primary[:key_length]
+        secondary = self._secondary[:key_length]
+        
+        # it is possible for the two keys to be the same
+        # after truncation. lose the second one if so
+        if primary == secondary:
+            secondary = ""
+        
+        return primary, secondary
+    
+    def _clean_vowels(self, metaph: str, encoding: str) -> str:
+        """
+        Make sure that no more than one 'A' in a row is encoded.
+        
+        Args:
+            metaph: key encoded so far
+            encoding: encoding characters about to be added
+        
+        Returns:
+            the encoding characters to actually add
+        """
+        if (encoding[0] == "A") and metaph and (metaph[-1] == "A"):
+            # as Metaphone3.js: keep only the second character
+            return encoding[1:2]
+        
+        return encoding
+    
+    def _metaph_add(self, main: str) -> None:
+        """
+        Adds an encoding character to the encoded key value - one parameter version.
+        
+        Args:
+            main: primary encoding character to be added to encoded key string.
+        """
+        if not main:
+            return
+        
+        self._primary += self._clean_vowels(self._primary, main)
+        self._secondary += self._clean_vowels(self._secondary, main)
+    
+    def _metaph_add_with_alt(self, main: str, alt: str) -> None:
+        """
+        Adds an encoding character to the encoded key value - two parameter version
+        
+        Args:
+            main: primary encoding character to be added to encoded key string
+            alt: alternative encoding character to be added to encoded alternative key string
+        """
+        if main:
+            self._primary += self._clean_vowels(self._primary, main)
+        
+        if alt:
+            self._secondary += self._clean_vowels(self._secondary, alt)
+    
+    def _metaph_add_exact_approx4(self, main_exact: str, alt_exact: str, main: str, alt: str) -> None:
+        """
+        Adds an encoding character to the encoded key value - Exact/Approx version
+        
+        Args:
+            main_exact: primary encoding character to be added to encoded key if encode_exact is set
+            alt_exact: alternative encoding character to be added to encoded alternative key if encode_exact is set
+            main: primary encoding character to be added to encoded key string
+            alt: alternative encoding character to be added to encoded alternative key string
+        """
+        if self.encode_exact:
+            self._metaph_add_with_alt(main_exact, alt_exact)
+        else:
+            self._metaph_add_with_alt(main, alt)
+    
+    def _metaph_add_exact_approx(self, main_exact: str, main: str) -> None:
+        """
+        Adds an encoding character to the encoded key value - Exact/Approx version
+        
+        Args:
+            main_exact: primary encoding character to be added to encoded key if encode_exact is set
+            main: primary encoding character to be added to encoded key string
+        """
+        if self.encode_exact:
+            self._metaph_add(main_exact)
+        else:
+            self._metaph_add(main)
+    
+    def _char_at(self, at: int) -> str:
+        """
+        Subscript safe character access.
+        
+        Args:
+            at: index of character to access
+        
+        Returns:
+            "\\0" if index out of bounds, the character otherwise
+        """
+        if (at < 0) or (at >= self._length):
+            return "\0"
+        
+        return self._word[at]
+    
+    def _string_at(self, start: int, length: int, *strings: str) -> bool:
+        """
+        Determines if one of the substrings sent in is the same as
+        what is at the specified position in the word being encoded.
+        
+        Args:
+            start: position of the substring in the word
+            length: length of the substring
+            strings: candidate substrings
+        
+        Returns:
+            True if the substring at start is one of strings
+        """
+        if (start < 0) or ((start + length) > self._length):
+            return False
+        
+        return self._word[start:start + length] in strings
+    
+    def _front_vowel(self, at: int) -> bool:
+        """
+        Test for close front vowels
+        
+        Returns:
+            true if close front vowel
+        """
+        return self._char_at(at) in FRONT_VOWELS
+    
+    def _is_vowel_char(self, char: str) -> bool:
+        """
+        Tests if character is a vowel
+        
+        Args:
+            char: character to be tested
+        
+        Returns:
+            true if character is a vowel, false if not
+        """
+        return char in VOWELS
+    
+    def _is_vowel(self, at: int) -> bool:
+        """
+        Tests if character in the input is a vowel
+        
+        Args:
+            at: position of character to be tested in to be encoded
+        
+        Returns:
+            true if character is a vowel, false if not
+        """
+        if (at < 0) or (at >= self._length):
+            return False
+        
+        return self._word[at] in VOWELS
+    
+    def _root_or_inflections(self, word: str, root: str) -> bool:
+        """
+        Tests whether the word is the root or a regular english inflection
+        of it, e.g. "ache", "achy", "aches", "ached", "aching", "achingly"
+        This is for cases where we want to match only the root and corresponding
+        inflected forms, and not completely different words which may have the
+        same substring in them.
+        """
+        if (word == root) or (word == root + "S"):
+            return True
+        
+        if root[-1] != "E":
+            if (word == root + "ES") or (word == root + "ED"):
+                return True
+        else:
+            if word == root + "D":
+                return True
+            root = root[:-1]
+        
+        return (word == root + "ING") or (word == root + "INGLY") or (word == root + "Y")
+    
+    def _slavo_germanic(self):
+        """
+        Detect names or words that begin with spellings
+        typical of german or slavic words, for the purpose
+        of choosing alternate pronunciations correctly
+        """
+        if (self._string_at(0, 3, "SCH")
+             or self._string_at(0, 2, "SW")
+             or (self._char_at(0) == "J")
+             or (self._char_at(0) == "W")):
+            return True
+
+        return False
+
+    def _skip_vowels(self, at):
+        """
+        Skips over vowels in a string. Has exceptions for skipping consonants that
+        will not be encoded.
+
+        Args:
+            at: position, in to be encoded, of character to start skipping from
+
+        Returns:
+            position of next consonant in to be encoded
+        """
+        if at < 0:
+            return 0
+
+        if at >= self._length:
+            return self._length
+
+        it = self._char_at(at)
+
+        while self._is_vowel_char(it) or (it == "W"):
+            if self._eastern_european_name_ending(at):
+                break
+            at += 1
+
+            if (((self._char_at(at - 1) == "W") and (self._char_at(at) == "H"))
+                 and not (self._string_at(at, 3, "HOP")
+                       or self._string_at(at, 4, "HIDE", "HARD", "HEAD", "HAWK", "HERD", "HOOK", "HAND", "HOLE")
+                       or self._string_at(at, 5, "HEART", "HOUSE", "HOUND")
+                       or self._string_at(at, 6, "HAMMER"))):
+                at += 1
+
+            if at > (self._length - 1):
+                break
+            it = self._char_at(at)
+
+        return at
+
+    def _advance_counter(self, if_not_encode_vowels, if_encode_vowels):
+        """
+        Advance the current position so that it indexes the next character to be encoded
+
+        Args:
+            if_not_encode_vowels: number of characters to advance if not encoding internal vowels
+            if_encode_vowels: number of characters to advance if encoding internal vowels
+        """
+        if not self.encode_vowels:
+            self._current += if_not_encode_vowels
+        else:
+            self._current += if_encode_vowels
+
+    def _encode_vowels(self):
+        """
+        Encodes all initial vowels to A.
+
+        Encodes non-initial vowels to A if encode_vowels is true
+        """
+        if self._current == 0:
+            # all init vowels map to 'A'
+            # as of Double Metaphone
+            self._metaph_add("A")
+        elif self.encode_vowels:
+            if self._char_at(self._current) != "E":
+                if self._skip_silent_ue():
+                    return
+
+                if self._o_silent():
+                    self._current += 1
+                    return
+
+                # encode all vowels and
+                # diphthongs to the same value
+                self._metaph_add("A")
+            else:
+                self._encode_e_pronounced()
+
+        if not (not self._is_vowel(self._current - 2) and self._string_at((self._current - 1), 4, "LEWA", "LEWO", "LEWI")):
+            self._current = self._skip_vowels(self._current)
+        else:
+            self._current += 1
+
+    def _e_silent(self):
+        """
+        Tests and encodes cases where non-initial 'e' is never pronounced
+        Only executed if non initial vowel encoding is turned on
+
+        Returns:
+            true if encoded as silent - no addition to the key
+        """
+        if self._e_pronounced_at_end():
+            return False
+
+        # 'e' silent when last letter, altho
+        if ((self._current == self._last)
+               # also silent if before plural 's'
+               # or past tense or participle 'd', e.g.
+               # 'grapes' and 'banished' => PNXT
+             or ((self._string_at(self._last, 1, "S", "D")
+                 and (self._current > 1)
+                 and ((self._current + 1) == self._last)
+                       # and not e.g. "nested", "rises", or "pieces" => RASAS
+                     and not (self._string_at((self._current - 1), 3, "TED", "SES", "CES")
+                         or self._string_at(0, 9, "ANTIPODES", "ANOPHELES")
+                         or self._string_at(0, 8, "MOHAMMED", "MUHAMMED", "MOUHAMED")
+                         or self._string_at(0, 7, "MOHAMED")
+                         or self._string_at(0, 6, "NORRED", "MEDVED", "MERCED", "ALLRED", "KHALED", "RASHED", "MASJED")
+                         or self._string_at(0, 5, "JARED", "AHMED", "HAMED", "JAVED")
+                         or self._string_at(0, 4, "ABED", "IMED"))))
+                   # e.g.  'wholeness', 'boneless', 'barely'
+                 or (self._string_at((self._current + 1), 4, "NESS", "LESS") and ((self._current + 4) == self._last))
+                 or (self._string_at((self._current + 1), 2, "LY") and ((self._current + 2) == self._last)
+                         and not self._string_at(0, 6, "CICELY"))):
+            return True
+
+        return False
+
+    def _encode_e_pronounced(self):
+        """
+        Encodes cases where non-initial 'e' is pronounced, taking
+        care to detect unusual cases from the greek.
+
+        Only executed if non initial vowel encoding is turned on
+        """
+        # special cases with two pronunciations
+        # 'agape' 'lame' 'resume'
+        if ((self._string_at(0, 4, "LAME", "SAKE", "PATE") and (self._length == 4))
+             or (self._string_at(0, 5, "AGAPE") and (self._length == 5))
+             or ((self._current == 5) and self._string_at(0, 6, "RESUME"))):
+            self._metaph_add_with_alt("", "A")
+            return
+
+        # special case "inge" => 'INGA', 'INJ'
+        if (self._string_at(0, 4, "INGE")
+             and (self._length == 4)):
+            self._metaph_add_with_alt("A", "")
+            return
+
+        # special cases with two pronunciations
+        # special handling due to the difference in
+        # the pronunciation of the '-D'
+        if (self._current == 5) and self._string_at(0, 7, "BLESSED", "LEARNED"):
+            self._metaph_add_exact_approx4("D", "AD", "T", "AT")
+            self._current += 2
+            return
+
+        # encode all vowels and diphthongs to the same value
+        if ((not self._e_silent()
+                 and not self._flag_al_inversion
+                 and not self._silent_internal_e())
+                 or self._e_pronounced_exceptions()):
+            self._metaph_add("A")
+
+        # now that we've visited the vowel in question
+        self._flag_al_inversion = False
+
+    def _o_silent(self):
+        """
+        Tests for cases where non-initial 'o' is not pronounced
+        Only executed if non initial vowel encoding is turned on
+
+        Returns:
+            true if encoded as silent - no addition to the key
+        """
+        # if "iron" at beginning or end of word and not "irony"
+        if ((self._char_at(self._current) == "O")
+            and not self._string_at((self._current - 2), 6, "IRONIC")
+            and ((self._string_at((self._current - 2), 4, "IRON")
+                or (self._string_at((self._current - 2), 4, "IRON")
+                    and (self._last == (self._current + 1))))
+                or self._string_at((self._current - 2), 5, "IVORY"))
+                or ((self._current == 3) and self._string_at((self._current - 3), 9, "LABORATOR"))):
+            return True
+
+        return False
+
+    def _e_pronounced_at_end(self):
+        """
+        Tests for words where an 'E' at the end of the word
+        is pronounced
+
+        special cases, mostly from the greek, spanish, japanese,
+        italian, and french words normally having an acute accent.
+        also, pronouns and articles
+
+        Many Thanks to ali, QuentinCompson, JeffCO, ToonScribe, Xan,
+        Trafalz, and VictorLaszlo, all of them atriots from the Eschaton,
+        for all their fine contributions!
+
+        Returns:
+            true if 'E' at end is pronounced
+        """
+        if ((self._current == self._last)
+             and (self._string_at((self._current - 6), 7, "STROPHE")
+               # if a vowel is before the 'E', vowel eater will have eaten it.
+               # otherwise, consonant + 'E' will need 'E' pronounced
+             or (self._length == 2)
+             or ((self._length == 3) and not self._is_vowel(0))
+               # these german name endings can be relied on to have the 'e' pronounced
+             or (self._string_at((self._last - 2), 3, "BKE", "DKE", "FKE", "KKE", "LKE",
+                                          "NKE", "MKE", "PKE", "TKE", "VKE", "ZKE")
+                 and not self._string_at(0, 5, "FINKE", "FUNKE")
+                 and not self._string_at(0, 6, "FRANKE"))
+             or self._string_at((self._last - 4), 5, "SCHKE")
+             or (self._string_at(0, 4, "ACME", "NIKE", "CAFE", "RENE", "LUPE", "JOSE", "ESME") and (self._length == 4))
+             or (self._string_at(0, 5, "LETHE", "CADRE", "TILDE", "SIGNE", "POSSE", "LATTE", "ANIME", "DOLCE", "CROCE",
+                                 "ADOBE", "OUTRE", "JESSE", "JAIME", "JAFFE", "BENGE", "RUNGE",
+                                 "CHILE", "DESME", "CONDE", "URIBE", "LIBRE", "ANDRE") and (self._length == 5))
+             or (self._string_at(0, 6, "HECATE", "PSYCHE", "DAPHNE", "PENSKE", "CLICHE", "RECIPE",
+                                "TAMALE", "SESAME", "SIMILE", "FINALE", "KARATE", "RENATE", "SHANTE",
+                                "OBERLE", "COYOTE", "KRESGE", "STONGE", "STANGE", "SWAYZE", "FUENTE",
+                                "SALOME", "URRIBE") and (self._length == 6))
+             or (self._string_at(0, 7, "ECHIDNE", "ARIADNE", "MEINEKE", "PORSCHE", "ANEMONE", "EPITOME",
+                                 "SYNCOPE", "SOUFFLE", "ATTACHE", "MACHETE", "KARAOKE", "BUKKAKE",
+                                 "VICENTE", "ELLERBE", "VERSACE") and (self._length == 7))
+             or (self._string_at(0, 8, "PENELOPE", "CALLIOPE", "CHIPOTLE", "ANTIGONE", "KAMIKAZE", "EURIDICE",
+                                "YOSEMITE", "FERRANTE") and (self._length == 8))
+             or (self._string_at(0, 9, "HYPERBOLE", "GUACAMOLE", "XANTHIPPE") and (self._length == 9))
+             or (self._string_at(0, 10, "SYNECDOCHE") and (self._length == 10)))):
+            return True
+
+        return False
+
+    def _silent_internal_e(self):
+        """
+        Detect internal silent 'E's e.g. "roseman",
+        "firestone"
+        """
+        # 'olesen' but not 'olen'	RAKE BLAKE
+        if ((self._string_at(0, 3, "OLE")
+                 and self._e_silent_suffix(3) and not self._e_pronouncing_suffix(3))
+            or (self._string_at(0, 4, "BARE", "FIRE", "FORE", "GATE", "HAGE", "HAVE",
+                              "HAZE", "HOLE", "CAPE", "HUSE", "LACE", "LINE",
+                              "LIVE", "LOVE", "MORE", "MOSE", "MORE", "NICE",
+                              "RAKE", "ROBE", "ROSE", "SISE", "SIZE", "WARE",
+                              "WAKE", "WISE", "WINE")
+                 and self._e_silent_suffix(4) and not self._e_pronouncing_suffix(4))
+            or (self._string_at(0, 5, "BLAKE", "BRAKE", "BRINE", "CARLE", "CLEVE", "DUNNE",
+                              "HEDGE", "HOUSE", "JEFFE", "LUNCE", "STOKE", "STONE",
+                              "THORE", "WEDGE", "WHITE")
+                  and self._e_silent_suffix(5) and not self._e_pronouncing_suffix(5))
+            or (self._string_at(0, 6, "BRIDGE", "CHEESE")
+                  and self._e_silent_suffix(6) and not self._e_pronouncing_suffix(6))
+            or self._string_at((self._current - 5), 7, "CHARLES")):
+            return True
+
+        return False
+
+    def _e_silent_suffix(self, at):
+        """
+        Detect conditions required
+        for the 'E' not to be pronounced
+        """
+        if ((self._current == (at - 1))
+                 and (self._length > (at + 1))
+                 and (self._is_vowel((at + 1))
+                 or (self._string_at(at, 2, "ST", "SL")
+                     and (self._length > (at + 2))))):
+            return True
+
+        return False
+
+    def _e_pronouncing_suffix(self, at):
+        """
+        Detect endings that will
+        cause the 'e' to be pronounced
+        """
+        # e.g. 'bridgewood' - the other vowels will get eaten
+        # up so we need to put one in here
+        if (self._length == (at + 4)) and self._string_at(at, 4, "WOOD"):
+            return True
+
+        # same as above
+        if (self._length == (at + 5)) and self._string_at(at, 5, "WATER", "WORTH"):
+            return True
+
+        # e.g. 'bridgette'
+        if (self._length == (at + 3)) and self._string_at(at, 3, "TTE", "LIA", "NOW", "ROS", "RAS"):
+            return True
+
+        # e.g. 'olena'
+        if ((self._length == (at + 2)) and self._string_at(at, 2, "TA", "TT", "NA", "NO", "NE",
+                                                      "RS", "RE", "LA", "AU", "RO", "RA")):
+            return True
+
+        # e.g. 'bridget'
+        if (self._length == (at + 1)) and self._string_at(at, 1, "T", "R"):
+            return True
+
+        return False
+
+    def _e_pronounced_exceptions(self):
+        """
+        Exceptions where 'E' is pronounced where it
+        usually wouldn't be, and also some cases
+        where 'LE' transposition rules don't apply
+        and the vowel needs to be encoded here
+
+        Returns:
+            true if 'E' pronounced
+        """
+        # greek names e.g. "herakles" or hispanic names e.g. "robles", where 'e' is pronounced, other exceptions
+        if ((((self._current + 1) == self._last)
+                 and (self._string_at((self._current - 3), 5, "OCLES", "ACLES", "AKLES")
+                     or self._string_at(0, 4, "INES")
+                     or self._string_at(0, 5, "LOPES", "ESTES", "GOMES", "NUNES", "ALVES", "ICKES",
+                                       "INNES", "PERES", "WAGES", "NEVES", "BENES", "DONES")
+                     or self._string_at(0, 6, "CORTES", "CHAVES", "VALDES", "ROBLES", "TORRES", "FLORES", "BORGES",
+                                       "NIEVES", "MONTES", "SOARES", "VALLES", "GEDDES", "ANDRES", "VIAJES",
+                                       "CALLES", "FONTES", "HERMES", "ACEVES", "BATRES", "MATHES")
+                     or self._string_at(0, 7, "DELORES", "MORALES", "DOLORES", "ANGELES", "ROSALES", "MIRELES", "LINARES",
+                                       "PERALES", "PAREDES", "BRIONES", "SANCHES", "CAZARES", "REVELES", "ESTEVES",
+                                       "ALVARES", "MATTHES", "SOLARES", "CASARES", "CACERES", "STURGES", "RAMIRES",
+                                       "FUNCHES", "BENITES", "FUENTES", "PUENTES", "TABARES", "HENTGES", "VALORES")
+                     or self._string_at(0, 8, "GONZALES", "MERCEDES", "FAGUNDES", "JOHANNES", "GONSALES", "BERMUDES",
+                                       "CESPEDES", "BETANCES", "TERRONES", "DIOGENES", "CORRALES", "CABRALES",
+                                       "MARTINES", "GRAJALES")
+                     or self._string_at(0, 9, "CERVANTES", "FERNANDES", "GONCALVES", "BENEVIDES", "CIFUENTES", "SIFUENTES",
+                                       "SERVANTES", "HERNANDES", "BENAVIDES")
+                     or self._string_at(0, 10, "ARCHIMEDES", "CARRIZALES", "MAGALLANES")))
+             or self._string_at(self._current - 2, 4, "FRED", "DGES", "DRED", "GNES")
+             or self._string_at((self._current - 5), 7, "PROBLEM", "RESPLEN")
+             or self._string_at((self._current - 4), 6, "REPLEN")
+             or self._string_at((self._current - 3), 4, "SPLE")):
+            return True
+
+        return False
+
+    def _skip_silent_ue(self):
+        """
+        Encodes "-UE".
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # always silent except for cases listed below
+        if ((self._string_at((self._current - 1), 3, "QUE", "GUE")
+             and not self._string_at(0, 8, "BARBEQUE", "PALENQUE", "APPLIQUE")
+               # '-que' cases usually french but missing the acute accent
+             and not self._string_at(0, 6, "RISQUE")
+             and not self._string_at((self._current - 3), 5, "ARGUE", "SEGUE")
+             and not self._string_at(0, 7, "PIROGUE", "ENRIQUE")
+             and not self._string_at(0, 10, "COMMUNIQUE"))
+             and (self._current > 1)
+                 and (((self._current + 1) == self._last)
+                     or self._string_at(0, 7, "JACQUES"))):
+            self._current = self._skip_vowels(self._current)
+            return True
+
+        return False
+
+    def _encode_b(self):
+        """Encodes 'B'"""
+        if self._encode_silent_b():
+            return
+
+        # "-mb", e.g", "dumb", already skipped over under
+        # 'M', altho it should really be handled here...
+        self._metaph_add_exact_approx("B", "P")
+
+        if ((self._char_at(self._current + 1) == "B")
+             or ((self._char_at(self._current + 1) == "P")
+             and ((self._current + 1 < self._last) and (self._char_at(self._current + 2) != "H")))):
+            self._current += 2
+        else:
+            self._current += 1
+
+    def _encode_silent_b(self):
+        """
+        Encodes silent 'B' for cases not covered under "-mb-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'debt', 'doubt', 'subtle'
+        if (self._string_at((self._current - 2), 4, "DEBT")
+             or self._string_at((self._current - 2), 5, "SUBTL")
+             or self._string_at((self._current - 2), 6, "SUBTIL")
+             or self._string_at((self._current - 3), 5, "DOUBT")):
+            self._metaph_add("T")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_c(self):
+        """Encodes 'C'"""
+        if (self._encode_silent_c_at_beginning()
+             or self._encode_ca_to_s()
+             or self._encode_co_to_s()
+             or self._encode_ch()
+             or self._encode_ccia()
+             or self._encode_cc()
+             or self._encode_ck_cg_cq()
+             or self._encode_c_front_vowel()
+             or self._encode_silent_c()
+             or self._encode_cz()
+             or self._encode_cs()):
+            return
+
+        # else
+        if not self._string_at((self._current - 1), 1, "C", "K", "G", "Q"):
+            self._metaph_add("K")
+
+        # name sent in 'mac caffrey', 'mac gregor
+        if self._string_at((self._current + 1), 2, " C", " Q", " G"):
+            self._current += 2
+        else:
+            if (self._string_at((self._current + 1), 1, "C", "K", "Q")
+                 and not self._string_at((self._current + 1), 2, "CE", "CI")):
+                self._current += 2
+                # account for combinations such as Ro-ckc-liffe
+                if (self._string_at((self._current), 1, "C", "K", "Q")
+                     and not self._string_at((self._current + 1), 2, "CE", "CI")):
+                    self._current += 1
+            else:
+                self._current += 1
+
+    def _encode_silent_c_at_beginning(self):
+        """
+        Encodes cases where 'C' is silent at beginning of word
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # skip these when at start of word
+        if ((self._current == 0)
+             and self._string_at(self._current, 2, "CT", "CN")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_ca_to_s(self):
+        """
+        Encodes exceptions where "-CA-" should encode to S
+        instead of K including cases where the cedilla has not been used
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # Special case: 'caesar'.
+        # Also, where cedilla not used, as in "linguica" => LNKS
+        if (((self._current == 0) and self._string_at(self._current, 4, "CAES", "CAEC", "CAEM"))
+             or self._string_at(0, 8, "FRANCAIS", "FRANCAIX", "LINGUICA")
+             or self._string_at(0, 6, "FACADE")
+             or self._string_at(0, 9, "GONCALVES", "PROVENCAL")):
+            self._metaph_add("S")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_co_to_s(self):
+        """
+        Encodes exceptions where "-CO-" encodes to S instead of K
+        including cases where the cedilla has not been used
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. 'coelecanth' => SLKN0
+        if ((self._string_at(self._current, 4, "COEL")
+                 and (self._is_vowel(self._current + 4) or ((self._current + 3) == self._last)))
+             or self._string_at(self._current, 5, "COENA", "COENO")
+             or self._string_at(0, 8, "FRANCOIS", "MELANCON")
+             or self._string_at(0, 6, "GARCON")):
+            self._metaph_add("S")
+            self._advance_counter(3, 1)
+            return True
+
+        return False
+
+    def _encode_ch(self):
+        """
+        Encode "-CH-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "CH"):
+            if (self._encode_chae()
+                 or self._encode_ch_to_h()
+                 or self._encode_silent_ch()
+                 or self._encode_arch()
+                   # Encode_CH_To_X() should be
+                   # called before the germanic
+                   # and greek encoding functions
+                 or self._encode_ch_to_x()
+                 or self._encode_english_ch_to_k()
+                 or self._encode_germanic_ch_to_k()
+                 or self._encode_greek_ch_initial()
+                 or self._encode_greek_ch_non_initial()):
+                return True
+
+            if self._current > 0:
+                if (self._string_at(0, 2, "MC")
+                         and (self._current == 1)):
+                    # e.g., "McHugh"
+                    self._metaph_add("K")
+                else:
+                    self._metaph_add_with_alt("X", "K")
+            else:
+                self._metaph_add("X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_chae(self):
+        """
+        Encodes "-CHAE-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. 'michael'
+        if ((self._current > 0) and self._string_at((self._current + 2), 2, "AE")):
+            if self._string_at(0, 7, "RACHAEL"):
+                self._metaph_add("X")
+            elif not self._string_at((self._current - 1), 1, "C", "K", "G", "Q"):
+                self._metaph_add("K")
+
+            self._advance_counter(4, 2)
+            return True
+
+        return False
+
+    def _encode_ch_to_h(self):
+        """
+        Encdoes transliterations from the hebrew where the
+        sound 'kh' is represented as "-CH-". The normal pronounciation
+        of this in english is either 'h' or 'kh', and alternate
+        spellings most often use "-H-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # hebrew => 'H', e.g. 'channukah', 'chabad'
+        if (((self._current == 0)
+             and (self._string_at((self._current + 2), 3, "AIM", "ETH", "ELM")
+             or self._string_at((self._current + 2), 4, "ASID", "AZAN")
+             or self._string_at((self._current + 2), 5, "UPPAH", "UTZPA", "ALLAH", "ALUTZ", "AMETZ")
+             or self._string_at((self._current + 2), 6, "ESHVAN", "ADARIM", "ANUKAH")
+             or self._string_at((self._current + 2), 7, "ALLLOTH", "ANNUKAH", "AROSETH")))
+               # and an irish name with the same encoding
+             or self._string_at((self._current - 3), 7, "CLACHAN")):
+            self._metaph_add("H")
+            self._advance_counter(3, 2)
+            return True
+
+        return False
+
+    def _encode_silent_ch(self):
+        """
+        Encodes cases where "-CH-" is not pronounced
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # '-ch-' not pronounced
+        if (self._string_at((self._current - 2), 7, "FUCHSIA")
+             or self._string_at((self._current - 2), 5, "YACHT")
+             or self._string_at(0, 8, "STRACHAN")
+             or self._string_at(0, 8, "CRICHTON")
+             or (self._string_at((self._current - 3), 6, "DRACHM"))
+                 and not self._string_at((self._current - 3), 7, "DRACHMA")):
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_ch_to_x(self):
+        """
+        Encodes "-CH-" to X
+        English language patterns
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. 'approach', 'beach'
+        if ((self._string_at((self._current - 2), 4, "OACH", "EACH", "EECH", "OUCH", "OOCH", "MUCH", "SUCH")
+                 and not self._string_at((self._current - 3), 5, "JOACH"))
+               # e.g. 'dacha', 'macho'
+             or (((self._current + 2) == self._last) and self._string_at((self._current - 1), 4, "ACHA", "ACHO"))
+             or (self._string_at(self._current, 4, "CHOT", "CHOD", "CHAT") and ((self._current + 3) == self._last))
+             or ((self._string_at((self._current - 1), 4, "OCHE") and ((self._current + 2) == self._last))
+                     and not self._string_at((self._current - 2), 5, "DOCHE"))
+             or self._string_at((self._current - 4), 6, "ATTACH", "DETACH", "KOVACH")
+             or self._string_at((self._current - 5), 7, "SPINACH")
+             or self._string_at(0, 6, "MACHAU")
+             or self._string_at((self._current - 4), 8, "PARACHUT")
+             or self._string_at((self._current - 5), 8, "MASSACHU")
+             or (self._string_at((self._current - 3), 5, "THACH") and not self._string_at((self._current - 1), 4, "ACHE"))
+             or self._string_at((self._current - 2), 6, "VACHON")):
+            self._metaph_add("X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_english_ch_to_k(self):
+        """
+        Encodes "-CH-" to K in contexts of
+        initial "A" or "E" follwed by "CH"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'ache', 'echo', alternate spelling of 'michael'
+        if (((self._current == 1) and self._root_or_inflections(self._word, "ACHE"))
+             or (((self._current > 3) and self._root_or_inflections(self._word[self._current - 1:], "ACHE"))
+                 and (self._string_at(0, 3, "EAR")
+                     or self._string_at(0, 4, "HEAD", "BACK")
+                     or self._string_at(0, 5, "HEART", "BELLY", "TOOTH")))
+             or self._string_at((self._current - 1), 4, "ECHO")
+             or self._string_at((self._current - 2), 7, "MICHEAL")
+             or self._string_at((self._current - 4), 7, "JERICHO")
+             or self._string_at((self._current - 5), 7, "LEPRECH")):
+            self._metaph_add_with_alt("K", "X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_germanic_ch_to_k(self):
+        """
+        Encodes "-CH-" to K in mostly germanic context
+        of internal "-ACH-", with exceptions
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # various germanic
+        # "<consonant><vowel>CH-"implies a german word where 'ch' => K
+        if (((self._current > 1)
+             and not self._is_vowel(self._current - 2)
+             and self._string_at((self._current - 1), 3, "ACH")
+             and not self._string_at((self._current - 2), 7, "MACHADO", "MACHUCA", "LACHANC", "LACHAPE", "KACHATU")
+             and not self._string_at((self._current - 3), 7, "KHACHAT")
+             and ((self._char_at(self._current + 2) != "I")
+                 and ((self._char_at(self._current + 2) != "E")
+                 or self._string_at((self._current - 2), 6, "BACHER", "MACHER", "MACHEN", "LACHER")))
+                           # e.g. 'brecht', 'fuchs'
+                 or (self._string_at((self._current + 2), 1, "T", "S")
+                         and not (self._string_at(0, 11, "WHICHSOEVER") or self._string_at(0, 9, "LUNCHTIME")))
+                           # e.g. 'andromache'
+                 or self._string_at(0, 4, "SCHR")
+                 or ((self._current > 2) and self._string_at((self._current - 2), 5, "MACHE"))
+                 or ((self._current == 2) and self._string_at((self._current - 2), 4, "ZACH"))
+                 or self._string_at((self._current - 4), 6, "SCHACH")
+                 or self._string_at((self._current - 1), 5, "ACHEN")
+                 or self._string_at((self._current - 3), 5, "SPICH", "ZURCH", "BUECH")
+                 or (self._string_at((self._current - 3), 5, "KIRCH", "JOACH", "BLECH", "MALCH")
+                           # "kirch" and "blech" both get 'X'
+                         and not (self._string_at((self._current - 3), 8, "KIRCHNER") or ((self._current + 1) == self._last)))
+                 or (((self._current + 1) == self._last) and self._string_at((self._current - 2), 4, "NICH", "LICH", "BACH"))
+                 or (((self._current + 1) == self._last)
+                         and self._string_at((self._current - 3), 5, "URICH", "BRICH", "ERICH", "DRICH", "NRICH")
+                         and not self._string_at((self._current - 5), 7, "ALDRICH")
+                         and not self._string_at((self._current - 6), 8, "GOODRICH")
+                         and not self._string_at((self._current - 7), 9, "GINGERICH")))
+                 or (((self._current + 1) == self._last) and self._string_at((self._current - 4), 6, "ULRICH", "LFRICH", "LLRICH",
+                                                                                 "EMRICH", "ZURICH", "EYRICH"))
+               # e.g., 'wachtler', 'wechsler', but not 'tichner'
+             or ((self._string_at((self._current - 1), 1, "A", "O", "U", "E") or (self._current == 0))
+                         and self._string_at((self._current + 2), 1, "L", "R", "N", "M", "B", "H", "F", "V", "W", " "))):
+            # "CHR/L-" e.g. 'chris' do not get
+            # alt pronunciation of 'X'
+            if (self._string_at((self._current + 2), 1, "R", "L")
+                 or self._slavo_germanic()):
+                self._metaph_add("K")
+            else:
+                self._metaph_add_with_alt("K", "X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_arch(self):
+        """
+        Encode "-ARCH-". Some occurances are from greek roots and therefore encode
+        to 'K', others are from english words and therefore encode to 'X'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at((self._current - 2), 4, "ARCH"):
+            # "-ARCH-" has many combining forms where "-CH-" => K because of its
+            # derivation from the greek
+            if (((self._is_vowel(self._current + 2) and self._string_at((self._current - 2), 5, "ARCHA", "ARCHI", "ARCHO", "ARCHU", "ARCHY"))
+                 or self._string_at((self._current - 2), 6, "ARCHEA", "ARCHEG", "ARCHEO", "ARCHET", "ARCHEL", "ARCHES", "ARCHEP",
+                                                 "ARCHEM", "ARCHEN")
+                 or (self._string_at((self._current - 2), 4, "ARCH") and (((self._current + 1) == self._last)))
+                 or self._string_at(0, 7, "MENARCH"))
+                 and (not self._root_or_inflections(self._word, "ARCH")
+                     and not self._string_at((self._current - 4), 6, "SEARCH", "POARCH")
+                     and not self._string_at(0, 9, "ARCHENEMY", "ARCHIBALD", "ARCHULETA", "ARCHAMBAU")
+                     and not self._string_at(0, 6, "ARCHER", "ARCHIE")
+                     and not ((((self._string_at((self._current - 3), 5, "LARCH", "MARCH", "PARCH")
+                             or self._string_at((self._current - 4), 6, "STARCH"))
+                             and not (self._string_at(0, 6, "EPARCH")
+                                     or self._string_at(0, 7, "NOMARCH")
+                                     or self._string_at(0, 8, "EXILARCH", "HIPPARCH", "MARCHESE")
+                                     or self._string_at(0, 9, "ARISTARCH")
+                                     or self._string_at(0, 9, "MARCHETTI")))
+                             or self._root_or_inflections(self._word, "STARCH"))
+                             and (not self._string_at((self._current - 2), 5, "ARCHU", "ARCHY")
+                                     or self._string_at(0, 7, "STARCHY"))))):
+                self._metaph_add_with_alt("K", "X")
+            else:
+                self._metaph_add("X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_greek_ch_initial(self):
+        """
+        Encode "-CH-" to K when from greek roots
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # greek roots e.g. 'chemistry', 'chorus', ch at beginning of root
+        if ((self._string_at(self._current, 6, "CHAMOM", "CHARAC", "CHARIS", "CHARTO", "CHARTU", "CHARYB", "CHRIST", "CHEMIC", "CHILIA")
+             or (self._string_at(self._current, 5, "CHEMI", "CHEMO", "CHEMU", "CHEMY", "CHOND", "CHONA", "CHONI", "CHOIR", "CHASM",
+                                        "CHARO", "CHROM", "CHROI", "CHAMA", "CHALC", "CHALD", "CHAET", "CHIRO", "CHILO", "CHELA", "CHOUS",
+                                        "CHEIL", "CHEIR", "CHEIM", "CHITI", "CHEOP")
+                 and not (self._string_at(self._current, 6, "CHEMIN") or self._string_at((self._current - 2), 8, "ANCHONDO")))
+             or (self._string_at(self._current, 5, "CHISM", "CHELI")
+               # exclude spanish "machismo"
+                 and not (self._string_at(0, 8, "MACHISMO")
+                   # exclude some french words
+                     or self._string_at(0, 10, "REVANCHISM")
+                     or self._string_at(0, 9, "RICHELIEU")
+                     or (self._string_at(0, 5, "CHISM") and (self._length == 5))
+                     or self._string_at(0, 6, "MICHEL")))
+               # include e.g. "chorus", "chyme", "chaos"
+             or (self._string_at(self._current, 4, "CHOR", "CHOL", "CHYM", "CHYL", "CHLO", "CHOS", "CHUS", "CHOE")
+                     and not self._string_at(0, 6, "CHOLLO", "CHOLLA", "CHORIZ"))
+               # "chaos" => K but not "chao"
+             or (self._string_at(self._current, 4, "CHAO") and ((self._current + 3) != self._last))
+               # e.g. "abranchiate"
+             or (self._string_at(self._current, 4, "CHIA") and not (self._string_at(0, 10, "APPALACHIA") or self._string_at(0, 7, "CHIAPAS")))
+               # e.g. "chimera"
+             or self._string_at(self._current, 7, "CHIMERA", "CHIMAER", "CHIMERI")
+               # e.g. "chameleon"
+             or ((self._current == 0) and self._string_at(self._current, 5, "CHAME", "CHELO", "CHITO"))
+               # e.g. "spirochete"
+             or ((((self._current + 4) == self._last) or ((self._current + 5) == self._last)) and self._string_at((self._current - 1), 6, "OCHETE")))
+               # more exceptions where "-CH-" => X e.g. "chortle", "crocheter"
+                 and not ((self._string_at(0, 5, "CHORE", "CHOLO", "CHOLA") and (self._length == 5))
+                     or self._string_at(self._current, 5, "CHORT", "CHOSE")
+                     or self._string_at((self._current - 3), 7, "CROCHET")
+                     or self._string_at(0, 7, "CHEMISE", "CHARISE", "CHARISS", "CHAROLE"))):
+            # "CHR/L-" e.g. 'christ', 'chlorine' do not get
+            # alt pronunciation of 'X'
+            if (self._string_at((self._current + 2), 1, "R", "L")
+                     or self._slavo_germanic()):
+                self._metaph_add("K")
+            else:
+                self._metaph_add_with_alt("K", "X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_greek_ch_non_initial(self):
+        """
+        Encode a variety of greek and some german roots where "-CH-" => K
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # greek & other roots e.g. 'tachometer', 'orchid', ch in middle or end of root
+        if (self._string_at((self._current - 2), 6, "ORCHID", "NICHOL", "MECHAN", "LICHEN", "MACHIC", "PACHEL", "RACHIF", "RACHID",
+                                         "RACHIS", "RACHIC", "MICHAL")
+             or self._string_at((self._current - 3), 5, "MELCH", "GLOCH", "TRACH", "TROCH", "BRACH", "SYNCH", "PSYCH",
+                                             "STICH", "PULCH", "EPOCH")
+             or (self._string_at((self._current - 3), 5, "TRICH") and not self._string_at((self._current - 5), 7, "OSTRICH"))
+             or (self._string_at((self._current - 2), 4, "TYCH", "TOCH", "BUCH", "MOCH", "CICH", "DICH", "NUCH", "EICH", "LOCH",
+                                              "DOCH", "ZECH", "WYCH")
+                 and not (self._string_at((self._current - 4), 9, "INDOCHINA") or self._string_at((self._current - 2), 6, "BUCHON")))
+             or self._string_at((self._current - 2), 5, "LYCHN", "TACHO", "ORCHO", "ORCHI", "LICHO")
+             or (self._string_at((self._current - 1), 5, "OCHER", "ECHIN", "ECHID") and ((self._current == 1) or (self._current == 2)))
+             or self._string_at((self._current - 4), 6, "BRONCH", "STOICH", "STRYCH", "TELECH", "PLANCH", "CATECH", "MANICH", "MALACH",
+                                             "BIANCH", "DIDACH")
+             or (self._string_at((self._current - 1), 4, "ICHA", "ICHN") and (self._current == 1))
+             or self._string_at((self._current - 2), 8, "ORCHESTR")
+             or self._string_at((self._current - 4), 8, "BRANCHIO", "BRANCHIF")
+             or (self._string_at((self._current - 1), 5, "ACHAB", "ACHAD", "ACHAN", "ACHAZ")
+                 and not self._string_at((self._current - 2), 7, "MACHADO", "LACHANC"))
+             or self._string_at((self._current - 1), 6, "ACHISH", "ACHILL", "ACHAIA", "ACHENE")
+             or self._string_at((self._current - 1), 7, "ACHAIAN", "ACHATES", "ACHIRAL", "ACHERON")
+             or self._string_at((self._current - 1), 8, "ACHILLEA", "ACHIMAAS", "ACHILARY", "ACHELOUS", "ACHENIAL", "ACHERNAR")
+             or self._string_at((self._current - 1), 9, "ACHALASIA", "ACHILLEAN", "ACHIMENES")
+             or self._string_at((self._current - 1), 10, "ACHIMELECH", "ACHITOPHEL")
+               # e.g. 'inchoate'
+             or (((self._current - 2) == 0) and (self._string_at((self._current - 2), 6, "INCHOA")
+               # e.g. 'ischemia'
+             or self._string_at(0, 4, "ISCH")))
+               # e.g. 'ablimelech', 'antioch', 'pentateuch'
+             or (((self._current + 1) == self._last) and self._string_at((self._current - 1), 1, "A", "O", "U", "E")
+                 and not (self._string_at(0, 7, "DEBAUCH")
+                         or self._string_at((self._current - 2), 4, "MUCH", "SUCH", "KOCH")
+                         or self._string_at((self._current - 5), 7, "OODRICH", "ALDRICH")))):
+            self._metaph_add_with_alt("K", "X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_ccia(self):
+        """
+        Encodes reliably italian "-CCIA-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g., 'focaccia'
+        if self._string_at((self._current + 1), 3, "CIA"):
+            self._metaph_add_with_alt("X", "S")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_cc(self):
+        """
+        Encode "-CC-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # double 'C', but not if e.g. 'McClellan'
+        if self._string_at(self._current, 2, "CC") and not ((self._current == 1) and (self._char_at(0) == "M")):
+            # exception
+            if self._string_at((self._current - 3), 7, "FLACCID"):
+                self._metaph_add("S")
+                self._advance_counter(3, 2)
+                return True
+
+            # 'bacci', 'bertucci', other italian
+            if ((((self._current + 2) == self._last) and self._string_at((self._current + 2), 1, "I"))
+                 or self._string_at((self._current + 2), 2, "IO")
+                 or (((self._current + 4) == self._last) and self._string_at((self._current + 2), 3, "INO", "INI"))):
+                self._metaph_add("X")
+                self._advance_counter(3, 2)
+                return True
+
+            # 'accident', 'accede' 'succeed'
+            if (self._string_at((self._current + 2), 1, "I", "E", "Y")
+                   # except 'bellocchio','bacchus', 'soccer' get K
+                 and not ((self._char_at(self._current + 2) == "H")
+                     or self._string_at((self._current - 2), 6, "SOCCER"))):
+                self._metaph_add("KS")
+                self._advance_counter(3, 2)
+                return True
+            else:
+                # Pierce's rule
+                self._metaph_add("K")
+                self._current += 2
+                return True
+
+        return False
+
+    def _encode_ck_cg_cq(self):
+        """
+        Encode cases where the consonant following "C" is redundant
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "CK", "CG", "CQ"):
+            # eastern european spelling e.g. 'gorecki' == 'goresky'
+            if (self._string_at(self._current, 3, "CKI", "CKY")
+                 and ((self._current + 2) == self._last)
+                 and (self._length > 6)):
+                self._metaph_add_with_alt("K", "SK")
+            else:
+                self._metaph_add("K")
+            self._current += 2
+
+            if self._string_at(self._current, 1, "K", "G", "Q"):
+                self._current += 1
+            return True
+
+        return False
+
+    def _encode_c_front_vowel(self):
+        """
+        Encode cases where "C" preceeds a front vowel such as "E", "I", or "Y".
+        These cases most likely => S or X
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "CI", "CE", "CY"):
+            if (self._encode_british_silent_ce()
+                 or self._encode_ce()
+                 or self._encode_ci()
+                 or self._encode_latinate_suffixes()):
+                self._advance_counter(2, 1)
+                return True
+
+            self._metaph_add("S")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_british_silent_ce(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # english place names like e.g.'gloucester' pronounced glo-ster
+        if ((self._string_at((self._current + 1), 5, "ESTER") and ((self._current + 5) == self._last))
+             or self._string_at((self._current + 1), 10, "ESTERSHIRE")):
+            return True
+
+        return False
+
+    def _encode_ce(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'ocean', 'commercial', 'provincial', 'cello', 'fettucini', 'medici'
+        if ((self._string_at((self._current + 1), 3, "EAN") and self._is_vowel(self._current - 1))
+               # e.g. 'rosacea'
+             or (self._string_at((self._current - 1), 4, "ACEA")
+                 and ((self._current + 2) == self._last)
+                 and not self._string_at(0, 7, "PANACEA"))
+               # e.g. 'botticelli', 'concerto'
+             or self._string_at((self._current + 1), 4, "ELLI", "ERTO", "EORL")
+               # some italian names familiar to americans
+             or (self._string_at((self._current - 3), 5, "CROCE") and ((self._current + 1) == self._last))
+             or self._string_at((self._current - 3), 5, "DOLCE")
+             or self._string_at((self._current - 5), 7, "VERSACE")
+               # e.g. 'cello'
+             or (self._string_at((self._current + 1), 4, "ELLO")
+                 and ((self._current + 4) == self._last))):
+            self._metaph_add_with_alt("X", "S")
+            return True
+
+        return False
+
+    def _encode_ci(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # with consonant before C
+        # e.g. 'fettucini', but exception for the americanized pronunciation of 'mancini'
+        if (((self._string_at((self._current + 1), 3, "INI") and not self._string_at(0, 7, "MANCINI")) and ((self._current + 3) == self._last))
+               # e.g. 'medici'
+             or (self._string_at((self._current - 1), 3, "ICI") and ((self._current + 1) == self._last))
+               # e.g. "commercial', 'provincial', 'cistercian'
+             or self._string_at((self._current - 1), 5, "RCIAL", "NCIAL", "RCIAN", "UCIUS")
+               # special cases
+             or self._string_at((self._current - 3), 6, "MARCIA")
+             or self._string_at((self._current - 2), 7, "ANCIENT")):
+            self._metaph_add_with_alt("X", "S")
+            return True
+
+        # with vowel before C (or at beginning?)
+        if (((self._string_at(self._current, 3, "CIO", "CIE", "CIA")
+             and self._is_vowel(self._current - 1))
+               # e.g. "ciao"
+             or self._string_at((self._current + 1), 3, "IAO"))
+             and not self._string_at((self._current - 4), 8, "COERCION")):
+            if ((self._string_at(self._current, 4, "CIAN", "CIAL", "CIAO", "CIES", "CIOL", "CION")
+                   # exception - "glacier" => 'X' but "spacier" = > 'S'
+                 or self._string_at((self._current - 3), 7, "GLACIER")
+                 or self._string_at(self._current, 5, "CIENT", "CIENC", "CIOUS", "CIATE", "CIATI", "CIATO", "CIABL", "CIARY")
+                 or (((self._current + 2) == self._last) and self._string_at(self._current, 3, "CIA", "CIO"))
+                 or (((self._current + 3) == self._last) and self._string_at(self._current, 4, "CIAS", "CIOS")))
+                   # exceptions
+                 and not (self._string_at((self._current - 4), 11, "ASSOCIATION")
+                     or self._string_at(0, 4, "OCIE")
+                       # exceptions mostly because these names are usually from
+                       # the spanish rather than the italian in america
+                     or self._string_at((self._current - 2), 5, "LUCIO")
+                     or self._string_at((self._current - 2), 6, "MACIAS")
+                     or self._string_at((self._current - 3), 6, "GRACIE", "GRACIA")
+                     or self._string_at((self._current - 2), 7, "LUCIANO")
+                     or self._string_at((self._current - 3), 8, "MARCIANO")
+                     or self._string_at((self._current - 4), 7, "PALACIO")
+                     or self._string_at((self._current - 4), 9, "FELICIANO")
+                     or self._string_at((self._current - 5), 9, "JUSTICIAR")
+                     or self._string_at((self._current - 5), 8, "MAURICIO")
+                     or self._string_at((self._current - 7), 11, "ENCARNACION")
+                     or self._string_at((self._current - 4), 8, "POLICIES")
+                     or self._string_at((self._current - 2), 8, "HACIENDA")
+                     or self._string_at((self._current - 6), 9, "ANDALUCIA")
+                     or self._string_at((self._current - 2), 5, "SOCIO", "SOCIE"))):
+                self._metaph_add_with_alt("X", "S")
+            else:
+                self._metaph_add_with_alt("S", "X")
+
+            return True
+
+        # exception
+        if self._string_at((self._current - 4), 8, "COERCION"):
+            self._metaph_add("J")
+            return True
+
+        return False
+
+    def _encode_latinate_suffixes(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at((self._current + 1), 4, "EOUS", "IOUS"):
+            self._metaph_add_with_alt("X", "S")
+            return True
+
+        return False
+
+    def _encode_silent_c(self):
+        """
+        Encodes some exceptions where "C" is silent
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at((self._current + 1), 1, "T", "S"):
+            if (self._string_at(0, 11, "CONNECTICUT")
+                or self._string_at(0, 6, "INDICT", "TUCSON")):
+                self._current += 1
+                return True
+
+        return False
+
+    def _encode_cz(self):
+        """
+        Encodes slavic spellings or transliterations
+        written as "-CZ-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (self._string_at((self._current + 1), 1, "Z")
+             and not self._string_at((self._current - 1), 6, "ECZEMA")):
+            if self._string_at(self._current, 4, "CZAR"):
+                self._metaph_add("S")
+            else:
+                # otherwise most likely a czech word...
+                self._metaph_add("X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_cs(self):
+        """
+        "-CS" special cases
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # give an 'etymological' 2nd
+        # encoding for "kovacs" so
+        # that it matches "kovach"
+        if self._string_at(0, 6, "KOVACS"):
+            self._metaph_add_with_alt("KS", "X")
+            self._current += 2
+            return True
+
+        if (self._string_at((self._current - 1), 3, "ACS")
+             and ((self._current + 1) == self._last)
+             and not self._string_at((self._current - 4), 6, "ISAACS")):
+            self._metaph_add("X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_d(self):
+        """
+        Encode "-D-"
+        """
+        if (self._encode_dg()
+             or self._encode_dj()
+             or self._encode_dt_dd()
+             or self._encode_d_to_j()
+             or self._encode_dous()
+             or self._encode_silent_d()):
+            return
+
+        if self.encode_exact:
+            # "final de-voicing" in this case
+            # e.g. 'missed' == 'mist'
+            if ((self._current == self._last)
+                 and self._string_at((self._current - 3), 4, "SSED")):
+                self._metaph_add("T")
+            else:
+                self._metaph_add("D")
+        else:
+            self._metaph_add("T")
+        self._current += 1
+
+    def _encode_dg(self):
+        """
+        Encode "-DG-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "DG"):
+            # excludes exceptions e.g. 'edgar',
+            # or cases where 'g' is first letter of combining form
+            # e.g. 'handgun', 'waldglas'
+            if (self._string_at((self._current + 2), 1, "A", "O")
+                   # e.g. "midgut"
+                 or self._string_at((self._current + 1), 3, "GUN", "GUT")
+                   # e.g. "handgrip"
+                 or self._string_at((self._current + 1), 4, "GEAR", "GLAS", "GRIP", "GREN", "GILL", "GRAF")
+                   # e.g. "mudgard"
+                 or self._string_at((self._current + 1), 5, "GUARD", "GUILT", "GRAVE", "GRASS")
+                   # e.g. "woodgrouse"
+                 or self._string_at((self._current + 1), 6, "GROUSE")):
+                self._metaph_add_exact_approx("DG", "TK")
+            else:
+                # e.g. "edge", "abridgment"
+                self._metaph_add("J")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_dj(self):
+        """
+        Encode "-DJ-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "adjacent"
+        if self._string_at(self._current, 2, "DJ"):
+            self._metaph_add("J")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_dt_dd(self):
+        """
+        Encode "-DD-" and "-DT-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # eat redundant 'T' or 'D'
+        if self._string_at(self._current, 2, "DT", "DD"):
+            if self._string_at(self._current, 3, "DTH"):
+                self._metaph_add_exact_approx("D0", "T0")
+                self._current += 3
+            else:
+                if self.encode_exact:
+                    # devoice it
+                    if self._string_at(self._current, 2, "DT"):
+                        self._metaph_add("T")
+                    else:
+                        self._metaph_add("D")
+                else:
+                    self._metaph_add("T")
+                self._current += 2
+            return True
+
+        return False
+
+    def _encode_d_to_j(self):
+        """
+        Encode cases where "-DU-" "-DI-", and "-DI-" => J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "module", "adulate"
+        if ((self._string_at(self._current, 3, "DUL")
+                 and (self._is_vowel(self._current - 1) and self._is_vowel(self._current + 3)))
+               # e.g. "soldier", "grandeur", "procedure"
+             or (((self._current + 3) == self._last)
+                 and self._string_at((self._current - 1), 5, "LDIER", "NDEUR", "EDURE", "RDURE"))
+             or self._string_at((self._current - 3), 7, "CORDIAL")
+               # e.g.  "pendulum", "education"
+             or self._string_at((self._current - 1), 5, "NDULA", "NDULU", "EDUCA")
+               # e.g. "individual", "individual", "residuum"
+             or self._string_at((self._current - 1), 4, "ADUA", "IDUA", "IDUU")):
+            self._metaph_add_exact_approx4("J", "D", "J", "T")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_dous(self):
+        """
+        Encode latinate suffix "-DOUS" where 'D' is pronounced as J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "assiduous", "arduous"
+        if self._string_at((self._current + 1), 4, "UOUS"):
+            self._metaph_add_exact_approx4("J", "D", "J", "T")
+            self._advance_counter(4, 1)
+            return True
+
+        return False
+
+    def _encode_silent_d(self):
+        """
+        Encode silent "-D-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # silent 'D' e.g. 'wednesday', 'handsome'
+        if (self._string_at((self._current - 2), 9, "WEDNESDAY")
+             or self._string_at((self._current - 3), 7, "HANDKER", "HANDSOM", "WINDSOR")
+               # french silent D at end in words or names familiar to americans
+             or self._string_at((self._current - 5), 6, "PERNOD", "ARTAUD", "RENAUD")
+             or self._string_at((self._current - 6), 7, "RIMBAUD", "MICHAUD", "BICHAUD")
+             or self._string_at((self._current + 1), 2, "ZH")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_f(self):
+        """
+        Encode "-F-"
+        """
+        # Encode cases where "-FT-" => "T" is usually silent
+        # e.g. 'often', 'soften'
+        # This should really be covered under "T"!
+        if self._string_at((self._current - 1), 5, "OFTEN"):
+            self._metaph_add_with_alt("F", "FT")
+            self._current += 2
+            return
+
+        # eat redundant 'F'
+        if self._char_at(self._current + 1) == "F":
+            self._current += 2
+        else:
+            self._current += 1
+
+        self._metaph_add("F")
+
+    def _encode_g(self):
+        """
+        Encode "-G-"
+        """
+        if (self._encode_silent_g_at_beginning()
+             or self._encode_gg()
+             or self._encode_gk()
+             or self._encode_gh()
+             or self._encode_silent_g()
+             or self._encode_gn()
+             or self._encode_gl()
+             or self._encode_initial_g_front_vowel()
+             or self._encode_nger()
+             or self._encode_ger()
+             or self._encode_gel()
+             or self._encode_non_initial_g_front_vowel()
+             or self._encode_ga_to_j()):
+            return
+
+        if not self._string_at((self._current - 1), 1, "C", "K", "G", "Q"):
+            self._metaph_add_exact_approx("G", "K")
+
+        self._current += 1
+
+    def _encode_silent_g_at_beginning(self):
+        """
+        Encode cases where 'G' is silent at beginning of word
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # skip these when at start of word
+        if ((self._current == 0)
+             and self._string_at(self._current, 2, "GN")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_gg(self):
+        """
+        Encode "-GG-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._char_at(self._current + 1) == "G":
+            # italian e.g, 'loggia', 'caraveggio', also 'suggest' and 'exaggerate'
+            if (self._string_at((self._current - 1), 5, "AGGIA", "OGGIA", "AGGIO", "EGGIO", "EGGIA", "IGGIO")
+                   # 'ruggiero' but not 'snuggies'
+                 or (self._string_at((self._current - 1), 5, "UGGIE") and not (((self._current + 3) == self._last) or ((self._current + 4) == self._last)))
+                 or (((self._current + 2) == self._last) and self._string_at((self._current - 1), 4, "AGGI", "OGGI"))
+                 or self._string_at((self._current - 2), 6, "SUGGES", "XAGGER", "REGGIE")):
+                # expection where "-GG-" => KJ
+                if self._string_at((self._current - 2), 7, "SUGGEST"):
+                    self._metaph_add_exact_approx("G", "K")
+
+                self._metaph_add("J")
+                self._advance_counter(3, 2)
+            else:
+                self._metaph_add_exact_approx("G", "K")
+                self._current += 2
+            return True
+
+        return False
+
+    def _encode_gk(self):
+        """
+        Encode "-GK-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'gingko'
+        if self._char_at(self._current + 1) == "K":
+            self._metaph_add("K")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_gh(self):
+        """
+        Encode "-GH-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._char_at(self._current + 1) == "H":
+            if (self._encode_gh_after_consonant()
+                 or self._encode_initial_gh()
+                 or self._encode_gh_to_j()
+                 or self._encode_gh_to_h()
+                 or self._encode_ught()
+                 or self._encode_gh_h_part_of_other_word()
+                 or self._encode_silent_gh()
+                 or self._encode_gh_to_f()):
+                return True
+
+            self._metaph_add_exact_approx("G", "K")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_gh_after_consonant(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. 'burgher', 'bingham'
+        if ((self._current > 0)
+             and not self._is_vowel(self._current - 1)
+               # not e.g. 'greenhalgh'
+             and not (self._string_at((self._current - 3), 5, "HALGH")
+                     and ((self._current + 1) == self._last))):
+            self._metaph_add_exact_approx("G", "K")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_initial_gh(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._current < 3:
+            # e.g. "ghislane", "ghiradelli"
+            if self._current == 0:
+                if self._char_at(self._current + 2) == "I":
+                    self._metaph_add("J")
+                else:
+                    self._metaph_add_exact_approx("G", "K")
+                self._current += 2
+                return True
+
+        return False
+
+    def _encode_gh_to_j(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g., 'greenhalgh', 'dunkenhalgh', english names
+        if self._string_at((self._current - 2), 4, "ALGH") and ((self._current + 1) == self._last):
+            self._metaph_add_with_alt("J", "")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_gh_to_h(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # special cases
+        # e.g., 'donoghue', 'donaghy'
+        if ((self._string_at((self._current - 4), 4, "DONO", "DONA") and self._is_vowel(self._current + 2))
+             or self._string_at((self._current - 5), 9, "CALLAGHAN")):
+            self._metaph_add("H")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_ught(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "ought", "aught", "daughter", "slaughter"
+        if self._string_at((self._current - 1), 4, "UGHT"):
+            if ((self._string_at((self._current - 3), 5, "LAUGH")
+                and not (self._string_at((self._current - 4), 7, "SLAUGHT")
+                    or self._string_at((self._current - 3), 7, "LAUGHTO")))
+                    or self._string_at((self._current - 4), 6, "DRAUGH")):
+                self._metaph_add("FT")
+            else:
+                self._metaph_add("T")
+            self._current += 3
+            return True
+
+        return False
+
+    def _encode_gh_h_part_of_other_word(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # if the 'H' is the beginning of another word or syllable
+        if self._string_at((self._current + 1), 4, "HOUS", "HEAD", "HOLE", "HORN", "HARN"):
+            self._metaph_add_exact_approx("G", "K")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_silent_gh(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # Parker's rule (with some further refinements) - e.g., 'hugh'
+        if (((((self._current > 1) and self._string_at((self._current - 2), 1, "B", "H", "D", "G", "L"))
+               # e.g., 'bough'
+             or ((self._current > 2)
+                 and self._string_at((self._current - 3), 1, "B", "H", "D", "K", "W", "N", "P", "V")
+                 and not self._string_at(0, 6, "ENOUGH"))
+               # e.g., 'broughton'
+             or ((self._current > 3) and self._string_at((self._current - 4), 1, "B", "H"))
+               # 'plough', 'slaugh'
+             or ((self._current > 3) and self._string_at((self._current - 4), 2, "PL", "SL"))
+             or ((self._current > 0)
+                       # 'sigh', 'light'
+                     and ((self._char_at(self._current - 1) == "I")
+                         or self._string_at(0, 4, "PUGH")
+                           # e.g. 'MCDONAGH', 'MURTAGH', 'CREAGH'
+                         or (self._string_at((self._current - 1), 3, "AGH")
+                                 and ((self._current + 1) == self._last))
+                         or self._string_at((self._current - 4), 6, "GERAGH", "DRAUGH")
+                         or (self._string_at((self._current - 3), 5, "GAUGH", "GEOGH", "MAUGH")
+                                 and not self._string_at(0, 9, "MCGAUGHEY"))
+                           # exceptions to 'tough', 'rough', 'lough'
+                         or (self._string_at((self._current - 2), 4, "OUGH")
+                                 and (self._current > 3)
+                                 and not self._string_at((self._current - 4), 6, "CCOUGH", "ENOUGH", "TROUGH", "CLOUGH")))))
+               # suffixes starting w/ vowel where "-GH-" is usually silent
+             and (self._string_at((self._current - 3), 5, "VAUGH", "FEIGH", "LEIGH")
+                 or self._string_at((self._current - 2), 4, "HIGH", "TIGH")
+                 or ((self._current + 1) == self._last)
+                 or (self._string_at((self._current + 2), 2, "IE", "EY", "ES", "ER", "ED", "TY")
+                     and ((self._current + 3) == self._last)
+                     and not self._string_at((self._current - 5), 9, "GALLAGHER"))
+                 or (self._string_at((self._current + 2), 1, "Y") and ((self._current + 2) == self._last))
+                 or (self._string_at((self._current + 2), 3, "ING", "OUT") and ((self._current + 4) == self._last))
+                 or (self._string_at((self._current + 2), 4, "ERTY") and ((self._current + 5) == self._last))
+                 or (not self._is_vowel(self._current + 2)
+                         or self._string_at((self._current - 3), 5, "GAUGH", "GEOGH", "MAUGH")
+                         or self._string_at((self._current - 4), 8, "BROUGHAM"))))
+               # exceptions where '-g-' pronounced
+             and not (self._string_at(0, 6, "BALOGH", "SABAGH")
+                 or self._string_at((self._current - 2), 7, "BAGHDAD")
+                 or self._string_at((self._current - 3), 5, "WHIGH")
+                 or self._string_at((self._current - 5), 7, "SABBAGH", "AKHLAGH"))):
+            # silent - do nothing
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_gh_special_cases(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        handled = False
+
+        # special case: 'hiccough' == 'hiccup'
+        if self._string_at((self._current - 6), 8, "HICCOUGH"):
+            self._metaph_add("P")
+            handled = True
+        # special case: 'lough' alt spelling for scots 'loch'
+        elif self._string_at(0, 5, "LOUGH"):
+            self._metaph_add("K")
+            handled = True
+        # hungarian
+        elif self._string_at(0, 6, "BALOGH"):
+            self._metaph_add_exact_approx4("G", "", "K", "")
+            handled = True
+        # "maclaughlin"
+        elif self._string_at((self._current - 3), 8, "LAUGHLIN", "COUGHLAN", "LOUGHLIN"):
+            self._metaph_add_with_alt("K", "F")
+            handled = True
+        elif (self._string_at((self._current - 3), 5, "GOUGH")
+            or self._string_at((self._current - 7), 9, "COLCLOUGH")):
+            self._metaph_add_with_alt("", "F")
+            handled = True
+
+        if handled:
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_gh_to_f(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # the cases covered here would fall under
+        # the GH_To_F rule below otherwise
+        if self._encode_gh_special_cases():
+            return True
+        else:
+            # e.g., 'laugh', 'cough', 'rough', 'tough'
+            if ((self._current > 2)
+                 and (self._char_at(self._current - 1) == "U")
+                 and self._is_vowel(self._current - 2)
+                 and self._string_at((self._current - 3), 1, "C", "G", "L", "R", "T", "N", "S")
+                 and not self._string_at((self._current - 4), 8, "BREUGHEL", "FLAUGHER")):
+                self._metaph_add("F")
+                self._current += 2
+                return True
+
+        return False
+
+    def _encode_silent_g(self):
+        """
+        Encode some contexts where "g" is silent
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "phlegm", "apothegm", "voigt"
+        if ((((self._current + 1) == self._last)
+             and (self._string_at((self._current - 1), 3, "EGM", "IGM", "AGM")
+                 or self._string_at(self._current, 2, "GT")))
+             or (self._string_at(0, 5, "HUGES") and (self._length == 5))):
+            self._current += 1
+            return True
+
+        # vietnamese names special cases
+        if ((self._string_at(0, 6, "NGUYEN", "NGHIEM", "NGUYET") and (self._length == 6))
+             or (self._string_at(0, 4, "NGOC", "NGAN") and (self._length == 4))):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_gn(self):
+        """
+        ENcode "-GN-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._char_at(self._current + 1) == "N":
+            # 'align' 'sign', 'resign' but not 'resignation'
+            # also 'impugn', 'impugnable', but not 'repugnant'
+            if (((self._current > 1)
+                 and ((self._string_at((self._current - 1), 1, "I", "U", "E")
+                     or self._string_at((self._current - 3), 9, "LORGNETTE")
+                     or self._string_at((self._current - 2), 9, "LAGNIAPPE")
+                     or self._string_at((self._current - 2), 6, "COGNAC")
+                     or self._string_at((self._current - 3), 7, "CHAGNON")
+                     or self._string_at((self._current - 5), 9, "COMPAGNIE")
+                     or self._string_at((self._current - 4), 6, "BOLOGN"))
+                   # Exceptions: following are cases where 'G' is pronounced
+                   # in "assign" 'g' is silent, but not in "assignation"
+                 and not (self._string_at((self._current + 2), 5, "ATION")
+                     or self._string_at((self._current + 2), 4, "ATOR")
+                     or self._string_at((self._current + 2), 3, "ATE", "ITY")
+                   # exception to exceptions, not pronounced:
+                 or (self._string_at((self._current + 2), 2, "AN", "AC", "IA", "UM")
+                     and not (self._string_at((self._current - 3), 8, "POIGNANT")
+                         or self._string_at((self._current - 2), 6, "COGNAC")))
+                 or self._string_at(0, 7, "SPIGNER", "STEGNER")
+                 or (self._string_at(0, 5, "SIGNE") and (self._length == 5))
+                 or self._string_at((self._current - 2), 5, "LIGNI", "LIGNO", "REGNA", "DIGNI", "WEGNE",
+                                                 "TIGNE", "RIGNE", "REGNE", "TIGNO")
+                 or self._string_at((self._current - 2), 6, "SIGNAL", "SIGNIF", "SIGNAT")
+                 or self._string_at((self._current - 1), 5, "IGNIT"))
+                 and not self._string_at((self._current - 2), 6, "SIGNET", "LIGNEO")))
+                   # not e.g. 'cagney', 'magna'
+                 or (((self._current + 2) == self._last)
+                         and self._string_at(self._current, 3, "GNE", "GNA")
+                         and not self._string_at((self._current - 2), 5, "SIGNA", "MAGNA", "SIGNE"))):
+                self._metaph_add_exact_approx4("N", "GN", "N", "KN")
+            else:
+                self._metaph_add_exact_approx("GN", "KN")
+            self._current += 2
+            return True
+        return False
+
+    def _encode_gl(self):
+        """
+        Encode "-GL-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'tagliaro', 'puglia' BUT add K in alternative
+        # since americans sometimes do this
+        if (self._string_at((self._current + 1), 3, "LIA", "LIO", "LIE")
+             and self._is_vowel(self._current - 1)):
+            self._metaph_add_exact_approx4("L", "GL", "L", "KL")
+            self._current += 2
+            return True
+
+        return False
+
+    def _initial_g_soft(self):
+        """
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (((self._string_at((self._current + 1), 2, "EL", "EM", "EN", "EO", "ER", "ES", "IA", "IN", "IO", "IP", "IU", "YM", "YN", "YP", "YR", "EE")
+                 or self._string_at((self._current + 1), 3, "IRA", "IRO"))
+               # except for smaller set of cases where => K, e.g. "gerber"
+             and not (self._string_at((self._current + 1), 3, "ELD", "ELT", "ERT", "INZ", "ERH", "ITE", "ERD", "ERL", "ERN",
+                                               "INT", "EES", "EEK", "ELB", "EER")
+                     or self._string_at((self._current + 1), 4, "ERSH", "ERST", "INSB", "INGR", "EROW", "ERKE", "EREN")
+                     or self._string_at((self._current + 1), 5, "ELLER", "ERDIE", "ERBER", "ESUND", "ESNER", "INGKO", "INKGO",
+                                                     "IPPER", "ESELL", "IPSON", "EEZER", "ERSON", "ELMAN")
+                     or self._string_at((self._current + 1), 6, "ESTALT", "ESTAPO", "INGHAM", "ERRITY", "ERRISH", "ESSNER", "ENNADI", "ENNADY", "ENGLER")
+                     or self._string_at((self._current + 1), 7, "YNAECOL", "YNECOLO", "ENTHNER", "ERAGHTY")
+                     or self._string_at((self._current + 1), 8, "INGERICH", "EOGHEGAN")))
+             or (self._is_vowel(self._current + 1)
+                 and (self._string_at((self._current + 1), 3, "EE ", "EEW")
+                         or (self._string_at((self._current + 1), 3, "IGI", "IRA", "IBE", "AOL", "IDE", "IGL")
+                                                         and not self._string_at((self._current + 1), 5, "IDEON"))
+                     or self._string_at((self._current + 1), 4, "ILES", "INGI", "ISEL")
+                     or (self._string_at((self._current + 1), 5, "INGER") and not self._string_at((self._current + 1), 8, "INGERICH"))
+                     or self._string_at((self._current + 1), 5, "IBBER", "IBBET", "IBLET", "IBRAN", "IGOLO", "IRARD", "IGANT")
+                     or self._string_at((self._current + 1), 6, "IRAFFE", "EEWHIZ")
+                     or self._string_at((self._current + 1), 7, "ILLETTE", "IBRALTA")))):
+            return True
+
+        return False
+
+    def _encode_initial_g_front_vowel(self):
+        """
+        Encode cases where 'G' is at start of word followed
+        by a "front" vowel e.g. 'E', 'I', 'Y'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'g' followed by vowel at beginning
+        if (self._current == 0) and self._front_vowel(self._current + 1):
+            # special case "gila" as in "gila monster"
+            if (self._string_at((self._current + 1), 3, "ILA")
+                 and (self._length == 4)):
+                self._metaph_add("H")
+            elif self._initial_g_soft():
+                self._metaph_add_exact_approx4("J", "G", "J", "K")
+            else:
+                # only code alternate 'J' if front vowel
+                if (self._char_at(self._current + 1) == "E") or (self._char_at(self._current + 1) == "I"):
+                    self._metaph_add_exact_approx4("G", "J", "K", "J")
+                else:
+                    self._metaph_add_exact_approx("G", "K")
+
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_nger(self):
+        """
+        Encode "-NGER-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if ((self._current > 1)
+             and self._string_at((self._current - 1), 4, "NGER")):
+            # default 'G' => J  such as 'ranger', 'stranger', 'manger', 'messenger', 'orangery', 'granger'
+            # 'boulanger', 'challenger', 'danger', 'changer', 'harbinger', 'lounger', 'ginger', 'passenger'
+            # except for these the following
+            if (not (self._root_or_inflections(self._word, "ANGER")
+                 or self._root_or_inflections(self._word, "LINGER")
+                 or self._root_or_inflections(self._word, "MALINGER")
+                 or self._root_or_inflections(self._word, "FINGER")
+                 or (self._string_at((self._current - 3), 4, "HUNG", "FING", "BUNG", "WING", "RING", "DING", "ZENG",
+                                                  "ZING", "JUNG", "LONG", "PING", "CONG", "MONG", "BANG",
+                                                  "GANG", "HANG", "LANG", "SANG", "SING", "WANG", "ZANG")
+                       # exceptions to above where 'G' => J
+                     and not (self._string_at((self._current - 6), 7, "BOULANG", "SLESING", "KISSING", "DERRING")
+                             or self._string_at((self._current - 8), 9, "SCHLESING")
+                             or self._string_at((self._current - 5), 6, "SALING", "BELANG")
+                             or self._string_at((self._current - 6), 7, "BARRING")
+                             or self._string_at((self._current - 6), 9, "PHALANGER")
+                             or self._string_at((self._current - 4), 5, "CHANG")))
+                 or self._string_at((self._current - 4), 5, "STING", "YOUNG")
+                 or self._string_at((self._current - 5), 6, "STRONG")
+                 or self._string_at(0, 3, "UNG", "ENG", "ING")
+                 or self._string_at(self._current, 6, "GERICH")
+                 or self._string_at(0, 6, "SENGER")
+                 or self._string_at((self._current - 3), 6, "WENGER", "MUNGER", "SONGER", "KINGER")
+                 or self._string_at((self._current - 4), 7, "FLINGER", "SLINGER", "STANGER", "STENGER", "KLINGER", "CLINGER")
+                 or self._string_at((self._current - 5), 8, "SPRINGER", "SPRENGER")
+                 or self._string_at((self._current - 3), 7, "LINGERF")
+                 or self._string_at((self._current - 2), 7, "ANGERLY", "ANGERBO", "INGERSO"))):
+                self._metaph_add_exact_approx4("J", "G", "J", "K")
+            else:
+                self._metaph_add_exact_approx4("G", "J", "K", "J")
+
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_ger(self):
+        """
+        Encode "-GER-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if ((self._current > 0)
+             and self._string_at((self._current + 1), 2, "ER")):
+            # Exceptions to 'GE' where 'G' => K
+            # e.g. "JAGER", "TIGER", "LIGER", "LAGER", "LUGER", "AUGER", "EAGER", "HAGER", "SAGER"
+            if ((((self._current == 2) and self._is_vowel(self._current - 1) and not self._is_vowel(self._current - 2)
+                     and not (self._string_at((self._current - 2), 5, "PAGER", "WAGER", "NIGER", "ROGER", "LEGER", "CAGER"))
+                 or self._string_at((self._current - 2), 5, "AUGER", "EAGER", "INGER", "YAGER"))
+                 or self._string_at((self._current - 3), 6, "SEEGER", "JAEGER", "GEIGER", "KRUGER", "SAUGER", "BURGER",
+                                                 "MEAGER", "MARGER", "RIEGER", "YAEGER", "STEGER", "PRAGER", "SWIGER",
+                                                 "YERGER", "TORGER", "FERGER", "HILGER", "ZEIGER", "YARGER",
+                                                 "COWGER", "CREGER", "KROGER", "KREGER", "GRAGER", "STIGER", "BERGER")
+                   # 'berger' but not 'bergerac'
+                 or (self._string_at((self._current - 3), 6, "BERGER") and ((self._current + 2) == self._last))
+                 or self._string_at((self._current - 4), 7, "KREIGER", "KRUEGER", "METZGER", "KRIEGER", "KROEGER", "STEIGER",
+                                                 "DRAEGER", "BUERGER", "BOERGER", "FIBIGER")
+                   # e.g. 'harshbarger', 'winebarger'
+                 or (self._string_at((self._current - 3), 6, "BARGER") and (self._current > 4))
+                   # e.g. 'weisgerber'
+                 or (self._string_at(self._current, 6, "GERBER") and (self._current > 0))
+                 or self._string_at((self._current - 5), 8, "SCHWAGER", "LYBARGER", "SPRENGER", "GALLAGER", "WILLIGER")
+                 or self._string_at(0, 6, "HARGER")
+                 or (self._string_at(0, 4, "AGER", "EGER") and (self._length == 4))
+                 or self._string_at((self._current - 1), 6, "YGERNE")
+                 or self._string_at((self._current - 6), 9, "SCHWEIGER"))
+                 and not (self._string_at((self._current - 5), 10, "BELLIGEREN")
+                         or self._string_at(0, 7, "MARGERY")
+                         or self._string_at((self._current - 3), 8, "BERGERAC"))):
+                if self._slavo_germanic():
+                    self._metaph_add_exact_approx("G", "K")
+                else:
+                    self._metaph_add_exact_approx4("G", "J", "K", "J")
+            else:
+                self._metaph_add_exact_approx4("J", "G", "J", "K")
+
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_gel(self):
+        """
+        ENcode "-GEL-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # more likely to be "-GEL-" => JL
+        if (self._string_at((self._current + 1), 2, "EL")
+             and (self._current > 0)):
+            # except for
+            # "BAGEL", "HEGEL", "HUGEL", "KUGEL", "NAGEL", "VOGEL", "FOGEL", "PAGEL"
+            if (((self._length == 5)
+                     and self._is_vowel(self._current - 1)
+                     and not self._is_vowel(self._current - 2)
+                     and not self._string_at((self._current - 2), 5, "NIGEL", "RIGEL"))
+                   # or the following as combining forms
+                 or self._string_at((self._current - 2), 5, "ENGEL", "HEGEL", "NAGEL", "VOGEL")
+                 or self._string_at((self._current - 3), 6, "MANGEL", "WEIGEL", "FLUGEL", "RANGEL", "HAUGEN", "RIEGEL", "VOEGEL")
+                 or self._string_at((self._current - 4), 7, "SPEIGEL", "STEIGEL", "WRANGEL", "SPIEGEL")
+                 or self._string_at((self._current - 4), 8, "DANEGELD")):
+                if self._slavo_germanic():
+                    self._metaph_add_exact_approx("G", "K")
+                else:
+                    self._metaph_add_exact_approx4("G", "J", "K", "J")
+            else:
+                self._metaph_add_exact_approx4("J", "G", "J", "K")
+
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_non_initial_g_front_vowel(self):
+        """
+        Encode "-G-" followed by a vowel when non-initial leter.
+        Default for this is a 'J' sound, so check exceptions where
+        it is pronounced 'G'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # -gy-, gi-, ge-
+        if self._string_at((self._current + 1), 1, "E", "I", "Y"):
+            # '-ge' at end
+            # almost always 'j 'sound
+            if self._string_at(self._current, 2, "GE") and (self._current == (self._last - 1)):
+                if self._hard_ge_at_end():
+                    if self._slavo_germanic():
+                        self._metaph_add_exact_approx("G", "K")
+                    else:
+                        self._metaph_add_exact_approx4("G", "J", "K", "J")
+                else:
+                    self._metaph_add("J")
+            else:
+                if self._internal_hard_g():
+                    # don't encode KG or KK if e.g. "mcgill"
+                    if (not ((self._current == 2) and self._string_at(0, 2, "MC"))
+                            or ((self._current == 3) and self._string_at(0, 3, "MAC"))):
+                        if self._slavo_germanic():
+                            self._metaph_add_exact_approx("G", "K")
+                        else:
+                            self._metaph_add_exact_approx4("G", "J", "K", "J")
+                else:
+                    self._metaph_add_exact_approx4("J", "G", "J", "K")
+
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _hard_ge_at_end(self):
+        if (self._string_at(0, 6, "RENEGE", "STONGE", "STANGE", "PRANGE", "KRESGE")
+             or self._string_at(0, 5, "BYRGE", "BIRGE", "BERGE", "HAUGE")
+             or self._string_at(0, 4, "HAGE")
+             or self._string_at(0, 5, "LANGE", "SYNGE", "BENGE", "RUNGE", "HELGE")
+             or self._string_at(0, 4, "INGE", "LAGE")):
+            return True
+
+        return False
+
+    def _internal_hard_g(self):
+        """
+        Exceptions to default encoding to 'J':
+        encode "-G-" to 'G' in "-g<frontvowel>-" words
+        where we are not at "-GE" at the end of the word
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # if not "-GE" at end
+        if (not (((self._current + 1) == self._last) and (self._char_at(self._current + 1) == "E"))
+                 and (self._internal_hard_ng()
+                     or self._internal_hard_gen_gin_get_git()
+                     or self._internal_hard_g_open_syllable()
+                     or self._internal_hard_g_other())):
+            return True
+
+        return False
+
+    def _internal_hard_g_other(self):
+        """
+        Detect words where "-ge-" or "-gi-" get a 'hard' 'g'
+        even though this is usually a 'soft' 'g' context
+
+        Returns:
+            true if 'hard' 'g' detected
+        """
+        if ((self._string_at(self._current, 4, "GETH", "GEAR", "GEIS", "GIRL", "GIVI", "GIVE", "GIFT",
+                                    "GIRD", "GIRT", "GILV", "GILD", "GELD")
+                     and not self._string_at((self._current - 3), 6, "GINGIV"))
+                   # "gish" but not "largish"
+                 or (self._string_at((self._current + 1), 3, "ISH") and (self._current > 0) and not self._string_at(0, 4, "LARG"))
+                 or (self._string_at((self._current - 2), 5, "MAGED", "MEGID") and not ((self._current + 2) == self._last))
+                 or self._string_at(self._current, 3, "GEZ")
+                 or self._string_at(0, 4, "WEGE", "HAGE")
+                 or (self._string_at((self._current - 2), 6, "ONGEST", "UNGEST")
+                     and ((self._current + 3) == self._last)
+                     and not self._string_at((self._current - 3), 7, "CONGEST"))
+                 or self._string_at(0, 5, "VOEGE", "BERGE", "HELGE")
+                 or (self._string_at(0, 4, "ENGE", "BOGY") and (self._length == 4))
+                 or self._string_at(self._current, 6, "GIBBON")
+                 or self._string_at(0, 10, "CORREGIDOR")
+                 or self._string_at(0, 8, "INGEBORG")
+                 or (self._string_at(self._current, 4, "GILL")
+                         and (((self._current + 3) == self._last) or ((self._current + 4) == self._last))
+                         and not self._string_at(0, 8, "STURGILL"))):
+            return True
+
+        return False
+
+    def _internal_hard_g_open_syllable(self):
+        """
+        Detect words where "-gy-", "-gie-", "-gee-",
+        or "-gio-" get a 'hard' 'g' even though this is
+        usually a 'soft' 'g' context
+
+        Returns:
+            true if 'hard' 'g' detected
+        """
+        if (self._string_at((self._current + 1), 3, "EYE")
+             or self._string_at((self._current - 2), 4, "FOGY", "POGY", "YOGI")
+             or self._string_at((self._current - 2), 5, "MAGEE", "MCGEE", "HAGIO")
+             or self._string_at((self._current - 1), 4, "RGEY", "OGEY")
+             or self._string_at((self._current - 3), 5, "HOAGY", "STOGY", "PORGY")
+             or self._string_at((self._current - 5), 8, "CARNEGIE")
+             or (self._string_at((self._current - 1), 4, "OGEY", "OGIE") and ((self._current + 2) == self._last))):
+            return True
+
+        return False
+
+    def _internal_hard_gen_gin_get_git(self):
+        """
+        Detect a number of contexts, mostly german names, that
+        take a 'hard' 'g'.
+
+        Returns:
+            true if 'hard' 'g' detected, false if not
+        """
+        if ((self._string_at((self._current - 3), 6, "FORGET", "TARGET", "MARGIT", "MARGET", "TURGEN",
+                                          "BERGEN", "MORGEN", "JORGEN", "HAUGEN", "JERGEN",
+                                          "JURGEN", "LINGEN", "BORGEN", "LANGEN", "KLAGEN", "STIGER", "BERGER")
+                     and not self._string_at(self._current, 7, "GENETIC", "GENESIS")
+                     and not self._string_at((self._current - 4), 8, "PLANGENT"))
+             or (self._string_at((self._current - 3), 6, "BERGIN", "FEAGIN", "DURGIN") and ((self._current + 2) == self._last))
+             or (self._string_at((self._current - 2), 5, "ENGEN") and not self._string_at((self._current + 3), 3, "DER", "ETI", "ESI"))
+             or self._string_at((self._current - 4), 7, "JUERGEN")
+             or self._string_at(0, 5, "NAGIN", "MAGIN", "HAGIN")
+             or (self._string_at(0, 5, "ENGIN", "DEGEN", "LAGEN", "MAGEN", "NAGIN") and (self._length == 5))
+             or (self._string_at((self._current - 2), 5, "BEGET", "BEGIN", "HAGEN", "FAGIN",
+                                          "BOGEN", "WIGIN", "NTGEN", "EIGEN",
+                                          "WEGEN", "WAGEN")
+                 and not self._string_at((self._current - 5), 8, "OSPHAGEN"))):
+            return True
+
+        return False
+
+    def _internal_hard_ng(self):
+        """
+        Detect a number of contexts of '-ng-' that will
+        take a 'hard' 'g' despite being followed by a
+        front vowel.
+
+        Returns:
+            true if 'hard' 'g' detected, false if not
+        """
+        if ((self._string_at((self._current - 3), 4, "DANG", "FANG", "SING")
+               # exception to exception
+                     and not self._string_at((self._current - 5), 8, "DISINGEN"))
+             or self._string_at(0, 5, "INGEB", "ENGEB")
+             or (self._string_at((self._current - 3), 4, "RING", "WING", "HANG", "LONG")
+                     and not (self._string_at((self._current - 4), 5, "CRING", "FRING", "ORANG", "TWING", "CHANG", "PHANG")
+                         or self._string_at((self._current - 5), 6, "SYRING")
+                         or self._string_at((self._current - 3), 7, "RINGENC", "RINGENT", "LONGITU", "LONGEVI")
+                           # e.g. 'longino', 'mastrangelo'
+                         or (self._string_at(self._current, 4, "GELO", "GINO") and ((self._current + 3) == self._last))))
+             or (self._string_at((self._current - 1), 3, "NGY")
+               # exceptions to exception
+                     and not (self._string_at((self._current - 3), 5, "RANGY", "MANGY", "MINGY")
+                         or self._string_at((self._current - 4), 6, "SPONGY", "STINGY")))):
+            return True
+
+        return False
+
+    def _encode_ga_to_j(self):
+        """
+        Encode special case where "-GA-" => J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'margary', 'margarine'
+        if ((self._string_at((self._current - 3), 7, "MARGARY", "MARGARI")
+               # but not in spanish forms such as "margatita"
+             and not self._string_at((self._current - 3), 8, "MARGARIT"))
+             or self._string_at(0, 4, "GAOL")
+             or self._string_at((self._current - 2), 5, "ALGAE")):
+            self._metaph_add_exact_approx4("J", "G", "J", "K")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_h(self):
+        """Encode 'H'"""
+        if (self._encode_initial_silent_h()
+             or self._encode_initial_hs()
+             or self._encode_initial_hu_hw()
+             or self._encode_non_initial_silent_h()):
+            return
+
+        # only keep if first & before vowel or btw. 2 vowels
+        if not self._encode_h_pronounced():
+            # also takes care of 'HH'
+            self._current += 1
+
+    def _encode_initial_silent_h(self):
+        """
+        Encode cases where initial 'H' is not pronounced (in American)
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'hour', 'herb', 'heir', 'honor'
+        if (self._string_at((self._current + 1), 3, "OUR", "ERB", "EIR")
+             or self._string_at((self._current + 1), 4, "ONOR")
+             or self._string_at((self._current + 1), 5, "ONOUR", "ONEST")):
+            # british pronounce H in this word
+            # americans give it 'H' for the name,
+            # no 'H' for the plant
+            if (self._current == 0) and self._string_at(self._current, 4, "HERB"):
+                if self.encode_vowels:
+                    self._metaph_add_with_alt("HA", "A")
+                else:
+                    self._metaph_add_with_alt("H", "A")
+            elif (self._current == 0) or self.encode_vowels:
+                self._metaph_add("A")
+
+            self._current += 1
+            # don't encode vowels twice
+            self._current = self._skip_vowels(self._current)
+            return True
+
+        return False
+
+    def _encode_initial_hs(self):
+        """
+        Encode "HS-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # old chinese pinyin transliteration
+        # e.g., 'HSIAO'
+        if (self._current == 0) and self._string_at(0, 2, "HS"):
+            self._metaph_add("X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_initial_hu_hw(self):
+        """
+        Encode cases where "HU-" is pronounced as part of a vowel dipthong
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # spanish spellings and chinese pinyin transliteration
+        if self._string_at(0, 3, "HUA", "HUE", "HWA"):
+            if not self._string_at(self._current, 4, "HUEY"):
+                self._metaph_add("A")
+
+                if not self.encode_vowels:
+                    self._current += 3
+                else:
+                    self._current += 1
+                    # don't encode vowels twice
+                    while self._is_vowel(self._current) or (self._char_at(self._current) == "W"):
+                        self._current += 1
+                return True
+
+        return False
+
+    def _encode_non_initial_silent_h(self):
+        """
+        Encode cases where 'H' is silent between vowels
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # exceptions - 'h' not pronounced
+        # "PROHIB" BUT NOT "PROHIBIT"
+        if (self._string_at((self._current - 2), 5, "NIHIL", "VEHEM", "LOHEN", "NEHEM",
+                                         "MAHON", "MAHAN", "COHEN", "GAHAN")
+             or self._string_at((self._current - 3), 6, "GRAHAM", "PROHIB", "FRAHER",
+                                             "TOOHEY", "TOUHEY")
+             or self._string_at((self._current - 3), 5, "TOUHY")
+             or self._string_at(0, 9, "CHIHUAHUA")):
+            if not self.encode_vowels:
+                self._current += 2
+            else:
+                self._current += 1
+                # don't encode vowels twice
+                self._current = self._skip_vowels(self._current)
+            return True
+
+        return False
+
+    def _encode_h_pronounced(self):
+        """
+        Encode cases where 'H' is pronounced
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if ((((self._current == 0)
+                 or self._is_vowel(self._current - 1)
+                 or self._string_at((self._current - 1), 1, "'")  # e.g. "o'hara"
+                 or ((self._current > 0)
+                     and (self._char_at(self._current - 1) == "W")))
+             and self._is_vowel(self._current + 1))
+               # e.g. 'alWahhab'
+             or ((self._char_at(self._current + 1) == "H") and self._is_vowel(self._current + 2))):
+            self._metaph_add("H")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_j(self):
+        """Encode 'J'"""
+        if (self._encode_spanish_j()
+             or self._encode_spanish_oj_uj()):
+            return
+
+        self._encode_other_j()
+
+    def _encode_spanish_j(self):
+        """
+        Encode cases where initial or medial "j" is in a spanish word or name
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # obvious spanish, e.g. "jose", "san jacinto"
+        if ((self._string_at((self._current + 1), 3, "UAN", "ACI", "ALI", "EFE", "ICA", "IME", "OAQ", "UAR")
+                 and not self._string_at(self._current, 8, "JIMERSON", "JIMERSEN"))
+             or (self._string_at((self._current + 1), 3, "OSE") and ((self._current + 3) == self._last))
+             or self._string_at((self._current + 1), 4, "EREZ", "UNTA", "AIME", "AVIE", "AVIA")
+             or self._string_at((self._current + 1), 6, "IMINEZ", "ARAMIL")
+             or (((self._current + 2) == self._last) and self._string_at((self._current - 2), 5, "MEJIA"))
+             or self._string_at((self._current - 2), 5, "TEJED", "TEJAD", "LUJAN", "FAJAR", "BEJAR", "BOJOR", "CAJIG",
+                                             "DEJAS", "DUJAR", "DUJAN", "MIJAR", "MEJOR", "NAJAR",
+                                             "NOJOS", "RAJED", "RIJAL", "REJON", "TEJAN", "UIJAN")
+             or self._string_at((self._current - 3), 8, "ALEJANDR", "GUAJARDO", "TRUJILLO")
+             or (self._string_at((self._current - 2), 5, "RAJAS") and (self._current > 2))
+             or (self._string_at((self._current - 2), 5, "MEJIA") and not self._string_at((self._current - 2), 6, "MEJIAN"))
+             or self._string_at((self._current - 1), 5, "OJEDA")
+             or self._string_at((self._current - 3), 5, "LEIJA", "MINJA")
+             or self._string_at((self._current - 3), 6, "VIAJES", "GRAJAL")
+             or self._string_at(self._current, 8, "JAUREGUI")
+             or self._string_at((self._current - 4), 8, "HINOJOSA")
+             or self._string_at(0, 4, "SAN ")
+             or (((self._current + 1) == self._last)
+             and (self._char_at(self._current + 1) == "O")
+               # exceptions
+             and not (self._string_at(0, 4, "TOJO")
+                     or self._string_at(0, 5, "BANJO")
+                     or self._string_at(0, 6, "MARYJO")))):
+            # americans pronounce "juan" as 'wan'
+            # and "marijuana" and "tijuana" also
+            # do not get the 'H' as in spanish, so
+            # just treat it like a vowel in these cases
+            if not (self._string_at(self._current, 4, "JUAN") or self._string_at(self._current, 4, "JOAQ")):
+                self._metaph_add("H")
+            else:
+                if self._current == 0:
+                    self._metaph_add("A")
+            self._advance_counter(2, 1)
+            return True
+
+        # Jorge gets 2nd HARHA. also JULIO, JESUS
+        if (self._string_at((self._current + 1), 4, "ORGE", "ULIO", "ESUS")
+             and not self._string_at(0, 6, "JORGEN")):
+            # get both consonants for "jorge"
+            if self._string_at((self._current + 1), 4, "ORGE"):
+                if self.encode_vowels:
+                    self._metaph_add_with_alt("JARJ", "HARHA")
+                else:
+                    self._metaph_add_with_alt("JRJ", "HRH")
+                self._advance_counter(5, 5)
+                return True
+
+            self._metaph_add_with_alt("J", "H")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_german_j(self):
+        """
+        Encode cases where 'J' is clearly in a german word or name
+        that americans pronounce in the german fashion
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (self._string_at((self._current + 1), 2, "AH")
+             or (self._string_at((self._current + 1), 5, "OHANN") and ((self._current + 5) == self._last))
+             or (self._string_at((self._current + 1), 3, "UNG") and not self._string_at((self._current + 1), 4, "UNGL"))
+             or self._string_at((self._current + 1), 3, "UGO")):
+            self._metaph_add("A")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_spanish_oj_uj(self):
+        """
+        Encode "-JOJ-" and "-JUJ-" as spanish words
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at((self._current + 1), 5, "OJOBA", "UJUY "):
+            if self.encode_vowels:
+                self._metaph_add("HAH")
+            else:
+                self._metaph_add("HH")
+
+            self._advance_counter(4, 3)
+            return True
+
+        return False
+
+    def _encode_j_to_j(self):
+        """
+        Encode 'J' => J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._is_vowel(self._current + 1):
+            if ((self._current == 0)
+                 and self._names_beginning_with_j_that_get_alt_y()):
+                # 'Y' is a vowel so encode
+                # is as 'A'
+                if self.encode_vowels:
+                    self._metaph_add_with_alt("JA", "A")
+                else:
+                    self._metaph_add_with_alt("J", "A")
+            else:
+                if self.encode_vowels:
+                    self._metaph_add("JA")
+                else:
+                    self._metaph_add("J")
+
+            self._current += 1
+            self._current = self._skip_vowels(self._current)
+            return False
+        else:
+            self._metaph_add("J")
+            self._current += 1
+            return True
+
+        # return false;
+
+    def _encode_spanish_j_2(self):
+        """
+        Encode 'J' toward end in spanish words
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # spanish forms e.g. "brujo", "badajoz"
+        if ((((self._current - 2) == 0)
+             and self._string_at((self._current - 2), 4, "BOJA", "BAJA", "BEJA", "BOJO", "MOJA", "MOJI", "MEJI"))
+             or (((self._current - 3) == 0)
+             and self._string_at((self._current - 3), 5, "FRIJO", "BRUJO", "BRUJA", "GRAJE", "GRIJA", "LEIJA", "QUIJA"))
+             or (((self._current + 3) == self._last)
+             and self._string_at((self._current - 1), 5, "AJARA"))
+             or (((self._current + 2) == self._last)
+             and self._string_at((self._current - 1), 4, "AJOS", "EJOS", "OJAS", "OJOS", "UJON", "AJOZ", "AJAL", "UJAR", "EJON", "EJAN"))
+             or (((self._current + 1) == self._last)
+             and (self._string_at((self._current - 1), 3, "OJA", "EJA") and not self._string_at(0, 4, "DEJA")))):
+            self._metaph_add("H")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_j_as_vowel(self):
+        """
+        Encode 'J' as vowel in some exception cases
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 5, "JEWSK"):
+            self._metaph_add_with_alt("J", "")
+            return True
+
+        # e.g. "stijl", "sejm" - dutch, scandanavian, and eastern european spellings
+        if ((self._string_at((self._current + 1), 1, "L", "T", "K", "S", "N", "M")
+                   # except words from hindi and arabic
+                 and not self._string_at((self._current + 2), 1, "A"))
+             or self._string_at(0, 9, "HALLELUJA", "LJUBLJANA")
+             or self._string_at(0, 4, "LJUB", "BJOR")
+             or self._string_at(0, 5, "HAJEK")
+             or self._string_at(0, 3, "WOJ")
+               # e.g. 'fjord'
+             or self._string_at(0, 2, "FJ")
+               # e.g. 'rekjavik', 'blagojevic'
+             or self._string_at(self._current, 5, "JAVIK", "JEVIC")
+             or (((self._current + 1) == self._last) and self._string_at(0, 5, "SONJA", "TANJA", "TONJA"))):
+            return True
+        return False
+
+    def _encode_other_j(self):
+        """Call routines to encode 'J', in proper order"""
+        if self._current == 0:
+            if self._encode_german_j():
+                return
+            else:
+                if self._encode_j_to_j():
+                    return
+        else:
+            if self._encode_spanish_j_2():
+                return
+            elif not self._encode_j_as_vowel():
+                self._metaph_add("J")
+
+            # it could happen! e.g. "hajj"
+            # eat redundant 'J'
+            if self._char_at(self._current + 1) == "J":
+                self._current += 2
+            else:
+                self._current += 1
+
+    def _encode_k(self):
+        """Encode 'K'"""
+        if not self._encode_silent_k():
+            if ((self._char_at(self._current + 1) == "H")
+                     and ((self._current + 1) != self._last)):
+                self._metaph_add_with_alt("K", "H")
+            else:
+                self._metaph_add("K")
+
+            # eat redundant 'K's and 'Q's
+            if ((self._char_at(self._current + 1) == "K")
+                 or (self._char_at(self._current + 1) == "Q")):
+                self._current += 2
+            else:
+                self._current += 1
+
+    def _encode_silent_k(self):
+        """
+        Encode cases where 'K' is not pronounced
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # skip this except for special cases
+        if ((self._current == 0)
+             and self._string_at(self._current, 2, "KN")):
+            if not (self._string_at((self._current + 2), 5, "ESSET", "IEVEL") or self._string_at((self._current + 2), 3, "ISH")):
+                self._current += 1
+                return True
+
+        # e.g. "know", "knit", "knob"
+        if ((self._string_at((self._current + 1), 3, "NOW", "NIT", "NOT", "NOB")
+                   # exception, "slipknot" => SLPNT but "banknote" => PNKNT
+                 and not self._string_at(0, 8, "BANKNOTE"))
+             or self._string_at((self._current + 1), 4, "NOCK", "NUCK", "NIFE", "NACK")
+             or self._string_at((self._current + 1), 5, "NIGHT")):
+            # N already encoded before
+            # e.g. "penknife"
+            if (self._current > 0) and self._char_at(self._current - 1) == "N":
+                self._current += 2
+            else:
+                self._current += 1
+
+            return True
+
+        return False
+
+    def _encode_l(self):
+        """
+        Encode 'L'
+
+        Includes special vowel transposition
+        encoding, where 'LE' => AL
+        """
+        # logic below needs to know this
+        # after 'm_current' variable changed
+        save_current = self._current
+
+        self._interpolate_vowel_when_cons_l_at_end()
+
+        if (self._encode_lely_to_l()
+             or self._encode_colonel()
+             or self._encode_french_ault()
+             or self._encode_french_euil()
+             or self._encode_french_oulx()
+             or self._encode_silent_l_in_lm()
+             or self._encode_silent_l_in_lk_lv()
+             or self._encode_silent_l_in_ould()):
+            return
+
+        if self._encode_ll_as_vowel_cases():
+            return
+
+        self._encode_le_cases(save_current)
+
+    def _interpolate_vowel_when_cons_l_at_end(self):
+        """
+        Cases where an L follows D, G, or T at the
+        end have a schwa pronounced before the L
+        """
+        if self.encode_vowels:
+            # e.g. "ertl", "vogl"
+            if ((self._current == self._last)
+                 and self._string_at((self._current - 1), 1, "D", "G", "T")):
+                self._metaph_add("A")
+
+    def _encode_lely_to_l(self):
+        """
+        Catch cases where 'L' spelled twice but pronounced
+        once, e.g., 'DOCILELY' => TSL
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "agilely", "docilely"
+        if (self._string_at((self._current - 1), 5, "ILELY")
+             and ((self._current + 3) == self._last)):
+            self._metaph_add("L")
+            self._current += 3
+            return True
+
+        return False
+
+    def _encode_colonel(self):
+        """
+        Encode special case "colonel" => KRNL. Can somebody tell
+        me how this pronounciation came to be?
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at((self._current - 2), 7, "COLONEL"):
+            self._metaph_add("R")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_french_ault(self):
+        """
+        Encode "-AULT-", found in a french names
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "renault" and "foucault", well known to americans, but not "fault"
+        if ((self._current > 3)
+             and (self._string_at((self._current - 3), 5, "RAULT", "NAULT", "BAULT", "SAULT", "GAULT", "CAULT")
+                 or self._string_at((self._current - 4), 6, "REAULT", "RIAULT", "NEAULT", "BEAULT"))
+             and not (self._root_or_inflections(self._word, "ASSAULT")
+                 or self._string_at((self._current - 8), 10, "SOMERSAULT")
+                 or self._string_at((self._current - 9), 11, "SUMMERSAULT"))):
+            self._metaph_add_with_alt("", "LT")  # sometimes pronounced e.g. 'Clair Chennault'
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_french_euil(self):
+        """
+        Encode "-EUIL-", always found in a french word
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "auteuil"
+        if self._string_at((self._current - 3), 4, "EUIL") and (self._current == self._last):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_french_oulx(self):
+        """
+        Encode "-OULX", always found in a french word
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "proulx"
+        if self._string_at((self._current - 2), 4, "OULX") and ((self._current + 1) == self._last):
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_silent_l_in_lm(self):
+        """
+        Encodes contexts where 'L' is not pronounced in "-LM-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "LM", "LN"):
+            # e.g. "lincoln", "holmes", "psalm", "salmon"
+            if ((self._string_at((self._current - 2), 4, "COLN", "CALM", "BALM", "MALM", "PALM")
+                 or (self._string_at((self._current - 1), 3, "OLM") and ((self._current + 1) == self._last))
+                 or self._string_at((self._current - 3), 5, "PSALM", "QUALM")
+                 or self._string_at((self._current - 2), 6, "SALMON", "HOLMES")
+                 or self._string_at((self._current - 1), 6, "ALMOND")
+                 or ((self._current == 1) and self._string_at((self._current - 1), 4, "ALMS")))
+                 and (not self._string_at((self._current + 2), 1, "A")
+                     and not self._string_at((self._current - 2), 5, "BALMO")
+                     and not self._string_at((self._current - 2), 6, "PALMER", "PALMOR", "BALMER")
+                     and not self._string_at((self._current - 3), 5, "THALM"))):
+                self._current += 1
+                return True
+            else:
+                self._metaph_add("L")
+                self._current += 1
+                return True
+
+        return False
+
+    def _encode_silent_l_in_lk_lv(self):
+        """
+        Encodes contexts where '-L-' is silent in 'LK', 'LV'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if ((self._string_at((self._current - 2), 4, "WALK", "YOLK", "FOLK", "HALF", "TALK", "CALF", "BALK", "CALK")
+             or (self._string_at((self._current - 2), 4, "POLK")
+                 and not self._string_at((self._current - 2), 5, "POLKA", "WALKO"))
+             or (self._string_at((self._current - 2), 4, "HALV")
+                 and not self._string_at((self._current - 2), 5, "HALVA", "HALVO"))
+             or (self._string_at((self._current - 3), 5, "CAULK", "CHALK", "BAULK", "FAULK")
+                 and not self._string_at((self._current - 4), 6, "SCHALK"))
+             or (self._string_at((self._current - 2), 5, "SALVE", "CALVE")
+             or self._string_at((self._current - 2), 6, "SOLDER"))
+               # exceptions to above cases where 'L' is usually pronounced
+             and not self._string_at((self._current - 2), 6, "SALVER", "CALVER"))
+             and not self._string_at((self._current - 5), 9, "GONSALVES", "GONCALVES")
+             and not self._string_at((self._current - 2), 6, "BALKAN", "TALKAL")
+             and not self._string_at((self._current - 3), 5, "PAULK", "CHALF")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_silent_l_in_ould(self):
+        """
+        Encode 'L' in contexts of "-OULD-" where it is silent
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'would', 'could'
+        if (self._string_at((self._current - 3), 5, "WOULD", "COULD")
+             or (self._string_at((self._current - 4), 6, "SHOULD")
+                 and not self._string_at((self._current - 4), 8, "SHOULDER"))):
+            self._metaph_add_exact_approx("D", "T")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_ll_as_vowel_special_cases(self):
+        """
+        Encode "-ILLA-" and "-ILLE-" in spanish and french
+        contexts were americans know to pronounce it as a 'Y'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (self._string_at((self._current - 5), 8, "TORTILLA")
+             or self._string_at((self._current - 8), 11, "RATATOUILLE")
+               # e.g. 'guillermo', "veillard"
+             or (self._string_at(0, 5, "GUILL", "VEILL", "GAILL")
+                   # 'guillotine' usually has '-ll-' pronounced as 'L' in english
+                 and not (self._string_at((self._current - 3), 7, "GUILLOT", "GUILLOR", "GUILLEN")
+                     or (self._string_at(0, 5, "GUILL") and (self._length == 5))))
+             or self._string_at(0, 6, "ROBILL")
+               # e.g. "brouillard", "gremillion"
+             or self._string_at(0, 7, "BROUILL", "GREMILL")
+               # e.g. 'mireille'
+             or (self._string_at((self._current - 2), 5, "EILLE")
+                     and ((self._current + 2) == self._last)
+                       # exception "reveille" usually pronounced as 're-vil-lee'
+                     and not self._string_at((self._current - 5), 8, "REVEILLE"))):
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_ll_as_vowel(self):
+        """
+        Encode other spanish cases where "-LL-" is pronounced as 'Y'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # spanish e.g. "cabrillo", "gallegos" but also "gorilla", "ballerina" -
+        # give both pronounciations since an american might pronounce "cabrillo"
+        # in the spanish or the american fashion.
+        if ((((self._current + 3) == self._length)
+             and self._string_at((self._current - 1), 4, "ILLO", "ILLA", "ALLE"))
+             or (((self._string_at((self._last - 1), 2, "AS", "OS")
+                     or self._string_at(self._last, 2, "AS", "OS")
+                     or self._string_at(self._last, 1, "A", "O"))
+                         and self._string_at((self._current - 1), 2, "AL", "IL"))
+                 and not self._string_at((self._current - 1), 4, "ALLA"))
+             or self._string_at(0, 5, "VILLE", "VILLA")
+             or self._string_at(0, 8, "GALLARDO", "VALLADAR", "MAGALLAN", "CAVALLAR", "BALLASTE")
+             or self._string_at(0, 3, "LLA")):
+            self._metaph_add_with_alt("L", "")
+            self._current += 2
+            return True
+        return False
+
+    def _encode_ll_as_vowel_cases(self):
+        """
+        Call routines to encode "-LL-", in proper order
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._char_at(self._current + 1) == "L":
+            if self._encode_ll_as_vowel_special_cases():
+                return True
+            elif self._encode_ll_as_vowel():
+                return True
+            self._current += 2
+        else:
+            self._current += 1
+
+        return False
+
+    def _encode_vowel_le_transposition(self, save_current):
+        """
+        Encode vowel-encoding cases where "-LE-" is pronounced "-EL-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # transposition of vowel sound and L occurs in many words,
+        # e.g. "bristle", "dazzle", "goggle" => KAKAL
+        if (self.encode_vowels
+             and (save_current > 1)
+             and not self._is_vowel(save_current - 1)
+             and (self._char_at(save_current + 1) == "E")
+             and (self._char_at(save_current - 1) != "L")
+             and (self._char_at(save_current - 1) != "R")
+               # lots of exceptions to this:
+             and not self._is_vowel(save_current + 2)
+             and not self._string_at(0, 7, "ECCLESI", "COMPLEC", "COMPLEJ", "ROBLEDO")
+             and not self._string_at(0, 5, "MCCLE", "MCLEL")
+             and not self._string_at(0, 6, "EMBLEM", "KADLEC")
+             and not (((save_current + 2) == self._last) and self._string_at(save_current, 3, "LET"))
+             and not self._string_at(save_current, 7, "LETTING")
+             and not self._string_at(save_current, 6, "LETELY", "LETTER", "LETION", "LETIAN", "LETING", "LETORY")
+             and not self._string_at(save_current, 5, "LETUS", "LETIV")
+             and not self._string_at(save_current, 4, "LESS", "LESQ", "LECT", "LEDG", "LETE", "LETH", "LETS", "LETT")
+             and not self._string_at(save_current, 3, "LEG", "LER", "LEX")
+               # e.g. "complement" !=> KAMPALMENT
+             and not (self._string_at(save_current, 6, "LEMENT")
+                 and not (self._string_at((self._current - 5), 6, "BATTLE", "TANGLE", "PUZZLE", "RABBLE", "BABBLE")
+                         or self._string_at((self._current - 4), 5, "TABLE")))
+             and not (((save_current + 2) == self._last) and self._string_at((save_current - 2), 5, "OCLES", "ACLES", "AKLES"))
+             and not self._string_at((save_current - 3), 5, "LISLE", "AISLE")
+             and not self._string_at(0, 4, "ISLE")
+             and not self._string_at(0, 6, "ROBLES")
+             and not self._string_at((save_current - 4), 7, "PROBLEM", "RESPLEN")
+             and not self._string_at((save_current - 3), 6, "REPLEN")
+             and not self._string_at((save_current - 2), 4, "SPLE")
+             and (self._char_at(save_current - 1) != "H")
+             and (self._char_at(save_current - 1) != "W")):
+            self._metaph_add("AL")
+            self._flag_al_inversion = True
+
+            # eat redundant 'L'
+            if self._char_at(save_current + 2) == "L":
+                self._current = save_current + 3
+            return True
+
+        return False
+
+    def _encode_vowel_preserve_vowel_after_l(self, save_current):
+        """
+        Encode special vowel-encoding cases where 'E' is not
+        silent at the end of a word as is the usual case
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # an example of where the vowel would NOT need to be preserved
+        # would be, say, "hustled", where there is no vowel pronounced
+        # between the 'l' and the 'd'
+        if (self.encode_vowels
+             and not self._is_vowel(save_current - 1)
+             and (self._char_at(save_current + 1) == "E")
+             and (save_current > 1)
+             and ((save_current + 1) != self._last)
+             and not (self._string_at((save_current + 1), 2, "ES", "ED")
+             and ((save_current + 2) == self._last))
+             and not self._string_at((save_current - 1), 5, "RLEST")):
+            self._metaph_add("LA")
+            self._current = self._skip_vowels(self._current)
+            return True
+
+        return False
+
+    def _encode_le_cases(self, save_current):
+        """
+        Call routines to encode "-LE-", in proper order
+
+        Args:
+            save_current: index of actual current letter
+        """
+        if self._encode_vowel_le_transposition(save_current):
+            return
+        else:
+            if self._encode_vowel_preserve_vowel_after_l(save_current):
+                return
+            else:
+                self._metaph_add("L")
+
+    def _encode_m(self):
+        """
+        Encode "-M-"
+        """
+        if (self._encode_silent_m_at_beginning()
+             or self._encode_mr_and_mrs()
+             or self._encode_mac()
+             or self._encode_mpt()):
+            return
+
+        # Silent 'B' should really be handled
+        # under 'B", not here under 'M'!
+        self._encode_mb()
+
+        self._metaph_add("M")
+
+    def _encode_silent_m_at_beginning(self):
+        """
+        Encode cases where 'M' is silent at beginning of word
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # skip these when at start of word
+        if ((self._current == 0)
+             and self._string_at(self._current, 2, "MN")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_mr_and_mrs(self):
+        """
+        Encode special cases "Mr." and "Mrs."
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (self._current == 0) and self._string_at(self._current, 2, "MR"):
+            # exceptions for "mr." and "mrs."
+            if (self._length == 2) and self._string_at(self._current, 2, "MR"):
+                if self.encode_vowels:
+                    self._metaph_add("MASTAR")
+                else:
+                    self._metaph_add("MSTR")
+                self._current += 2
+                return True
+            elif (self._length == 3) and self._string_at(self._current, 3, "MRS"):
+                if self.encode_vowels:
+                    self._metaph_add("MASAS")
+                else:
+                    self._metaph_add("MSS")
+                self._current += 3
+                return True
+
+        return False
+
+    def _encode_mac(self):
+        """
+        Encode "Mac-" and "Mc-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # should only find irish and
+        # scottish names e.g. 'macintosh'
+        if ((self._current == 0)
+                 and (self._string_at(0, 7, "MACIVER", "MACEWEN")
+                 or self._string_at(0, 8, "MACELROY", "MACILROY")
+                 or self._string_at(0, 9, "MACINTOSH")
+                 or self._string_at(0, 2, "MC"))):
+            if self.encode_vowels:
+                self._metaph_add("MAK")
+            else:
+                self._metaph_add("MK")
+
+            if self._string_at(0, 2, "MC"):
+                if (self._string_at((self._current + 2), 1, "K", "G", "Q")
+                       # watch out for e.g. "McGeorge"
+                     and not self._string_at((self._current + 2), 4, "GEOR")):
+                    self._current += 3
+                else:
+                    self._current += 2
+            else:
+                self._current += 3
+
+            return True
+
+        return False
+
+    def _encode_mpt(self):
+        """
+        Encode silent 'M' in context of "-MPT-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (self._string_at((self._current - 2), 8, "COMPTROL")
+             or self._string_at((self._current - 4), 7, "ACCOMPT")):
+            self._metaph_add("N")
+            self._current += 2
+            return True
+
+        return False
+
+    def _test_silent_mb_1(self):
+        """
+        Test if 'B' is silent in these contexts
+
+        Returns:
+            true if 'B' is silent in this context
+        """
+        # e.g. "LAMB", "COMB", "LIMB", "DUMB", "BOMB"
+        # Handle combining roots first
+        if (((self._current == 3)
+                and self._string_at((self._current - 3), 5, "THUMB"))
+            or ((self._current == 2)
+                and self._string_at((self._current - 2), 4, "DUMB", "BOMB", "DAMN", "LAMB", "NUMB", "TOMB"))):
+            return True
+
+        return False
+
+    def _test_pronounced_mb(self):
+        """
+        Test if 'B' is pronounced in this context
+
+        Returns:
+            true if 'B' is pronounced in this context
+        """
+        if (self._string_at((self._current - 2), 6, "NUMBER")
+            or (self._string_at((self._current + 2), 1, "A")
+                and not self._string_at((self._current - 2), 7, "DUMBASS"))
+            or self._string_at((self._current + 2), 1, "O")
+            or self._string_at((self._current - 2), 6, "LAMBEN", "LAMBER", "LAMBET", "TOMBIG", "LAMBRE")):
+            return True
+
+        return False
+
+    def _test_silent_mb_2(self):
+        """
+        Test whether "-B-" is silent in these contexts
+
+        Returns:
+            true if 'B' is silent in this context
+        """
+        # 'M' is the current letter
+        if ((self._char_at(self._current + 1) == "B") and (self._current > 1)
+            and (((self._current + 1) == self._last)
+              # other situations where "-MB-" is at end of root
+              # but not at end of word. The tests are for standard
+              # noun suffixes.
+              # e.g. "climbing" => KLMNK
+            or self._string_at((self._current + 2), 3, "ING", "ABL")
+            or self._string_at((self._current + 2), 4, "LIKE")
+            or ((self._char_at(self._current + 2) == "S") and ((self._current + 2) == self._last))
+            or self._string_at((self._current - 5), 7, "BUNCOMB")
+              # e.g. "bomber",
+            or (self._string_at((self._current + 2), 2, "ED", "ER")
+            and ((self._current + 3) == self._last)
+            and (self._string_at(0, 5, "CLIMB", "PLUMB")
+              # e.g. "beachcomber"
+            or not self._string_at((self._current - 1), 5, "IMBER", "AMBER", "EMBER", "UMBER"))
+              # exceptions
+            and not self._string_at((self._current - 2), 6, "CUMBER", "SOMBER")))):
+            return True
+
+        return False
+
+    def _test_pronounced_mb_2(self):
+        """
+        Test if 'B' is pronounced in these "-MB-" contexts
+
+        Returns:
+            true if "-B-" is pronounced in these contexts
+        """
+        # e.g. "bombastic", "umbrage", "flamboyant"
+        if (self._string_at((self._current - 1), 5, "OMBAS", "OMBAD", "UMBRA")
+            or self._string_at((self._current - 3), 4, "FLAM")):
+            return True
+
+        return False
+
+    def _test_mn(self):
+        """
+        Tests for contexts where "-N-" is silent when after "-M-"
+
+        Returns:
+            true if "-N-" is silent in these contexts
+        """
+        if ((self._char_at(self._current + 1) == "N")
+            and (((self._current + 1) == self._last)
+              # or at the end of a word but followed by suffixes
+            or (self._string_at((self._current + 2), 3, "ING", "EST") and ((self._current + 4) == self._last))
+            or ((self._char_at(self._current + 2) == "S") and ((self._current + 2) == self._last))
+            or (self._string_at((self._current + 2), 2, "LY", "ER", "ED")
+                and ((self._current + 3) == self._last))
+            or self._string_at((self._current - 2), 9, "DAMNEDEST")
+            or self._string_at((self._current - 5), 9, "GODDAMNIT"))):
+            return True
+
+        return False
+
+    def _encode_mb(self):
+        """Call routines to encode "-MB-", in proper order"""
+        if self._test_silent_mb_1():
+            if self._test_pronounced_mb():
+                self._current += 1
+            else:
+                self._current += 2
+        elif self._test_silent_mb_2():
+            if self._test_pronounced_mb_2():
+                self._current += 1
+            else:
+                self._current += 2
+        elif self._test_mn():
+            self._current += 2
+        else:
+            # eat redundant 'M'
+            if self._char_at(self._current + 1) == "M":
+                self._current += 2
+            else:
+                self._current += 1
+
+    def _encode_n(self):
+        """
+        Encode "-N-"
+        """
+        if self._encode_nce():
+            return
+
+        # eat redundant 'N'
+        if self._char_at(self._current + 1) == "N":
+            self._current += 2
+        else:
+            self._current += 1
+
+        if (not self._string_at((self._current - 3), 8, "MONSIEUR")
+              # e.g. "aloneness",
+            and not self._string_at((self._current - 3), 6, "NENESS")):
+            self._metaph_add("N")
+
+    def _encode_nce(self):
+        """
+        Encode "-NCE-" and "-NSE-"
+        "entrance" is pronounced exactly the same as "entrants"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'acceptance', 'accountancy'
+        if (self._string_at((self._current + 1), 1, "C", "S")
+             and self._string_at((self._current + 2), 1, "E", "Y", "I")
+             and (((self._current + 2) == self._last)
+                 or (((self._current + 3) == self._last))
+                     and (self._char_at(self._current + 3) == "S"))):
+            self._metaph_add("NTS")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_p(self):
+        """
+        Encode "-P-"
+        """
+        if (self._encode_silent_p_at_beginning()
+            or self._encode_pt()
+            or self._encode_ph()
+            or self._encode_pph()
+            or self._encode_rps()
+            or self._encode_coup()
+            or self._encode_pneum()
+            or self._encode_psych()
+            or self._encode_psalm()):
+            return
+
+        self._encode_pb()
+
+        self._metaph_add("P")
+
+    def _encode_silent_p_at_beginning(self):
+        """
+        Encode cases where "-P-" is silent at the start of a word
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # skip these when at start of word
+        if ((self._current == 0)
+             and self._string_at(self._current, 2, "PN", "PF", "PS", "PT")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_pt(self):
+        """
+        Encode cases where "-P-" is silent before "-T-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'pterodactyl', 'receipt', 'asymptote'
+        if (self._char_at(self._current + 1) == "T"):
+            if (((self._current == 0) and self._string_at(self._current, 5, "PTERO"))
+                or self._string_at((self._current - 5), 7, "RECEIPT")
+                or self._string_at((self._current - 4), 8, "ASYMPTOT")):
+                self._metaph_add("T")
+                self._current += 2
+                return True
+        return False
+
+    def _encode_ph(self):
+        """
+        Encode "-PH-", usually as F, with exceptions for
+        cases where it is silent, or where the 'P' and 'T'
+        are pronounced seperately because they belong to
+        two different words in a combining form
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._char_at(self._current + 1) == "H":
+            # 'PH' silent in these contexts
+            if (self._string_at(self._current, 9, "PHTHALEIN")
+                or ((self._current == 0) and self._string_at(self._current, 4, "PHTH"))
+                or self._string_at((self._current - 3), 10, "APOPHTHEGM")):
+                self._metaph_add("0")
+                self._current += 4
+            # combining forms
+            # 'sheepherd', 'upheaval', 'cupholder'
+            elif ((self._current > 0)
+                and (self._string_at((self._current + 2), 3, "EAD", "OLE", "ELD", "ILL", "OLD", "EAP", "ERD",
+                                             "ARD", "ANG", "ORN", "EAV", "ART")
+                or self._string_at((self._current + 2), 4, "OUSE")
+                or (self._string_at((self._current + 2), 2, "AM") and not self._string_at((self._current - 1), 5, "LPHAM"))
+                or self._string_at((self._current + 2), 5, "AMMER", "AZARD", "UGGER")
+                or self._string_at((self._current + 2), 6, "OLSTER"))
+                    and not self._string_at((self._current - 3), 5, "LYMPH", "NYMPH")):
+                self._metaph_add("P")
+                self._advance_counter(3, 2)
+            else:
+                if (self._string_at((self._current - 3), 7, "STEPHEN")
+                         and self.encode_exact):
+                    self._metaph_add("V")
+                else:
+                    self._metaph_add("F")
+                self._current += 2
+            return True
+
+        return False
+
+    def _encode_pph(self):
+        """
+        Encode "-PPH-". I don't know why the greek poet's
+        name is transliterated this way...
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'sappho'
+        if ((self._char_at(self._current + 1) == "P")
+                 and ((self._current + 2) < self._length) and (self._char_at(self._current + 2) == "H")):
+            self._metaph_add("F")
+            self._current += 3
+            return True
+
+        return False
+
+    def _encode_rps(self):
+        """
+        Encode "-CORPS-" where "-PS-" not pronounced
+        since the cognate is here from the french
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # '-corps-', 'corpsman'
+        if (self._string_at((self._current - 3), 5, "CORPS")
+             and not self._string_at((self._current - 3), 6, "CORPSE")):
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_coup(self):
+        """
+        Encode "-COUP-" where "-P-" is not pronounced
+        since the word is from the french
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'coup'
+        if ((self._current == self._last)
+             and self._string_at((self._current - 3), 4, "COUP")
+             and not self._string_at((self._current - 5), 6, "RECOUP")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_pneum(self):
+        """
+        Encode 'P' in non-initial contexts of "-PNEUM-"
+        where is also silent
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # '-pneum-'
+        if self._string_at((self._current + 1), 4, "NEUM"):
+            self._metaph_add("N")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_psych(self):
+        """
+        Encode special case "-PSYCH-" where two encodings need to be
+        accounted for in one syllable, one for the 'PS' and one for
+        the 'CH'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # '-psych-'
+        if self._string_at((self._current + 1), 4, "SYCH"):
+            if self.encode_vowels:
+                self._metaph_add("SAK")
+            else:
+                self._metaph_add("SK")
+
+            self._current += 5
+            return True
+
+        return False
+
+    def _encode_psalm(self):
+        """
+        Encode 'P' in context of "-PSALM-", where it has
+        become silent
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # '-psalm-'
+        if self._string_at((self._current + 1), 4, "SALM"):
+            # go ahead and encode entire word
+            if self.encode_vowels:
+                self._metaph_add("SAM")
+            else:
+                self._metaph_add("SM")
+
+            self._current += 5
+            return True
+
+        return False
+
+    def _encode_pb(self):
+        """Eat redundant 'B' or 'P'"""
+        # e.g. "campbell", "raspberry"
+        # eat redundant 'P' or 'B'
+        if self._string_at((self._current + 1), 1, "P", "B"):
+            self._current += 2
+        else:
+            self._current += 1
+
+    def _encode_q(self):
+        """
+        Encode "-Q-"
+        """
+        # current pinyin
+        if self._string_at(self._current, 3, "QIN"):
+            self._metaph_add("X")
+            self._current += 1
+            return
+
+        # eat redundant 'Q'
+        if self._char_at(self._current + 1) == "Q":
+            self._current += 2
+        else:
+            self._current += 1
+
+        self._metaph_add("K")
+
+    def _encode_r(self):
+        """
+        Encode "-R-"
+        """
+        if self._encode_rz():
+            return
+
+        if not self._test_silent_r():
+            if not self._encode_vowel_re_transposition():
+                self._metaph_add("R")
+
+        # eat redundant 'R'; also skip 'S' as well as 'R' in "poitiers"
+        if (self._char_at(self._current + 1) == "R") or self._string_at((self._current - 6), 8, "POITIERS"):
+            self._current += 2
+        else:
+            self._current += 1
+
+    def _encode_rz(self):
+        """
+        Encode "-RZ-" according
+        to american and polish pronunciations
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (self._string_at((self._current - 2), 4, "GARZ", "KURZ", "MARZ", "MERZ", "HERZ", "PERZ", "WARZ")
+             or self._string_at(self._current, 5, "RZANO", "RZOLA")
+             or self._string_at((self._current - 1), 4, "ARZA", "ARZN")
+             or self._string_at(self._current, 3, "RZH")):
+            return False
+
+        # 'yastrzemski' usually has 'z' silent in
+        # united states, but should get 'X' in poland
+        if self._string_at((self._current - 4), 11, "YASTRZEMSKI"):
+            self._metaph_add_with_alt("R", "X")
+            self._current += 2
+            return True
+        # 'BRZEZINSKI' gets two pronunciations
+        # in the united states, neither of which
+        # are authentically polish
+        if self._string_at((self._current - 1), 10, "BRZEZINSKI"):
+            self._metaph_add_with_alt("RS", "RJ")
+            # skip over 2nd 'Z'
+            self._current += 4
+            return True
+        # 'z' in 'rz after voiceless consonant gets 'X'
+        # in alternate polish style pronunciation
+        elif (self._string_at((self._current - 1), 3, "TRZ", "PRZ", "KRZ")
+            or (self._string_at(self._current, 2, "RZ")
+                    and (self._is_vowel(self._current - 1) or (self._current == 0)))):
+            self._metaph_add_with_alt("RS", "X")
+            self._current += 2
+            return True
+        # 'z' in 'rz after voiceled consonant, vowel, or at
+        # beginning gets 'J' in alternate polish style pronunciation
+        elif self._string_at((self._current - 1), 3, "BRZ", "DRZ", "GRZ"):
+            self._metaph_add_with_alt("RS", "J")
+            self._current += 2
+            return True
+
+        return False
+
+    def _test_silent_r(self):
+        """
+        Test whether 'R' is silent in this context
+
+        Returns:
+            true if 'R' is silent in this context
+        """
+        # special case
+        if self._string_at((self._current - 3), 8, "FEBRUARY"):
+            # more common without, but sometimes pronounced
+            self._metaph_add_with_alt("", "R")
+            return True
+            # since handled here
+        # test cases where 'R' is silent, either because the
+        # word is from the french or because it is no longer pronounced.
+        # e.g. "rogier", "monsieur", "surburban"
+        if (((self._current == self._last)
+               # reliably french word ending
+             and self._string_at((self._current - 2), 3, "IER")
+               # e.g. "metier"
+             and (self._string_at((self._current - 5), 3, "MET", "VIV", "LUC")
+               # e.g. "cartier", "bustier"
+             or self._string_at((self._current - 6), 4, "CART", "DOSS", "FOUR", "OLIV", "BUST", "DAUM", "ATEL",
+                                             "SONN", "CORM", "MERC", "PELT", "POIR", "BERN", "FORT", "GREN",
+                                             "SAUC", "GAGN", "GAUT", "GRAN", "FORC", "MESS", "LUSS", "MEUN",
+                                             "POTH", "HOLL", "CHEN")
+               # e.g. "croupier"
+             or self._string_at((self._current - 7), 5, "CROUP", "TORCH", "CLOUT", "FOURN", "GAUTH", "TROTT",
+                                             "DEROS", "CHART")
+               # e.g. "chevalier"
+             or self._string_at((self._current - 8), 6, "CHEVAL", "LAVOIS", "PELLET", "SOMMEL", "TREPAN", "LETELL", "COLOMB")
+             or self._string_at((self._current - 9), 7, "CHARCUT")
+             or self._string_at((self._current - 10), 8, "CHARPENT")))
+             or self._string_at((self._current - 2), 7, "SURBURB", "WORSTED")
+             or self._string_at((self._current - 2), 9, "WORCESTER")
+             or self._string_at((self._current - 7), 8, "MONSIEUR")
+             or self._string_at((self._current - 6), 8, "POITIERS")):
+            return True
+
+        return False
+
+    def _encode_vowel_re_transposition(self):
+        """
+        Encode '-re-" as 'AR' in contexts
+        where this is the correct pronunciation
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # -re inversion is just like
+        # -le inversion
+        # e.g. "fibre" => FABAR or "centre" => SANTAR
+        if ((self.encode_vowels)
+             and (self._char_at(self._current + 1) == "E")
+             and (self._length > 3)
+             and not self._string_at(0, 5, "OUTRE", "LIBRE", "ANDRE")
+             and not (self._string_at(0, 4, "FRED", "TRES") and (self._length == 4))
+             and not self._string_at((self._current - 2), 5, "LDRED", "LFRED", "NDRED", "NFRED", "NDRES", "IFRED")
+             and not (self._string_at((self._current - 2), 4, "TRES") and ((self._current + 1) < self._last))
+             and not self._is_vowel(self._current - 1)
+             and not (self._is_vowel(self._current - 2) and (self._char_at(self._current - 1) == "H"))  # e.g. "myhre", "bahre"
+             and (((self._current + 1) == self._last)
+                 or (((self._current + 2) == self._last)
+                         and self._string_at((self._current + 2), 1, "D", "S")))):
+            self._metaph_add("AR")
+            return True
+
+        return False
+
+    def _encode_s(self):
+        """
+        Encode "-S-"
+        """
+        if (self._encode_skj()
+             or self._encode_sr()
+             or self._encode_special_sw()
+             or self._encode_sj()
+             or self._encode_silent_french_s_final()
+             or self._encode_silent_french_s_internal()
+             or self._encode_isl()
+             or self._encode_stl()
+             or self._encode_christmas()
+             or self._encode_sthm()
+             or self._encode_isten()
+             or self._encode_sugar()
+             or self._encode_sh()
+             or self._encode_sch()
+             or self._encode_sur()
+             or self._encode_su()
+             or self._encode_ssio()
+             or self._encode_ss()
+             or self._encode_sia()
+             or self._encode_sio()
+             or self._encode_anglicisations()
+             or self._encode_sc()
+             or self._encode_sea_sui_sier()
+             or self._encode_sea()):
+            return
+
+        self._metaph_add("S")
+
+        if (self._string_at((self._current + 1), 1, "S", "Z")
+             and not self._string_at((self._current + 1), 2, "SH")):
+            self._current += 2
+        else:
+            self._current += 1
+
+    def _encode_sr(self):
+        """
+        Encode "SRI-" and "SRE-" as XR
+        except for "sriracha" where the first 'R' is silent
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # popular hot sauce - first 'R' silent
+        if self._string_at(0, 8, "SRIRACHA"):
+            self._metaph_add("S")
+            self._current += 2
+            return True
+
+        # hindi "SRI-" and bosnian "SRE-"
+        if self._string_at(0, 3, "SRI", "SRE"):
+            self._metaph_add_with_alt("X", "S")
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_special_sw(self):
+        """
+        Encode a couple of contexts where scandinavian, slavic
+        or german names should get an alternate, native
+        pronunciation of 'SV' or 'XV'
+
+        Returns:
+            true if handled
+        """
+        if self._current == 0:
+            #
+            if self._names_beginning_with_sw_that_get_alt_sv():
+                self._metaph_add_with_alt("S", "SV")
+                self._current += 2
+                return True
+
+            #
+            if self._names_beginning_with_sw_that_get_alt_xv():
+                self._metaph_add_with_alt("S", "XV")
+                self._current += 2
+                return True
+
+        return False
+
+    def _encode_skj(self):
+        """
+        Encode "-SKJ-" as X ("sh"), since americans pronounce
+        the name Dag Hammerskjold as "hammer-shold"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # scandinavian
+        if (self._string_at(self._current, 4, "SKJO", "SKJU")
+             and self._is_vowel(self._current + 3)):
+            self._metaph_add("X")
+            self._current += 3
+            return True
+
+        return False
+
+    def _encode_sj(self):
+        """
+        Encode initial swedish "SJ-" as X ("sh")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(0, 2, "SJ"):
+            self._metaph_add("X")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_silent_french_s_final(self):
+        """
+        Encode final 'S' in words from the french, where they
+        are not pronounced
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # "louis" is an exception because it gets two pronuncuations
+        if self._string_at(0, 5, "LOUIS") and (self._current == self._last):
+            self._metaph_add_with_alt("S", "")
+            self._current += 1
+            return True
+
+        # french words familiar to americans where final s is silent
+        if ((self._current == self._last)
+             and (self._string_at(0, 4, "YVES")
+             or (self._string_at(0, 4, "HORS") and (self._current == 3))
+             or self._string_at((self._current - 4), 5, "CAMUS", "YPRES")
+             or self._string_at((self._current - 5), 6, "MESNES", "DEBRIS", "BLANCS", "INGRES", "CANNES")
+             or self._string_at((self._current - 6), 7, "CHABLIS", "APROPOS", "JACQUES", "ELYSEES", "OEUVRES",
+                                             "GEORGES", "DESPRES")
+             or self._string_at(0, 8, "ARKANSAS", "FRANCAIS", "CRUDITES", "BRUYERES")
+             or self._string_at(0, 9, "DESCARTES", "DESCHUTES", "DESCHAMPS", "DESROCHES", "DESCHENES")
+             or self._string_at(0, 10, "RENDEZVOUS")
+             or self._string_at(0, 11, "CONTRETEMPS", "DESLAURIERS"))
+             or ((self._current == self._last)
+                     and self._string_at((self._current - 2), 2, "AI", "OI", "UI")
+                     and not self._string_at(0, 4, "LOIS", "LUIS"))):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_silent_french_s_internal(self):
+        """
+        Encode non-final 'S' in words from the french where they
+        are not pronounced.
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # french words familiar to americans where internal s is silent
+        if (self._string_at((self._current - 2), 9, "DESCARTES")
+             or self._string_at((self._current - 2), 7, "DESCHAM", "DESPRES", "DESROCH", "DESROSI", "DESJARD", "DESMARA",
+                         "DESCHEN", "DESHOTE", "DESLAUR")
+             or self._string_at((self._current - 2), 6, "MESNES")
+             or self._string_at((self._current - 5), 8, "DUQUESNE", "DUCHESNE")
+             or self._string_at((self._current - 7), 10, "BEAUCHESNE")
+             or self._string_at((self._current - 3), 7, "FRESNEL")
+             or self._string_at((self._current - 3), 9, "GROSVENOR")
+             or self._string_at((self._current - 4), 10, "LOUISVILLE")
+             or self._string_at((self._current - 7), 10, "ILLINOISAN")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_isl(self):
+        """
+        Encode silent 'S' in context of "-ISL-"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # special cases 'island', 'isle', 'carlisle', 'carlysle'
+        if ((self._string_at((self._current - 2), 4, "LISL", "LYSL", "AISL")
+             and not self._string_at((self._current - 3), 7, "PAISLEY", "BAISLEY", "ALISLAM", "ALISLAH", "ALISLAA"))
+             or ((self._current == 1)
+                 and ((self._string_at((self._current - 1), 4, "ISLE")
+                     or self._string_at((self._current - 1), 5, "ISLAN"))
+                     and not self._string_at((self._current - 1), 5, "ISLEY", "ISLER")))):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_stl(self):
+        """
+        Encode "-STL-" in contexts where the 'T' is silent. Also
+        encode "-USCLE-" in contexts where the 'C' is silent
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'hustle', 'bustle', 'whistle'
+        if ((self._string_at(self._current, 4, "STLE", "STLI")
+                 and not self._string_at((self._current + 2), 4, "LESS", "LIKE", "LINE"))
+             or self._string_at((self._current - 3), 7, "THISTLY", "BRISTLY", "GRISTLY")
+               # e.g. "corpuscle"
+             or self._string_at((self._current - 1), 5, "USCLE")):
+            # KRISTEN, KRYSTLE, CRYSTLE, KRISTLE all pronounce the 't'
+            # also, exceptions where "-LING" is a nominalizing suffix
+            if (self._string_at(0, 7, "KRISTEN", "KRYSTLE", "CRYSTLE", "KRISTLE")
+                 or self._string_at(0, 11, "CHRISTENSEN", "CHRISTENSON")
+                 or self._string_at((self._current - 3), 9, "FIRSTLING")
+                 or self._string_at((self._current - 2), 8, "NESTLING", "WESTLING")):
+                self._metaph_add("ST")
+                self._current += 2
+            else:
+                if (self.encode_vowels
+                     and (self._char_at(self._current + 3) == "E")
+                     and (self._char_at(self._current + 4) != "R")
+                     and not self._string_at((self._current + 3), 4, "ETTE", "ETTA")
+                     and not self._string_at((self._current + 3), 2, "EY")):
+                    self._metaph_add("SAL")
+                    self._flag_al_inversion = True
+                else:
+                    self._metaph_add("SL")
+                self._current += 3
+            return True
+
+        return False
+
+    def _encode_christmas(self):
+        """
+        Encode "christmas". Americans always pronounce this as "krissmuss"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'christmas'
+        if self._string_at((self._current - 4), 8, "CHRISTMA"):
+            self._metaph_add("SM")
+            self._current += 3
+            return True
+
+        return False
+
+    def _encode_sthm(self):
+        """
+        Encode "-STHM-" in contexts where the 'TH'
+        is silent.
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'asthma', 'isthmus'
+        if self._string_at(self._current, 4, "STHM"):
+            self._metaph_add("SM")
+            self._current += 4
+            return True
+
+        return False
+
+    def _encode_isten(self):
+        """
+        Encode "-ISTEN-" and "-STNT-" in contexts
+        where the 'T' is silent
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 't' is silent in verb, pronounced in name
+        if self._string_at(0, 8, "CHRISTEN"):
+            # the word itself
+            if (self._root_or_inflections(self._word, "CHRISTEN")
+                 or self._string_at(0, 11, "CHRISTENDOM")):
+                self._metaph_add_with_alt("S", "ST")
+            else:
+                # e.g. 'christenson', 'christene'
+                self._metaph_add("ST")
+            self._current += 2
+            return True
+
+        # e.g. 'glisten', 'listen'
+        if (self._string_at((self._current - 2), 6, "LISTEN", "RISTEN", "HASTEN", "FASTEN", "MUSTNT")
+             or self._string_at((self._current - 3), 7, "MOISTEN")):
+            self._metaph_add("S")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_sugar(self):
+        """
+        Encode special case "sugar"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # special case 'sugar-'
+        if self._string_at(self._current, 5, "SUGAR"):
+            self._metaph_add("X")
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_sh(self):
+        """
+        Encode "-SH-" as X ("sh"), except in cases
+        where the 'S' and 'H' belong to different combining
+        roots and are therefore pronounced seperately
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "SH"):
+            # exception
+            if self._string_at((self._current - 2), 8, "CASHMERE"):
+                self._metaph_add("J")
+                self._current += 2
+                return True
+
+            # combining forms, e.g. 'clotheshorse', 'woodshole'
+            if ((self._current > 0)
+                   # e.g. "mishap"
+                 and ((self._string_at((self._current + 1), 3, "HAP") and ((self._current + 3) == self._last))
+                   # e.g. "hartsheim", "clothshorse"
+                 or self._string_at((self._current + 1), 4, "HEIM", "HOEK", "HOLM", "HOLZ", "HOOD", "HEAD", "HEID",
+                                                 "HAAR", "HORS", "HOLE", "HUND", "HELM", "HAWK", "HILL")
+                   # e.g. "dishonor"
+                 or self._string_at((self._current + 1), 5, "HEART", "HATCH", "HOUSE", "HOUND", "HONOR")
+                   # e.g. "mishear"
+                 or (self._string_at((self._current + 2), 3, "EAR") and ((self._current + 4) == self._last))
+                   # e.g. "hartshorn"
+                 or (self._string_at((self._current + 2), 3, "ORN") and not self._string_at((self._current - 2), 7, "UNSHORN"))
+                   # e.g. "newshour" but not "bashour", "manshour"
+                 or (self._string_at((self._current + 1), 4, "HOUR")
+                     and not (self._string_at(0, 7, "BASHOUR") or self._string_at(0, 8, "MANSHOUR") or self._string_at(0, 6, "ASHOUR")))
+                   # e.g. "dishonest", "grasshopper"
+                 or self._string_at((self._current + 2), 5, "ARMON", "ONEST", "ALLOW", "OLDER", "OPPER", "EIMER", "ANDLE", "ONOUR")
+                   # e.g. "dishabille", "transhumance"
+                 or self._string_at((self._current + 2), 6, "ABILLE", "UMANCE", "ABITUA"))):
+                if not self._string_at((self._current - 1), 1, "S"):
+                    self._metaph_add("S")
+            else:
+                self._metaph_add("X")
+
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_sch(self):
+        """
+        Encode "-SCH-" in cases where the 'S' is pronounced
+        seperately from the "CH", in words from the dutch, italian,
+        and greek where it can be pronounced SK, and german words
+        where it is pronounced X ("sh")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # these words were combining forms many centuries ago
+        if self._string_at((self._current + 1), 2, "CH"):
+            if ((self._current > 0)
+                   # e.g. "mischief", "escheat"
+                 and (self._string_at((self._current + 3), 3, "IEF", "EAT")
+                   # e.g. "mischance"
+                 or self._string_at((self._current + 3), 4, "ANCE", "ARGE")
+                   # e.g. "eschew"
+                 or self._string_at(0, 6, "ESCHEW"))):
+                self._metaph_add("S")
+                self._current += 1
+                return True
+
+            # Schlesinger's rule
+            # dutch, danish, italian, greek origin, e.g. "school", "schooner", "schiavone", "schiz-"
+            if ((self._string_at((self._current + 3), 2, "OO", "ER", "EN", "UY", "ED", "EM", "IA", "IZ", "IS", "OL")
+                     and not self._string_at(self._current, 6, "SCHOLT", "SCHISL", "SCHERR"))
+                 or self._string_at((self._current + 3), 3, "ISZ")
+                 or (self._string_at((self._current - 1), 6, "ESCHAT", "ASCHIN", "ASCHAL", "ISCHAE", "ISCHIA")
+                         and not self._string_at((self._current - 2), 8, "FASCHING"))
+                 or (self._string_at((self._current - 1), 5, "ESCHI") and ((self._current + 3) == self._last))
+                 or (self._char_at(self._current + 3) == "Y")):
+                # e.g. "schermerhorn", "schenker", "schistose"
+                if (self._string_at((self._current + 3), 2, "ER", "EN", "IS")
+                     and (((self._current + 4) == self._last)
+                         or self._string_at((self._current + 3), 3, "ENK", "ENB", "IST"))):
+                    self._metaph_add_with_alt("X", "SK")
+                else:
+                    self._metaph_add("SK")
+                self._current += 3
+                return True
+            else:
+                self._metaph_add("X")
+                self._current += 3
+                return True
+
+        return False
+
+    def _encode_sur(self):
+        """
+        Encode "-SUR<E,A,Y>-" to J, unless it is at the beginning,
+        or preceeded by 'N', 'K', or "NO"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'erasure', 'usury'
+        if self._string_at((self._current + 1), 3, "URE", "URA", "URY"):
+            # 'sure', 'ensure'
+            if ((self._current == 0)
+                or self._string_at((self._current - 1), 1, "N", "K")
+                or self._string_at((self._current - 2), 2, "NO")):
+                self._metaph_add("X")
+            else:
+                self._metaph_add("J")
+
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_su(self):
+        """
+        Encode "-SU<O,A>-" to X ("sh") unless it is preceeded by
+        an 'R', in which case it is encoded to S, or it is
+        preceeded by a vowel, in which case it is encoded to J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'sensuous', 'consensual'
+        if self._string_at((self._current + 1), 2, "UO", "UA") and (self._current != 0):
+            # exceptions e.g. "persuade"
+            if self._string_at((self._current - 1), 4, "RSUA"):
+                self._metaph_add("S")
+            # exceptions e.g. "casual"
+            elif self._is_vowel(self._current - 1):
+                self._metaph_add_with_alt("J", "S")
+            else:
+                self._metaph_add_with_alt("X", "S")
+
+            self._advance_counter(3, 1)
+            return True
+
+        return False
+
+    def _encode_ssio(self):
+        """
+        Encodes "-SSIO-" in contexts where it is pronounced
+        either J or X ("sh")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at((self._current + 1), 4, "SION"):
+            # "abcission"
+            if self._string_at((self._current - 2), 2, "CI"):
+                self._metaph_add("J")
+            else:
+                # 'mission'
+                if self._is_vowel(self._current - 1):
+                    self._metaph_add("X")
+
+            self._advance_counter(4, 2)
+            return True
+
+        return False
+
+    def _encode_ss(self):
+        """
+        Encode "-SS-" in contexts where it is pronounced X ("sh")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "russian", "pressure"
+        if (self._string_at((self._current - 1), 5, "USSIA", "ESSUR", "ISSUR", "ISSUE")
+               # e.g. "hessian", "assurance"
+             or self._string_at((self._current - 1), 6, "ESSIAN", "ASSURE", "ASSURA", "ISSUAB", "ISSUAN", "ASSIUS")):
+            self._metaph_add("X")
+            self._advance_counter(3, 2)
+            return True
+
+        return False
+
+    def _encode_sia(self):
+        """
+        Encodes "-SIA-" in contexts where it is pronounced
+        as X ("sh"), J, or S
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "controversial", also "fuchsia", "ch" is silent
+        if (self._string_at((self._current - 2), 5, "CHSIA")
+             or self._string_at((self._current - 1), 5, "RSIAL")):
+            self._metaph_add("X")
+            self._advance_counter(3, 1)
+            return True
+
+        # names generally get 'X' where terms, e.g. "aphasia" get 'J'
+        if ((self._string_at(0, 6, "ALESIA", "ALYSIA", "ALISIA", "STASIA")
+                 and (self._current == 3)
+                 and not self._string_at(0, 9, "ANASTASIA"))
+             or self._string_at((self._current - 5), 9, "DIONYSIAN")
+             or self._string_at((self._current - 5), 8, "THERESIA")):
+            self._metaph_add_with_alt("X", "S")
+            self._advance_counter(3, 1)
+            return True
+
+        if ((self._string_at(self._current, 3, "SIA") and ((self._current + 2) == self._last))
+             or (self._string_at(self._current, 4, "SIAN") and ((self._current + 3) == self._last))
+             or self._string_at((self._current - 5), 9, "AMBROSIAL")):
+            if ((self._is_vowel(self._current - 1) or self._string_at((self._current - 1), 1, "R"))
+                  # exclude compounds based on names, or french or greek words
+                and not (self._string_at(0, 5, "JAMES", "NICOS", "PEGAS", "PEPYS")
+                or self._string_at(0, 6, "HOBBES", "HOLMES", "JAQUES", "KEYNES")
+                or self._string_at(0, 7, "MALTHUS", "HOMOOUS")
+                or self._string_at(0, 8, "MAGLEMOS", "HOMOIOUS")
+                or self._string_at(0, 9, "LEVALLOIS", "TARDENOIS")
+                or self._string_at((self._current - 4), 5, "ALGES"))):
+                self._metaph_add("J")
+            else:
+                self._metaph_add("S")
+
+            self._advance_counter(2, 1)
+            return True
+        return False
+
+    def _encode_sio(self):
+        """
+        Encodes "-SIO-" in contexts where it is pronounced
+        as J or X ("sh")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # special case, irish name
+        if self._string_at(0, 7, "SIOBHAN"):
+            self._metaph_add("X")
+            self._advance_counter(3, 1)
+            return True
+
+        if self._string_at((self._current + 1), 3, "ION"):
+            # e.g. "vision", "version"
+            if self._is_vowel(self._current - 1) or self._string_at((self._current - 2), 2, "ER", "UR"):
+                self._metaph_add("J")
+            else:
+                # e.g. "declension"
+                self._metaph_add("X")
+
+            self._advance_counter(3, 1)
+            return True
+
+        return False
+
+    def _encode_anglicisations(self):
+        """
+        Encode cases where "-S-" might well be from a german name
+        and add encoding of german pronounciation in the alternate key
+        so that it can be found in a genealogical search
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # german & anglicisations, e.g. 'smith' match 'schmidt', 'snider' match 'schneider'
+        # also, -sz- in slavic language altho in hungarian it is pronounced 's'
+        if (((self._current == 0)
+             and self._string_at((self._current + 1), 1, "M", "N", "L"))
+             or self._string_at((self._current + 1), 1, "Z")):
+            self._metaph_add_with_alt("S", "X")
+
+            # eat redundant 'Z'
+            if self._string_at((self._current + 1), 1, "Z"):
+                self._current += 2
+            else:
+                self._current += 1
+
+            return True
+
+        return False
+
+    def _encode_sc(self):
+        """
+        Encode "-SC<vowel>-" in contexts where it is silent,
+        or pronounced as X ("sh"), S, or SK
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "SC"):
+            # exception 'viscount'
+            if self._string_at((self._current - 2), 8, "VISCOUNT"):
+                self._current += 1
+                return True
+
+            # encode "-SC<front vowel>-"
+            if self._string_at((self._current + 2), 1, "I", "E", "Y"):
+                # e.g. "conscious"
+                if (self._string_at((self._current + 2), 4, "IOUS")
+                       # e.g. "prosciutto"
+                     or self._string_at((self._current + 2), 3, "IUT")
+                     or self._string_at((self._current - 4), 9, "OMNISCIEN")
+                       # e.g. "conscious"
+                     or self._string_at((self._current - 3), 8, "CONSCIEN", "CRESCEND", "CONSCION")
+                     or self._string_at((self._current - 2), 6, "FASCIS")):
+                    self._metaph_add("X")
+                elif (self._string_at(self._current, 7, "SCEPTIC", "SCEPSIS")
+                        or self._string_at(self._current, 5, "SCIVV", "SCIRO")
+                          # commonly pronounced this way in u.s.
+                        or self._string_at(self._current, 6, "SCIPIO")
+                        or self._string_at((self._current - 2), 10, "PISCITELLI")):
+                    self._metaph_add("SK")
+                else:
+                    self._metaph_add("S")
+                self._current += 2
+                return True
+
+            self._metaph_add("SK")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_sea_sui_sier(self):
+        """
+        Encode "-S<EA,UI,IER>-" in contexts where it is pronounced
+        as J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # "nausea" by itself has => NJ as a more likely encoding. Other forms
+        # using "nause-" (see Encode_SEA()) have X or S as more familiar pronounciations
+        if ((self._string_at((self._current - 3), 6, "NAUSEA") and ((self._current + 2) == self._last))
+               # e.g. "casuistry", "frasier", "hoosier"
+             or self._string_at((self._current - 2), 5, "CASUI")
+             or (self._string_at((self._current - 1), 5, "OSIER", "ASIER")
+                     and not (self._string_at(0, 6, "EASIER")
+                         or self._string_at(0, 5, "OSIER")
+                         or self._string_at((self._current - 2), 6, "ROSIER", "JOSIER", "COSIER", "NOSIER")))):
+            self._metaph_add_with_alt("J", "X")
+            self._advance_counter(3, 1)
+            return True
+
+        return False
+
+    def _encode_sea(self):
+        """
+        Encode cases where "-SE-" is pronounced as X ("sh")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if ((self._string_at(0, 4, "SEAN") and ((self._current + 3) == self._last))
+             or (self._string_at((self._current - 3), 6, "NAUSEO")
+             and not self._string_at((self._current - 3), 7, "NAUSEAT"))):
+            self._metaph_add("X")
+            self._advance_counter(3, 1)
+            return True
+
+        return False
+
+    def _encode_t(self):
+        """
+        Encode "-T-"
+        """
+        if (self._encode_t_initial()
+             or self._encode_tch()
+             or self._encode_silent_french_t()
+             or self._encode_tun_tul_tua_tuo()
+             or self._encode_tue_teu_teou_tul_tie()
+             or self._encode_tur_tiu_suffixes()
+             or self._encode_ti()
+             or self._encode_tient()
+             or self._encode_tsch()
+             or self._encode_tzsch()
+             or self._encode_th_pronounced_separately()
+             or self._encode_tth()
+             or self._encode_th()):
+            return
+
+        # eat redundant 'T' or 'D'
+        if self._string_at((self._current + 1), 1, "T", "D"):
+            self._current += 2
+        else:
+            self._current += 1
+
+        self._metaph_add("T")
+
+    def _encode_t_initial(self):
+        """
+        Encode some exceptions for initial 'T'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._current == 0:
+            # americans usually pronounce "tzar" as "zar"
+            if self._string_at((self._current + 1), 3, "SAR", "ZAR"):
+                self._current += 1
+                return True
+
+            # "tx-" e.g. "Txalaka" basque spelling pronounced as "tch"
+            if self._string_at((self._current + 1), 1, "X"):
+                self._metaph_add("X")
+                self._current += 2
+                return True
+
+            # old 'École française d'Extrême-Orient' chinese pinyin where 'ts-' => 'X'
+            if (((self._length == 3) and self._string_at((self._current + 1), 2, "SO", "SA", "SU"))
+                or ((self._length == 4) and self._string_at((self._current + 1), 3, "SAO", "SAI"))
+                or ((self._length == 5) and self._string_at((self._current + 1), 4, "SING", "SANG"))):
+                self._metaph_add("X")
+                self._advance_counter(3, 2)
+                return True
+
+            # "TS<vowel>-" at start can be pronounced both with and without 'T'
+            if self._string_at((self._current + 1), 1, "S") and self._is_vowel(self._current + 2):
+                self._metaph_add_with_alt("TS", "S")
+                self._advance_counter(3, 2)
+                return True
+
+            # e.g. "Tjaarda"
+            if self._string_at((self._current + 1), 1, "J"):
+                self._metaph_add("X")
+                self._advance_counter(3, 2)
+                return True
+
+            # cases where initial "TH-" is pronounced as T and not 0 ("th")
+            if ((self._string_at((self._current + 1), 2, "HU") and (self._length == 3))
+                or self._string_at((self._current + 1), 3, "HAI", "HUY", "HAO")
+                or self._string_at((self._current + 1), 4, "HYME", "HYMY", "HANH")
+                or self._string_at((self._current + 1), 5, "HERES")):
+                self._metaph_add("T")
+                self._advance_counter(3, 2)
+                return True
+
+        return False
+
+    def _encode_tch(self):
+        """
+        Encode "-TCH-", reliably X ("sh", or in this case, "ch")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at((self._current + 1), 2, "CH"):
+            self._metaph_add("X")
+            self._current += 3
+            return True
+
+        return False
+
+    def _encode_silent_french_t(self):
+        """
+        Encode the many cases where americans are aware that a certain word is
+        french and know to not pronounce the 'T'
+
+        Returns:
+            true if encoding handled in this routine, false if not TOUCHET CHABOT BENOIT
+        """
+        # french silent T familiar to americans
+        if (((self._current == self._last) and self._string_at((self._current - 4), 5, "MONET", "GENET", "CHAUT"))
+             or self._string_at((self._current - 2), 9, "POTPOURRI")
+             or self._string_at((self._current - 3), 9, "BOATSWAIN")
+             or self._string_at((self._current - 3), 8, "MORTGAGE")
+             or (self._string_at((self._current - 4), 5, "BERET", "BIDET", "FILET", "DEBUT", "DEPOT", "PINOT", "TAROT")
+             or self._string_at((self._current - 5), 6, "BALLET", "BUFFET", "CACHET", "CHALET", "ESPRIT", "RAGOUT", "GOULET",
+                                             "CHABOT", "BENOIT")
+             or self._string_at((self._current - 6), 7, "GOURMET", "BOUQUET", "CROCHET", "CROQUET", "PARFAIT", "PINCHOT",
+                                             "CABARET", "PARQUET", "RAPPORT", "TOUCHET", "COURBET", "DIDEROT")
+             or self._string_at((self._current - 7), 8, "ENTREPOT", "CABERNET", "DUBONNET", "MASSENET", "MUSCADET", "RICOCHET", "ESCARGOT")
+             or self._string_at((self._current - 8), 9, "SOBRIQUET", "CABRIOLET", "CASSOULET", "OUBRIQUET", "CAMEMBERT"))
+             and not self._string_at((self._current + 1), 2, "AN", "RY", "IC", "OM", "IN")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_tun_tul_tua_tuo(self):
+        """
+        Encode "-TU<N,L,A,O>-" in cases where it is pronounced
+        X ("sh", or in this case, "ch")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "fortune", "fortunate"
+        if (self._string_at((self._current - 3), 6, "FORTUN")
+               # e.g. "capitulate"
+             or (self._string_at(self._current, 3, "TUL")
+                 and (self._is_vowel(self._current - 1) and self._is_vowel(self._current + 3)))
+               # e.g. "obituary", "barbituate"
+             or self._string_at((self._current - 2), 5, "BITUA", "BITUE")
+               # e.g. "actual"
+             or ((self._current > 1) and self._string_at(self._current, 3, "TUA", "TUO"))):
+            self._metaph_add_with_alt("X", "T")
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_tue_teu_teou_tul_tie(self):
+        """
+        Encode "-T<vowel>-" forms where 'T' is pronounced as X
+        ("sh", or in this case "ch")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'constituent', 'pasteur'
+        if (self._string_at((self._current + 1), 4, "UENT")
+             or self._string_at((self._current - 4), 9, "RIGHTEOUS")
+             or self._string_at((self._current - 3), 7, "STATUTE")
+             or self._string_at((self._current - 3), 7, "AMATEUR")
+               # e.g. "blastula", "pasteur"
+             or (self._string_at((self._current - 1), 5, "NTULE", "NTULA", "STULE", "STULA", "STEUR"))
+               # e.g. "statue"
+             or (((self._current + 2) == self._last) and self._string_at(self._current, 3, "TUE"))
+               # e.g. "constituency"
+             or self._string_at(self._current, 5, "TUENC")
+               # e.g. "statutory"
+             or self._string_at((self._current - 3), 8, "STATUTOR")
+               # e.g. "patience"
+             or (((self._current + 5) == self._last) and self._string_at(self._current, 6, "TIENCE"))):
+            self._metaph_add_with_alt("X", "T")
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_tur_tiu_suffixes(self):
+        """
+        Encode "-TU-" forms in suffixes where it is usually
+        pronounced as X ("sh")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'adventure', 'musculature'
+        if (self._current > 0) and self._string_at((self._current + 1), 3, "URE", "URA", "URI", "URY", "URO", "IUS"):
+            # exceptions e.g. 'tessitura', mostly from romance languages
+            if ((self._string_at((self._current + 1), 3, "URA", "URO")
+                  # && !this.StringAt((m_current + 1), 4, "URIA", "")
+                and ((self._current + 3) == self._last))
+                and not self._string_at((self._current - 3), 7, "VENTURA")
+                  # e.g. "kachaturian", "hematuria"
+                or self._string_at((self._current + 1), 4, "URIA")):
+                self._metaph_add("T")
+            else:
+                self._metaph_add_with_alt("X", "T")
+
+            self._advance_counter(2, 1)
+            return True
+
+        return False
+
+    def _encode_ti(self):
+        """
+        Encode "-TI<O,A,U>-" as X ("sh"), except
+        in cases where it is part of a combining form,
+        or as J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # '-tio-', '-tia-', '-tiu-'
+        # except combining forms where T already pronounced e.g 'rooseveltian'
+        if ((self._string_at((self._current + 1), 2, "IO") and not self._string_at((self._current - 1), 5, "ETIOL"))
+             or self._string_at((self._current + 1), 3, "IAL")
+             or self._string_at((self._current - 1), 5, "RTIUM", "ATIUM")
+             or ((self._string_at((self._current + 1), 3, "IAN") and (self._current > 0))
+                     and not (self._string_at((self._current - 4), 8, "FAUSTIAN")
+             or self._string_at((self._current - 5), 9, "PROUSTIAN")
+             or self._string_at((self._current - 2), 7, "TATIANA")
+             or (self._string_at((self._current - 3), 7, "KANTIAN", "GENTIAN")
+             or self._string_at((self._current - 8), 12, "ROOSEVELTIAN")))
+             or (((self._current + 2) == self._last)
+                     and self._string_at(self._current, 3, "TIA")
+               # exceptions to above rules where the pronounciation is usually X
+             and not (self._string_at((self._current - 3), 6, "HESTIA", "MASTIA")
+                 or self._string_at((self._current - 2), 5, "OSTIA")
+                 or self._string_at(0, 3, "TIA")
+                 or self._string_at((self._current - 5), 8, "IZVESTIA")))
+             or self._string_at((self._current + 1), 4, "IATE", "IATI", "IABL", "IATO", "IARY")
+             or self._string_at((self._current - 5), 9, "CHRISTIAN"))):
+            if (((self._current == 2) and self._string_at(0, 4, "ANTI"))
+                 or self._string_at(0, 5, "PATIO", "PITIA", "DUTIA")):
+                self._metaph_add("T")
+            elif self._string_at((self._current - 4), 8, "EQUATION"):
+                self._metaph_add("J")
+            else:
+                if self._string_at(self._current, 4, "TION"):
+                    self._metaph_add("X")
+                elif self._string_at(0, 5, "KATIA", "LATIA"):
+                    self._metaph_add_with_alt("T", "X")
+                else:
+                    self._metaph_add_with_alt("X", "T")
+
+            self._advance_counter(3, 1)
+            return True
+
+        return False
+
+    def _encode_tient(self):
+        """
+        Encode "-TIENT-" where "TI" is pronounced X ("sh")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. 'patient'
+        if self._string_at((self._current + 1), 4, "IENT"):
+            self._metaph_add_with_alt("X", "T")
+            self._advance_counter(3, 1)
+            return True
+
+        return False
+
+    def _encode_tsch(self):
+        """
+        Encode "-TSCH-" as X ("ch")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'deutsch'
+        if (self._string_at(self._current, 4, "TSCH")
+               # combining forms in german where the 'T' is pronounced seperately
+             and not self._string_at((self._current - 3), 4, "WELT", "KLAT", "FEST")):
+            # pronounced the same as "ch" in "chit" => X
+            self._metaph_add("X")
+            self._current += 4
+            return True
+
+        return False
+
+    def _encode_tzsch(self):
+        """
+        Encode "-TZSCH-" as X ("ch")
+
+        "Neitzsche is peachy"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'neitzsche'
+        if self._string_at(self._current, 5, "TZSCH"):
+            self._metaph_add("X")
+            self._current += 5
+            return True
+
+        return False
+
+    def _encode_th_pronounced_separately(self):
+        """
+        Encodes cases where the 'H' in "-TH-" is the beginning of
+        another word in a combining form, special cases where it is
+        usually pronounced as 'T', and a special case where it has
+        become pronounced as X ("sh", in this case "ch")
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'adulthood', 'bithead', 'apartheid'
+        if (((self._current > 0)
+                 and self._string_at((self._current + 1), 4, "HOOD", "HEAD", "HEID", "HAND", "HILL", "HOLD",
+                                                 "HAWK", "HEAP", "HERD", "HOLE", "HOOK", "HUNT",
+                                                 "HUMO", "HAUS", "HOFF", "HARD", "HIDE")
+                 and not self._string_at((self._current - 3), 5, "SOUTH", "NORTH"))
+             or self._string_at((self._current + 1), 5, "HOUSE", "HEART", "HASTE", "HYPNO", "HEQUE", "HOUND")
+             or ((self._current > 0) and self._string_at((self._current + 1), 6, "HAMMER"))
+               # watch out for greek root "-thallic"
+             or (self._string_at((self._current + 1), 4, "HALL")
+                 and ((self._current + 4) == self._last)
+                 and not self._string_at((self._current - 3), 5, "SOUTH", "NORTH"))
+             or (self._string_at((self._current + 1), 3, "HAM")
+                     and ((self._current + 3) == self._last)
+                     and not (self._string_at(0, 6, "GOTHAM", "WITHAM", "LATHAM")
+                          or self._string_at(0, 7, "BENTHAM", "WALTHAM", "WORTHAM")
+                          or self._string_at(0, 8, "GRANTHAM")))
+             or (self._string_at((self._current + 1), 5, "HATCH")
+             and not ((self._current == 0) or self._string_at((self._current - 2), 8, "UNTHATCH")))
+             or self._string_at((self._current - 3), 7, "WARTHOG")
+               # and some special cases where "-TH-" is usually pronounced 'T'
+             or self._string_at((self._current - 2), 6, "ESTHER")
+             or self._string_at((self._current - 3), 6, "GOETHE")
+             or self._string_at((self._current - 2), 8, "NATHALIE")):
+            # special case
+            if self._string_at((self._current - 3), 7, "POSTHUM"):
+                self._metaph_add("X")
+            else:
+                self._metaph_add("T")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_tth(self):
+        """
+        Encode the "-TTH-" in "matthew", eating the redundant 'T'
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'matthew' vs. 'outthink'
+        if self._string_at(self._current, 3, "TTH"):
+            if self._string_at((self._current - 2), 5, "MATTH"):
+                self._metaph_add("0")
+            else:
+                self._metaph_add("T0")
+            self._current += 3
+            return True
+
+        return False
+
+    def _encode_th(self):
+        """
+        Encode "-TH-". 0 (zero) is used in Metaphone to encode this sound
+        when it is pronounced as a dipthong, either voiced or unvoiced
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "TH"):
+            # '-clothes-'
+            if self._string_at((self._current - 3), 7, "CLOTHES"):
+                # vowel already encoded so skip right to S
+                self._current += 3
+                return True
+
+            # special case "thomas", "thames", "beethoven" or germanic words
+            if (self._string_at((self._current + 2), 4, "OMAS", "OMPS", "OMPK", "OMSO", "OMSE",
+                                             "AMES", "OVEN", "OFEN", "ILDA", "ILDE")
+                 or (self._string_at(0, 4, "THOM") and (self._length == 4))
+                 or (self._string_at(0, 5, "THOMS") and (self._length == 5))
+                 or self._string_at(0, 4, "VAN ", "VON ")
+                 or self._string_at(0, 3, "SCH")):
+                self._metaph_add("T")
+            else:
+                # give an 'etymological' 2nd
+                # encoding for "smith"
+                if self._string_at(0, 2, "SM"):
+                    self._metaph_add_with_alt("0", "T")
+                else:
+                    self._metaph_add("0")
+
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_v(self):
+        """
+        Encode "-V-"
+        """
+        # eat redundant 'V'
+        if self._char_at(self._current + 1) == "V":
+            self._current += 2
+        else:
+            self._current += 1
+
+        self._metaph_add_exact_approx("V", "F")
+
+    def _encode_w(self):
+        """
+        Encode "-W-"
+        """
+        if (self._encode_silent_w_at_beginning()
+             or self._encode_witz_wicz()
+             or self._encode_wr()
+             or self._encode_initial_w_vowel()
+             or self._encode_wh()
+             or self._encode_eastern_european_w()):
+            return
+
+        # e.g. 'zimbabwe'
+        if (self.encode_vowels
+             and self._string_at(self._current, 2, "WE")
+             and ((self._current + 1) == self._last)):
+            self._metaph_add("A")
+
+        # else skip it
+        self._current += 1
+
+    def _encode_silent_w_at_beginning(self):
+        """
+        Encode cases where 'W' is silent at beginning of word
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # skip these when at start of word
+        if ((self._current == 0)
+             and self._string_at(self._current, 2, "WR")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_witz_wicz(self):
+        """
+        Encode polish patronymic suffix, mapping
+        alternate spellings to the same encoding,
+        and including easern european pronounciation
+        to the american so that both forms can
+        be found in a genealogy search
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # polish e.g. 'filipowicz'
+        if ((self._current + 3) == self._last) and self._string_at(self._current, 4, "WICZ", "WITZ"):
+            if self.encode_vowels:
+                if ((len(self._primary) > 0)
+                         and self._primary[-1:] == "A"):
+                    self._metaph_add_with_alt("TS", "FAX")
+                else:
+                    self._metaph_add_with_alt("ATS", "FAX")
+            else:
+                self._metaph_add_with_alt("TS", "FX")
+            self._current += 4
+            return True
+
+        return False
+
+    def _encode_wr(self):
+        """
+        Encode "-WR-" as R ('W' always effectively silent)
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # can also be in middle of word
+        if self._string_at(self._current, 2, "WR"):
+            self._metaph_add("R")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_initial_w_vowel(self):
+        """
+        Encode "W-", adding central and eastern european
+        pronounciations so that both forms can be found
+        in a genealogy search
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (self._current == 0) and self._is_vowel(self._current + 1):
+            # Witter should match Vitter
+            if self._germanic_or_slavic_name_beginning_with_w():
+                if self.encode_vowels:
+                    self._metaph_add_exact_approx4("A", "VA", "A", "FA")
+                else:
+                    self._metaph_add_exact_approx4("A", "V", "A", "F")
+            else:
+                self._metaph_add("A")
+
+            self._current += 1
+            # don't encode vowels twice
+            self._current = self._skip_vowels(self._current)
+            return True
+
+        return False
+
+    def _encode_wh(self):
+        """
+        Encode "-WH-" either as H, or close enough to 'U' to be
+        considered a vowel
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if self._string_at(self._current, 2, "WH"):
+            # cases where it is pronounced as H
+            # e.g. 'who', 'whole'
+            if ((self._char_at(self._current + 2) == "O")
+                   # exclude cases where it is pronounced like a vowel
+                 and not (self._string_at((self._current + 2), 4, "OOSH")
+                 or self._string_at((self._current + 2), 3, "OOP", "OMP", "ORL", "ORT")
+                 or self._string_at((self._current + 2), 2, "OA", "OP"))):
+                self._metaph_add("H")
+                self._advance_counter(3, 2)
+                return True
+            else:
+                # combining forms, e.g. 'hollowhearted', 'rawhide'
+                if (self._string_at((self._current + 2), 3, "IDE", "ARD", "EAD", "AWK", "ERD",
+                                                 "OOK", "AND", "OLE", "OOD")
+                     or self._string_at((self._current + 2), 4, "EART", "OUSE", "OUND")
+                     or self._string_at((self._current + 2), 5, "AMMER")):
+                    self._metaph_add("H")
+                    self._current += 2
+                    return True
+                elif self._current == 0:
+                    self._metaph_add("A")
+                    self._current += 2
+                    # don't encode vowels twice
+                    self._current = self._skip_vowels(self._current)
+                    return True
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_eastern_european_w(self):
+        """
+        Encode "-W-" when in eastern european names, adding
+        the eastern european pronounciation to the american so
+        that both forms can be found in a genealogy search
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (self._eastern_european_name_ending(self._current)
+             or self._string_at(0, 3, "SCH")):
+            self._metaph_add_exact_approx4("", "V", "", "F")
+            self._current += 1
+            return True
+
+        return False
+
+    def _eastern_european_name_ending(self, current):
+        """
+        'W' in these contexts needs special handling
+
+        Args:
+            current
+        """
+        # Arnow should match Arnoff
+        if (((self._char_at(current) == "W")
+                     and self._is_vowel(current - 1)
+                     and (current == self._last)
+                     and (self._length > 3)
+                     and not self._english_word_ending_in_ow(current))
+             or self._string_at((current - 1), 5, "EWSKI", "EWSKY", "OWSKI", "OWSKY", "OWNIA")
+             or (self._string_at((current - 1), 4, "OWNI", "OWNY") and ((current + 2) == self._last))
+             or (self._string_at(current, 5, "WICKI", "WACKI") and ((current + 4) == self._last))
+             or self._string_at(current, 4, "WIAK", "WICZ", "WITZ") and ((current + 3) == self._last)):
+            return True
+
+        return False
+
+    def _english_word_ending_in_ow(self, current):
+        """
+        Exclude these from 2nd encoding designed to catch alt spelling of eastern european names
+
+        Args:
+            current
+        """
+        if (self._string_at((current - 3), 4, "BROW", "AVOW", "BLOW", "CHOW", "CROW", "DHOW", "FLOW", "GLOW",
+                 "GROW", "KNOW", "MEOW", "PLOW", "PROW", "SCOW", "SHOW", "SLOW", "SNOW", "STOW", "TROW")
+                 or self._string_at((current - 4), 5, "ALLOW", "ARROW", "BELOW", "ELBOW", "ENDOW", "THROW", "MIAOW")
+                 or self._string_at((current - 5), 6, "BARLOW", "BARROW", "BELLOW", "BESTOW", "BILLOW", "BORROW",
+                         "BOWWOW", "BURROW", "CALLOW", "ERENOW", "ESCROW", "FALLOW", "FARROW", "FELLOW",
+                         "FOLLOW", "FURROW", "HALLOW", "HARROW", "HAYMOW", "HOLLOW", "KOWTOW", "MALLOW",
+                         "MARROW", "MEADOW", "MELLOW", "MINNOW", "MORROW", "NARROW", "PILLOW", "POWWOW",
+                         "SHADOW", "SALLOW", "SORROW", "TALLOW", "WALLOW", "WILLOW", "WINDOW", "WINNOW", "YARROW", "YELLOW")
+                 or self._string_at((current - 6), 7, "SHALLOW", "HOOSGOW", "LONGBOW", "SOMEHOW", "SPARROW", "SWALLOW", "WHITLOW", "WINDROW")
+                 or self._string_at((current - 7), 8, "BUNGALOW", "CARASSOW", "CROSSBOW", "FURBELOW", "HEDGEROW", "HOOSEGOW", "LOBBYGOW", "CROSSBOW")):
+            return True
+
+        return False
+
+    def _encode_x(self):
+        """
+        Encode "-X-"
+        """
+        if (self._encode_initial_x()
+             or self._encode_greek_x()
+             or self._encode_x_special_cases()
+             or self._encode_x_to_h()
+             or self._encode_x_vowel()
+             or self._encode_french_x_final()):
+            return
+
+        # eat redundant 'X' or other redundant cases
+        if (self._string_at((self._current + 1), 1, "X", "Z", "S")
+               # e.g. "excite", "exceed"
+             or self._string_at((self._current + 1), 2, "CI", "CE")):
+            self._current += 2
+        else:
+            self._current += 1
+
+    def _encode_initial_x(self):
+        """
+        Encode initial X where it is usually pronounced as S
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # current chinese pinyin spelling
+        if (self._string_at(0, 3, "XIA", "XIO", "XIE")
+             or self._string_at(0, 2, "XU")):
+            self._metaph_add("X")
+            self._current += 1
+            return True
+
+        # else
+        if (self._current == 0):
+            self._metaph_add("S")
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_greek_x(self):
+        """
+        Encode X when from greek roots where it is usually pronounced as S
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'xylophone', xylem', 'xanthoma', 'xeno-'
+        if (self._string_at((self._current + 1), 3, "YLO", "YLE", "ENO")
+             or self._string_at((self._current + 1), 4, "ANTH")):
+            self._metaph_add("S")
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_x_special_cases(self):
+        """
+        Encode special cases, "LUXUR-", "Texeira"
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # 'luxury'
+        if self._string_at((self._current - 2), 5, "LUXUR"):
+            self._metaph_add_exact_approx("GJ", "KJ")
+            self._current += 1
+            return True
+
+        # 'texeira' portuguese/galician name
+        if (self._string_at(0, 7, "TEXEIRA")
+             or self._string_at(0, 8, "TEIXEIRA")):
+            self._metaph_add("X")
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_x_to_h(self):
+        """
+        Encode special case where americans know the
+        proper mexican indian pronounciation of this name
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # TODO: look for other mexican indian words
+        # where 'X' is usually pronounced this way
+        if (self._string_at((self._current - 2), 6, "OAXACA")
+             or self._string_at((self._current - 3), 7, "QUIXOTE")):
+            self._metaph_add("H")
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_x_vowel(self):
+        """
+        Encode "-X-" in vowel contexts where it is usually
+        pronounced KX ("ksh")
+        account also for BBC pronounciation of => KS
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # e.g. "sexual", "connexion" (british), "noxious"
+        if self._string_at((self._current + 1), 3, "UAL", "ION", "IOU"):
+            self._metaph_add_with_alt("KX", "KS")
+            self._advance_counter(3, 1)
+            return True
+
+        return False
+
+    def _encode_french_x_final(self):
+        """
+        Encode cases of "-X", encoding as silent when part
+        of a french word where it is not pronounced
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # french e.g. "breaux", "paix"
+        if (not ((self._current == self._last)
+             and (self._string_at((self._current - 3), 3, "IAU", "EAU", "IEU")
+             or self._string_at((self._current - 2), 2, "AI", "AU", "OU", "OI", "EU")))):
+            self._metaph_add("KS")
+
+        return False
+
+    def _encode_z(self):
+        """
+        Encode "-Z-"
+        """
+        if (self._encode_zz()
+             or self._encode_zu_zier_zs()
+             or self._encode_french_ez()
+             or self._encode_german_z()):
+            return
+
+        if self._encode_zh():
+            return
+        else:
+            self._metaph_add("S")
+
+        # eat redundant 'Z'
+        if self._char_at(self._current + 1) == "Z":
+            self._current += 2
+        else:
+            self._current += 1
+
+    def _encode_zz(self):
+        """
+        Encode cases of "-ZZ-" where it is obviously part
+        of an italian word where "-ZZ-" is pronounced as TS
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # "abruzzi", 'pizza'
+        if ((self._char_at(self._current + 1) == "Z")
+             and ((self._string_at((self._current + 2), 1, "I", "O", "A")
+             and ((self._current + 2) == self._last))
+             or self._string_at((self._current - 2), 9, "MOZZARELL", "PIZZICATO", "PUZZONLAN"))):
+            self._metaph_add_with_alt("TS", "S")
+            self._current += 2
+            return True
+
+        return False
+
+    def _encode_zu_zier_zs(self):
+        """
+        Encode special cases where "-Z-" is pronounced as J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (((self._current == 1) and self._string_at((self._current - 1), 4, "AZUR"))
+             or (self._string_at(self._current, 4, "ZIER")
+                     and not self._string_at((self._current - 2), 6, "VIZIER"))
+             or self._string_at(self._current, 3, "ZSA")):
+            self._metaph_add_with_alt("J", "S")
+
+            if self._string_at(self._current, 3, "ZSA"):
+                self._current += 2
+            else:
+                self._current += 1
+            return True
+
+        return False
+
+    def _encode_french_ez(self):
+        """
+        Encode cases where americans recognize "-EZ" as part
+        of a french word where Z not pronounced
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (((self._current == 3) and self._string_at((self._current - 3), 4, "CHEZ"))
+             or self._string_at((self._current - 5), 6, "RENDEZ")):
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_german_z(self):
+        """
+        Encode cases where "-Z-" is in a german word
+        where Z => TS in german
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        if (((self._current == 2) and ((self._current + 1) == self._last) and self._string_at((self._current - 2), 4, "NAZI"))
+             or self._string_at((self._current - 2), 6, "NAZIFY", "MOZART")
+             or self._string_at((self._current - 3), 4, "HOLZ", "HERZ", "MERZ", "FITZ")
+             or (self._string_at((self._current - 3), 4, "GANZ") and not self._is_vowel(self._current + 1))
+             or self._string_at((self._current - 4), 5, "STOLZ", "PRINZ")
+             or self._string_at((self._current - 4), 7, "VENEZIA")
+             or self._string_at((self._current - 3), 6, "HERZOG")
+               # german words beginning with "sch-" but not schlimazel, schmooze
+             or (("SCH" in self._word) and not (self._string_at((self._last - 2), 3, "IZE", "OZE", "ZEL")))
+             or ((self._current > 0) and self._string_at(self._current, 4, "ZEIT"))
+             or self._string_at((self._current - 3), 4, "WEIZ")):
+            if (self._current > 0) and self._char_at(self._current - 1) == "T":
+                self._metaph_add("S")
+            else:
+                self._metaph_add("TS")
+            self._current += 1
+            return True
+
+        return False
+
+    def _encode_zh(self):
+        """
+        Encode "-ZH-" as J
+
+        Returns:
+            true if encoding handled in this routine, false if not
+        """
+        # chinese pinyin e.g. 'zhao', also english "phonetic spelling"
+        if self._char_at(self._current + 1) == "H":
+            self._metaph_add("J")
+            self._current += 2
+            return True
+
+        return False
+
+    def _names_beginning_with_sw_that_get_alt_sv(self):
+        """
+        Test for names derived from the swedish,
+        dutch, or slavic that should get an alternate
+        pronunciation of 'SV' to match the native
+        version
+
+        Returns:
+            true if swedish, dutch, or slavic derived name
+        """
+        if (self._string_at(0, 7, "SWANSON", "SWENSON", "SWINSON", "SWENSEN",
+                           "SWOBODA")
+             or self._string_at(0, 9, "SWIDERSKI", "SWARTHOUT")
+             or self._string_at(0, 10, "SWEARENGIN")):
+            return True
+
+        return False
+
+    def _names_beginning_with_sw_that_get_alt_xv(self):
+        """
+        Test for names derived from the german
+        that should get an alternate pronunciation
+        of 'XV' to match the german version spelled
+        "schw-"
+
+        Returns:
+            true if german derived name
+        """
+        if (self._string_at(0, 5, "SWART")
+             or self._string_at(0, 6, "SWARTZ", "SWARTS", "SWIGER")
+             or self._string_at(0, 7, "SWITZER", "SWANGER", "SWIGERT",
+                               "SWIGART", "SWIHART")
+             or self._string_at(0, 8, "SWEITZER", "SWATZELL", "SWINDLER")
+             or self._string_at(0, 9, "SWINEHART")
+             or self._string_at(0, 10, "SWEARINGEN")):
+            return True
+
+        return False
+
+    def _germanic_or_slavic_name_beginning_with_w(self):
+        """
+        Test whether the word in question
+        is a name of germanic or slavic origin, for
+        the purpose of determining whether to add an
+        alternate encoding of 'V'
+
+        Returns:
+            true if germanic or slavic name
+        """
+        if (self._string_at(0, 3, "WEE", "WIX", "WAX")
+             or self._string_at(0, 4, "WOLF", "WEIS", "WAHL", "WALZ", "WEIL", "WERT",
+                               "WINE", "WILK", "WALT", "WOLL", "WADA", "WULF",
+                               "WEHR", "WURM", "WYSE", "WENZ", "WIRT", "WOLK",
+                               "WEIN", "WYSS", "WASS", "WANN", "WINT", "WINK",
+                               "WILE", "WIKE", "WIER", "WELK", "WISE")
+             or self._string_at(0, 5, "WIRTH", "WIESE", "WITTE", "WENTZ", "WOLFF", "WENDT",
+                               "WERTZ", "WILKE", "WALTZ", "WEISE", "WOOLF", "WERTH",
+                               "WEESE", "WURTH", "WINES", "WARGO", "WIMER", "WISER",
+                               "WAGER", "WILLE", "WILDS", "WAGAR", "WERTS", "WITTY",
+                               "WIENS", "WIEBE", "WIRTZ", "WYMER", "WULFF", "WIBLE",
+                               "WINER", "WIEST", "WALKO", "WALLA", "WEBRE", "WEYER",
+                               "WYBLE", "WOMAC", "WILTZ", "WURST", "WOLAK", "WELKE",
+                               "WEDEL", "WEIST", "WYGAN", "WUEST", "WEISZ", "WALCK",
+                               "WEITZ", "WYDRA", "WANDA", "WILMA", "WEBER")
+             or self._string_at(0, 6, "WETZEL", "WEINER", "WENZEL", "WESTER", "WALLEN", "WENGER",
+                               "WALLIN", "WEILER", "WIMMER", "WEIMER", "WYRICK", "WEGNER",
+                               "WINNER", "WESSEL", "WILKIE", "WEIGEL", "WOJCIK", "WENDEL",
+                               "WITTER", "WIENER", "WEISER", "WEXLER", "WACKER", "WISNER",
+                               "WITMER", "WINKLE", "WELTER", "WIDMER", "WITTEN", "WINDLE",
+                               "WASHER", "WOLTER", "WILKEY", "WIDNER", "WARMAN", "WEYANT",
+                               "WEIBEL", "WANNER", "WILKEN", "WILTSE", "WARNKE", "WALSER",
+                               "WEIKEL", "WESNER", "WITZEL", "WROBEL", "WAGNON", "WINANS",
+                               "WENNER", "WOLKEN", "WILNER", "WYSONG", "WYCOFF", "WUNDER",
+                               "WINKEL", "WIDMAN", "WELSCH", "WEHNER", "WEIGLE", "WETTER",
+                               "WUNSCH", "WHITTY", "WAXMAN", "WILKER", "WILHAM", "WITTIG",
+                               "WITMAN", "WESTRA", "WEHRLE", "WASSER", "WILLER", "WEGMAN",
+                               "WARFEL", "WYNTER", "WERNER", "WAGNER", "WISSER")
+             or self._string_at(0, 7, "WISEMAN", "WINKLER", "WILHELM", "WELLMAN", "WAMPLER", "WACHTER",
+                               "WALTHER", "WYCKOFF", "WEIDNER", "WOZNIAK", "WEILAND", "WILFONG",
+                               "WIEGAND", "WILCHER", "WIELAND", "WILDMAN", "WALDMAN", "WORTMAN",
+                               "WYSOCKI", "WEIDMAN", "WITTMAN", "WIDENER", "WOLFSON", "WENDELL",
+                               "WEITZEL", "WILLMAN", "WALDRUP", "WALTMAN", "WALCZAK", "WEIGAND",
+                               "WESSELS", "WIDEMAN", "WOLTERS", "WIREMAN", "WILHOIT", "WEGENER",
+                               "WOTRING", "WINGERT", "WIESNER", "WAYMIRE", "WHETZEL", "WENTZEL",
+                               "WINEGAR", "WESTMAN", "WYNKOOP", "WALLICK", "WURSTER", "WINBUSH",
+                               "WILBERT", "WALLACH", "WYNKOOP", "WALLICK", "WURSTER", "WINBUSH",
+                               "WILBERT", "WALLACH", "WEISSER", "WEISNER", "WINDERS", "WILLMON",
+                               "WILLEMS", "WIERSMA", "WACHTEL", "WARNICK", "WEIDLER", "WALTRIP",
+                               "WHETSEL", "WHELESS", "WELCHER", "WALBORN", "WILLSEY", "WEINMAN",
+                               "WAGAMAN", "WOMMACK", "WINGLER", "WINKLES", "WIEDMAN", "WHITNER",
+                               "WOLFRAM", "WARLICK", "WEEDMAN", "WHISMAN", "WINLAND", "WEESNER",
+                               "WARTHEN", "WETZLER", "WENDLER", "WALLNER", "WOLBERT", "WITTMER",
+                               "WISHART", "WILLIAM")
+             or self._string_at(0, 8, "WESTPHAL", "WICKLUND", "WEISSMAN", "WESTLUND", "WOLFGANG", "WILLHITE",
+                               "WEISBERG", "WALRAVEN", "WOLFGRAM", "WILHOITE", "WECHSLER", "WENDLING",
+                               "WESTBERG", "WENDLAND", "WININGER", "WHISNANT", "WESTRICK", "WESTLING",
+                               "WESTBURY", "WEITZMAN", "WEHMEYER", "WEINMANN", "WISNESKI", "WHELCHEL",
+                               "WEISHAAR", "WAGGENER", "WALDROUP", "WESTHOFF", "WIEDEMAN", "WASINGER",
+                               "WINBORNE")
+             or self._string_at(0, 9, "WHISENANT", "WEINSTEIN", "WESTERMAN", "WASSERMAN", "WITKOWSKI", "WEINTRAUB",
+                               "WINKELMAN", "WINKFIELD", "WANAMAKER", "WIECZOREK", "WIECHMANN", "WOJTOWICZ",
+                               "WALKOWIAK", "WEINSTOCK", "WILLEFORD", "WARKENTIN", "WEISINGER", "WINKLEMAN",
+                               "WILHEMINA")
+             or self._string_at(0, 10, "WISNIEWSKI", "WUNDERLICH", "WHISENHUNT", "WEINBERGER", "WROBLEWSKI",
+                                "WAGUESPACK", "WEISGERBER", "WESTERVELT", "WESTERLUND", "WASILEWSKI",
+                                "WILDERMUTH", "WESTENDORF", "WESOLOWSKI", "WEINGARTEN", "WINEBARGER",
+                                "WESTERBERG", "WANNAMAKER", "WEISSINGER")
+             or self._string_at(0, 11, "WALDSCHMIDT", "WEINGARTNER", "WINEBRENNER")
+             or self._string_at(0, 12, "WOLFENBARGER")
+             or self._string_at(0, 13, "WOJCIECHOWSKI")):
+            return True
+
+        return False
+
+    def _names_beginning_with_j_that_get_alt_y(self):
+        """
+        Test whether the word in question
+        is a name starting with 'J' that should
+        match names starting with a 'Y' sound.
+        All forms of 'John', 'Jane', etc, get
+        and alt to match e.g. 'Ian', 'Yana'. Joelle
+        should match 'Yael', 'Joseph' should match
+        'Yusef'. German and slavic last names are
+        also included.
+
+        Returns:
+            true if name starting with 'J' that should get an alternate encoding as a vowel
+        """
+        if (self._string_at(0, 3, "JAN", "JON", "JAN", "JIN", "JEN")
+             or self._string_at(0, 4, "JUHL", "JULY", "JOEL", "JOHN", "JOSH",
+                               "JUDE", "JUNE", "JONI", "JULI", "JENA",
+                               "JUNG", "JINA", "JANA", "JENI", "JOEL",
+                               "JANN", "JONA", "JENE", "JULE", "JANI",
+                               "JONG", "JOHN", "JEAN", "JUNG", "JONE",
+                               "JARA", "JUST", "JOST", "JAHN", "JACO",
+                               "JANG", "JUDE", "JONE")
+             or self._string_at(0, 5, "JOANN", "JANEY", "JANAE", "JOANA", "JUTTA",
+                               "JULEE", "JANAY", "JANEE", "JETTA", "JOHNA",
+                               "JOANE", "JAYNA", "JANES", "JONAS", "JONIE",
+                               "JUSTA", "JUNIE", "JUNKO", "JENAE", "JULIO",
+                               "JINNY", "JOHNS", "JACOB", "JETER", "JAFFE",
+                               "JESKE", "JANKE", "JAGER", "JANIK", "JANDA",
+                               "JOSHI", "JULES", "JANTZ", "JEANS", "JUDAH",
+                               "JANUS", "JENNY", "JENEE", "JONAH", "JONAS",
+                               "JAKOB", "JOSUE", "JOSEF", "JULES", "JULIE",
+                               "JULIA", "JANIE", "JANIS", "JENNA", "JANNA",
+                               "JEANA", "JENNI", "JEANE", "JONNA")
+             or self._string_at(0, 6, "JORDAN", "JORDON", "JOSEPH", "JOSHUA", "JOSIAH",
+                               "JOSPEH", "JUDSON", "JULIAN", "JULIUS", "JUNIOR",
+                               "JUDITH", "JOESPH", "JOHNIE", "JOANNE", "JEANNE",
+                               "JOANNA", "JOSEFA", "JULIET", "JANNIE", "JANELL",
+                               "JASMIN", "JANINE", "JOHNNY", "JEANIE", "JEANNA",
+                               "JOHNNA", "JOELLE", "JOVITA", "JOSEPH", "JONNIE",
+                               "JANEEN", "JANINA", "JOANIE", "JAZMIN", "JOHNIE",
+                               "JANENE", "JOHNNY", "JONELL", "JENELL", "JANETT",
+                               "JANETH", "JENINE", "JOELLA", "JOEANN", "JULIAN",
+                               "JOHANA", "JENICE", "JANNET", "JANISE", "JULENE",
+                               "JOSHUA", "JANEAN", "JAIMEE", "JOETTE", "JANYCE",
+                               "JENEVA", "JORDAN", "JACOBS", "JENSEN", "JOSEPH",
+                               "JANSEN", "JORDON", "JULIAN", "JAEGER", "JACOBY",
+                               "JENSON", "JARMAN", "JOSLIN", "JESSEN", "JAHNKE",
+                               "JACOBO", "JULIEN", "JOSHUA", "JEPSON", "JULIUS",
+                               "JANSON", "JACOBI", "JUDSON", "JARBOE", "JOHSON",
+                               "JANZEN", "JETTON", "JUNKER", "JONSON", "JAROSZ",
+                               "JENNER", "JAGGER", "JASMIN", "JEPSEN", "JORDEN",
+                               "JANNEY", "JUHASZ", "JERGEN", "JAKOBS", "JACOBS")
+             or self._string_at(0, 7, "JOHNSON", "JOHNNIE", "JASMINE", "JEANNIE", "JOHANNA",
+                               "JANELLE", "JANETTE", "JULIANA", "JUSTINA", "JOSETTE",
+                               "JOELLEN", "JENELLE", "JULIETA", "JULIANN", "JULISSA",
+                               "JENETTE", "JANETTA", "JOSELYN", "JONELLE", "JESENIA",
+                               "JANESSA", "JAZMINE", "JEANENE", "JOANNIE", "JADWIGA",
+                               "JOLANDA", "JULIANE", "JANUARY", "JEANICE", "JANELLA",
+                               "JEANETT", "JENNINE", "JOHANNE", "JOHNSIE", "JANIECE",
+                               "JOHNSON", "JENNELL", "JAMISON", "JANSSEN", "JOHNSEN",
+                               "JARDINE", "JAGGERS", "JURGENS", "JOURDAN", "JULIANO",
+                               "JOSEPHS", "JHONSON", "JOZWIAK", "JANICKI", "JELINEK",
+                               "JANSSON", "JOACHIM", "JANELLE", "JACOBUS", "JENNING",
+                               "JANTZEN", "JOHNNIE")
+             or self._string_at(0, 8, "JOSEFINA", "JEANNINE", "JULIANNE", "JULIANNA", "JONATHAN",
+                               "JONATHON", "JEANETTE", "JANNETTE", "JEANETTA", "JOHNETTA",
+                               "JENNEFER", "JULIENNE", "JOSPHINE", "JEANELLE", "JOHNETTE",
+                               "JULIEANN", "JOSEFINE", "JULIETTA", "JOHNSTON", "JACOBSON",
+                               "JACOBSEN", "JOHANSEN", "JOHANSON", "JAWORSKI", "JENNETTE",
+                               "JELLISON", "JOHANNES", "JASINSKI", "JUERGENS", "JARNAGIN",
+                               "JEREMIAH", "JEPPESEN", "JARNIGAN", "JANOUSEK")
+             or self._string_at(0, 9, "JOHNATHAN", "JOHNATHON", "JORGENSEN", "JEANMARIE", "JOSEPHINA",
+                               "JEANNETTE", "JOSEPHINE", "JEANNETTA", "JORGENSON", "JANKOWSKI",
+                               "JOHNSTONE", "JABLONSKI", "JOSEPHSON", "JOHANNSEN", "JURGENSEN",
+                               "JIMMERSON", "JOHANSSON")
+             or self._string_at(0, 10, "JAKUBOWSKI")):
+            return True
+
+        return False
+
+
+
+def keys_complete(keys: Tuple[str, str], key_length: int) -> bool:
+    """
+    Check whether keys encoded at key_length are the word's complete keys,
+    not cut short by key_length.
+    
+    key_length only stops the main loop once a key grows past it and trims
+    the keys at the end; everything else the engine reads of its keys is
+    their last character. Keys both shorter than key_length were never
+    trimmed, so the main loop ran to the end of the word, and every
+    key_length of at least their length runs the same steps to the same
+    keys. Truncating longer keys is not equivalent: encoding stops as soon
+    as one key passes key_length, which may leave the other one shorter.
+    
+    Args:
+        keys (Tuple[str, str]): Primary and alternate keys
+        key_length (int): key_length they were encoded with
+        
+    Returns:
+        bool: True if the keys are complete
+    """
+    return max(len(keys[0]), len(keys[1])) < key_length
+
+
+def keys_fit(keys: Tuple[str, str], key_length: int) -> bool:
+    """
+    Check whether complete keys (see keys_complete()) are the encoding at key_length.
+    
+    Args:
+        keys (Tuple[str, str]): Complete primary and alternate keys
+        key_length (int): key_length asked for
+        
+    Returns:
+        bool: True if encoding at key_length returns the same keys
+    """
+    return max(len(keys[0]), len(keys[1])) <= key_length
+
+
+def read_word_list(path: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Read a word list in the format of large_word_list_output_3_21_15_DEFAULT_ENCODING.txt,
+    one "WORD PRIMARY (ALTERNATE)" entry per line.
+    
+    Args:
+        path (str): Path to the word list
+        
+    Yields:
+        Tuple[str, str, str]: word, expected primary and expected alternate
+    """
+    with open(path, encoding="utf-8") as word_list:
+        for line in word_list:
+            tokens = line.rstrip("\n").split(" ")
+            if not tokens[0]:
+                continue
+            primary = tokens[1] if len(tokens) > 1 else ""
+            alternate = tokens[2][1:-1] if len(tokens) > 2 else ""
+            yield tokens[0], primary, alternate
+
+
+def verify_word_list(path: str, encoder: Metaphone3 = None) -> int:
+    """
+    Compare encodings against a word list in the format of
+    large_word_list_output_3_21_15_DEFAULT_ENCODING.txt ("WORD PRIMARY (ALTERNATE)").
+    
+    Args:
+        path (str): Path to the word list
+        encoder (Metaphone3): Encoder to check (default: default settings)
+        
+    Returns:
+        int: Number of mismatching words (mismatches are printed)
+    """
+    encoder = encoder or Metaphone3()
+    mismatches = 0
+    for word, expected_primary, expected_alternate in read_word_list(path):
+        primary, alternate = encoder.encode(word)
+        if (primary, alternate) != (expected_primary, expected_alternate):
+            mismatches += 1
+            print(f"{word} : {expected_primary} ({expected_alternate}) : {primary} ({alternate})")
+    return mismatches
+
+
+def _configure(encoder: Metaphone3, settings: dict) -> None:
+    """Apply the settings of a worker request to an encoder."""
+    encoder.set_encode_vowels(settings.get('encode_vowels', False))
+    encoder.set_encode_exact(settings.get('encode_exact', False))
+    encoder.set_key_length(settings.get('key_length', DEFAULT_MAX_KEY_LENGTH))
+
+
+def _encode_word_result(encoder: Metaphone3, word: str) -> dict:
+    """Encode one word into a worker response dict."""
+    try:
+        primary, alternate = encoder.encode(word)
+    except (TypeError, AttributeError) as e:
+        return {'success': False, 'error': str(e), 'word': word}
+    return {'success': True, 'primary': primary, 'alternate': alternate, 'word': word}
+
+
+def _encode_words(request: dict, encode) -> dict:
+    """
+    Answer a worker request's "words" with one encode(word) result each, or
+    give up once the request's timeout_ms has passed.
+    """
+    timeout_ms = request.get('timeout_ms')
+    deadline = time.perf_counter() + timeout_ms / 1000 if isinstance(timeout_ms, (int, float)) else None
+    results = []
+    for index, word in enumerate(request['words']):
+        if deadline is not None and index % DEADLINE_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+            return {'success': False, 'error': "Deadline exceeded", 'deadline_exceeded': True}
+        results.append(encode(word))
+    return {'success': True, 'results': results}
+
+
+def serve_worker(input_stream: TextIO = sys.stdin, output_stream: TextIO = sys.stdout) -> None:
+    """
+    Answer encode requests as a persistent worker, speaking the same
+    newline-delimited JSON protocol as the Node.js worker of metaphone3_wrapper.
+    
+    A {"ready": true} line is written first. Each request line carries the
+    encode_vowels / encode_exact / key_length settings and either a "word",
+    answered with one result, or a list of "words", answered with a
+    "results" list in the same order. A request with a list of "variants"
+    settings instead of top-level settings is answered with, per word, a list
+    of results in variant order. A batch request may carry timeout_ms, after
+    which the worker stops encoding it and answers with deadline_exceeded.
+    Every response reports the seconds spent encoding as engine_seconds.
+    
+    Args:
+        input_stream (TextIO): Stream to read requests from (default: stdin)
+        output_stream (TextIO): Stream to write responses to (default: stdout)
+    """
+    encoder = Metaphone3()
+    output_stream.write(json.dumps({'ready': True}) + "\n")
+    output_stream.flush()
+    
+    for line in input_stream:
+        engine_seconds = 0.0
+        try:
+            request = json.loads(line)
+            start = time.perf_counter()
+            if isinstance(request.get('variants'), list):
+                def encode_variants(word):
+                    row = []
+                    for settings in request['variants']:
+                        _configure(encoder, settings)
+                        row.append(_encode_word_result(encoder, word))
+                    return row
+                
+                response = _encode_words(request, encode_variants)
+            elif isinstance(request.get('words'), list):
+                _configure(encoder, request)
+                response = _encode_words(request, lambda word: _encode_word_result(encoder, word))
+            else:
+                _configure(encoder, request)
+                response = _encode_word_result(encoder, request.get('word'))
+            engine_seconds = time.perf_counter() - start
+        except (ValueError, TypeError, AttributeError) as e:
+            response = {'success': False, 'error': str(e)}
+        response['engine_seconds'] = engine_seconds
+        output_stream.write(json.dumps(response) + "\n")
+        output_stream.flush()
+
+
+def main():
+    """Verify the port against a word list, serve as a worker (--worker), or encode words given on the command line."""
+    if sys.argv[1:] == ["--worker"]:
+        serve_worker()
+        return
+    
+    if len(sys.argv) == 2 and sys.argv[1].endswith(".txt"):
+        mismatches = verify_word_list(sys.argv[1])
+        print(f"{mismatches} mismatches")
+        sys.exit(1 if mismatches else 0)
+    
+    m3 = Metaphone3()
+    for word in sys.argv[1:]:
+        primary, alternate = m3.encode(word)
+        print(f"{word:12} -> {primary:8} | {alternate}")
+
+
+if __name__ == "__main__":
+    main()
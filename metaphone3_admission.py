@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Admission Control
+
+Bounds the work a server accepts for the encoder. At most max_concurrent
+requests are served at once; up to max_queue more wait their turn, first in
+first out. Anything beyond that is rejected at once, so that under a burst
+clients get a fast answer they can retry later instead of piling up behind
+the encoder until their own timeouts fire:
+
+    queue full                          -> AdmissionRejected, status 429
+    no slot within queue_timeout, or    -> AdmissionRejected, status 503
+    the request's deadline passed first
+
+Each rejection carries a Retry-After estimate in whole seconds, from the
+number of requests ahead and the recent average time a request holds its
+slot.
+
+Usage:
+    from metaphone3_admission import AdmissionController, AdmissionRejected
+
+    admission = AdmissionController(max_concurrent=8, max_queue=64, queue_timeout=1.0)
+
+    try:
+        with admission.admit(deadline=time.monotonic() + 5):
+            ...  # encode
+    except AdmissionRejected as e:
+        ...  # answer e.status with a Retry-After: e.retry_after header
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+
+# Default number of requests served at once
+DEFAULT_MAX_CONCURRENT = 8
+
+# Default number of requests waiting for a slot
+DEFAULT_MAX_QUEUE = 64
+
+# Default seconds a request may wait for a slot
+DEFAULT_QUEUE_TIMEOUT = 1.0
+
+# Weight of the latest request in the average time a slot is held
+SERVICE_TIME_WEIGHT = 0.2
+
+
+class AdmissionRejected(Exception):
+    """A request was turned away because the server is saturated."""
+
+    def __init__(self, message: str, status: int, retry_after: int):
+        """
+        Args:
+            message (str): Reason for the rejection
+            status (int): HTTP status to answer with, 429 or 503
+            retry_after (int): Seconds the client should wait before retrying
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class Admission:
+    """A slot held by an admitted request; release() it when the request is done."""
+
+    __slots__ = ('_controller', '_start', '_released')
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self._start = time.monotonic()
+        self._released = False
+
+    def release(self) -> None:
+        """Give the slot to the next waiting request; later calls do nothing."""
+        if self._released:
+            return
+        self._released = True
+        self._controller._release(time.monotonic() - self._start)
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a bounded FIFO queue in front of it.
+
+    A released slot is handed straight to the longest-waiting request, so
+    newcomers cannot overtake the queue.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT, max_queue: int = DEFAULT_MAX_QUEUE,
+                 queue_timeout: float = DEFAULT_QUEUE_TIMEOUT):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrent (int): Requests served at once (default: 8)
+            max_queue (int): Requests waiting for a slot; 0 rejects every
+                request that finds all slots taken (default: 64)
+            queue_timeout (float): Seconds a request may wait for a slot
+                (default: 1.0)
+        """
+        if max_concurrent < 1:
+            raise ValueError("Maximum concurrency must be at least 1")
+        if max_queue < 0:
+            raise ValueError("Maximum queue length must not be negative")
+        if queue_timeout < 0:
+            raise ValueError("Queue timeout must not be negative")
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self._active = 0
+        self._waiters = deque()
+        self._service_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float] = None) -> Admission:
+        """
+        Wait for a slot.
+
+        Args:
+            deadline (float): time.monotonic() value after which the request
+                is no longer worth serving (default: none)
+
+        Returns:
+            Admission: The slot, to be released when the request is done
+
+        Raises:
+            AdmissionRejected: If the queue is full, or no slot frees up
+                within queue_timeout or before the deadline
+        """
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                self.admitted += 1
+                return Admission(self)
+            if len(self._waiters) >= self.max_queue:
+                self.rejected_queue_full += 1
+                raise AdmissionRejected("Too many requests, try again later", 429, self._retry_after())
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+
+        timeout = self.queue_timeout
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+        waiter.wait(max(timeout, 0.0))
+
+        with self._lock:
+            # A slot handed over just as the wait timed out is still taken
+            if not waiter.is_set():
+                self._waiters.remove(waiter)
+                self.rejected_timeout += 1
+                raise AdmissionRejected("Server busy, try again later", 503, self._retry_after())
+            self.admitted += 1
+        return Admission(self)
+
+    @contextmanager
+    def admit(self, deadline: Optional[float] = None):
+        """Hold a slot for the duration of a with block; see acquire()."""
+        admission = self.acquire(deadline)
+        try:
+            yield admission
+        finally:
+            admission.release()
+
+    def _release(self, held: float) -> None:
+        """Hand a slot to the next waiter, or free it, and update the average hold time."""
+        with self._lock:
+            self._service_time += SERVICE_TIME_WEIGHT * (held - self._service_time)
+            if self._waiters:
+                self._waiters.popleft().set()
+            else:
+                self._active -= 1
+
+    def _retry_after(self) -> int:
+        """Seconds until the queue has likely drained, at least 1. Call with the lock held."""
+        ahead = len(self._waiters) + 1
+        return max(1, math.ceil(ahead * self._service_time / self.max_concurrent))
+
+    def stats(self) -> dict:
+        """
+        Get admission statistics.
+
+        Returns:
+            dict: Limits, active and queued requests, admitted and rejected
+            counts and the average seconds a request holds its slot
+        """
+        with self._lock:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'max_queue': self.max_queue,
+                'queue_timeout_ms': 1000 * self.queue_timeout,
+                'active': self._active,
+                'queued': len(self._waiters),
+                'admitted': self.admitted,
+                'rejected_queue_full': self.rejected_queue_full,
+                'rejected_timeout': self.rejected_timeout,
+                'avg_service_seconds': self._service_time
+            }
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Benchmark Suite
+
+Measures what encoding costs through Metaphone3Wrapper and the HTTP endpoints
+of app.py, using the shipped word list as the corpus. Everything runs offline:
+the endpoints are driven through Flask's test client, without a server.
+
+Reported per backend:
+    cold_start_ms        new Python process importing the wrapper and
+                         encoding its first word
+    encode               per-word latency percentiles of encode() (us)
+    encode_list          words/sec of encode_list() for batch sizes 1, 100, 10000
+    http.startup_ms      new Python process running app.create_app() until the
+                         service is warm and ready, phonetic index included
+    http.encode          per-request latency percentiles of POST /encode (us)
+    http.udf             words/sec of POST / for batch sizes 1, 100, 10000
+    peak_rss_mb          peak resident set size of this process and of its
+                         children (Node.js workers)
+
+The LRU cache and the dictionary are disabled so the encoder itself is timed.
+The corpus is a fixed-seed sample of the word list, so runs are comparable.
+
+Thresholds are a JSON object mapping dotted metric names of the result file
+to bounds, for example:
+
+    {
+        "python.encode_list.batch_10000.words_per_sec": {"min": 20000},
+        "python.cold_start_ms": {"max": 3000}
+    }
+
+Any metric outside its bounds is reported and makes the run exit with 1.
+
+Usage:
+    python metaphone3_benchmark.py
+    python metaphone3_benchmark.py --backend python --backend node --output bench.json
+    python metaphone3_benchmark.py --thresholds benchmark_thresholds.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from metaphone3 import read_word_list
+from metaphone3_wrapper import Metaphone3Wrapper, Metaphone3Error, BACKENDS
+
+
+# Shipped word list used as the corpus
+DEFAULT_CORPUS = "large_word_list_output_3_21_15_DEFAULT_ENCODING.txt"
+
+# Batch sizes timed for encode_list() and the UDF endpoint
+BATCH_SIZES = (1, 100, 10000)
+
+# Default number of words timed per measurement
+DEFAULT_SAMPLE_SIZE = 20000
+
+# Seed of the corpus sample
+DEFAULT_SEED = 3
+
+
+def load_corpus(path: str, size: int, seed: int = DEFAULT_SEED) -> list:
+    """
+    Load a reproducible sample of words from a word list.
+
+    Args:
+        path (str): Word list with "WORD PRIMARY (ALTERNATE)" lines
+        size (int): Number of words to sample (all words if larger than the list)
+        seed (int): Random seed of the sample
+
+    Returns:
+        list: Sampled words
+    """
+    words = [word for word, _, _ in read_word_list(path)]
+    if size >= len(words):
+        return words
+    return random.Random(seed).sample(words, size)
+
+
+def percentiles(samples: list) -> dict:
+    """Summarize latency samples in seconds as microsecond percentiles."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+
+    def at(fraction):
+        return round(1e6 * ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 2)
+
+    return {
+        'count': len(ordered),
+        'p50_us': at(0.50),
+        'p90_us': at(0.90),
+        'p99_us': at(0.99),
+        'max_us': round(1e6 * ordered[-1], 2),
+        'mean_us': round(1e6 * sum(ordered) / len(ordered), 2)
+    }
+
+
+def batches(words: list, batch_size: int) -> list:
+    """Split words into consecutive batches of batch_size (the last one may be shorter)."""
+    return [words[i:i + batch_size] for i in range(0, len(words), batch_size)]
+
+
+def throughput(function, word_batches: list) -> dict:
+    """Time function over every batch and report words/sec."""
+    words = sum(len(batch) for batch in word_batches)
+    start = time.perf_counter()
+    for batch in word_batches:
+        function(batch)
+    elapsed = time.perf_counter() - start
+    return {
+        'words': words,
+        'seconds': round(elapsed, 4),
+        'words_per_sec': round(words / elapsed, 1) if elapsed else 0.0
+    }
+
+
+def measure_cold_start(backend: str) -> float:
+    """Time a new Python process that imports the wrapper and encodes one word, in ms."""
+    script = (
+        "from metaphone3_wrapper import Metaphone3Wrapper\n"
+        f"m3 = Metaphone3Wrapper(backend={backend!r}, cache_size=0)\n"
+        "m3.encode('smith')\n"
+        "m3.close()\n"
+    )
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return round(1000 * (time.perf_counter() - start), 1)
+
+
+def measure_app_startup(backend: str) -> float:
+    """Time a new Python process that builds and warms up app.py with create_app(), in ms."""
+    script = (
+        "import sys, app\n"
+        "app.create_app()\n"
+        "sys.exit(0 if app.m3_ready else 1)\n"
+    )
+    # Default service configuration, whatever earlier benchmarks set
+    env = {name: value for name, value in os.environ.items() if not name.startswith("METAPHONE3_")}
+    env["METAPHONE3_BACKEND"] = backend
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", script], check=True, env=env, stderr=subprocess.DEVNULL,
+                   cwd=os.path.dirname(os.path.abspath(__file__)))
+    return round(1000 * (time.perf_counter() - start), 1)
+
+
+def benchmark_wrapper(backend: str, words: list) -> dict:
+    """Benchmark encode() latency and encode_list() throughput of one backend."""
+    m3 = Metaphone3Wrapper(backend=backend, cache_size=0)
+    try:
+        # Warm up: start every pooled worker and load code paths before timing
+        m3.encode_list(words[:BATCH_SIZES[-1]])
+
+        latencies = []
+        for word in words:
+            start = time.perf_counter()
+            m3.encode(word)
+            latencies.append(time.perf_counter() - start)
+
+        return {
+            'encode': percentiles(latencies),
+            'encode_list': {
+                f'batch_{size}': throughput(m3.encode_list, batches(words, size))
+                for size in BATCH_SIZES
+            }
+        }
+    finally:
+        m3.close()
+
+
+def benchmark_http(backend: str, words: list) -> dict:
+    """Benchmark POST /encode latency and POST / throughput of app.py for one backend."""
+    os.environ["METAPHONE3_BACKEND"] = backend
+    os.environ["METAPHONE3_CACHE_SIZE"] = "0"
+    os.environ["METAPHONE3_DICTIONARY"] = ""
+    os.environ.pop("METAPHONE3_COALESCE_WINDOW_MS", None)
+    os.environ["METAPHONE3_INDEX_CORPUS"] = ""
+
+    # The first import builds an encoder; swap it for one of this backend
+    import app
+    if app.m3_wrapper is not None:
+        app.m3_wrapper.close()
+    if not app.initialize_metaphone3():
+        raise Metaphone3Error("Failed to initialize app.py")
+    client = app.app.test_client()
+
+    def call_udf(batch):
+        response = client.post('/', json={'calls': [[word] for word in batch]})
+        if response.status_code != 200:
+            raise Metaphone3Error(f"POST / failed with status {response.status_code}")
+
+    try:
+        call_udf(words[:BATCH_SIZES[-1]])
+
+        latencies = []
+        for word in words:
+            start = time.perf_counter()
+            response = client.post('/encode', json={'word': word})
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise Metaphone3Error(f"POST /encode failed with status {response.status_code}")
+
+        return {
+            'encode': percentiles(latencies),
+            'udf': {
+                f'batch_{size}': throughput(call_udf, batches(words, size))
+                for size in BATCH_SIZES
+            }
+        }
+    finally:
+        app.m3_wrapper.close()
+
+
+def peak_rss() -> dict:
+    """Peak resident set size of this process and of its waited-for children, in MB."""
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        'self': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+        'children': round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1)
+    }
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    """Flatten nested results into dotted metric names."""
+    metrics = {}
+    for name, value in results.items():
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{prefix}{name}."))
+        else:
+            metrics[prefix + name] = value
+    return metrics
+
+
+def check_thresholds(results: dict, thresholds: dict) -> list:
+    """
+    Compare results against thresholds.
+
+    Args:
+        results (dict): Benchmark results
+        thresholds (dict): Dotted metric name -> {"min": ..., "max": ...}
+
+    Returns:
+        list: Failure messages, empty if every threshold holds
+    """
+    metrics = flatten(results)
+    failures = []
+    for name, bounds in thresholds.items():
+        value = metrics.get(name)
+        if not isinstance(value, (int, float)):
+            failures.append(f"{name}: not measured")
+            continue
+        if 'min' in bounds and value < bounds['min']:
+            failures.append(f"{name}: {value} < min {bounds['min']}")
+        if 'max' in bounds and value > bounds['max']:
+            failures.append(f"{name}: {value} > max {bounds['max']}")
+    return failures
+
+
+def run(backends: list, corpus: str, sample_size: int, seed: int, http: bool) -> dict:
+    """
+    Run the benchmark suite.
+
+    Args:
+        backends (list): Backends to benchmark
+        corpus (str): Word list to sample words from
+        sample_size (int): Number of words timed per measurement
+        seed (int): Random seed of the sample
+        http (bool): Also benchmark the HTTP endpoints
+
+    Returns:
+        dict: Results keyed by backend, plus 'meta' and 'peak_rss_mb'
+    """
+    words = load_corpus(corpus, sample_size, seed)
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'corpus': corpus,
+            'words': len(words),
+            'seed': seed
+        }
+    }
+
+    for backend in backends:
+        print(f"Benchmarking {backend} backend...", file=sys.stderr)
+        result = {'cold_start_ms': measure_cold_start(backend)}
+        result.update(benchmark_wrapper(backend, words))
+        if http:
+            result['http'] = {'startup_ms': measure_app_startup(backend)}
+            result['http'].update(benchmark_http(backend, words))
+        results[backend] = result
+
+    results['peak_rss_mb'] = peak_rss()
+    return results
+
+
+def print_summary(results: dict) -> None:
+    """Print the main figures of a benchmark run."""
+    for backend in BACKENDS:
+        result = results.get(backend)
+        if result is None:
+            continue
+        print(f"\n=== {backend} ===")
+        print(f"cold start          {result['cold_start_ms']:10.1f} ms")
+        latency = result['encode']
+        print(f"encode              p50 {latency['p50_us']:.1f} us  p99 {latency['p99_us']:.1f} us")
+        for name, batch in result['encode_list'].items():
+            print(f"encode_list {name:13} {batch['words_per_sec']:10.0f} words/sec")
+        if 'http' in result:
+            print(f"app startup         {result['http']['startup_ms']:10.1f} ms")
+            latency = result['http']['encode']
+            print(f"POST /encode        p50 {latency['p50_us']:.1f} us  p99 {latency['p99_us']:.1f} us")
+            for name, batch in result['http']['udf'].items():
+                print(f"POST / {name:18} {batch['words_per_sec']:10.0f} words/sec")
+    rss = results['peak_rss_mb']
+    print(f"\npeak RSS            {rss['self']} MB (children {rss['children']} MB)")
+
+
+def main():
+    """Run the benchmarks, write the JSON result file and check thresholds."""
+    parser = argparse.ArgumentParser(description="Benchmark Metaphone3 encoding.")
+    parser.add_argument("--backend", action="append", choices=BACKENDS,
+                        help="backend to benchmark, repeatable (default: all available)")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="word list to sample from")
+    parser.add_argument("--words", type=int, default=DEFAULT_SAMPLE_SIZE,
+                        help="words timed per measurement (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="corpus sample seed")
+    parser.add_argument("--no-http", action="store_true", help="skip the HTTP endpoint benchmarks")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON result file")
+    parser.add_argument("--thresholds", help="JSON file of metric bounds that must hold")
+    args = parser.parse_args()
+
+    backends = args.backend
+    if not backends:
+        backends = []
+        for backend in BACKENDS:
+            try:
+                Metaphone3Wrapper(backend=backend, cache_size=0).close()
+                backends.append(backend)
+            except Metaphone3Error as e:
+                print(f"Skipping {backend} backend: {e}", file=sys.stderr)
+
+    results = run(backends, args.corpus, args.words, args.seed, not args.no_http)
+
+    failures = []
+    if args.thresholds:
+        with open(args.thresholds) as thresholds_file:
+            failures = check_thresholds(results, json.load(thresholds_file))
+        results['threshold_failures'] = failures
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+
+    print_summary(results)
+    print(f"\nResults written to {args.output}")
+
+    if failures:
+        print("\nThreshold failures:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
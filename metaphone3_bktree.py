@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Key BK-Tree
+
+A Burkhard-Keller tree over Metaphone3 keys, answering "all keys within edit
+distance k of this key" without comparing the key to the whole corpus. Each
+child of a node is filed under its Levenshtein distance to the node's key, so
+by the triangle inequality a search only descends into children whose
+distance lies within k of the query's distance to the node. Distances are
+computed with the bounded, early-exiting edit distance of metaphone3_ranking.
+
+Usage:
+    from metaphone3_bktree import KeyTree
+
+    tree = KeyTree.from_word_list("large_word_list_output_3_21_15_DEFAULT_ENCODING.txt")
+    tree.search("SM0", 1)  # [("SM0", 0), ("SMT", 1), ...]
+
+    # Through the wrapper: keys near the primary and alternate keys of a word
+    m3.similar_keys("smith", tree, max_distance=1)
+
+    # Command line
+    python metaphone3_bktree.py WORD_LIST KEY [MAX_DISTANCE]
+"""
+
+import sys
+from typing import Iterable, List, Tuple
+
+from metaphone3 import read_word_list
+from metaphone3_ranking import EditDistancePattern
+
+
+class KeyTree:
+    """
+    BK-tree of distinct strings under Levenshtein distance.
+
+    Nodes are [key, {distance: child node}] lists.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        """
+        Build a tree.
+
+        Args:
+            keys (Iterable[str]): Keys to insert
+        """
+        self._root = None
+        self._size = 0
+        for key in keys:
+            self.add(key)
+
+    @classmethod
+    def from_word_list(cls, path: str) -> "KeyTree":
+        """
+        Build a tree of the distinct primary and alternate keys of a word list
+        with "WORD PRIMARY (ALTERNATE)" lines.
+
+        Args:
+            path (str): Word list to read
+
+        Returns:
+            KeyTree: The tree
+        """
+        keys = set()
+        for _, primary, alternate in read_word_list(path):
+            keys.add(primary)
+            keys.add(alternate)
+        keys.discard("")
+        # Sorted insertion keeps the tree the same from run to run
+        return cls(sorted(keys))
+
+    def add(self, key: str) -> bool:
+        """
+        Insert a key.
+
+        Args:
+            key (str): Key to insert
+
+        Returns:
+            bool: True if the key was new
+        """
+        if self._root is None:
+            self._root = [key, {}]
+            self._size = 1
+            return True
+
+        pattern = EditDistancePattern(key)
+        node = self._root
+        while True:
+            distance = pattern.distance(node[0])
+            if distance == 0:
+                return False
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [key, {}]
+                self._size += 1
+                return True
+            node = child
+
+    def search(self, key: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find the keys within max_distance of a key.
+
+        Args:
+            key (str): Key to search around
+            max_distance (int): Largest edit distance of interest
+
+        Returns:
+            List[Tuple[str, int]]: (key, distance) pairs, nearest first, then
+            alphabetically
+        """
+        if self._root is None or max_distance < 0:
+            return []
+
+        pattern = EditDistancePattern(key)
+        found = []
+        stack = [self._root]
+        while stack:
+            node_key, children = stack.pop()
+            # Beyond this bound neither the node nor any child can match
+            bound = max_distance + max(children) if children else max_distance
+            distance = pattern.bounded_distance(node_key, bound)
+            if distance is None:
+                continue
+            if distance <= max_distance:
+                found.append((distance, node_key))
+            low = distance - max_distance
+            high = distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+
+        return [(node_key, distance) for distance, node_key in sorted(found)]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        return any(distance == 0 for _, distance in self.search(key, 0))
+
+
+def main():
+    """Search the keys of a word list around a key."""
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python metaphone3_bktree.py WORD_LIST KEY [MAX_DISTANCE]")
+        sys.exit(1)
+
+    tree = KeyTree.from_word_list(sys.argv[1])
+    max_distance = int(sys.argv[3]) if len(sys.argv) == 4 else 1
+    for key, distance in tree.search(sys.argv[2], max_distance):
+        print(f"{distance} {key}")
+
+
+if __name__ == "__main__":
+    main()
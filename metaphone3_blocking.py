@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Record-Linkage Blocking
+
+Entity resolution compares records pairwise, which is quadratic in the number
+of records. Blocking cuts that down to the pairs worth comparing: records are
+filed into blocks by the primary and alternate Metaphone3 keys of their name
+fields, and only records sharing a block become candidate pairs.
+
+The records are read as a stream and encoded in batches through the
+wrapper's encode_list(). Their (block key, record) entries are sorted in
+runs of at most run_size entries, spilled to temporary files and merged, so
+only one run and one block are ever held in memory, and candidate pairs are
+generated lazily, block by block. Blocks larger than max_block_size, such as
+the key of a very common surname, are skipped, since they would produce
+quadratically many pairs of little value.
+
+A pair of records sharing several blocks is emitted once, from the first of
+their shared blocks (in key order) that was not skipped.
+
+Block keys are "FIELD:KEY", so keys of different fields never share a block.
+
+Usage:
+    from metaphone3_wrapper import Metaphone3Wrapper
+    from metaphone3_blocking import Blocker
+
+    blocker = Blocker(Metaphone3Wrapper(backend="python"), fields=["first_name", "last_name"])
+    for id_a, id_b in blocker.pairs(records):  # records: dicts with "id" and the fields
+        compare(id_a, id_b)
+    blocker.stats()  # records, blocks, skipped blocks, pairs, ...
+
+    # Command line: CSV in, tab-separated candidate pairs out
+    python metaphone3_blocking.py people.csv --id person_id --fields first_name,last_name > pairs.tsv
+"""
+
+import argparse
+import csv
+import heapq
+import itertools
+import json
+import os
+import sys
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from metaphone3_wrapper import Metaphone3Wrapper, Metaphone3Error, EncodeOptions, BACKENDS
+
+
+# Records encoded per encode_list() call
+DEFAULT_BATCH_SIZE = 10000
+
+# Largest block that still produces pairs
+DEFAULT_MAX_BLOCK_SIZE = 1000
+
+# (block key, record) entries sorted in memory before spilling to disk
+DEFAULT_RUN_SIZE = 1000000
+
+
+class Blocker:
+    """
+    Blocks records on the Metaphone3 keys of their name fields and generates
+    candidate pairs.
+
+    Records are read with record[id_field] and record[field], so dicts and
+    sequences (with integer fields) both work. Record ids must be JSON
+    serializable, such as strings or integers.
+    """
+
+    def __init__(self, wrapper: Metaphone3Wrapper, fields: Sequence, id_field="id",
+                 options: Optional[EncodeOptions] = None, use_alternate: bool = True,
+                 max_block_size: int = DEFAULT_MAX_BLOCK_SIZE, batch_size: int = DEFAULT_BATCH_SIZE,
+                 run_size: int = DEFAULT_RUN_SIZE, temp_dir: Optional[str] = None):
+        """
+        Initialize the blocker.
+
+        Args:
+            wrapper (Metaphone3Wrapper): Encoder for the name fields
+            fields (Sequence): Names (or indexes) of the fields to block on
+            id_field: Name (or index) of the record id (default: "id")
+            options (EncodeOptions): Encoder settings (default: the wrapper
+                defaults)
+            use_alternate (bool): Block on alternate keys too (default: True)
+            max_block_size (int): Skip blocks with more records (default: 1000)
+            batch_size (int): Records per encode_list() call (default: 10000)
+            run_size (int): Entries sorted in memory per temporary file
+                (default: 1000000)
+            temp_dir (str): Directory for the temporary files (default: the
+                system temporary directory)
+        """
+        if not fields:
+            raise ValueError("At least one field is required")
+        if max_block_size < 2:
+            raise ValueError("Maximum block size must be at least 2")
+        if batch_size < 1 or run_size < 1:
+            raise ValueError("Batch and run sizes must be at least 1")
+        self.wrapper = wrapper
+        self.fields = list(fields)
+        self.id_field = id_field
+        self.options = options
+        self.use_alternate = use_alternate
+        self.max_block_size = max_block_size
+        self.batch_size = batch_size
+        self.run_size = run_size
+        self.temp_dir = temp_dir
+        self._stats = {}
+
+    def record_keys(self, records: Iterable) -> Iterator[Tuple[object, List[str]]]:
+        """
+        Encode records in batches and compute their block keys.
+
+        Args:
+            records (Iterable): Records to encode
+
+        Yields:
+            Tuple[object, List[str]]: Record id and its sorted "FIELD:KEY"
+            block keys, in input order; records without any name get none
+
+        Raises:
+            Metaphone3Error: If a name fails to encode
+        """
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                yield from self._encode_batch(batch)
+                batch = []
+        if batch:
+            yield from self._encode_batch(batch)
+
+    def _encode_batch(self, batch: list) -> Iterator[Tuple[object, List[str]]]:
+        """Block keys of a batch of records, from one encode_list() call."""
+        names = [record[field] for record in batch for field in self.fields]
+        encoded = iter(self.wrapper.encode_list(names, self.options))
+        for record in batch:
+            keys = set()
+            for field in self.fields:
+                name, primary, alternate = next(encoded)
+                # encode_list reports per-word failures as ("", "Error: ...")
+                if not primary and alternate.startswith("Error: "):
+                    raise Metaphone3Error(f"Failed to encode '{name}': {alternate[len('Error: '):]}")
+                # Empty names have empty keys, which block nothing
+                if primary:
+                    keys.add(f"{field}:{primary}")
+                if alternate and self.use_alternate:
+                    keys.add(f"{field}:{alternate}")
+            yield record[self.id_field], sorted(keys)
+
+    def _write_runs(self, records: Iterable, directory: str) -> List[str]:
+        """Sort (block key, sequence, id, keys) entries in runs and write each run to a file."""
+        runs = []
+        entries = []
+
+        def spill():
+            entries.sort(key=lambda entry: (entry[0], entry[1]))
+            path = os.path.join(directory, f"run{len(runs)}.ndjson")
+            with open(path, "w", encoding="utf-8") as run_file:
+                for entry in entries:
+                    run_file.write(json.dumps(entry) + "\n")
+            runs.append(path)
+            entries.clear()
+
+        for sequence, (record_id, keys) in enumerate(self.record_keys(records)):
+            self._stats['records'] += 1
+            for key in keys:
+                entries.append((key, sequence, record_id, keys))
+            if len(entries) >= self.run_size:
+                spill()
+        if entries:
+            spill()
+        return runs
+
+    def _blocks(self, records: Iterable, skipped: set) -> Iterator[Tuple[str, list]]:
+        """
+        Merge the sorted runs and yield each block of at least two records
+        as (key, [(id, keys), ...]) in input order. Keys of oversized blocks
+        are added to skipped.
+        """
+        with tempfile.TemporaryDirectory(prefix="metaphone3-blocking-", dir=self.temp_dir) as directory:
+            runs = self._write_runs(records, directory)
+            run_files = [open(path, encoding="utf-8") for path in runs]
+            try:
+                merged = heapq.merge(*(map(json.loads, run_file) for run_file in run_files),
+                                     key=lambda entry: (entry[0], entry[1]))
+                for key, entries in itertools.groupby(merged, key=lambda entry: entry[0]):
+                    self._stats['blocks'] += 1
+                    members = []
+                    for _, _, record_id, keys in entries:
+                        if len(members) == self.max_block_size:
+                            # Too large: drain the rest of the block without keeping it
+                            size = len(members) + 1 + sum(1 for _ in entries)
+                            members = None
+                            break
+                        members.append((record_id, keys))
+                    if members is None:
+                        skipped.add(key)
+                        self._stats['skipped_blocks'] += 1
+                        self._stats['skipped_records'] += size
+                        continue
+                    if len(members) >= 2:
+                        yield key, members
+            finally:
+                for run_file in run_files:
+                    run_file.close()
+
+    def blocks(self, records: Iterable) -> Iterator[Tuple[str, list]]:
+        """
+        Block records on their keys.
+
+        Args:
+            records (Iterable): Records to block
+
+        Yields:
+            Tuple[str, list]: Block key and the ids of its records in input
+            order, for every block of at least two records and at most
+            max_block_size, by ascending key
+        """
+        self._reset_stats()
+        for key, members in self._blocks(records, set()):
+            yield key, [record_id for record_id, _ in members]
+
+    def pairs(self, records: Iterable) -> Iterator[Tuple[object, object]]:
+        """
+        Generate candidate pairs: records sharing at least one block.
+
+        Args:
+            records (Iterable): Records to block
+
+        Yields:
+            Tuple[object, object]: Pairs of record ids, the earlier record
+            first, each pair once
+        """
+        self._reset_stats()
+        skipped = set()
+        for key, members in self._blocks(records, skipped):
+            key_sets = [set(keys) for _, keys in members]
+            for i, (id_a, keys_a) in enumerate(members):
+                for j in range(i + 1, len(members)):
+                    # Emitted from an earlier shared block already?
+                    if any(shared < key and shared not in skipped and shared in key_sets[j] for shared in keys_a):
+                        continue
+                    self._stats['pairs'] += 1
+                    yield id_a, members[j][0]
+
+    def _reset_stats(self) -> None:
+        self._stats = {
+            'records': 0,
+            'blocks': 0,
+            'skipped_blocks': 0,
+            'skipped_records': 0,
+            'pairs': 0
+        }
+
+    def stats(self) -> dict:
+        """
+        Get statistics of the last (or current) run.
+
+        Returns:
+            dict: records read, blocks, skipped_blocks over max_block_size,
+            skipped_records (block entries) in them and pairs generated
+        """
+        return dict(self._stats)
+
+
+def main():
+    """Block a CSV file on the command line and print candidate pairs as tab-separated ids."""
+    parser = argparse.ArgumentParser(description="Generate candidate record pairs by Metaphone3 blocking.")
+    parser.add_argument("input", help="CSV file with a header row")
+    parser.add_argument("--id", default="id", help="id column (default: id)")
+    parser.add_argument("--fields", required=True, help="comma-separated name columns to block on")
+    parser.add_argument("--primary-only", action="store_true", help="block on primary keys only")
+    parser.add_argument("--max-block-size", type=int, default=DEFAULT_MAX_BLOCK_SIZE,
+                        help="skip larger blocks (default: %(default)s)")
+    parser.add_argument("--backend", choices=BACKENDS, default="python", help="encoder backend (default: python)")
+    args = parser.parse_args()
+
+    try:
+        with Metaphone3Wrapper(backend=args.backend) as wrapper, \
+                open(args.input, newline="", encoding="utf-8") as input_file:
+            blocker = Blocker(wrapper, args.fields.split(","), id_field=args.id,
+                              use_alternate=not args.primary_only, max_block_size=args.max_block_size)
+            for id_a, id_b in blocker.pairs(csv.DictReader(input_file)):
+                print(f"{id_a}\t{id_b}")
+    except (Metaphone3Error, ValueError, KeyError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(blocker.stats()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
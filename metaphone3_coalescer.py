@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Request Coalescer
+
+Gathers concurrent single-word encode calls from many threads into batches
+and sends each batch to the engine with one Metaphone3Wrapper.encode_list()
+call, so a high rate of one-word requests costs one round trip per batch
+instead of one per word.
+
+A batch is dispatched once max_batch words are waiting, or window seconds
+after its first word arrived, whichever comes first. Words answered by the
+wrapper's cache or dictionary never wait. Up to concurrency batches (by
+default the wrapper's pool_size) are encoded at once, so every worker of the
+pool takes part; while all of them are busy, waiting words gather into the
+next batch.
+
+Calls made inside a Metaphone3Wrapper.deadline() block keep their deadline:
+words whose deadline passed while they waited are dropped from the batch,
+and the batch is encoded under the latest deadline of its words.
+
+Usage:
+    from metaphone3_wrapper import Metaphone3Wrapper
+    from metaphone3_coalescer import EncodeCoalescer
+
+    coalescer = EncodeCoalescer(Metaphone3Wrapper(), window=0.002, max_batch=64)
+
+    # From any number of threads
+    primary, alternate = coalescer.encode("smith")
+
+    coalescer.close()
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from metaphone3_wrapper import Metaphone3Wrapper, Metaphone3Error, Metaphone3DeadlineError, EncodeOptions
+
+
+# Default time to wait for more words after the first one of a batch (seconds)
+DEFAULT_WINDOW = 0.002
+
+# Default maximum number of words per batch
+DEFAULT_MAX_BATCH = 64
+
+
+class _PendingEncode:
+    """One waiting encode call."""
+
+    __slots__ = ('word', 'options', 'deadline', 'result', 'error', 'done')
+
+    def __init__(self, word: str, options: EncodeOptions, deadline: Optional[float]):
+        self.word = word
+        self.options = options
+        self.deadline = deadline
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class EncodeCoalescer:
+    """
+    Micro-batching front end for a Metaphone3Wrapper.
+
+    Calls to encode() block until their batch has been encoded. A
+    background dispatcher thread, started on first use, cuts the batches and
+    hands them to a pool of concurrency encoding threads.
+    """
+
+    def __init__(self, wrapper: Metaphone3Wrapper, window: float = DEFAULT_WINDOW,
+                 max_batch: int = DEFAULT_MAX_BATCH, concurrency: Optional[int] = None):
+        """
+        Initialize the coalescer.
+
+        Args:
+            wrapper (Metaphone3Wrapper): Wrapper that encodes the batches
+            window (float): Seconds to wait for more words after the first
+                word of a batch (default: 0.002)
+            max_batch (int): Number of words that dispatches a batch
+                immediately (default: 64)
+            concurrency (int): Batches encoded at once (default: the
+                wrapper's pool_size)
+        """
+        if window < 0:
+            raise ValueError("Window must not be negative")
+        if max_batch < 1:
+            raise ValueError("Maximum batch size must be at least 1")
+        if concurrency is None:
+            concurrency = wrapper.pool_size
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self.wrapper = wrapper
+        self.window = window
+        self.max_batch = max_batch
+        self.concurrency = concurrency
+        self.batches = 0
+        self.words = 0
+        self._pending = []
+        self._first_arrival = 0.0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def encode(self, word: str, options: Optional[EncodeOptions] = None) -> Tuple[str, str]:
+        """
+        Encode a word as part of the next batch.
+
+        Args:
+            word (str): Word to encode
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
+
+        Returns:
+            Tuple[str, str]: Primary and alternate phonetic encodings
+
+        Raises:
+            Metaphone3Error: If encoding fails, the batch times out or the
+                coalescer is closed
+            Metaphone3DeadlineError: If the calling thread's deadline passes
+                before the word is encoded
+        """
+        if not word or not isinstance(word, str):
+            return "", ""
+        if options is None:
+            options = self.wrapper.default_options()
+
+        cached = self.wrapper.lookup(word, options)
+        if cached is not None:
+            return cached
+
+        deadline = self.wrapper.current_deadline()
+        timeout = self.window + self.wrapper.timeout
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                raise Metaphone3DeadlineError("Deadline exceeded")
+
+        pending = _PendingEncode(word, options, deadline)
+        with self._condition:
+            if self._closed:
+                raise Metaphone3Error("Coalescer is closed")
+            if not self._pending:
+                self._first_arrival = time.monotonic()
+            self._pending.append(pending)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="metaphone3-coalescer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+        if not pending.done.wait(timeout):
+            if deadline is not None and time.monotonic() >= deadline:
+                raise Metaphone3DeadlineError("Deadline exceeded")
+            raise Metaphone3Error("Timeout while waiting for batch encoding")
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _next_batch(self) -> list:
+        """Wait until a batch is due and take it off the queue; empty once closed."""
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+
+            deadline = self._first_arrival + self.window
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            if self._pending:
+                # Leftovers start the next window now
+                self._first_arrival = time.monotonic()
+            return batch
+
+    def _run(self) -> None:
+        """Dispatcher loop: hand batches to the encoding threads until closed and drained."""
+        # A free slot is taken before the next batch is cut, so words keep
+        # gathering while every encoding thread is busy
+        slots = threading.Semaphore(self.concurrency)
+
+        def dispatch(batch):
+            try:
+                self._dispatch(batch)
+            finally:
+                slots.release()
+
+        with ThreadPoolExecutor(self.concurrency, thread_name_prefix="metaphone3-coalescer") as executor:
+            while True:
+                slots.acquire()
+                batch = self._next_batch()
+                if not batch:
+                    return
+                with self._condition:
+                    self.batches += 1
+                    self.words += len(batch)
+                executor.submit(dispatch, batch)
+
+    def _dispatch(self, batch: list) -> None:
+        """Encode a batch, one encode_list() call per distinct options, and wake its callers."""
+        groups = {}
+        now = time.monotonic()
+        for pending in batch:
+            # Nobody is waiting for words whose deadline has passed
+            if pending.deadline is not None and now >= pending.deadline:
+                pending.error = Metaphone3DeadlineError("Deadline exceeded")
+                pending.done.set()
+                continue
+            groups.setdefault(pending.options, []).append(pending)
+
+        for options, group in groups.items():
+            deadlines = [pending.deadline for pending in group]
+            deadline = None if None in deadlines else max(deadlines)
+            try:
+                with self.wrapper.deadline(deadline):
+                    results = self.wrapper.encode_list([pending.word for pending in group], options)
+            except Exception as e:
+                results = [(pending.word, "", f"Error: {e}") for pending in group]
+
+            for pending, (_, primary, alternate) in zip(group, results):
+                # encode_list reports per-word failures as ("", "Error: ...")
+                if not primary and alternate.startswith("Error: "):
+                    if pending.deadline is not None and time.monotonic() >= pending.deadline:
+                        pending.error = Metaphone3DeadlineError("Deadline exceeded")
+                    else:
+                        pending.error = Metaphone3Error(alternate[len("Error: "):])
+                else:
+                    pending.result = (primary, alternate)
+                pending.done.set()
+
+    def stats(self) -> dict:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            dict: window_ms, max_batch, concurrency, batches, words,
+            average batch size and currently waiting words
+        """
+        with self._condition:
+            return {
+                'window_ms': 1000 * self.window,
+                'max_batch': self.max_batch,
+                'concurrency': self.concurrency,
+                'batches': self.batches,
+                'words': self.words,
+                'avg_batch_size': self.words / self.batches if self.batches else 0.0,
+                'waiting': len(self._pending)
+            }
+
+    def close(self) -> None:
+        """Encode the words still waiting and stop the dispatcher and encoding threads."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Conformance Runner
+
+Checks every available encoder backend against a golden word list such as
+large_word_list_output_3_21_15_DEFAULT_ENCODING.txt. The list is streamed in
+chunks that are encoded through Metaphone3Wrapper.encode_list() by a pool of
+processes, one per core, so the whole list is re-verified in a fraction of the
+time a single process needs.
+
+For each backend the runner prints the number of words checked, the number of
+mismatches (with the first few of them) and the throughput. It exits with 1
+if any backend diverges from the list or fails to run.
+
+Usage:
+    python metaphone3_conformance.py
+    python metaphone3_conformance.py large_word_list_output_3_21_15_DEFAULT_ENCODING.txt --backend python
+    python metaphone3_conformance.py --processes 8 --show 20
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+from typing import Iterator
+
+from metaphone3 import read_word_list
+from metaphone3_wrapper import Metaphone3Wrapper, Metaphone3Error, BACKENDS
+
+
+# Golden word list shipped with the repository
+DEFAULT_WORD_LIST = "large_word_list_output_3_21_15_DEFAULT_ENCODING.txt"
+
+# Word list entries sent to a worker process at a time
+DEFAULT_CHUNK_SIZE = 5000
+
+# Mismatches printed per backend
+DEFAULT_SHOW = 10
+
+# Wrapper of the current worker process, or the error that kept it from starting
+_wrapper = None
+_init_error = None
+
+
+def _init_worker(backend: str) -> None:
+    """Create the worker process's wrapper, without cache or dictionary."""
+    global _wrapper, _init_error
+    try:
+        # Each process brings its own parallelism, so one Node.js worker is enough
+        _wrapper = Metaphone3Wrapper(backend=backend, cache_size=0, pool_size=1)
+    except Metaphone3Error as e:
+        # A failing initializer makes the pool respawn workers forever, so
+        # the error is raised by the tasks instead
+        _init_error = e
+
+
+def _check_chunk(chunk: list) -> tuple:
+    """
+    Encode a chunk of word list entries and compare them with their golden keys.
+
+    Returns:
+        tuple: Number of entries and list of (word, expected, actual) mismatches,
+        where expected and actual are (primary, alternate) tuples
+    """
+    if _init_error is not None:
+        raise _init_error
+    results = _wrapper.encode_list([word for word, _, _ in chunk])
+    mismatches = []
+    for (word, primary, alternate), (_, actual_primary, actual_alternate) in zip(chunk, results):
+        if (primary, alternate) != (actual_primary, actual_alternate):
+            mismatches.append((word, (primary, alternate), (actual_primary, actual_alternate)))
+    return len(chunk), mismatches
+
+
+def chunked(entries: Iterator, size: int) -> Iterator[list]:
+    """Group an iterator into lists of at most size items."""
+    while True:
+        chunk = list(itertools.islice(entries, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def check_backend(backend: str, word_list_path: str, processes: int,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """
+    Check one backend against a word list in parallel.
+
+    Args:
+        backend (str): Backend to check
+        word_list_path (str): Word list with "WORD PRIMARY (ALTERNATE)" lines
+        processes (int): Number of worker processes
+        chunk_size (int): Entries per task
+
+    Returns:
+        dict: backend, words, mismatches (list of (word, expected, actual)),
+        seconds and words_per_sec
+
+    Raises:
+        Metaphone3Error: If the backend cannot be used
+    """
+    # Fail here rather than in every worker process
+    Metaphone3Wrapper(backend=backend, cache_size=0, pool_size=1).close()
+
+    start = time.perf_counter()
+    words = 0
+    mismatches = []
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(backend,)) as pool:
+        chunks = chunked(read_word_list(word_list_path), chunk_size)
+        for count, chunk_mismatches in pool.imap_unordered(_check_chunk, chunks):
+            words += count
+            mismatches.extend(chunk_mismatches)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'backend': backend,
+        'words': words,
+        'mismatches': mismatches,
+        'seconds': elapsed,
+        'words_per_sec': words / elapsed if elapsed else 0.0
+    }
+
+
+def available_backends() -> list:
+    """Backends that can be started in this environment."""
+    backends = []
+    for backend in BACKENDS:
+        try:
+            Metaphone3Wrapper(backend=backend, cache_size=0).close()
+            backends.append(backend)
+        except Metaphone3Error as e:
+            print(f"Skipping {backend} backend: {e}")
+    return backends
+
+
+def main():
+    """Check backends against the golden word list and exit non-zero on divergence."""
+    parser = argparse.ArgumentParser(description="Check Metaphone3 backends against a golden word list.")
+    parser.add_argument("word_list", nargs="?", default=DEFAULT_WORD_LIST,
+                        help="word list with 'WORD PRIMARY (ALTERNATE)' lines")
+    parser.add_argument("--backend", action="append", choices=BACKENDS,
+                        help="backend to check, repeatable (default: all available)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: number of CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="word list entries per task (default: %(default)s)")
+    parser.add_argument("--show", type=int, default=DEFAULT_SHOW,
+                        help="mismatches printed per backend (default: %(default)s)")
+    args = parser.parse_args()
+
+    backends = args.backend or available_backends()
+    if not backends:
+        print("No backend available")
+        sys.exit(1)
+
+    failed = False
+    for backend in backends:
+        try:
+            result = check_backend(backend, args.word_list, args.processes, args.chunk_size)
+        except (Metaphone3Error, OSError) as e:
+            print(f"{backend:8} FAILED: {e}")
+            failed = True
+            continue
+
+        mismatches = result['mismatches']
+        status = "OK" if not mismatches else "DIVERGES"
+        print(f"{backend:8} {status:8} {result['words']} words, {len(mismatches)} mismatches, "
+              f"{result['seconds']:.1f} s ({result['words_per_sec']:.0f} words/sec)")
+        for word, expected, actual in sorted(mismatches)[:args.show]:
+            print(f"    {word} : {expected[0]} ({expected[1]}) : {actual[0]} ({actual[1]})")
+        failed = failed or bool(mismatches) or not result['words']
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
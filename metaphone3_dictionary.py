@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Precomputed Metaphone3 Dictionary
+
+This module compiles a word list with known encodings (such as the shipped
+large_word_list_output_3_21_15_DEFAULT_ENCODING.txt) into a compact binary file
+and looks words up in it through a read-only memory map. All processes that open
+the same file share its pages through the OS page cache instead of each holding
+a copy, and opening it costs no parsing.
+
+File layout (all integers little-endian):
+    header   magic (8 bytes), encode_vowels (u8), encode_exact (u8),
+             key_length (u8), padding (u8), entry count (u32), slot count (u32)
+    slots    open-addressing hash table of u32 record numbers + 1 (0 = empty),
+             indexed by CRC-32 of the upper-cased word with linear probing
+    offsets  (count + 1) u32 offsets of the records, relative to the first record
+    records  "WORD\\0PRIMARY\\0ALTERNATE" in UTF-8, sorted by upper-cased word
+
+Usage:
+    # Build step
+    python metaphone3_dictionary.py build large_word_list_output_3_21_15_DEFAULT_ENCODING.txt metaphone3_dictionary.bin
+
+    # Lookup
+    from metaphone3_dictionary import Metaphone3Dictionary
+
+    dictionary = Metaphone3Dictionary("metaphone3_dictionary.bin")
+    dictionary.lookup("smith")  # ("SM0", "XMT"), or None if unknown
+"""
+
+import mmap
+import struct
+import sys
+import threading
+import zlib
+from typing import Optional, Tuple
+
+from metaphone3 import DEFAULT_MAX_KEY_LENGTH, keys_complete, keys_fit, read_word_list
+
+
+MAGIC = b"M3DICT\x00\x02"
+HEADER = struct.Struct("<8sBBBxII")
+OFFSET = struct.Struct("<I")
+
+# Default location of the compiled dictionary
+DEFAULT_DICTIONARY_PATH = "metaphone3_dictionary.bin"
+
+
+class Metaphone3DictionaryError(Exception):
+    """Raised for missing or malformed dictionary files."""
+    pass
+
+
+def build_dictionary(word_list_path: str, output_path: str, encode_vowels: bool = False,
+                     encode_exact: bool = False, key_length: int = DEFAULT_MAX_KEY_LENGTH) -> int:
+    """
+    Compile a word list into a binary dictionary file.
+
+    Args:
+        word_list_path (str): Word list with "WORD PRIMARY (ALTERNATE)" lines
+        output_path (str): Path of the dictionary file to write
+        encode_vowels (bool): encode_vowels setting the word list was encoded with
+        encode_exact (bool): encode_exact setting the word list was encoded with
+        key_length (int): key_length setting the word list was encoded with
+
+    Returns:
+        int: Number of entries written
+    """
+    entries = {}
+    for word, primary, alternate in read_word_list(word_list_path):
+        # The engine upper-cases its input, so case variants share one entry
+        entries.setdefault(word.upper().encode("utf-8"), (primary, alternate))
+
+    # Hash table at most half full, so probe sequences stay short
+    slot_count = 1
+    while slot_count < 2 * len(entries):
+        slot_count *= 2
+    slots = [0] * slot_count
+
+    records = bytearray()
+    offsets = bytearray()
+    for number, word in enumerate(sorted(entries), 1):
+        primary, alternate = entries[word]
+        offsets += OFFSET.pack(len(records))
+        records += word + b"\0" + primary.encode("utf-8") + b"\0" + alternate.encode("utf-8")
+
+        slot = zlib.crc32(word) & (slot_count - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = number
+    offsets += OFFSET.pack(len(records))
+
+    with open(output_path, "wb") as output:
+        output.write(HEADER.pack(MAGIC, bool(encode_vowels), bool(encode_exact), key_length,
+                                 len(entries), slot_count))
+        output.write(struct.pack(f"<{slot_count}I", *slots))
+        output.write(offsets)
+        output.write(records)
+
+    return len(entries)
+
+
+class Metaphone3Dictionary:
+    """
+    Read-only, memory-mapped lookup of precomputed Metaphone3 encodings.
+
+    Lookups hash the upper-cased word into the slot table and are thread-safe.
+    """
+
+    def __init__(self, path: str = DEFAULT_DICTIONARY_PATH):
+        """
+        Open a dictionary file built by build_dictionary().
+
+        Args:
+            path (str): Path to the dictionary file
+
+        Raises:
+            Metaphone3DictionaryError: If the file is missing or malformed
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        try:
+            with open(path, "rb") as dictionary_file:
+                self._map = mmap.mmap(dictionary_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise Metaphone3DictionaryError(f"Cannot open dictionary {path}: {e}")
+
+        if len(self._map) < HEADER.size:
+            raise Metaphone3DictionaryError(f"Not a Metaphone3 dictionary: {path}")
+        magic, encode_vowels, encode_exact, key_length, count, slot_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise Metaphone3DictionaryError(f"Not a Metaphone3 dictionary: {path}")
+
+        self.encode_vowels = bool(encode_vowels)
+        self.encode_exact = bool(encode_exact)
+        self.key_length = key_length
+        self._count = count
+        self._mask = slot_count - 1
+        offsets_start = HEADER.size + slot_count * OFFSET.size
+        self._records_start = offsets_start + (count + 1) * OFFSET.size
+
+        self._slots = self._table(HEADER.size, offsets_start)
+        self._offsets = self._table(offsets_start, self._records_start)
+
+    def _table(self, start: int, end: int):
+        """Zero-copy u32 view of part of the file; an unpacked copy on big-endian hosts."""
+        view = memoryview(self._map)[start:end]
+        if sys.byteorder == "little":
+            return view.cast("I")
+        table = [OFFSET.unpack_from(view, i)[0] for i in range(0, len(view), OFFSET.size)]
+        view.release()
+        return table
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) is not None
+
+    def _find(self, word: str) -> Optional[bytes]:
+        """Hash lookup of a word, returning its record or None."""
+        if not word or not isinstance(word, str):
+            return None
+        target = word.upper().encode("utf-8")
+
+        data = self._map
+        slots = self._slots
+        offsets = self._offsets
+        base = self._records_start
+        size = len(target)
+        slot = zlib.crc32(target) & self._mask
+        while True:
+            number = slots[slot]
+            if not number:
+                return None
+            start = base + offsets[number - 1]
+            if data[start:start + size] == target and data[start + size] == 0:
+                return data[start:base + offsets[number]]
+            slot = (slot + 1) & self._mask
+
+    def lookup(self, word: str, key_length: Optional[int] = None) -> Optional[Tuple[str, str]]:
+        """
+        Look up the precomputed encoding of a word.
+
+        Args:
+            word (str): Word to look up (case-insensitive)
+            key_length (int): Answer for this key_length rather than the one
+                the dictionary was built with, where the entry holds the
+                word's complete keys and they fit (see keys_complete())
+                (default: the dictionary's key_length)
+
+        Returns:
+            Optional[Tuple[str, str]]: Primary and alternate encodings, or None
+            if the word is not in the dictionary or its entry does not
+            answer key_length
+        """
+        record = self._find(word)
+        keys = None
+        if record is not None:
+            _, primary, alternate = record.decode("utf-8").split("\0")
+            keys = (primary, alternate)
+            if key_length is not None and key_length != self.key_length and not (
+                    keys_complete(keys, self.key_length) and keys_fit(keys, key_length)):
+                keys = None
+
+        with self._lock:
+            if keys is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return keys
+
+    def stats(self) -> dict:
+        """
+        Get dictionary statistics.
+
+        Returns:
+            dict: path, entries, settings, hits and misses
+        """
+        return {
+            'path': self.path,
+            'entries': self._count,
+            'encode_vowels': self.encode_vowels,
+            'encode_exact': self.encode_exact,
+            'key_length': self.key_length,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def close(self) -> None:
+        """Unmap the dictionary file."""
+        for table in (self._slots, self._offsets):
+            if isinstance(table, memoryview):
+                table.release()
+        self._map.close()
+
+
+def main():
+    """Build a dictionary file, or look words up in one."""
+    if len(sys.argv) in (3, 4) and sys.argv[1] == "build":
+        output_path = sys.argv[3] if len(sys.argv) == 4 else DEFAULT_DICTIONARY_PATH
+        count = build_dictionary(sys.argv[2], output_path)
+        print(f"Wrote {count} entries to {output_path}")
+    elif len(sys.argv) >= 3 and sys.argv[1] == "lookup":
+        dictionary = Metaphone3Dictionary(sys.argv[2])
+        for word in sys.argv[3:]:
+            print(f"{word:12} -> {dictionary.lookup(word)}")
+    else:
+        print("Usage:")
+        print("  python metaphone3_dictionary.py build WORD_LIST [OUTPUT]")
+        print("  python metaphone3_dictionary.py lookup DICTIONARY WORD...")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Disk Cache
+
+A persistent encoding cache in a single SQLite file, shared by every process
+that opens the same path: gunicorn workers, several services on one host, or
+instances mounting the same volume. The file survives restarts, so a new
+process starts out with what the others already encoded instead of with an
+empty cache.
+
+The database runs in WAL mode, so readers never block each other or the
+writer, and concurrent writers wait for each other up to a busy timeout.
+Each thread (and each forked process) opens its own connection. The cache is
+best effort: a lookup that fails counts as a miss and a write that fails is
+dropped, so a locked or damaged file slows the encoder down but never breaks
+it.
+
+Entries are keyed on the upper-cased word and the encode_vowels /
+encode_exact / key_length settings. Entries filed under key_length
+ANY_KEY_LENGTH hold a word's complete keys and answer every key_length they
+fit (see keys_complete() in metaphone3.py). The file holds at most
+max_entries; once a write goes past that, the entries written longest ago
+are evicted.
+
+Usage:
+    from metaphone3_wrapper import Metaphone3Wrapper
+
+    # Through the wrapper: looked up after the LRU cache, written after encoding
+    m3 = Metaphone3Wrapper(disk_cache_path="/var/cache/metaphone3.sqlite")
+
+    # Directly
+    from metaphone3_disk_cache import DiskCache
+
+    cache = DiskCache("/var/cache/metaphone3.sqlite")
+    cache.put(("SMITH", False, False, 8), ("SM0", "XMT"))
+    cache.get(("SMITH", False, False, 8))  # ("SM0", "XMT")
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from metaphone3 import ANY_KEY_LENGTH, keys_fit
+
+
+# Default maximum number of entries kept in the file
+DEFAULT_DISK_CACHE_SIZE = 1000000
+
+# Default seconds to wait for another process's write to finish
+DEFAULT_BUSY_TIMEOUT = 5.0
+
+# Words per lookup query, below SQLite's limit on bound parameters
+QUERY_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS encodings (
+    word TEXT NOT NULL,
+    encode_vowels INTEGER NOT NULL,
+    encode_exact INTEGER NOT NULL,
+    key_length INTEGER NOT NULL,
+    primary_key TEXT NOT NULL,
+    alternate_key TEXT NOT NULL,
+    PRIMARY KEY (word, encode_vowels, encode_exact, key_length)
+);
+CREATE TABLE IF NOT EXISTS entry_count (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS encodings_insert AFTER INSERT ON encodings
+BEGIN
+    UPDATE entry_count SET entries = entries + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS encodings_delete AFTER DELETE ON encodings
+BEGIN
+    UPDATE entry_count SET entries = entries - 1;
+END;
+"""
+
+
+class DiskCache:
+    """
+    Process-shared, size-bounded encoding cache in an SQLite file.
+
+    Keys are (upper-cased word, encode_vowels, encode_exact, key_length)
+    tuples, as built by Metaphone3Wrapper, and values (primary, alternate)
+    tuples. Every write gets a higher rowid than all rows before it, so rowid
+    order is write order and eviction deletes the lowest rowids. Triggers
+    keep the number of rows in the one-row entry_count table, so a write
+    knows whether to evict without counting the table.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_DISK_CACHE_SIZE,
+                 busy_timeout: float = DEFAULT_BUSY_TIMEOUT):
+        """
+        Open the cache file, creating it if needed.
+
+        Args:
+            path (str): SQLite file
+            max_entries (int): Maximum number of entries kept (default: 1000000)
+            busy_timeout (float): Seconds to wait for other writers
+                (default: 5.0)
+
+        Raises:
+            sqlite3.Error: If the file cannot be opened or created
+        """
+        if max_entries < 1:
+            raise ValueError("Disk cache size must be at least 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.busy_timeout = busy_timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+        connection = self._connection()
+        # One transaction, so the count starts from the rows the triggers will track
+        try:
+            connection.executescript("BEGIN IMMEDIATE;" + _SCHEMA)
+            if connection.execute("SELECT 1 FROM entry_count").fetchone() is None:
+                connection.execute("INSERT INTO entry_count (id, entries) SELECT 0, COUNT(*) FROM encodings")
+            connection.commit()
+        except sqlite3.Error:
+            if connection.in_transaction:
+                connection.rollback()
+            raise
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening one in a new thread or forked process."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+
+        # Only this thread uses the connection, but close() may run on another
+        connection = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode commits need no fsync; a crash loses at most the last writes
+        connection.execute("PRAGMA synchronous=NORMAL")
+        # Rows deleted by INSERT OR REPLACE fire the delete trigger only with this on
+        connection.execute("PRAGMA recursive_triggers=ON")
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def _count(self, hits: int, misses: int, errors: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.errors += errors
+
+    def get(self, key: tuple) -> Optional[Tuple[str, str]]:
+        """
+        Look up one entry.
+
+        Returns:
+            Optional[Tuple[str, str]]: The cached value, or None on a miss
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[tuple]) -> Dict[tuple, Tuple[str, str]]:
+        """
+        Look up many entries with a few queries.
+
+        A key is answered by its own entry or, failing that, by the word's
+        ANY_KEY_LENGTH entry if its keys fit the key's key_length.
+
+        Args:
+            keys (Iterable[tuple]): Keys to look up
+
+        Returns:
+            Dict[tuple, Tuple[str, str]]: Values of the keys found
+        """
+        # One query per settings and chunk of words
+        words_by_settings = {}
+        for word, encode_vowels, encode_exact, key_length in keys:
+            words_by_settings.setdefault((bool(encode_vowels), bool(encode_exact), key_length), set()).add(word)
+
+        found = {}
+        requested = sum(len(words) for words in words_by_settings.values())
+        try:
+            connection = self._connection()
+            for settings, words in words_by_settings.items():
+                words = list(words)
+                for start in range(0, len(words), QUERY_CHUNK_SIZE):
+                    chunk = words[start:start + QUERY_CHUNK_SIZE]
+                    rows = connection.execute(
+                        "SELECT word, key_length, primary_key, alternate_key FROM encodings "
+                        "WHERE encode_vowels = ? AND encode_exact = ? AND key_length IN (?, ?) "
+                        f"AND word IN ({', '.join('?' * len(chunk))})",
+                        (int(settings[0]), int(settings[1]), settings[2], ANY_KEY_LENGTH, *chunk)
+                    )
+                    for word, key_length, primary, alternate in rows:
+                        key = (word,) + settings
+                        if key_length == settings[2]:
+                            found[key] = (primary, alternate)
+                        elif key not in found and keys_fit((primary, alternate), settings[2]):
+                            found[key] = (primary, alternate)
+        except sqlite3.Error:
+            self._count(0, requested, errors=1)
+            return {}
+
+        self._count(len(found), requested - len(found))
+        return found
+
+    def put(self, key: tuple, value: Tuple[str, str]) -> None:
+        """Store one entry."""
+        self.put_many([(key, value)])
+
+    def put_many(self, items: Iterable[Tuple[tuple, Tuple[str, str]]]) -> None:
+        """
+        Store many entries in one transaction, then evict the oldest entries
+        beyond max_entries.
+
+        Args:
+            items (Iterable[Tuple[tuple, Tuple[str, str]]]): (key, value) pairs
+        """
+        rows = [(word, int(bool(encode_vowels)), int(bool(encode_exact)), key_length, primary, alternate)
+                for (word, encode_vowels, encode_exact, key_length), (primary, alternate) in items]
+        if not rows:
+            return
+        try:
+            connection = self._connection()
+            with connection:
+                # REPLACE deletes the old row, so rewritten entries count as new
+                connection.executemany(
+                    "INSERT OR REPLACE INTO encodings "
+                    "(word, encode_vowels, encode_exact, key_length, primary_key, alternate_key) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                # Replacements and earlier evictions leave gaps in the rowids,
+                # so the oldest rows are counted off rather than taken as a range
+                excess = connection.execute("SELECT entries FROM entry_count").fetchone()[0] - self.max_entries
+                evicted = 0
+                if excess > 0:
+                    evicted = connection.execute(
+                        "DELETE FROM encodings WHERE rowid IN "
+                        "(SELECT rowid FROM encodings ORDER BY rowid LIMIT ?)",
+                        (excess,)
+                    ).rowcount
+        except sqlite3.Error:
+            self._count(0, 0, errors=1)
+            return
+
+        if evicted > 0:
+            with self._lock:
+                self.evictions += evicted
+
+    def preload(self, limit: int) -> List[Tuple[tuple, Tuple[str, str]]]:
+        """
+        Read the most recently written entries, for warming a memory cache.
+
+        Args:
+            limit (int): Maximum number of entries
+
+        Returns:
+            List[Tuple[tuple, Tuple[str, str]]]: (key, value) pairs, newest
+            first
+        """
+        if limit <= 0:
+            return []
+        try:
+            rows = self._connection().execute(
+                "SELECT word, encode_vowels, encode_exact, key_length, primary_key, alternate_key "
+                "FROM encodings ORDER BY rowid DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        except sqlite3.Error:
+            self._count(0, 0, errors=1)
+            return []
+        return [((word, bool(encode_vowels), bool(encode_exact), key_length), (primary, alternate))
+                for word, encode_vowels, encode_exact, key_length, primary, alternate in rows]
+
+    def clear(self) -> None:
+        """Remove all entries, for every process sharing the file. Counters are kept."""
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM encodings")
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT entries FROM entry_count").fetchone()[0]
+
+    def stats(self) -> dict:
+        """
+        Get statistics of this process's use of the cache.
+
+        Returns:
+            dict: path, max_entries, hits, misses, evictions, errors and
+            hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'path': self.path,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'errors': self.errors,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+
+    def close(self) -> None:
+        """Close the connections opened by this process."""
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
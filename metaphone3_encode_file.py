@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 File Encoder
+
+Encodes one column of a large text, CSV or NDJSON file with a pool of worker
+processes and streams the result to an output file in input order. Memory
+stays bounded: the input is read in chunks and only a few chunks per process
+are in flight at any time.
+
+Output formats follow the input:
+    text     one word per line -> "word<TAB>primary<TAB>alternate"
+    csv      every row gets metaphone3_primary and metaphone3_alternate columns
+    ndjson   every object gets metaphone3_primary and metaphone3_alternate fields
+
+After each chunk is written, the output is flushed to disk and a checkpoint
+file (OUTPUT.checkpoint by default) records how far input and output got.
+After a crash, --resume truncates the output to the checkpoint and continues
+from there. The checkpoint is removed when the run completes.
+
+Usage:
+    python metaphone3_encode_file.py names.txt names.tsv
+    python metaphone3_encode_file.py people.csv out.csv --format csv --column last_name --processes 8
+    python metaphone3_encode_file.py people.ndjson out.ndjson --format ndjson --column name \\
+        --encode-vowels --key-length 12 --resume
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from multiprocessing import Pool
+from typing import Iterator, Optional, Tuple
+
+from metaphone3_wrapper import Metaphone3Wrapper, Metaphone3Error, EncodeOptions, BACKENDS
+
+
+# Input formats
+FORMATS = ("text", "csv", "ndjson")
+
+# Names of the columns/fields added to CSV and NDJSON records
+PRIMARY_COLUMN = "metaphone3_primary"
+ALTERNATE_COLUMN = "metaphone3_alternate"
+
+# Records per task sent to a worker process
+DEFAULT_CHUNK_SIZE = 10000
+
+# Chunks in flight per worker process
+CHUNKS_PER_PROCESS = 2
+
+# Seconds between progress reports
+PROGRESS_INTERVAL = 5.0
+
+# Encoder and job settings of the current worker process, or the error that
+# kept its encoder from starting
+_wrapper = None
+_options = None
+_job = None
+_init_error = None
+
+
+def _init_worker(backend: str, options: EncodeOptions, job: dict) -> None:
+    """Create the worker process's wrapper."""
+    global _wrapper, _options, _job, _init_error
+    _options = options
+    _job = job
+    try:
+        # Each process brings its own parallelism, so one Node.js worker is enough
+        _wrapper = Metaphone3Wrapper(backend=backend, pool_size=1)
+    except Metaphone3Error as e:
+        # A failing initializer makes the pool respawn workers forever, so
+        # the error is raised by the tasks instead
+        _init_error = e
+
+
+def _encode_chunk(records: list) -> str:
+    """
+    Encode the selected column of a chunk of records and format the output.
+
+    Args:
+        records (list): Lines (text, ndjson) or parsed rows (csv)
+
+    Returns:
+        str: Output text of the chunk
+    """
+    if _init_error is not None:
+        raise _init_error
+    input_format = _job['format']
+    column = _job['column']
+
+    if input_format == "ndjson":
+        records = [json.loads(line) for line in records]
+        words = [record.get(column) if isinstance(record, dict) else None for record in records]
+    elif input_format == "csv":
+        words = [row[column] if column < len(row) else None for row in records]
+    else:
+        words = records
+
+    output = io.StringIO()
+    results = _wrapper.encode_list(words, _options)
+    if input_format == "csv":
+        writer = csv.writer(output, lineterminator="\n")
+    for record, (word, primary, alternate) in zip(records, results):
+        if not primary and alternate.startswith("Error: "):
+            raise Metaphone3Error(f"Failed to encode '{word}': {alternate[len('Error: '):]}")
+        if input_format == "ndjson":
+            if isinstance(record, dict):
+                record[PRIMARY_COLUMN] = primary
+                record[ALTERNATE_COLUMN] = alternate
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif input_format == "csv":
+            writer.writerow(record + [primary, alternate])
+        else:
+            output.write(f"{word}\t{primary}\t{alternate}\n")
+    return output.getvalue()
+
+
+class _OffsetLines:
+    """Decoded lines of a binary file that remember the offset after the last line read."""
+
+    def __init__(self, binary_file):
+        self._file = binary_file
+        self.offset = binary_file.tell()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        line = self._file.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        return line.decode("utf-8")
+
+
+def read_records(input_file, input_format: str) -> Iterator[Tuple[object, int]]:
+    """
+    Read records from a binary input file positioned at a record boundary.
+
+    Yields:
+        Tuple[object, int]: The record (line or CSV row) and the input offset
+        just after it
+    """
+    lines = _OffsetLines(input_file)
+    if input_format == "csv":
+        for row in csv.reader(lines):
+            yield row, lines.offset
+        return
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if input_format == "ndjson" and not line.strip():
+            continue
+        yield line, lines.offset
+
+
+def load_checkpoint(path: str) -> Optional[dict]:
+    """Read a checkpoint file, or None if there is none."""
+    try:
+        with open(path, encoding="utf-8") as checkpoint_file:
+            return json.load(checkpoint_file)
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        raise Metaphone3Error(f"Corrupt checkpoint {path}: {e}")
+
+
+def save_checkpoint(path: str, checkpoint: dict) -> None:
+    """Write a checkpoint file atomically."""
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, delete=False) as temp_file:
+        json.dump(checkpoint, temp_file)
+        temp_path = temp_file.name
+    os.replace(temp_path, path)
+
+
+def encode_file(input_path: str, output_path: str, input_format: str = "text", column: str = None,
+                has_header: bool = True, options: Optional[EncodeOptions] = None, backend: str = "python",
+                processes: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                checkpoint_path: Optional[str] = None, resume: bool = False, progress=None) -> int:
+    """
+    Encode a column of a file into an output file, in parallel and resumably.
+
+    Args:
+        input_path (str): Input file
+        output_path (str): Output file
+        input_format (str): "text", "csv" or "ndjson" (default: "text")
+        column (str): CSV column name or 0-based index, or NDJSON field
+            (default: first CSV column, NDJSON field "word")
+        has_header (bool): Whether a CSV input starts with a header row
+        options (EncodeOptions): Encoder settings (default: EncodeOptions())
+        backend (str): Encoder backend of the worker processes
+        processes (int): Number of worker processes (default: number of CPUs)
+        chunk_size (int): Records per task
+        checkpoint_path (str): Checkpoint file (default: OUTPUT.checkpoint)
+        resume (bool): Continue from an existing checkpoint
+        progress (callable): Called with (rows, rows_per_sec) while running
+
+    Returns:
+        int: Total number of records encoded, including resumed ones
+
+    Raises:
+        Metaphone3Error: On bad arguments, a mismatching checkpoint, an
+            unavailable backend or an encoding failure
+    """
+    if input_format not in FORMATS:
+        raise Metaphone3Error(f"Unknown format '{input_format}', expected one of {FORMATS}")
+    options = options or EncodeOptions()
+    processes = processes or os.cpu_count() or 1
+    checkpoint_path = checkpoint_path or output_path + ".checkpoint"
+
+    settings = {
+        'input': os.path.abspath(input_path),
+        'format': input_format,
+        'column': column,
+        'has_header': has_header,
+        'encode_vowels': options.encode_vowels,
+        'encode_exact': options.encode_exact,
+        'key_length': options.key_length
+    }
+    checkpoint = load_checkpoint(checkpoint_path) if resume else None
+    if checkpoint is not None and checkpoint.get('settings') != settings:
+        raise Metaphone3Error(f"Checkpoint {checkpoint_path} was written with different settings")
+
+    # Fail before the output is touched rather than in every worker process
+    Metaphone3Wrapper(backend=backend, pool_size=1).close()
+
+    with open(input_path, "rb") as input_file, open(output_path, "r+b" if checkpoint else "wb") as output_file:
+        header = None
+        header_end = 0
+        if input_format == "csv" and has_header:
+            first_row = next(read_records(input_file, "csv"), None)
+            if first_row is not None:
+                header, header_end = first_row
+
+        if input_format != "csv":
+            resolved_column = column or "word"
+        elif column is None:
+            resolved_column = 0
+        elif column.isdigit():
+            resolved_column = int(column)
+        elif header is not None and column in header:
+            resolved_column = header.index(column)
+        else:
+            raise Metaphone3Error(f"Column '{column}' not found in the CSV header")
+
+        if checkpoint:
+            rows = checkpoint['rows']
+            input_file.seek(checkpoint['input_offset'])
+            output_file.truncate(checkpoint['output_offset'])
+            output_file.seek(checkpoint['output_offset'])
+        else:
+            rows = 0
+            input_file.seek(header_end)
+            if header is not None:
+                header_text = io.StringIO()
+                csv.writer(header_text, lineterminator="\n").writerow(header + [PRIMARY_COLUMN, ALTERNATE_COLUMN])
+                output_file.write(header_text.getvalue().encode("utf-8"))
+
+        job = {'format': input_format, 'column': resolved_column}
+        start = time.monotonic()
+        start_rows = rows
+        last_report = start
+
+        def chunks():
+            chunk = []
+            for record, offset in read_records(input_file, input_format):
+                chunk.append(record)
+                if len(chunk) >= chunk_size:
+                    yield chunk, offset
+                    chunk = []
+            if chunk:
+                yield chunk, offset
+
+        with Pool(processes, initializer=_init_worker, initargs=(backend, options, job)) as pool:
+            pending = deque()
+            chunk_iterator = chunks()
+            while True:
+                # Keep a bounded number of chunks in flight
+                while len(pending) < processes * CHUNKS_PER_PROCESS:
+                    next_chunk = next(chunk_iterator, None)
+                    if next_chunk is None:
+                        break
+                    records, offset = next_chunk
+                    pending.append((pool.apply_async(_encode_chunk, (records,)), len(records), offset))
+                if not pending:
+                    break
+
+                result, count, offset = pending.popleft()
+                output_file.write(result.get().encode("utf-8"))
+                output_file.flush()
+                os.fsync(output_file.fileno())
+                rows += count
+                save_checkpoint(checkpoint_path, {
+                    'settings': settings,
+                    'rows': rows,
+                    'input_offset': offset,
+                    'output_offset': output_file.tell()
+                })
+
+                now = time.monotonic()
+                if progress is not None and now - last_report >= PROGRESS_INTERVAL:
+                    progress(rows, (rows - start_rows) / (now - start))
+                    last_report = now
+
+        if progress is not None:
+            elapsed = time.monotonic() - start
+            progress(rows, (rows - start_rows) / elapsed if elapsed else 0.0)
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return rows
+
+
+def main():
+    """Encode a file from the command line."""
+    parser = argparse.ArgumentParser(description="Encode a column of a large file with Metaphone3.")
+    parser.add_argument("input", help="input file")
+    parser.add_argument("output", help="output file")
+    parser.add_argument("--format", choices=FORMATS, default="text", help="input format (default: text)")
+    parser.add_argument("--column", help="CSV column name or 0-based index, or NDJSON field (default: "
+                                         "first CSV column, NDJSON field 'word')")
+    parser.add_argument("--no-header", action="store_true", help="CSV input has no header row")
+    parser.add_argument("--encode-vowels", action="store_true", help="encode non-initial vowels")
+    parser.add_argument("--encode-exact", action="store_true", help="encode consonants exactly")
+    parser.add_argument("--key-length", type=int, default=8, help="maximum key length, 1-32 (default: 8)")
+    parser.add_argument("--backend", choices=BACKENDS, default="python", help="encoder backend (default: python)")
+    parser.add_argument("--processes", type=int, help="worker processes (default: number of CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="records per task (default: %(default)s)")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: OUTPUT.checkpoint)")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint after a crash")
+    args = parser.parse_args()
+
+    def report(rows, rate):
+        print(f"{rows} rows, {rate:.0f} rows/sec", file=sys.stderr)
+
+    try:
+        rows = encode_file(
+            args.input, args.output,
+            input_format=args.format,
+            column=args.column,
+            has_header=not args.no_header,
+            options=EncodeOptions(args.encode_vowels, args.encode_exact, args.key_length),
+            backend=args.backend,
+            processes=args.processes,
+            chunk_size=args.chunk_size,
+            checkpoint_path=args.checkpoint,
+            resume=args.resume,
+            progress=report
+        )
+    except (Metaphone3Error, ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Encoded {rows} rows into {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
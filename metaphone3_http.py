@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 HTTP Request Handling
+
+Request limits, deadline parsing, word validation and result formatting
+shared by the Flask app (app.py) and the ASGI app (async_app.py), so both
+servers accept the same requests and answer them with the same bodies.
+
+Configuration:
+- METAPHONE3_MAX_REQUEST_BYTES: largest request body, before and after gzip
+  decompression (default: 16 MiB)
+- METAPHONE3_MAX_REQUEST_SECONDS: default and longest deadline of a request,
+  from arrival and including time spent queueing (default: 30). Clients ask
+  for a shorter one with an X-Request-Timeout header in seconds.
+
+Usage:
+    from metaphone3_http import encoding_result, parse_deadline, validate_word
+
+    deadline = parse_deadline(headers.get(REQUEST_TIMEOUT_HEADER))
+    if validate_word(word):
+        result = encoding_result(*m3.encode_list([word.strip()])[0])
+"""
+
+import logging
+import os
+import time
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Largest request body accepted, before and after gzip decompression
+DEFAULT_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# Default and longest deadline of a request in seconds, queueing included
+DEFAULT_MAX_REQUEST_SECONDS = 30
+
+# Request header carrying a shorter deadline, in seconds from arrival
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+
+MAX_REQUEST_BYTES = int(os.environ.get("METAPHONE3_MAX_REQUEST_BYTES", DEFAULT_MAX_REQUEST_BYTES))
+MAX_REQUEST_SECONDS = float(os.environ.get("METAPHONE3_MAX_REQUEST_SECONDS", DEFAULT_MAX_REQUEST_SECONDS))
+
+# Error message of requests that ran past their deadline
+DEADLINE_MESSAGE = (f"Request not completed within its deadline; send a longer {REQUEST_TIMEOUT_HEADER} "
+                    f"(at most {MAX_REQUEST_SECONDS:g} s) or split the batch")
+
+# Error message of request bodies over MAX_REQUEST_BYTES
+TOO_LARGE_MESSAGE = f"Request body larger than {MAX_REQUEST_BYTES} bytes"
+
+
+def parse_deadline(header: Optional[str]) -> float:
+    """
+    Get the deadline of a request arriving now: MAX_REQUEST_SECONDS from
+    now, or sooner if the client sent a shorter X-Request-Timeout.
+
+    Args:
+        header (Optional[str]): Value of the X-Request-Timeout header, or
+            None if the request has none
+
+    Returns:
+        float: time.monotonic() value
+
+    Raises:
+        ValueError: If the header is not a positive number of seconds
+    """
+    seconds = MAX_REQUEST_SECONDS
+    if header is not None:
+        try:
+            requested = float(header)
+        except ValueError:
+            requested = 0.0
+        if not requested > 0:
+            raise ValueError(f"{REQUEST_TIMEOUT_HEADER} must be a positive number of seconds")
+        seconds = min(seconds, requested)
+    return time.monotonic() + seconds
+
+
+def deadline_error(udf: bool = False) -> dict:
+    """
+    Body of the 504 response to a request that ran past its deadline.
+
+    Args:
+        udf (bool): Answer in the BigQuery remote function format, which has
+            no "success" field (default: False)
+    """
+    if udf:
+        return {"error": DEADLINE_MESSAGE}
+    return {"error": DEADLINE_MESSAGE, "success": False}
+
+
+def validate_word(word) -> bool:
+    """Validate that the word is a non-empty string."""
+    return isinstance(word, str) and bool(word.strip())
+
+
+def encoding_result(word: str, primary: str, alternate: str) -> dict:
+    """Build the JSON result of one word from an encode_list() tuple."""
+    # encode_list reports per-word failures as ("", "Error: ...")
+    if not primary and alternate.startswith("Error: "):
+        logger.error(f"Error encoding word '{word}': {alternate}")
+        return {
+            "word": word,
+            "error": alternate[len("Error: "):],
+            "success": False
+        }
+    return {
+        "word": word,
+        "primary": primary,
+        "alternate": alternate if alternate != primary else None,
+        "success": True
+    }
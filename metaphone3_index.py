@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Phonetic Index
+
+An inverted index from Metaphone3 keys to the words that produce them, for
+"sounds like" lookups: every word is filed under its primary key and, when it
+differs, its alternate key. Searching a word encodes it once and reads the
+words under its keys with one dictionary lookup per key.
+
+The index can be seeded from a word list in the format of
+large_word_list_output_3_21_15_DEFAULT_ENCODING.txt (whose keys are used as
+is, without encoding) or from any list of words, is updated incrementally with
+add() / remove(), and is saved to and loaded from a JSON file. With
+autosave() a background thread writes the changes made within a save
+interval to the file in one go, so updates never wait for a save.
+
+Usage:
+    from metaphone3_wrapper import Metaphone3Wrapper
+    from metaphone3_index import PhoneticIndex
+
+    index = PhoneticIndex.from_word_list(Metaphone3Wrapper(backend="python"),
+                                         "large_word_list_output_3_21_15_DEFAULT_ENCODING.txt")
+    index.add("Smythe")
+    index.search("smith")  # {"primary": "SM0", "alternate": "XMT", "matches": [...]}
+    index.save("metaphone3_index.json")
+
+    # Or keep the file up to date in the background
+    index.autosave("metaphone3_index.json")
+    index.add_many(["Smyth", "Smithe"])
+    index.close()  # writes what is still unsaved
+
+    # Command line
+    python metaphone3_index.py build WORD_LIST OUTPUT
+    python metaphone3_index.py search INDEX WORD...
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Iterable, Optional
+
+from metaphone3 import read_word_list
+from metaphone3_wrapper import Metaphone3Wrapper, Metaphone3Error, EncodeOptions
+
+
+logger = logging.getLogger(__name__)
+
+# Format tag written to index files
+INDEX_FORMAT = "metaphone3-index/1"
+
+# Default seconds autosave() gathers changes before writing them
+DEFAULT_SAVE_INTERVAL = 1.0
+
+
+class PhoneticIndex:
+    """
+    Thread-safe inverted index of words by Metaphone3 key.
+
+    All words are encoded with the same EncodeOptions, fixed when the index
+    is created.
+    """
+
+    def __init__(self, wrapper: Metaphone3Wrapper, options: Optional[EncodeOptions] = None):
+        """
+        Create an empty index.
+
+        Args:
+            wrapper (Metaphone3Wrapper): Encoder for added and searched words
+            options (EncodeOptions): Settings keys are built with (default:
+                EncodeOptions())
+        """
+        self.wrapper = wrapper
+        self.options = options or EncodeOptions()
+        # word -> (primary, alternate), and key -> set of words
+        self._words = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+        # Bumped by every change; autosave() writes when it moves past the saved one
+        self._version = 0
+        self._saved_version = 0
+        self._save_path = None
+        self._save_thread = None
+        self._changed = threading.Condition(self._lock)
+        self._closing = False
+
+    @classmethod
+    def from_word_list(cls, wrapper: Metaphone3Wrapper, path: str,
+                       options: Optional[EncodeOptions] = None) -> "PhoneticIndex":
+        """
+        Seed an index from a word list with "WORD PRIMARY (ALTERNATE)" lines.
+
+        The keys in the file are trusted when the index uses the default
+        settings it was produced with; otherwise the words are re-encoded.
+
+        Args:
+            wrapper (Metaphone3Wrapper): Encoder for later additions and searches
+            path (str): Word list to read
+            options (EncodeOptions): Settings keys are built with
+
+        Returns:
+            PhoneticIndex: The seeded index
+        """
+        index = cls(wrapper, options)
+        if index.options == EncodeOptions():
+            with index._lock:
+                for word, primary, alternate in read_word_list(path):
+                    index._insert(word, primary, alternate)
+        else:
+            index.add_many(word for word, _, _ in read_word_list(path))
+        return index
+
+    @classmethod
+    def load(cls, wrapper: Metaphone3Wrapper, path: str) -> "PhoneticIndex":
+        """
+        Load an index saved with save().
+
+        Args:
+            wrapper (Metaphone3Wrapper): Encoder for later additions and searches
+            path (str): Index file
+
+        Returns:
+            PhoneticIndex: The loaded index
+
+        Raises:
+            Metaphone3Error: If the file is missing or not an index file
+        """
+        try:
+            with open(path, encoding="utf-8") as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError) as e:
+            raise Metaphone3Error(f"Cannot load index {path}: {e}")
+        if not isinstance(data, dict) or data.get('format') != INDEX_FORMAT:
+            raise Metaphone3Error(f"Not a Metaphone3 index: {path}")
+
+        index = cls(wrapper, EncodeOptions(**data['options']))
+        with index._lock:
+            for word, (primary, alternate) in data['words'].items():
+                index._insert(word, primary, alternate)
+        return index
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a JSON file, replacing it atomically.
+
+        Args:
+            path (str): Index file
+        """
+        self._write(path)
+
+    def _write(self, path: str) -> int:
+        """Write the index to a file; returns the version written."""
+        with self._lock:
+            version = self._version
+            data = {
+                'format': INDEX_FORMAT,
+                'options': {
+                    'encode_vowels': self.options.encode_vowels,
+                    'encode_exact': self.options.encode_exact,
+                    'key_length': self.options.key_length
+                },
+                'words': {word: list(keys) for word, keys in self._words.items()}
+            }
+
+        # Readers see the old file or the new one, never a partial write
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, delete=False) as temp_file:
+            temp_path = temp_file.name
+            try:
+                json.dump(data, temp_file, separators=(",", ":"))
+            except BaseException:
+                temp_file.close()
+                os.unlink(temp_path)
+                raise
+        try:
+            os.replace(temp_path, path)
+        except OSError:
+            os.unlink(temp_path)
+            raise
+        return version
+
+    def autosave(self, path: str, interval: float = DEFAULT_SAVE_INTERVAL) -> None:
+        """
+        Save changes to a file from a background thread.
+
+        After a change, the thread waits interval seconds for more, then
+        writes them all with one save(). close() writes what is left.
+
+        Args:
+            path (str): Index file
+            interval (float): Seconds changes are gathered before a save
+                (default: 1.0)
+        """
+        with self._lock:
+            if self._save_thread is not None:
+                raise Metaphone3Error("Index is already saved automatically")
+            self._save_path = path
+            self._saved_version = self._version
+            self._save_thread = threading.Thread(
+                target=self._save_loop, args=(interval,), name="metaphone3-index-save", daemon=True
+            )
+        self._save_thread.start()
+
+    def _save_loop(self, interval: float) -> None:
+        while True:
+            with self._lock:
+                while self._version == self._saved_version and not self._closing:
+                    self._changed.wait()
+                # Let the rest of a burst of changes arrive before writing;
+                # close() ends the wait and writes them itself
+                deadline = time.monotonic() + interval
+                while not self._closing and time.monotonic() < deadline:
+                    self._changed.wait(deadline - time.monotonic())
+                if self._closing:
+                    return
+            self._save_changes()
+
+    def _save_changes(self) -> None:
+        """Write the index if it changed since the last automatic save."""
+        with self._lock:
+            if self._version == self._saved_version:
+                return
+        try:
+            version = self._write(self._save_path)
+        except OSError as e:
+            # Kept unsaved, so the next change or close() tries again
+            logger.error(f"Failed to save index to {self._save_path}: {e}")
+            return
+        with self._lock:
+            self._saved_version = max(self._saved_version, version)
+
+    def close(self) -> None:
+        """Stop automatic saving, writing changes not saved yet."""
+        with self._lock:
+            thread = self._save_thread
+            if thread is None:
+                return
+            self._closing = True
+            self._changed.notify_all()
+        thread.join()
+        self._save_changes()
+        with self._lock:
+            self._save_thread = None
+            self._closing = False
+
+    def _insert(self, word: str, primary: str, alternate: str) -> bool:
+        """File a word under its keys; the caller holds the lock."""
+        if word in self._words:
+            return False
+        self._words[word] = (primary, alternate)
+        for key in {primary, alternate}:
+            if key:
+                self._keys.setdefault(key, set()).add(word)
+        self._version += 1
+        self._changed.notify_all()
+        return True
+
+    def add(self, word: str) -> bool:
+        """
+        Add a word to the index.
+
+        Args:
+            word (str): Word to add
+
+        Returns:
+            bool: True if the word was added, False if it was already indexed
+            or encodes to no key
+        """
+        if not word or not isinstance(word, str):
+            return False
+        primary, alternate = self.wrapper.encode(word, self.options)
+        if not primary:
+            return False
+        with self._lock:
+            return self._insert(word, primary, alternate)
+
+    def add_many(self, words: Iterable[str]) -> int:
+        """
+        Add words to the index, encoding them in one batch.
+
+        The whole batch is encoded before the index changes, so a word that
+        fails to encode leaves the index as it was.
+
+        Args:
+            words (Iterable[str]): Words to add
+
+        Returns:
+            int: Number of words added
+
+        Raises:
+            Metaphone3Error: If a word fails to encode
+        """
+        results = self.wrapper.encode_list(list(words), self.options)
+        for word, primary, alternate in results:
+            if not primary and alternate.startswith("Error: "):
+                raise Metaphone3Error(f"Failed to encode '{word}': {alternate[len('Error: '):]}")
+
+        added = 0
+        with self._lock:
+            for word, primary, alternate in results:
+                if word and isinstance(word, str) and primary and self._insert(word, primary, alternate):
+                    added += 1
+        return added
+
+    def remove(self, word: str) -> bool:
+        """
+        Remove a word from the index.
+
+        Args:
+            word (str): Word to remove
+
+        Returns:
+            bool: True if the word was indexed
+        """
+        with self._lock:
+            keys = self._words.pop(word, None)
+            if keys is None:
+                return False
+            for key in set(keys):
+                words = self._keys.get(key)
+                if words is not None:
+                    words.discard(word)
+                    if not words:
+                        del self._keys[key]
+            self._version += 1
+            self._changed.notify_all()
+            return True
+
+    def lookup_key(self, key: str) -> list:
+        """
+        Get the words filed under a Metaphone3 key.
+
+        Args:
+            key (str): Primary or alternate key
+
+        Returns:
+            list: Sorted words producing the key
+        """
+        with self._lock:
+            return sorted(self._keys.get(key, ()))
+
+    def search(self, word: str, limit: Optional[int] = None) -> dict:
+        """
+        Find the indexed words that share a Metaphone3 key with a word.
+
+        Args:
+            word (str): Query word
+            limit (int): Maximum number of matches returned (default: all)
+
+        Returns:
+            dict: The query's primary and alternate keys, the sorted matches
+            and their total count before the limit
+        """
+        primary, alternate = self.wrapper.encode(word, self.options)
+        with self._lock:
+            matches = set()
+            for key in {primary, alternate}:
+                if key:
+                    matches.update(self._keys.get(key, ()))
+        matches = sorted(matches)
+        return {
+            'primary': primary,
+            'alternate': alternate,
+            'matches': matches[:limit] if limit is not None else matches,
+            'total': len(matches)
+        }
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._words
+
+    def stats(self) -> dict:
+        """
+        Get index statistics.
+
+        Returns:
+            dict: Number of words and distinct keys, and the settings
+        """
+        with self._lock:
+            return {
+                'words': len(self._words),
+                'keys': len(self._keys),
+                'encode_vowels': self.options.encode_vowels,
+                'encode_exact': self.options.encode_exact,
+                'key_length': self.options.key_length
+            }
+
+
+def main():
+    """Build an index file from a word list, or search one."""
+    if len(sys.argv) == 4 and sys.argv[1] == "build":
+        wrapper = Metaphone3Wrapper(backend="python")
+        index = PhoneticIndex.from_word_list(wrapper, sys.argv[2])
+        index.save(sys.argv[3])
+        print(f"Wrote {len(index)} words to {sys.argv[3]}")
+    elif len(sys.argv) >= 4 and sys.argv[1] == "search":
+        wrapper = Metaphone3Wrapper(backend="python")
+        index = PhoneticIndex.load(wrapper, sys.argv[2])
+        for word in sys.argv[3:]:
+            result = index.search(word)
+            print(f"{word:12} -> {result['primary']} | {result['alternate']}: {' '.join(result['matches'])}")
+    else:
+        print("Usage:")
+        print("  python metaphone3_index.py build WORD_LIST OUTPUT")
+        print("  python metaphone3_index.py search INDEX WORD...")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Compact In-Memory Metaphone3 Key Store
+
+A read-only word -> (primary, alternate) mapping for large word lists, such
+as the shipped 251k-word list or a corpus of millions of names, held in a
+handful of contiguous buffers instead of a dict of str -> tuple, where every
+entry costs a dict slot, a tuple and three string objects:
+
+    words         upper-cased words in UTF-8, sorted, back to back
+    word offsets  (count + 1) u32 offsets of the words in the words buffer
+    key ids       two u32 per word: the ids of its primary and alternate key
+    keys          each distinct key once (interned), back to back, id 0 = ""
+    key offsets   u32 offsets of the keys in the keys buffer
+
+Lookups binary-search the sorted words, so they take O(log n) comparisons
+and need no hash table. The store is a collections.abc.Mapping, and it
+answers lookup() like Metaphone3Dictionary, so the wrapper can use it in
+place of a dictionary file. Unlike the memory-mapped dictionary file, the
+store is private to its process; it suits a process that builds its word
+list itself rather than sharing a prebuilt file.
+
+Building needs the entries once more in temporary memory, unless they arrive
+sorted by upper-cased word, in which case they are streamed straight into
+the buffers. The first entry of a word wins, as in build_dictionary().
+
+Usage:
+    from metaphone3_key_store import KeyStore
+
+    store = KeyStore.from_word_list("large_word_list_output_3_21_15_DEFAULT_ENCODING.txt")
+    store["smith"]  # ("SM0", "XMT")
+    store.get("nosuchword")  # None
+
+    # Answer words from the store before encoding them
+    from metaphone3_wrapper import Metaphone3Wrapper
+
+    m3 = Metaphone3Wrapper(dictionary=store)
+
+    # Command line: bytes per entry of the store versus a plain dict
+    python metaphone3_key_store.py report large_word_list_output_3_21_15_DEFAULT_ENCODING.txt
+"""
+
+import bisect
+import json
+import sys
+import threading
+import tracemalloc
+from array import array
+from collections.abc import Mapping
+from typing import Iterable, Iterator, Optional, Tuple
+
+from metaphone3 import DEFAULT_MAX_KEY_LENGTH, keys_complete, keys_fit, read_word_list
+
+
+# Offsets and key ids are unsigned 32-bit integers
+OFFSET_TYPE = "I"
+
+
+class _SortedWords:
+    """Sequence view of the words buffer, for bisect."""
+
+    __slots__ = ('_data', '_offsets')
+
+    def __init__(self, data: bytes, offsets: array):
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._data[self._offsets[index]:self._offsets[index + 1]]
+
+
+class KeyStore(Mapping):
+    """
+    Read-only mapping of upper-cased words to (primary, alternate) keys in
+    contiguous buffers.
+
+    Lookups are case-insensitive and thread-safe. Iteration yields the
+    upper-cased words in sorted (UTF-8 byte) order.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]], encode_vowels: bool = False,
+                 encode_exact: bool = False, key_length: int = DEFAULT_MAX_KEY_LENGTH,
+                 path: Optional[str] = None):
+        """
+        Build the store.
+
+        Args:
+            entries (Iterable[Tuple[str, str, str]]): (word, primary, alternate)
+                entries, such as read_word_list() yields
+            encode_vowels (bool): encode_vowels setting the keys were encoded with
+            encode_exact (bool): encode_exact setting the keys were encoded with
+            key_length (int): key_length setting the keys were encoded with
+            path (str): Word list the entries came from, for stats()
+                (default: None)
+
+        Raises:
+            OverflowError: If the words or keys take 4 GiB or more
+        """
+        self.path = path
+        self.encode_vowels = bool(encode_vowels)
+        self.encode_exact = bool(encode_exact)
+        self.key_length = key_length
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        keys = bytearray()
+        key_offsets = array(OFFSET_TYPE, [0, 0])
+        interned = {"": 0}
+
+        def intern(key: str) -> int:
+            key_id = interned.get(key)
+            if key_id is None:
+                key_id = interned[key] = len(interned)
+                keys.extend(key.encode("utf-8"))
+                key_offsets.append(len(keys))
+            return key_id
+
+        words = bytearray()
+        word_offsets = array(OFFSET_TYPE, [0])
+        key_ids = array(OFFSET_TYPE)
+        in_order = True
+        previous = None
+        for word, primary, alternate in entries:
+            if not word:
+                continue
+            data = word.upper().encode("utf-8")
+            if previous is not None and data <= previous:
+                in_order = False
+            previous = data
+            words.extend(data)
+            word_offsets.append(len(words))
+            key_ids.append(intern(primary))
+            key_ids.append(intern(alternate))
+
+        if not in_order:
+            words, word_offsets, key_ids = self._sort(words, word_offsets, key_ids)
+
+        self._words = bytes(words)
+        self._word_offsets = word_offsets
+        self._key_ids = key_ids
+        self._keys = bytes(keys)
+        self._key_offsets = key_offsets
+        self._sorted_words = _SortedWords(self._words, word_offsets)
+
+    @staticmethod
+    def _sort(words: bytearray, word_offsets: array, key_ids: array) -> Tuple[bytearray, array, array]:
+        """Reorder the buffers by word, keeping the first entry of each word."""
+        view = _SortedWords(bytes(words), word_offsets)
+        # Stable, so the first entry of a word comes first among its duplicates
+        order = sorted(range(len(view)), key=view.__getitem__)
+
+        sorted_words = bytearray()
+        sorted_offsets = array(OFFSET_TYPE, [0])
+        sorted_ids = array(OFFSET_TYPE)
+        previous = None
+        for number in order:
+            data = view[number]
+            if data == previous:
+                continue
+            previous = data
+            sorted_words.extend(data)
+            sorted_offsets.append(len(sorted_words))
+            sorted_ids.append(key_ids[2 * number])
+            sorted_ids.append(key_ids[2 * number + 1])
+        return sorted_words, sorted_offsets, sorted_ids
+
+    @classmethod
+    def from_word_list(cls, path: str, encode_vowels: bool = False, encode_exact: bool = False,
+                       key_length: int = DEFAULT_MAX_KEY_LENGTH) -> "KeyStore":
+        """
+        Build a store from a word list with "WORD PRIMARY (ALTERNATE)" lines.
+
+        Args:
+            path (str): Word list, such as the shipped
+                large_word_list_output_3_21_15_DEFAULT_ENCODING.txt
+            encode_vowels (bool): encode_vowels setting the word list was encoded with
+            encode_exact (bool): encode_exact setting the word list was encoded with
+            key_length (int): key_length setting the word list was encoded with
+
+        Returns:
+            KeyStore: The store
+        """
+        return cls(read_word_list(path), encode_vowels, encode_exact, key_length, path=path)
+
+    def _find(self, word: str) -> int:
+        """Binary search for a word, returning its entry number or -1."""
+        if not word or not isinstance(word, str):
+            return -1
+        target = word.upper().encode("utf-8")
+        number = bisect.bisect_left(self._sorted_words, target)
+        if number < len(self._sorted_words) and self._sorted_words[number] == target:
+            return number
+        return -1
+
+    def _key(self, key_id: int) -> str:
+        offsets = self._key_offsets
+        return self._keys[offsets[key_id]:offsets[key_id + 1]].decode("utf-8")
+
+    def _entry(self, number: int) -> Tuple[str, str]:
+        return self._key(self._key_ids[2 * number]), self._key(self._key_ids[2 * number + 1])
+
+    def __getitem__(self, word: str) -> Tuple[str, str]:
+        number = self._find(word)
+        if number < 0:
+            raise KeyError(word)
+        return self._entry(number)
+
+    def __contains__(self, word) -> bool:
+        return self._find(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for number in range(len(self)):
+            yield self._sorted_words[number].decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._word_offsets) - 1
+
+    def lookup(self, word: str, key_length: Optional[int] = None) -> Optional[Tuple[str, str]]:
+        """
+        Look up the keys of a word, counting hits and misses.
+
+        Args:
+            word (str): Word to look up (case-insensitive)
+            key_length (int): Answer for this key_length rather than the one
+                the keys were encoded with, where the entry holds the word's
+                complete keys and they fit (see keys_complete())
+                (default: the store's key_length)
+
+        Returns:
+            Optional[Tuple[str, str]]: Primary and alternate encodings, or None
+            if the word is not in the store or its entry does not answer
+            key_length
+        """
+        number = self._find(word)
+        keys = None
+        if number >= 0:
+            keys = self._entry(number)
+            if key_length is not None and key_length != self.key_length and not (
+                    keys_complete(keys, self.key_length) and keys_fit(keys, key_length)):
+                keys = None
+
+        with self._lock:
+            if keys is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return keys
+
+    def nbytes(self) -> int:
+        """Bytes held by the buffers."""
+        return (len(self._words) + len(self._keys)
+                + sum(table.itemsize * len(table)
+                      for table in (self._word_offsets, self._key_ids, self._key_offsets)))
+
+    def stats(self) -> dict:
+        """
+        Get store statistics.
+
+        Returns:
+            dict: path, entries, distinct keys, settings, bytes, hits and misses
+        """
+        return {
+            'path': self.path,
+            'entries': len(self),
+            'keys': len(self._key_offsets) - 1,
+            'encode_vowels': self.encode_vowels,
+            'encode_exact': self.encode_exact,
+            'key_length': self.key_length,
+            'bytes': self.nbytes(),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def close(self) -> None:
+        """Nothing to release; the buffers go with the store."""
+        pass
+
+
+def memory_report(word_list_path: str) -> dict:
+    """
+    Compare the memory of a KeyStore and of a plain dict holding a word list.
+
+    Both are measured with tracemalloc as the memory still allocated once
+    they are built (retained) and the most allocated while building (peak).
+    The dict maps upper-cased words to (primary, alternate) tuples, as a
+    straightforward in-memory cache would.
+
+    Args:
+        word_list_path (str): Word list with "WORD PRIMARY (ALTERNATE)" lines
+
+    Returns:
+        dict: entries, and for 'store' and 'dict' the retained and peak
+        bytes and retained bytes per entry
+    """
+    def measure(build):
+        tracemalloc.start()
+        try:
+            mapping = build()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return mapping, retained, peak
+
+    def build_dict():
+        entries = {}
+        for word, primary, alternate in read_word_list(word_list_path):
+            entries.setdefault(word.upper(), (primary, alternate))
+        return entries
+
+    store, store_retained, store_peak = measure(lambda: KeyStore.from_word_list(word_list_path))
+    entries, dict_retained, dict_peak = measure(build_dict)
+    count = len(store)
+    return {
+        'entries': count,
+        'store': {
+            'bytes': store_retained,
+            'peak_bytes': store_peak,
+            'bytes_per_entry': store_retained / count if count else 0.0
+        },
+        'dict': {
+            'bytes': dict_retained,
+            'peak_bytes': dict_peak,
+            'bytes_per_entry': dict_retained / count if count else 0.0
+        }
+    }
+
+
+def main():
+    """Report the memory of a store built from a word list, or look words up in one."""
+    if len(sys.argv) == 3 and sys.argv[1] == "report":
+        report = memory_report(sys.argv[2])
+        print(json.dumps(report, indent=2))
+        store, plain = report['store'], report['dict']
+        print(f"{report['entries']} entries: {store['bytes_per_entry']:.1f} bytes per entry in the store, "
+              f"{plain['bytes_per_entry']:.1f} in a dict "
+              f"({plain['bytes'] / max(store['bytes'], 1):.1f}x)")
+    elif len(sys.argv) >= 3 and sys.argv[1] == "lookup":
+        store = KeyStore.from_word_list(sys.argv[2])
+        for word in sys.argv[3:]:
+            print(f"{word:12} -> {store.get(word)}")
+    else:
+        print("Usage:")
+        print("  python metaphone3_key_store.py report WORD_LIST")
+        print("  python metaphone3_key_store.py lookup WORD_LIST WORD...")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
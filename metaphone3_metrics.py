@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Metaphone3 Metrics
+
+Small thread-safe counters, gauges and histograms for the wrapper and the
+API, rendered in the Prometheus text exposition format (version 0.0.4)
+without depending on prometheus_client. The same values are available as
+plain dicts through MetricsRegistry.snapshot().
+
+Counters and gauges either hold values set through inc() / set(), or are
+read from a function when rendered, for values another object already keeps
+(cache statistics, worker pool occupancy).
+
+Usage:
+    from metaphone3_metrics import MetricsRegistry
+
+    metrics = MetricsRegistry()
+    requests = metrics.counter("requests_total", "Requests served", ["route"])
+    latency = metrics.histogram("request_seconds", "Request latency", ["route"])
+
+    requests.inc(route="/encode")
+    latency.observe(0.0012, route="/encode")
+    metrics.render()    # Prometheus text
+    metrics.snapshot()  # {"requests_total": {...}, ...}
+"""
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+
+# Content type of render() output
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram buckets for latencies in seconds, from a cache hit to a cold start
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+                   0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Histogram buckets for batch sizes in words
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 100000)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as Prometheus expects."""
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Format a label set as {name="value",...}, escaping the values."""
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Metric:
+    """Base of all metric types: a name, help text and values per label set."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 function: Optional[Callable] = None):
+        """
+        Create a metric.
+
+        Args:
+            name (str): Metric name
+            documentation (str): Help text
+            labelnames (Sequence[str]): Names of the labels every sample carries
+            function (callable): Read the values when rendering instead of
+                storing them: returns a number, or a dict of label value
+                tuples to numbers when the metric has labels
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._function = function
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict) -> tuple:
+        """Turn keyword labels into a tuple in labelnames order."""
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+
+    def _items(self) -> list:
+        """(label values, value) pairs, in insertion order."""
+        if self._function is not None:
+            values = self._function()
+            if not isinstance(values, dict):
+                return [((), values)]
+            return [(tuple(str(value) for value in key), value) for key, value in values.items()]
+        with self._lock:
+            return list(self._values.items())
+
+    def samples(self) -> list:
+        """
+        Get the metric's samples.
+
+        Returns:
+            list: One {"labels": {...}, "value": number} dict per label set
+        """
+        return [{'labels': dict(zip(self.labelnames, key)), 'value': value} for key, value in self._items()]
+
+    def render(self) -> list:
+        """Prometheus text lines of the metric, without HELP and TYPE."""
+        return [f"{self.name}{_format_labels(dict(zip(self.labelnames, key)))} {_format_value(value)}"
+                for key, value in self._items()]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            amount (float): Non-negative increment (default: 1)
+            **labels: Label values
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        """
+        Set the gauge.
+
+        Args:
+            value (float): New value
+            **labels: Label values
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed, cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        """
+        Create a histogram.
+
+        Args:
+            name (str): Metric name
+            documentation (str): Help text
+            labelnames (Sequence[str]): Names of the labels every sample carries
+            buckets (Iterable[float]): Upper bounds of the buckets; +Inf is
+                always added (default: LATENCY_BUCKETS)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(bucket for bucket in buckets if bucket != math.inf))
+
+    def observe(self, value: float, **labels) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value (float): Observed value
+            **labels: Label values
+        """
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket counts (not yet cumulative), sum and count
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a with block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _items(self) -> list:
+        with self._lock:
+            return [(key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items()]
+
+    def samples(self) -> list:
+        """
+        Get the histogram's samples.
+
+        Returns:
+            list: One dict per label set with "labels", "count", "sum" and
+            "buckets", a list of [upper bound, cumulative count] pairs ending
+            with +Inf
+        """
+        samples = []
+        for key, (counts, total, count) in self._items():
+            cumulative = 0
+            buckets = []
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                buckets.append([bound, cumulative])
+            samples.append({
+                'labels': dict(zip(self.labelnames, key)),
+                'count': count,
+                'sum': total,
+                'buckets': buckets
+            })
+        return samples
+
+    def render(self) -> list:
+        lines = []
+        for sample in self.samples():
+            labels = sample['labels']
+            for bound, cumulative in sample['buckets']:
+                bucket_labels = dict(labels, le=_format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {sample['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                function: Optional[Callable] = None) -> Counter:
+        """Register and return a Counter; see _Metric for the arguments."""
+        return self._register(Counter(name, documentation, labelnames, function))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              function: Optional[Callable] = None) -> Gauge:
+        """Register and return a Gauge; see _Metric for the arguments."""
+        return self._register(Gauge(name, documentation, labelnames, function))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        """Register and return a Histogram; see Histogram for the arguments."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self) -> dict:
+        """
+        Get the current value of every metric.
+
+        Returns:
+            dict: Metric name -> {"type", "help", "samples"}, see the
+            samples() method of each metric type
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {'type': metric.kind, 'help': metric.documentation, 'samples': metric.samples()}
+            for metric in metrics
+        }
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: HELP, TYPE and sample lines, newline terminated
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            documentation = metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+            lines.append(f"# HELP {metric.name} {documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n" if lines else ""
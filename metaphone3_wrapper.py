@@ -5,9 +5,71 @@ Metaphone3 Python Wrapper
 This module provides a Python interface to the Metaphone3 JavaScript implementation.
 It uses Node.js to execute the JavaScript code and return phonetic encodings.
 
+By default a single long-lived Node.js worker process is started on first use.
+The worker keeps Metaphone3.js loaded and exchanges newline-delimited JSON
+requests/responses with the wrapper over stdin/stdout, so no process is spawned
+and no temporary file is written per word. Pass persistent=False to fall back
+to launching a fresh Node.js process for every encode.
+
+Encodings are kept in a size-bounded LRU cache keyed on the upper-cased word
+and the encode_vowels / encode_exact / key_length settings, so repeated words
+are answered without touching the engine. See get_cache_stats() and
+clear_cache(). Keys shorter than the key_length they were encoded with are
+the word's complete keys, and the engine returns them for every key_length
+they fit (see keys_complete() in metaphone3.py). Such encodings are cached
+once, under ANY_KEY_LENGTH, and serve all those key_length values, so
+clients asking for different lengths share entries and engine calls; only
+words whose keys were cut short are cached per key_length.
+
+Pass dictionary_path to answer words from a precomputed, memory-mapped
+dictionary built by metaphone3_dictionary.py (for example from the shipped
+word list) whenever the settings match the ones it was built with. Only words
+missing from the dictionary reach the engine. Pass dictionary instead to use
+an in-memory store with the same lookup(), such as a
+metaphone3_key_store.KeyStore built from a word list.
+
+Pass disk_cache_path to back the LRU cache with a persistent SQLite file (see
+metaphone3_disk_cache.py) shared by all processes that use the same path.
+Words missing from the LRU cache and the dictionary are looked up there
+before they are encoded, new encodings are written to it, and a new wrapper
+fills its LRU cache with the most recently written entries, so a restarted
+process starts warm.
+
+Pass backend="python" to encode in-process with the pure Python port in
+metaphone3.py instead. It returns the same keys as Metaphone3.js and needs
+neither Node.js nor Metaphone3.js.
+
+encode() and encode_list() accept an immutable EncodeOptions per call, so one
+wrapper can be shared by many threads using different settings. Calls without
+options use the wrapper defaults set through set_encode_vowels() and friends.
+Node.js requests are spread over a pool of up to pool_size workers; the python
+backend keeps one in-process encoder per thread. Workers start on first use,
+or all at once with warm_up() before traffic arrives.
+
+encode_variants() and encode_list_variants() return the keys of words under
+several settings at once (by default all four encode_vowels / encode_exact
+combinations), from a single engine round trip per batch.
+
+encode_phrase() and encode_phrases() encode multi-token names such as
+"Mary Ann Smith-Jones" token by token rather than as one run of letters. Each
+distinct token of a call is encoded once, through the cache, and the keys of
+a phrase are returned per token and combined.
+
+Calls made inside "with m3.deadline(time.monotonic() + seconds):" give up
+with Metaphone3DeadlineError once the deadline passes: waiting for a worker
+stops, the remaining time travels to the worker with each request as
+timeout_ms, and workers stop encoding a batch whose time is up instead of
+finishing it. encode_list() reports such words as failed.
+
+Every wrapper keeps metrics in its own MetricsRegistry (see
+metaphone3_metrics.py): time per encoder stage, from waiting for a worker and
+starting Node.js to the engine itself and JSON parsing, batch sizes, cache
+and dictionary hits and worker pool occupancy. Read them with get_metrics(),
+or render them for Prometheus with metrics.render().
+
 Requirements:
-- Node.js installed and accessible via 'node' command
-- Metaphone3.js file in the same directory or specified path
+- Node.js installed and accessible via 'node' command (backend="node" only)
+- Metaphone3.js file in the same directory or specified path (backend="node" only)
 
 Usage:
     from metaphone3_wrapper import Metaphone3Wrapper
@@ -19,17 +81,36 @@ Usage:
     primary, alternate = m3.encode("hello")
     print(f"Primary: {primary}, Alternate: {alternate}")
     
-    # Configure options
-    m3.set_encode_vowels(True)
-    m3.set_encode_exact(True)
-    primary, alternate = m3.encode("hello")
+    # Configure options for one call
+    options = EncodeOptions(encode_vowels=True, encode_exact=True)
+    primary, alternate = m3.encode("hello", options)
+    
+    # Stop the Node.js workers when done
+    m3.close()
 """
 
 import subprocess
 import json
 import os
+import queue
+import re
+import select
+import sqlite3
+import sys
 import tempfile
-from typing import Tuple, Optional, Union
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Sequence, Tuple, Optional, Union
+
+from metaphone3 import (Metaphone3, DEFAULT_MAX_KEY_LENGTH, MAX_KEY_ALLOCATION, DEADLINE_CHECK_INTERVAL,
+                        ANY_KEY_LENGTH, keys_complete, keys_fit)
+from metaphone3_dictionary import Metaphone3Dictionary, Metaphone3DictionaryError
+from metaphone3_disk_cache import DiskCache, DEFAULT_DISK_CACHE_SIZE
+from metaphone3_metrics import MetricsRegistry, BATCH_SIZE_BUCKETS
 
 
 class Metaphone3Error(Exception):
@@ -37,31 +118,351 @@ class Metaphone3Error(Exception):
     pass
 
 
+class Metaphone3DeadlineError(Metaphone3Error):
+    """The deadline of a call passed before its words were encoded."""
+    pass
+
+
+# Available encoding backends
+BACKENDS = ("node", "python")
+
+# Default number of encodings kept in the LRU cache
+DEFAULT_CACHE_SIZE = 10000
+
+# Default maximum number of persistent Node.js workers
+DEFAULT_POOL_SIZE = 4
+
+# Smallest batch share worth handing to another Node.js worker
+MIN_SHARD_SIZE = 256
+
+# Seconds a worker may answer after the deadline it was sent, to report that
+# it gave up, before it is treated as hung and killed
+DEADLINE_GRACE = 1.0
+
+# Words encoded by warm_up(), chosen to run through many of the engine's rules
+WARMUP_WORDS = (
+    "smith", "schmidt", "johnson", "williams", "jones", "garcia", "rodriguez", "martinez",
+    "hernandez", "lopez", "gonzalez", "wilson", "anderson", "thomas", "taylor", "moore",
+    "jackson", "martin", "lee", "perez", "thompson", "white", "harris", "sanchez",
+    "clark", "ramirez", "lewis", "robinson", "walker", "young", "allen", "king",
+    "wright", "scott", "torres", "nguyen", "hill", "flores", "green", "adams",
+    "nelson", "baker", "hall", "rivera", "campbell", "mitchell", "carter", "roberts",
+    "phonetic", "pneumonia", "psychology", "knight", "gnocchi", "wren", "xavier", "zhang",
+    "tschaikowsky", "czerny", "ghislaine", "bacchus", "caesar", "chianti", "michael", "orchestra",
+    "thumb", "dumb", "laugh", "cough", "edge", "judge", "jose", "san jacinto",
+    "yankelovich", "jankelowicz", "womo", "wachtler", "hochmeier", "accident", "succeed", "bellocchio"
+)
+
+# Phrases are split into tokens at runs of whitespace and hyphens (or dashes)
+PHRASE_SEPARATORS = re.compile(r"[\s\-\u2010-\u2015]+")
+
+# Apostrophes do not split tokens and are dropped before encoding, so
+# "O'Brien", "O\u2019Brien" and "OBrien" share one cache entry; the engine
+# skips them anyway
+PHRASE_APOSTROPHES = re.compile(r"['`\u2018\u2019\u02bc]")
+
+# Separator of the token keys in the combined key of a phrase
+PHRASE_KEY_SEPARATOR = " "
+
+
+def tokenize_phrase(phrase: str) -> List[str]:
+    """
+    Split a name or phrase into the tokens encode_phrase() encodes.
+    
+    Args:
+        phrase (str): Name or phrase, such as "Mary Ann Smith-Jones"
+        
+    Returns:
+        List[str]: Non-empty tokens in order, as written in the phrase
+    """
+    return [token for token in PHRASE_SEPARATORS.split(phrase) if token]
+
+
+@dataclass(frozen=True)
+class EncodeOptions:
+    """
+    Immutable Metaphone3 settings for one encode call.
+    
+    Attributes:
+        encode_vowels (bool): Encode non-initial vowels (default: False)
+        encode_exact (bool): Encode consonants exactly (default: False)
+        key_length (int): Maximum length of encoded keys, 1-32 (default: 8)
+    """
+    encode_vowels: bool = False
+    encode_exact: bool = False
+    key_length: int = DEFAULT_MAX_KEY_LENGTH
+    
+    def __post_init__(self):
+        if not 1 <= self.key_length <= MAX_KEY_ALLOCATION:
+            raise ValueError("Key length must be between 1 and 32")
+        # Normalise truthy values so equal settings share cache entries
+        object.__setattr__(self, 'encode_vowels', bool(self.encode_vowels))
+        object.__setattr__(self, 'encode_exact', bool(self.encode_exact))
+
+
+# The four encode_vowels / encode_exact combinations, default settings first
+ALL_VARIANTS = (
+    EncodeOptions(),
+    EncodeOptions(encode_vowels=True),
+    EncodeOptions(encode_exact=True),
+    EncodeOptions(encode_vowels=True, encode_exact=True)
+)
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded least-recently-used cache.
+    
+    Counts hits, misses and evictions. A cache with max_size 0 stores nothing.
+    """
+    
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size (int): Maximum number of entries (default: 10000)
+        """
+        if max_size < 0:
+            raise ValueError("Cache size must not be negative")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, count: bool = True):
+        """
+        Look up a key and mark it as most recently used.
+        
+        Args:
+            key: Key to look up
+            count (bool): Count the lookup as a hit or miss; pass False for
+                probes counted later with count() (default: True)
+        
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                if count:
+                    self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            if count:
+                self.hits += 1
+            return value
+    
+    def count(self, hit: bool) -> None:
+        """Count a lookup made of uncounted get() probes as a hit or miss."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+    
+    def put(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if self.max_size == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Remove all entries. Counters are kept."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: size, max_size, hits, misses, evictions and hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+
+
 class Metaphone3Wrapper:
     """
     Python wrapper for the Metaphone3 JavaScript implementation.
     
     This class provides a convenient Python interface to generate phonetic
-    encodings using the Metaphone3 algorithm implemented in JavaScript.
+    encodings using the Metaphone3 algorithm implemented in JavaScript, or
+    its in-process Python port.
     """
     
-    def __init__(self, js_file_path: str = "Metaphone3.js", node_command: str = "node"):
+    # JavaScript helpers shared by the batch runner and the persistent worker
+    _JS_ENCODE_FUNCTIONS = """
+function configure(settings) {
+    m3.SetEncodeVowels(settings.encode_vowels);
+    m3.SetEncodeExact(settings.encode_exact);
+    m3.SetKeyLength(settings.key_length);
+}
+
+function encodeWord(word) {
+    try {
+        m3.SetWord(word);
+        m3.Encode();
+        
+        return {
+            success: true,
+            primary: m3.GetMetaph() || "",
+            alternate: m3.GetAlternateMetaph() || "",
+            word: word
+        };
+    } catch (error) {
+        return {
+            success: false,
+            error: error.message,
+            word: word
+        };
+    }
+}
+
+function encodeWords(request, encode) {
+    // Give up on the batch once the caller's timeout_ms has passed
+    const deadline = typeof request.timeout_ms === 'number'
+        ? process.hrtime.bigint() + BigInt(Math.round(request.timeout_ms * 1e6))
+        : null;
+    const results = [];
+    for (let i = 0; i < request.words.length; i++) {
+        if (deadline !== null && i % """ + str(DEADLINE_CHECK_INTERVAL) + """ === 0 && process.hrtime.bigint() > deadline) {
+            return { success: false, error: "Deadline exceeded", deadline_exceeded: true };
+        }
+        results.push(encode(request.words[i]));
+    }
+    return { success: true, results: results };
+}
+
+function encodeRequest(request) {
+    if (Array.isArray(request.variants)) {
+        // Each word under every variant's settings, in one pass over the words
+        return encodeWords(request, function (word) {
+            return request.variants.map(function (settings) {
+                configure(settings);
+                return encodeWord(word);
+            });
+        });
+    }
+    configure(request);
+    if (Array.isArray(request.words)) {
+        // Batch request: one response carrying every word's result
+        return encodeWords(request, encodeWord);
+    }
+    return encodeWord(request.word);
+}
+"""
+    
+    def __init__(self, js_file_path: str = "Metaphone3.js", node_command: str = "node",
+                 persistent: bool = True, timeout: float = 30, backend: str = "node",
+                 cache_size: int = DEFAULT_CACHE_SIZE, dictionary_path: Optional[str] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE, disk_cache_path: Optional[str] = None,
+                 disk_cache_size: int = DEFAULT_DISK_CACHE_SIZE, dictionary=None):
         """
         Initialize the Metaphone3 wrapper.
         
         Args:
             js_file_path (str): Path to the Metaphone3.js file
             node_command (str): Command to run Node.js (default: "node")
+            persistent (bool): Keep one Node.js worker process running and send
+                it every word, instead of spawning Node.js per word (default: True)
+            timeout (float): Seconds to wait for Node.js to answer (default: 30)
+            backend (str): "node" to run Metaphone3.js, or "python" to encode
+                in-process with metaphone3.py (default: "node")
+            cache_size (int): Maximum number of encodings kept in the LRU
+                cache, 0 to disable caching (default: 10000)
+            dictionary_path (str): Precomputed dictionary file to look words up
+                in before encoding them (default: None)
+            pool_size (int): Maximum number of persistent Node.js workers
+                serving concurrent calls (default: 4)
+            disk_cache_path (str): SQLite file of a persistent cache shared
+                with other processes (default: None)
+            disk_cache_size (int): Maximum number of encodings kept in the
+                disk cache (default: 1000000)
+            dictionary: Precomputed encodings to look words up in before
+                encoding them, instead of a dictionary_path file, such as a
+                metaphone3_key_store.KeyStore (default: None)
         
         Raises:
-            Metaphone3Error: If Node.js is not available or JS file not found
+            Metaphone3Error: If the backend is unknown, the disk cache cannot
+                be opened, or Node.js is not available or JS file not found
+                for the "node" backend
         """
+        if backend not in BACKENDS:
+            raise Metaphone3Error(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        if pool_size < 1:
+            raise ValueError("Pool size must be at least 1")
+        if dictionary is not None and dictionary_path:
+            raise ValueError("Pass either dictionary or dictionary_path, not both")
+        
         self.js_file_path = os.path.abspath(js_file_path)
         self.node_command = node_command
+        self.persistent = persistent
+        self.timeout = timeout
+        self.backend = backend
         self.encode_vowels = False
         self.encode_exact = False
         self.key_length = 8
         
+        # Pool of persistent worker processes. Each slot holds a worker, or
+        # None until a call needs it, so workers are started lazily.
+        self.pool_size = pool_size
+        self._pool = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put(None)
+        self._workers = set()
+        self._workers_lock = threading.Lock()
+        
+        # In-process encoders for the python backend, one per thread
+        self._local = threading.local()
+        
+        # Encodings keyed on (upper-cased word, encode_vowels, encode_exact, key_length)
+        self._cache = LRUCache(cache_size)
+        
+        # Precomputed encodings, shared with other processes through mmap
+        # when read from a dictionary file
+        self._dictionary = dictionary
+        if dictionary_path:
+            try:
+                self._dictionary = Metaphone3Dictionary(dictionary_path)
+            except Metaphone3DictionaryError as e:
+                raise Metaphone3Error(str(e))
+        
+        # Encodings shared with other processes and kept across restarts
+        self._disk_cache = None
+        if disk_cache_path:
+            try:
+                self._disk_cache = DiskCache(disk_cache_path, disk_cache_size)
+            except sqlite3.Error as e:
+                raise Metaphone3Error(f"Failed to open disk cache {disk_cache_path}: {e}")
+            self.preload_cache()
+        
+        # Stage timings, batch sizes, cache and pool occupancy
+        self.metrics = MetricsRegistry()
+        self._init_metrics()
+        
+        if self.backend == "python":
+            return
+        
         # Verify Node.js is available
         self._check_node_availability()
         
@@ -86,12 +487,87 @@ class Metaphone3Wrapper:
                 "command is available in your PATH."
             )
     
-    def _create_js_runner(self, word: str) -> str:
+    def _init_metrics(self) -> None:
+        """Register the wrapper's metrics in self.metrics."""
+        self._stage_seconds = self.metrics.histogram(
+            "metaphone3_stage_seconds",
+            "Seconds spent per encoder stage: queue_wait for a free worker, spawn of a Node.js "
+            "process, load of Metaphone3.js, tempfile write, serialize of a request, ipc round "
+            "trip without the engine, engine encode and parse of a response",
+            ["stage"]
+        )
+        self._batch_size = self.metrics.histogram(
+            "metaphone3_batch_size_words",
+            "Words per encode_list call (request) and per batch handed to the engine (engine)",
+            ["kind"],
+            buckets=BATCH_SIZE_BUCKETS
+        )
+        self._engine_words = self.metrics.counter(
+            "metaphone3_engine_words_total",
+            "Words encoded by the engine, after the cache and dictionary"
+        )
+        
+        def lookup_counts():
+            counts = {'cache': (self._cache.hits, self._cache.misses)}
+            if self._dictionary is not None:
+                counts['dictionary'] = (self._dictionary.hits, self._dictionary.misses)
+            if self._disk_cache is not None:
+                counts['disk'] = (self._disk_cache.hits, self._disk_cache.misses)
+            return counts
+        
+        def lookups():
+            values = {}
+            for cache, (hits, misses) in lookup_counts().items():
+                values[(cache, 'hit')] = hits
+                values[(cache, 'miss')] = misses
+            return values
+        
+        def hit_ratios():
+            return {(cache,): hits / (hits + misses) if hits + misses else 0.0
+                    for cache, (hits, misses) in lookup_counts().items()}
+        
+        self.metrics.counter(
+            "metaphone3_cache_lookups_total",
+            "Lookups in the LRU cache, the precomputed dictionary and the disk cache",
+            ["cache", "result"],
+            function=lookups
+        )
+        self.metrics.gauge(
+            "metaphone3_cache_hit_ratio",
+            "Share of lookups answered by the LRU cache, the precomputed dictionary and the disk cache",
+            ["cache"],
+            function=hit_ratios
+        )
+        self.metrics.gauge("metaphone3_cache_entries", "Encodings in the LRU cache",
+                           function=lambda: len(self._cache))
+        self.metrics.counter("metaphone3_cache_evictions_total", "Encodings evicted from the LRU cache",
+                             function=lambda: self._cache.evictions)
+        self.metrics.gauge("metaphone3_worker_pool_size", "Maximum number of persistent workers",
+                           function=lambda: self.pool_size)
+        self.metrics.gauge("metaphone3_workers_running", "Persistent worker processes running",
+                           function=lambda: len(self._workers))
+        # Idle slots wait in the pool queue; every other slot is serving a request
+        self.metrics.gauge("metaphone3_workers_busy", "Persistent workers serving a request",
+                           function=lambda: self.pool_size - self._pool.qsize())
+    
+    def get_metrics(self) -> dict:
+        """
+        Get the wrapper's metrics.
+        
+        Returns:
+            dict: Metric name -> {"type", "help", "samples"}, as returned by
+            MetricsRegistry.snapshot(). Render them for Prometheus with
+            self.metrics.render().
+        """
+        return self.metrics.snapshot()
+    
+    def _create_js_runner(self, word: str, options: EncodeOptions) -> str:
         """
         Create JavaScript code to run Metaphone3 encoding.
         
         Args:
             word (str): Word to encode
+            options (EncodeOptions): Settings to encode with
             
         Returns:
             str: JavaScript code as string
@@ -104,16 +580,18 @@ const fs = require('fs');
 
 try {{
     // Load the Metaphone3 implementation
+    const loadStart = process.hrtime.bigint();
     const metaphone3Code = fs.readFileSync('{self.js_file_path.replace(os.sep, '/')}', 'utf8');
     eval(metaphone3Code);
     
     // Create Metaphone3 instance
     const m3 = new Metaphone3();
+    const encodeStart = process.hrtime.bigint();
     
     // Configure settings
-    m3.SetEncodeVowels({json.dumps(self.encode_vowels)});
-    m3.SetEncodeExact({json.dumps(self.encode_exact)});
-    m3.SetKeyLength({self.key_length});
+    m3.SetEncodeVowels({json.dumps(options.encode_vowels)});
+    m3.SetEncodeExact({json.dumps(options.encode_exact)});
+    m3.SetKeyLength({options.key_length});
     
     // Set word and encode
     m3.SetWord({escaped_word});
@@ -128,7 +606,9 @@ try {{
         success: true,
         primary: primary || "",
         alternate: alternate || "",
-        word: {escaped_word}
+        word: {escaped_word},
+        load_seconds: Number(encodeStart - loadStart) / 1e9,
+        engine_seconds: Number(process.hrtime.bigint() - encodeStart) / 1e9
     }}));
     
 }} catch (error) {{
@@ -141,12 +621,437 @@ try {{
 """
         return js_code
     
-    def encode(self, word: str) -> Tuple[str, str]:
+    def _create_js_batch_runner(self, request: dict) -> str:
+        """
+        Create JavaScript code to answer one batch request in one Node.js run.
+        
+        Args:
+            request (dict): Request in the persistent worker's protocol
+            
+        Returns:
+            str: JavaScript code as string
+        """
+        js_code = f"""
+const fs = require('fs');
+
+try {{
+    // Load the Metaphone3 implementation
+    const loadStart = process.hrtime.bigint();
+    eval(fs.readFileSync({json.dumps(self.js_file_path)}, 'utf8'));
+    const m3 = new Metaphone3();
+    {self._JS_ENCODE_FUNCTIONS}
+    const encodeStart = process.hrtime.bigint();
+    const response = encodeRequest({json.dumps(request)});
+    
+    response.load_seconds = Number(encodeStart - loadStart) / 1e9;
+    response.engine_seconds = Number(process.hrtime.bigint() - encodeStart) / 1e9;
+    console.log(JSON.stringify(response));
+    
+}} catch (error) {{
+    console.log(JSON.stringify({{
+        success: false,
+        error: error.message
+    }}));
+}}
+"""
+        return js_code
+    
+    def _create_worker_script(self) -> str:
+        """
+        Create JavaScript code for the persistent worker process.
+        
+        The worker loads Metaphone3.js once, prints a ready line and then answers
+        one JSON request per input line with one JSON response per output line.
+        A request carries either a single "word" or a list of "words"; the
+        latter is answered with a "results" list in the same order. A request
+        with a list of "variants" settings instead of top-level settings is
+        answered with, per word, a list of results in variant order. The ready
+        line reports the seconds spent loading Metaphone3.js as load_seconds,
+        and every response the seconds spent encoding as engine_seconds.
+        
+        Returns:
+            str: JavaScript code as string
+        """
+        js_code = f"""
+const fs = require('fs');
+const readline = require('readline');
+
+// Load the Metaphone3 implementation once
+const loadStart = process.hrtime.bigint();
+eval(fs.readFileSync({json.dumps(self.js_file_path)}, 'utf8'));
+const m3 = new Metaphone3();
+const loadSeconds = Number(process.hrtime.bigint() - loadStart) / 1e9;
+
+{self._JS_ENCODE_FUNCTIONS}
+const lines = readline.createInterface({{ input: process.stdin, terminal: false }});
+
+lines.on('line', function (line) {{
+    let response;
+    let engineSeconds = 0;
+    try {{
+        const request = JSON.parse(line);
+        const start = process.hrtime.bigint();
+        response = encodeRequest(request);
+        engineSeconds = Number(process.hrtime.bigint() - start) / 1e9;
+    }} catch (error) {{
+        response = {{ success: false, error: error.message }};
+    }}
+    response.engine_seconds = engineSeconds;
+    process.stdout.write(JSON.stringify(response) + "\\n");
+}});
+
+lines.on('close', function () {{
+    process.exit(0);
+}});
+
+process.stdout.write(JSON.stringify({{ ready: true, load_seconds: loadSeconds }}) + "\\n");
+"""
+        return js_code
+    
+    def worker_command(self) -> list:
+        """
+        Get the command line of a persistent worker process for this backend.
+        
+        Node.js workers run Metaphone3.js; python workers run
+        "metaphone3.py --worker". Both speak the same newline-delimited JSON
+        protocol, so other process pools can use either.
+        
+        Returns:
+            list: Program and arguments
+        """
+        if self.backend == "python":
+            return [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "metaphone3.py"),
+                    "--worker"]
+        return [self.node_command, "-e", self._create_worker_script()]
+    
+    def _start_worker(self) -> subprocess.Popen:
+        """
+        Start the persistent Node.js worker and wait until it is ready.
+        
+        Returns:
+            subprocess.Popen: The running worker process
+            
+        Raises:
+            Metaphone3Error: If the worker cannot be started
+        """
+        start = time.perf_counter()
+        try:
+            worker = subprocess.Popen(
+                self.worker_command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1
+            )
+        except OSError as e:
+            raise Metaphone3Error(f"Failed to start Node.js worker: {e}")
+        
+        try:
+            output = json.loads(self._read_worker_line(worker))
+        except json.JSONDecodeError:
+            self._stop_worker(worker)
+            raise Metaphone3Error("Node.js worker did not start properly")
+        
+        if not output.get('ready'):
+            self._stop_worker(worker)
+            raise Metaphone3Error("Node.js worker did not start properly")
+        
+        # Process startup and loading Metaphone3.js are reported separately
+        load_seconds = output.get('load_seconds', 0.0)
+        self._stage_seconds.observe(max(time.perf_counter() - start - load_seconds, 0.0), stage="spawn")
+        if load_seconds:
+            self._stage_seconds.observe(load_seconds, stage="load")
+        return worker
+    
+    def _stop_worker(self, worker: subprocess.Popen) -> None:
+        """Terminate a worker process and release its pipes."""
+        try:
+            worker.kill()
+            worker.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        for stream in (worker.stdin, worker.stdout, worker.stderr):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        with self._workers_lock:
+            self._workers.discard(worker)
+    
+    def _read_worker_line(self, worker: subprocess.Popen, timeout: Optional[float] = None) -> str:
+        """
+        Read one response line from the worker, honouring the timeout.
+        
+        Args:
+            worker (subprocess.Popen): Worker to read from
+            timeout (float): Seconds to wait (default: the wrapper timeout)
+        
+        Raises:
+            Metaphone3Error: On timeout or if the worker exited
+            Metaphone3DeadlineError: On timeout after the call's deadline
+        """
+        ready, _, _ = select.select([worker.stdout], [], [], self.timeout if timeout is None else timeout)
+        if not ready:
+            self._stop_worker(worker)
+            self._check_deadline()
+            raise Metaphone3Error("Timeout while executing JavaScript")
+        
+        line = worker.stdout.readline()
+        if not line:
+            worker.wait()
+            stderr = worker.stderr.read()
+            self._stop_worker(worker)
+            raise Metaphone3Error(f"Node.js worker exited: {stderr.strip()}")
+        
+        return line
+    
+    def _worker_request(self, request: dict) -> dict:
+        """
+        Send one request to a persistent worker from the pool and return its response.
+        
+        Each worker serves one request at a time; concurrent calls take
+        different workers and wait only when all pool_size are busy. Workers
+        are (re)started on demand, so a crashed or timed out worker is replaced
+        transparently on the next call.
+        
+        Args:
+            request (dict): JSON-serializable request
+            
+        Returns:
+            dict: Parsed JSON response
+            
+        Raises:
+            Metaphone3Error: If no worker frees up within the timeout, or the
+                worker fails or answers with invalid JSON
+            Metaphone3DeadlineError: If the call's deadline passes first
+        """
+        wait_start = time.perf_counter()
+        try:
+            worker = self._pool.get(timeout=self._time_left())
+        except queue.Empty:
+            self._check_deadline()
+            raise Metaphone3Error("Timeout while waiting for a Node.js worker")
+        self._stage_seconds.observe(time.perf_counter() - wait_start, stage="queue_wait")
+        
+        try:
+            worker = self._ready_worker(worker)
+            return self._exchange(worker, request)
+        finally:
+            # Dead workers go back too and are restarted by the next caller
+            self._pool.put(worker)
+    
+    def _ready_worker(self, worker: Optional[subprocess.Popen]) -> subprocess.Popen:
+        """Return a pool slot's worker, starting a new one if the slot is empty or its worker died."""
+        if worker is None or worker.poll() is not None:
+            worker = self._start_worker()
+            with self._workers_lock:
+                self._workers.add(worker)
+        return worker
+    
+    def _exchange(self, worker: subprocess.Popen, request: dict) -> dict:
+        """
+        Send one request to a running worker held by the caller and parse its response.
+        
+        Raises:
+            Metaphone3Error: If the worker fails or answers with invalid JSON
+            Metaphone3DeadlineError: If the call's deadline passes first
+        """
+        start = time.perf_counter()
+        timeout = self._time_left()
+        if self.current_deadline() is not None:
+            # The worker gives up on its own, so it only gets killed if it hangs
+            request = dict(request, timeout_ms=1000 * timeout)
+            timeout += DEADLINE_GRACE
+        message = json.dumps(request) + "\n"
+        sent = time.perf_counter()
+        try:
+            worker.stdin.write(message)
+            worker.stdin.flush()
+        except (OSError, ValueError) as e:
+            self._stop_worker(worker)
+            raise Metaphone3Error(f"Node.js worker failed: {e}")
+        
+        line = self._read_worker_line(worker, timeout)
+        received = time.perf_counter()
+        try:
+            output = json.loads(line)
+        except json.JSONDecodeError:
+            raise Metaphone3Error(f"Invalid JSON output: {line}")
+        
+        # The worker reports its own encoding time; the rest of the round trip is IPC
+        engine_seconds = output.get('engine_seconds', 0.0) if isinstance(output, dict) else 0.0
+        self._stage_seconds.observe(sent - start, stage="serialize")
+        self._stage_seconds.observe(max(received - sent - engine_seconds, 0.0), stage="ipc")
+        self._stage_seconds.observe(engine_seconds, stage="engine")
+        self._stage_seconds.observe(time.perf_counter() - received, stage="parse")
+        return output
+    
+    @contextmanager
+    def deadline(self, deadline: Optional[float]):
+        """
+        Give up on calls made by this thread inside the with block once a
+        deadline passes.
+        
+        Waiting for a worker stops at the deadline, workers receive the time
+        left with each request and abandon batches that run past it, and
+        calls raise Metaphone3DeadlineError (or, for encode_list(), report
+        the words as failed) instead of completing late. Nested blocks keep
+        the earlier deadline.
+        
+        Args:
+            deadline (float): time.monotonic() value after which calls give
+                up, or None for no deadline
+        """
+        previous = self.current_deadline()
+        if previous is not None and (deadline is None or previous < deadline):
+            deadline = previous
+        self._local.deadline = deadline
+        try:
+            yield
+        finally:
+            self._local.deadline = previous
+    
+    def current_deadline(self) -> Optional[float]:
+        """
+        Get the deadline of calls made by this thread.
+        
+        Returns:
+            Optional[float]: time.monotonic() value set by the innermost
+            deadline() block, or None
+        """
+        return getattr(self._local, 'deadline', None)
+    
+    def _check_deadline(self) -> None:
+        """Raise Metaphone3DeadlineError if this thread's deadline has passed."""
+        deadline = self.current_deadline()
+        if deadline is not None and time.monotonic() >= deadline:
+            raise Metaphone3DeadlineError("Deadline exceeded")
+    
+    def _time_left(self) -> float:
+        """
+        Seconds the next engine step may take: the wrapper timeout, or less
+        if this thread's deadline comes sooner.
+        
+        Raises:
+            Metaphone3DeadlineError: If the deadline has passed
+        """
+        deadline = self.current_deadline()
+        if deadline is None:
+            return self.timeout
+        left = deadline - time.monotonic()
+        if left <= 0:
+            raise Metaphone3DeadlineError("Deadline exceeded")
+        return min(left, self.timeout)
+    
+    def warm_up(self, words: Optional[list] = None, options: Optional[EncodeOptions] = None) -> float:
+        """
+        Prepare the encoder for traffic before the first real call.
+        
+        For the persistent node backend every one of the pool_size workers is
+        started, side by side, and encodes the warm-up batch once, so no
+        request pays Node.js startup, loading Metaphone3.js or cold JIT code.
+        Other backends encode the batch once in-process or in a fresh Node.js
+        process. Results are not cached.
+        
+        Args:
+            words (list): Non-empty words to encode (default: WARMUP_WORDS)
+            options (EncodeOptions): Settings to encode with (default: the
+                wrapper defaults)
+            
+        Returns:
+            float: Seconds the warm-up took
+            
+        Raises:
+            Metaphone3Error: If a worker cannot be started or the batch fails
+        """
+        start = time.perf_counter()
+        words = list(words or WARMUP_WORDS)
+        if options is None:
+            options = self.default_options()
+        
+        if self.backend == "python" or not self.persistent:
+            self._check_warm_up(self._encode_batch(words, options))
+            return time.perf_counter() - start
+        
+        # Hold every slot so each worker gets exactly one warm-up batch
+        slots = []
+        try:
+            for _ in range(self.pool_size):
+                slots.append(self._pool.get(timeout=self.timeout))
+            
+            def warm(index):
+                slots[index] = self._ready_worker(slots[index])
+                output = self._exchange(slots[index], dict(asdict(options), words=words))
+                self._check_warm_up(self._check_batch_output(output, words))
+            
+            with ThreadPoolExecutor(max_workers=len(slots)) as executor:
+                for future in [executor.submit(warm, index) for index in range(len(slots))]:
+                    future.result()
+        except queue.Empty:
+            raise Metaphone3Error("Timeout while waiting for a Node.js worker")
+        finally:
+            for worker in slots:
+                self._pool.put(worker)
+        return time.perf_counter() - start
+    
+    def _check_warm_up(self, results: list) -> None:
+        """Raise if any word of the warm-up batch failed to encode."""
+        for result in results:
+            if not result.get('success'):
+                raise Metaphone3Error(f"Warm-up failed: {result.get('error', 'Unknown error')}")
+    
+    def close(self) -> None:
+        """Stop the persistent Node.js workers, if running, unmap the dictionary and close the disk cache."""
+        with self._workers_lock:
+            workers = list(self._workers)
+        for worker in workers:
+            self._stop_worker(worker)
+        if self._dictionary is not None:
+            self._dictionary.close()
+            self._dictionary = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def default_options(self) -> EncodeOptions:
+        """
+        Get the wrapper's default settings as an EncodeOptions.
+        
+        Returns:
+            EncodeOptions: Settings used by calls that pass no options
+        """
+        return EncodeOptions(self.encode_vowels, self.encode_exact, self.key_length)
+    
+    def _python_encoder(self, options: EncodeOptions) -> Metaphone3:
+        """Return this thread's in-process encoder, configured with the given settings."""
+        encoder = getattr(self._local, 'encoder', None)
+        if encoder is None:
+            encoder = self._local.encoder = Metaphone3()
+        encoder.encode_vowels = options.encode_vowels
+        encoder.encode_exact = options.encode_exact
+        encoder.key_length = options.key_length
+        return encoder
+    
+    def _cache_key(self, word: str, options: EncodeOptions) -> tuple:
+        """Build the cache key for a word under the given settings."""
+        # The engine upper-cases its input, so case variants share one entry
+        return (word.upper(), options.encode_vowels, options.encode_exact, options.key_length)
+    
+    def encode(self, word: str, options: Optional[EncodeOptions] = None) -> Tuple[str, str]:
         """
         Encode a word using Metaphone3 algorithm.
         
         Args:
             word (str): Word to encode
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
             
         Returns:
             Tuple[str, str]: Primary and alternate phonetic encodings
@@ -156,37 +1061,185 @@ try {{
         """
         if not word or not isinstance(word, str):
             return "", ""
+        if options is None:
+            options = self.default_options()
         
-        # Create temporary JavaScript file
-        js_code = self._create_js_runner(word)
+        result = self.lookup(word, options)
+        if result is None:
+            result = self._encode_word(word, options)
+            self.remember(word, options, result)
+        return result
+    
+    def lookup(self, word: str, options: Optional[EncodeOptions] = None) -> Optional[Tuple[str, str]]:
+        """
+        Answer a word from the cache or the precomputed dictionary, without encoding it.
+        
+        Args:
+            word (str): Non-empty word to look up
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
+            
+        Returns:
+            Optional[Tuple[str, str]]: Primary and alternate encodings, or None
+            if the word still has to be encoded
+        """
+        if options is None:
+            options = self.default_options()
+        key = self._cache_key(word, options)
+        result = self._lookup_memory(word, options, key)
+        if result is None and self._disk_cache is not None:
+            result = self._disk_cache.get(key)
+            if result is not None:
+                self._cache.put(self._storage_key(key, result), result)
+        return result
+    
+    def _lookup_memory(self, word: str, options: EncodeOptions, key: tuple) -> Optional[Tuple[str, str]]:
+        """Answer a word from the LRU cache or the precomputed dictionary, but not the disk cache."""
+        # Complete keys first, then keys cut short at exactly this key_length
+        result = self._cache.get(key[:3] + (ANY_KEY_LENGTH,), count=False)
+        if result is None or not keys_fit(result, options.key_length):
+            result = self._cache.get(key, count=False)
+        self._cache.count(result is not None)
+        if result is None:
+            result = self._lookup_dictionary(word, options)
+            if result is not None:
+                self._cache.put(self._storage_key(key, result), result)
+        return result
+    
+    def _storage_key(self, key: tuple, result: Tuple[str, str]) -> tuple:
+        """Cache key to file an encoding under: ANY_KEY_LENGTH for complete keys, else its own key."""
+        if keys_complete(result, key[3]):
+            return key[:3] + (ANY_KEY_LENGTH,)
+        return key
+    
+    def _lookup_disk(self, keys: list) -> dict:
+        """Look many cache keys up in the disk cache at once, copying hits into the LRU cache."""
+        if self._disk_cache is None or not keys:
+            return {}
+        found = self._disk_cache.get_many(keys)
+        for key, result in found.items():
+            self._cache.put(self._storage_key(key, result), result)
+        return found
+    
+    def remember(self, word: str, options: EncodeOptions, result: Tuple[str, str]) -> None:
+        """
+        Store an encoding computed outside the wrapper in its cache.
         
+        Args:
+            word (str): Encoded word
+            options (EncodeOptions): Settings it was encoded with
+            result (Tuple[str, str]): Primary and alternate encodings
+        """
+        self._remember_many([(self._cache_key(word, options), result)])
+    
+    def _remember_many(self, items: list) -> None:
+        """Store (cache key, encoding) pairs in the LRU cache and, in one transaction, the disk cache."""
+        items = [(self._storage_key(key, result), result) for key, result in items]
+        for key, result in items:
+            self._cache.put(key, result)
+        if self._disk_cache is not None and items:
+            self._disk_cache.put_many(items)
+    
+    def preload_cache(self, limit: Optional[int] = None) -> int:
+        """
+        Fill the LRU cache with the most recently written disk cache entries.
+        
+        Args:
+            limit (int): Maximum number of entries (default: the LRU cache size)
+            
+        Returns:
+            int: Number of entries loaded
+        """
+        if self._disk_cache is None:
+            return 0
+        entries = self._disk_cache.preload(self._cache.max_size if limit is None else limit)
+        # Oldest first, so the newest end up most recently used
+        for key, result in reversed(entries):
+            self._cache.put(key, result)
+        return len(entries)
+    
+    def _lookup_dictionary(self, word: str, options: EncodeOptions) -> Optional[Tuple[str, str]]:
+        """Look a word up in the precomputed dictionary if it was built with the same encode_vowels / encode_exact."""
+        if self._dictionary is None:
+            return None
+        if (self._dictionary.encode_vowels, self._dictionary.encode_exact) != (options.encode_vowels,
+                                                                               options.encode_exact):
+            return None
+        return self._dictionary.lookup(word, options.key_length)
+    
+    def _encode_word(self, word: str, options: EncodeOptions) -> Tuple[str, str]:
+        """Encode a non-empty word with the configured backend, bypassing the cache."""
+        self._engine_words.inc()
+        if self.backend == "python":
+            self._check_deadline()
+            start = time.perf_counter()
+            result = self._python_encoder(options).encode(word)
+            self._stage_seconds.observe(time.perf_counter() - start, stage="engine")
+            return result
+        
+        if self.persistent:
+            output = self._worker_request(dict(asdict(options), word=word))
+            if output.get('success'):
+                return output.get('primary', ''), output.get('alternate', '')
+            raise Metaphone3Error(f"JavaScript error: {output.get('error', 'Unknown error')}")
+        
+        output = self._run_js(self._create_js_runner(word, options))
+        if output.get('success'):
+            return output.get('primary', ''), output.get('alternate', '')
+        raise Metaphone3Error(f"JavaScript error: {output.get('error', 'Unknown error')}")
+    
+    def _run_js(self, js_code: str) -> dict:
+        """
+        Run JavaScript code in a fresh Node.js process and parse its JSON output.
+        
+        Args:
+            js_code (str): JavaScript code printing one JSON line
+            
+        Returns:
+            dict: Parsed JSON output
+            
+        Raises:
+            Metaphone3Error: If Node.js fails or prints invalid JSON
+        """
+        # Create temporary JavaScript file
         try:
+            start = time.perf_counter()
             with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as temp_file:
                 temp_file.write(js_code)
                 temp_file_path = temp_file.name
+            written = time.perf_counter()
             
             # Execute JavaScript
             result = subprocess.run(
                 [self.node_command, temp_file_path],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=self._time_left()
             )
+            finished = time.perf_counter()
             
             # Parse result
             if result.returncode == 0:
                 try:
                     output = json.loads(result.stdout.strip())
-                    if output.get('success'):
-                        return output.get('primary', ''), output.get('alternate', '')
-                    else:
-                        raise Metaphone3Error(f"JavaScript error: {output.get('error', 'Unknown error')}")
                 except json.JSONDecodeError:
                     raise Metaphone3Error(f"Invalid JSON output: {result.stdout}")
+                
+                # The script reports loading and encoding; the rest of the run is process startup
+                load_seconds = output.get('load_seconds', 0.0)
+                engine_seconds = output.get('engine_seconds', 0.0)
+                self._stage_seconds.observe(written - start, stage="tempfile")
+                self._stage_seconds.observe(max(finished - written - load_seconds - engine_seconds, 0.0),
+                                            stage="spawn")
+                self._stage_seconds.observe(load_seconds, stage="load")
+                self._stage_seconds.observe(engine_seconds, stage="engine")
+                self._stage_seconds.observe(time.perf_counter() - finished, stage="parse")
+                return output
             else:
                 raise Metaphone3Error(f"Node.js execution failed: {result.stderr}")
                 
         except subprocess.TimeoutExpired:
+            self._check_deadline()
             raise Metaphone3Error("Timeout while executing JavaScript")
         finally:
             # Clean up temporary file
@@ -195,28 +1248,408 @@ try {{
             except:
                 pass
     
-    def encode_list(self, words: list) -> list:
+    def _encode_batch(self, words: list, options: EncodeOptions) -> list:
+        """
+        Encode a list of non-empty words in a single round trip to Node.js
+        (or in-process for the python backend).
+        
+        Large batches for the persistent node backend are split into shards of
+        at least MIN_SHARD_SIZE words that are encoded concurrently by
+        different workers of the pool.
+        
+        Args:
+            words (list): Non-empty strings to encode
+            options (EncodeOptions): Settings to encode with
+            
+        Returns:
+            list: One result dict per word, in order, each with 'success' and
+            either 'primary'/'alternate' or 'error'
+            
+        Raises:
+            Metaphone3Error: If the batch as a whole could not be run
+        """
+        if not words:
+            return []
+        self._engine_words.inc(len(words))
+        
+        if self.backend == "python":
+            self._batch_size.observe(len(words), kind="engine")
+            start = time.perf_counter()
+            encoder = self._python_encoder(options)
+            results = []
+            for index, word in enumerate(words):
+                if index % DEADLINE_CHECK_INTERVAL == 0:
+                    self._check_deadline()
+                primary, alternate = encoder.encode(word)
+                results.append({'success': True, 'primary': primary, 'alternate': alternate})
+            self._stage_seconds.observe(time.perf_counter() - start, stage="engine")
+            return results
+        
+        return self._node_batch(words, asdict(options))
+    
+    def _encode_variants_batch(self, words: list, variants: tuple) -> list:
+        """
+        Encode a list of non-empty words under several settings in a single
+        round trip to Node.js (or in-process for the python backend), sharded
+        like _encode_batch().
+        
+        Args:
+            words (list): Non-empty strings to encode
+            variants (tuple): EncodeOptions to encode each word with
+            
+        Returns:
+            list: Per word, one result dict per variant, in variant order
+            
+        Raises:
+            Metaphone3Error: If the batch as a whole could not be run
+        """
+        if not words:
+            return []
+        self._engine_words.inc(len(words) * len(variants))
+        
+        if self.backend == "python":
+            self._batch_size.observe(len(words), kind="engine")
+            start = time.perf_counter()
+            results = []
+            for index, word in enumerate(words):
+                if index % DEADLINE_CHECK_INTERVAL == 0:
+                    self._check_deadline()
+                row = []
+                for options in variants:
+                    primary, alternate = self._python_encoder(options).encode(word)
+                    row.append({'success': True, 'primary': primary, 'alternate': alternate})
+                results.append(row)
+            self._stage_seconds.observe(time.perf_counter() - start, stage="engine")
+            return results
+        
+        results = self._node_batch(words, {'variants': [asdict(options) for options in variants]})
+        if not all(isinstance(row, list) and len(row) == len(variants) for row in results):
+            raise Metaphone3Error("Invalid batch output from JavaScript")
+        return results
+    
+    def _node_batch(self, words: list, settings: dict) -> list:
+        """Run one batch request for the node backend, sharded over the worker pool when large."""
+        if not self.persistent:
+            self._batch_size.observe(len(words), kind="engine")
+            request = dict(settings, words=words)
+            if self.current_deadline() is not None:
+                request['timeout_ms'] = 1000 * self._time_left()
+            return self._check_batch_output(self._run_js(self._create_js_batch_runner(request)), words)
+        
+        shard_count = min(self.pool_size, len(words) // MIN_SHARD_SIZE)
+        if shard_count <= 1:
+            return self._worker_batch(words, settings)
+        
+        # Shards run on other threads, which must honour this thread's deadline
+        deadline = self.current_deadline()
+        
+        def encode_shard(shard):
+            with self.deadline(deadline):
+                return self._worker_batch(shard, settings)
+        
+        shard_size = -(-len(words) // shard_count)
+        shards = [words[i:i + shard_size] for i in range(0, len(words), shard_size)]
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            outputs = list(executor.map(encode_shard, shards))
+        return [result for output in outputs for result in output]
+    
+    def _worker_batch(self, words: list, settings: dict) -> list:
+        """Encode a batch of words with one request to a persistent worker."""
+        self._batch_size.observe(len(words), kind="engine")
+        return self._check_batch_output(self._worker_request(dict(settings, words=words)), words)
+    
+    def _check_batch_output(self, output: dict, words: list) -> list:
+        """Validate a batch response from JavaScript and return its results."""
+        if output.get('deadline_exceeded'):
+            raise Metaphone3DeadlineError("Deadline exceeded")
+        if not output.get('success'):
+            raise Metaphone3Error(f"JavaScript error: {output.get('error', 'Unknown error')}")
+        
+        results = output.get('results')
+        if not isinstance(results, list) or len(results) != len(words):
+            raise Metaphone3Error("Invalid batch output from JavaScript")
+        return results
+    
+    def encode_list(self, words: list, options: Optional[EncodeOptions] = None) -> list:
         """
         Encode a list of words.
         
+        Cached words are answered from the cache or the precomputed
+        dictionary, then from the disk cache in one query; all other distinct
+        valid words are encoded in a single batch (one Node.js round trip for
+        the node backend).
+        
         Args:
             words (list): List of words to encode
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
             
         Returns:
-            list: List of tuples containing (word, primary, alternate)
+            list: List of tuples containing (word, primary, alternate). Words
+            that failed to encode get an empty primary and "Error: ..." as
+            alternate; empty or non-string entries encode to ("", "").
         """
+        if options is None:
+            options = self.default_options()
+        self._batch_size.observe(len(words), kind="request")
+        
+        # Resolve each distinct word from the cache or queue it for encoding
+        encoded = {}
+        missing = {}
+        for word in words:
+            if not word or not isinstance(word, str):
+                continue
+            key = self._cache_key(word, options)
+            if key in encoded or key in missing:
+                continue
+            cached = self._lookup_memory(word, options, key)
+            if cached is not None:
+                encoded[key] = cached
+            else:
+                missing[key] = word
+        
+        # The disk cache is asked once for all remaining words
+        for key, cached in self._lookup_disk(list(missing)).items():
+            encoded[key] = cached
+            del missing[key]
+        
+        errors = {}
+        try:
+            outputs = self._encode_batch(list(missing.values()), options)
+        except Metaphone3Error as e:
+            errors = dict.fromkeys(missing, f"Error: {e}")
+        else:
+            fresh = []
+            for key, output in zip(missing, outputs):
+                if output.get('success'):
+                    encoded[key] = (output.get('primary', ''), output.get('alternate', ''))
+                    fresh.append((key, encoded[key]))
+                else:
+                    errors[key] = f"Error: JavaScript error: {output.get('error', 'Unknown error')}"
+            self._remember_many(fresh)
+        
         results = []
         for word in words:
-            try:
-                primary, alternate = self.encode(word)
-                results.append((word, primary, alternate))
-            except Metaphone3Error as e:
-                results.append((word, "", f"Error: {e}"))
+            if not word or not isinstance(word, str):
+                results.append((word, "", ""))
+                continue
+            
+            key = self._cache_key(word, options)
+            if key in encoded:
+                results.append((word,) + encoded[key])
+            else:
+                results.append((word, "", errors[key]))
+        return results
+    
+    def encode_variants(self, word: str,
+                        variants: Optional[Sequence[EncodeOptions]] = None) -> Dict[EncodeOptions, Tuple[str, str]]:
+        """
+        Encode a word under several settings at once, in one engine round trip.
+        
+        Args:
+            word (str): Word to encode
+            variants (Sequence[EncodeOptions]): Settings to encode with
+                (default: ALL_VARIANTS)
+            
+        Returns:
+            Dict[EncodeOptions, Tuple[str, str]]: Primary and alternate
+            encodings per settings, in variant order
+            
+        Raises:
+            Metaphone3Error: If encoding fails
+        """
+        _, encodings = self.encode_list_variants([word], variants)[0]
+        for primary, alternate in encodings.values():
+            if not primary and alternate.startswith("Error: "):
+                raise Metaphone3Error(alternate[len("Error: "):])
+        return encodings
+    
+    def encode_list_variants(self, words: list, variants: Optional[Sequence[EncodeOptions]] = None) -> list:
+        """
+        Encode a list of words under several settings at once.
+        
+        Words whose encodings under every variant are cached are answered
+        from the cache or the precomputed dictionary. All other distinct valid
+        words travel to the engine once, in a single batch, and are encoded
+        under each variant in turn before the next word is read.
+        
+        Args:
+            words (list): List of words to encode
+            variants (Sequence[EncodeOptions]): Settings to encode with
+                (default: ALL_VARIANTS)
+            
+        Returns:
+            list: List of (word, {EncodeOptions: (primary, alternate)})
+            tuples, the dicts in variant order. Failed encodings get an empty
+            primary and "Error: ..." as alternate; empty or non-string entries
+            encode to ("", "") under every variant.
+            
+        Raises:
+            ValueError: If variants is empty
+        """
+        variants = ALL_VARIANTS if variants is None else tuple(dict.fromkeys(variants))
+        if not variants:
+            raise ValueError("At least one variant is required")
+        self._batch_size.observe(len(words), kind="request")
+        
+        # Resolve each distinct word from the cache or queue it for encoding;
+        # the engine is the same for every case variant of a word
+        encoded = {}
+        missing = {}
+        for word in words:
+            if not word or not isinstance(word, str):
+                continue
+            name = word.upper()
+            if name in encoded or name in missing:
+                continue
+            found = {}
+            for options in variants:
+                cached = self._lookup_memory(word, options, self._cache_key(word, options))
+                if cached is None:
+                    missing[name] = word
+                    break
+                found[options] = cached
+            else:
+                encoded[name] = found
+        
+        # The disk cache is asked once for all remaining words under every variant
+        on_disk = self._lookup_disk([self._cache_key(word, options)
+                                     for word in missing.values() for options in variants])
+        for name, word in list(missing.items()):
+            found = {options: on_disk.get(self._cache_key(word, options)) for options in variants}
+            if None not in found.values():
+                encoded[name] = found
+                del missing[name]
+        
+        errors = {}
+        try:
+            outputs = self._encode_variants_batch(list(missing.values()), variants)
+        except Metaphone3Error as e:
+            errors = dict.fromkeys(missing, f"Error: {e}")
+        else:
+            fresh = []
+            for name, row in zip(missing, outputs):
+                encodings = {}
+                for options, output in zip(variants, row):
+                    if output.get('success'):
+                        encodings[options] = (output.get('primary', ''), output.get('alternate', ''))
+                        fresh.append((self._cache_key(missing[name], options), encodings[options]))
+                    else:
+                        encodings[options] = ("", f"Error: JavaScript error: {output.get('error', 'Unknown error')}")
+                encoded[name] = encodings
+            self._remember_many(fresh)
+        
+        results = []
+        for word in words:
+            if not word or not isinstance(word, str):
+                results.append((word, dict.fromkeys(variants, ("", ""))))
+            elif word.upper() in encoded:
+                results.append((word, dict(encoded[word.upper()])))
+            else:
+                results.append((word, dict.fromkeys(variants, ("", errors[word.upper()]))))
+        return results
+    
+    def encode_phrase(self, phrase: str,
+                      options: Optional[EncodeOptions] = None) -> Tuple[List[Tuple[str, str, str]], str, str]:
+        """
+        Encode a multi-token name or phrase token by token.
+        
+        Args:
+            phrase (str): Name or phrase, such as "Mary Ann Smith-Jones"
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
+            
+        Returns:
+            Tuple[List[Tuple[str, str, str]], str, str]: The (token, primary,
+            alternate) tuples and the combined primary and alternate keys;
+            see encode_phrases()
+            
+        Raises:
+            Metaphone3Error: If a token fails to encode
+        """
+        _, tokens, primary, alternate = self.encode_phrases([phrase], options)[0]
+        if not primary and alternate.startswith("Error: "):
+            raise Metaphone3Error(alternate[len("Error: "):])
+        return tokens, primary, alternate
+    
+    def encode_phrases(self, phrases: list, options: Optional[EncodeOptions] = None) -> list:
+        """
+        Encode a list of multi-token names or phrases token by token.
+        
+        Phrases are split with tokenize_phrase(), and the tokens of all
+        phrases, without their apostrophes, are encoded with a single
+        encode_list() call, so each distinct token is looked up in the
+        caches or encoded once, in one engine batch, however many phrases it
+        occurs in.
+        
+        The combined primary key joins the primary keys of the tokens with
+        PHRASE_KEY_SEPARATOR, skipping tokens without a key (such as "&").
+        The combined alternate key does the same with each token's alternate
+        key, or its primary key where it has none, and is empty when no token
+        has an alternate key.
+        
+        Args:
+            phrases (list): List of phrases to encode
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
+            
+        Returns:
+            list: List of (phrase, [(token, primary, alternate), ...],
+            primary, alternate) tuples, each token as written in the
+            phrase. Phrases with a token that failed to
+            encode get an empty combined primary and "Error: ..." as combined
+            alternate; empty or non-string entries encode to (phrase, [], "", "").
+        """
+        tokenized = [tokenize_phrase(phrase) if phrase and isinstance(phrase, str) else []
+                     for phrase in phrases]
+        encoded = iter(self.encode_list([PHRASE_APOSTROPHES.sub("", token)
+                                         for tokens in tokenized for token in tokens], options))
+        
+        results = []
+        for phrase, tokens in zip(phrases, tokenized):
+            keys = [(token,) + next(encoded)[1:] for token in tokens]
+            failed = [alternate for _, primary, alternate in keys if not primary and alternate.startswith("Error: ")]
+            if failed:
+                results.append((phrase, keys, "", failed[0]))
+                continue
+            
+            primary = PHRASE_KEY_SEPARATOR.join(primary for _, primary, _ in keys if primary)
+            alternate = ""
+            if any(alternate for _, _, alternate in keys):
+                alternate = PHRASE_KEY_SEPARATOR.join(alternate or primary for _, primary, alternate in keys
+                                                      if primary)
+            results.append((phrase, keys, primary, alternate))
         return results
     
+    def similar_keys(self, word: str, tree, max_distance: int = 1,
+                     options: Optional[EncodeOptions] = None) -> List[Tuple[str, int]]:
+        """
+        Find the keys near a word's primary and alternate keys in a key tree.
+        
+        Args:
+            word (str): Word to encode
+            tree (KeyTree): metaphone3_bktree.KeyTree of keys built with the
+                same settings
+            max_distance (int): Largest edit distance of interest (default: 1)
+            options (EncodeOptions): Settings for this call (default: the
+                wrapper defaults)
+            
+        Returns:
+            List[Tuple[str, int]]: (key, distance) pairs, each key with its
+            distance to the nearer of the word's keys, nearest first
+        """
+        nearest = {}
+        for key in set(self.encode(word, options)):
+            if not key:
+                continue
+            for found, distance in tree.search(key, max_distance):
+                if distance < nearest.get(found, max_distance + 1):
+                    nearest[found] = distance
+        return sorted(nearest.items(), key=lambda item: (item[1], item[0]))
+    
     def set_encode_vowels(self, encode_vowels: bool) -> None:
         """
-        Set whether to encode non-initial vowels.
+        Set whether to encode non-initial vowels by default.
         
         Args:
             encode_vowels (bool): True to encode vowels, False otherwise
@@ -225,7 +1658,7 @@ try {{
     
     def set_encode_exact(self, encode_exact: bool) -> None:
         """
-        Set whether to encode consonants exactly.
+        Set whether to encode consonants exactly by default.
         
         Args:
             encode_exact (bool): True for exact encoding, False for approximate
@@ -234,7 +1667,7 @@ try {{
     
     def set_key_length(self, length: int) -> None:
         """
-        Set maximum length of encoded keys.
+        Set the default maximum length of encoded keys.
         
         Args:
             length (int): Maximum key length (1-32)
@@ -244,6 +1677,28 @@ try {{
         else:
             raise ValueError("Key length must be between 1 and 32")
     
+    def get_cache_stats(self) -> dict:
+        """
+        Get encoding cache statistics.
+        
+        Returns:
+            dict: size, max_size, hits, misses, evictions and hit_ratio, plus
+            'dictionary' statistics when a precomputed dictionary is loaded
+            and 'disk' statistics when a disk cache is used
+        """
+        stats = self._cache.stats()
+        if self._dictionary is not None:
+            stats['dictionary'] = self._dictionary.stats()
+        if self._disk_cache is not None:
+            stats['disk'] = self._disk_cache.stats()
+        return stats
+    
+    def clear_cache(self) -> None:
+        """Remove all cached encodings from the LRU cache and the disk cache."""
+        self._cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+    
     def get_settings(self) -> dict:
         """
         Get current settings.
@@ -255,7 +1710,13 @@ try {{
             'encode_vowels': self.encode_vowels,
             'encode_exact': self.encode_exact,
             'key_length': self.key_length,
-            'js_file_path': self.js_file_path
+            'js_file_path': self.js_file_path,
+            'persistent': self.persistent,
+            'backend': self.backend,
+            'pool_size': self.pool_size,
+            'cache_size': self._cache.max_size,
+            'dictionary_path': self._dictionary.path if self._dictionary is not None else None,
+            'disk_cache_path': self._disk_cache.path if self._disk_cache is not None else None
         }
 
 
@@ -284,9 +1745,9 @@ def main():
         
         # Test with vowel encoding
         print("\\n=== With Vowel Encoding ===")
-        m3.set_encode_vowels(True)
+        options = EncodeOptions(encode_vowels=True)
         for word in test_words[:5]:
-            primary, alternate = m3.encode(word)
+            primary, alternate = m3.encode(word, options)
             if alternate and alternate != primary:
                 print(f"{word:12} -> {primary:8} | {alternate}")
             else:
@@ -294,9 +1755,9 @@ def main():
         
         # Test with exact encoding
         print("\\n=== With Exact Encoding ===")
-        m3.set_encode_exact(True)
+        options = EncodeOptions(encode_vowels=True, encode_exact=True)
         for word in test_words[:5]:
-            primary, alternate = m3.encode(word)
+            primary, alternate = m3.encode(word, options)
             if alternate and alternate != primary:
                 print(f"{word:12} -> {primary:8} | {alternate}")
             else:
@@ -304,11 +1765,11 @@ def main():
         
         # Test batch encoding
         print("\\n=== Batch Encoding ===")
-        m3.set_encode_vowels(False)
-        m3.set_encode_exact(False)
         batch_results = m3.encode_list(["smith", "smyth", "schmidt"])
         for word, primary, alternate in batch_results:
             print(f"{word:10} -> {primary:8} | {alternate}")
+        
+        m3.close()
             
     except Metaphone3Error as e:
         print(f"Error: {e}")
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import async_app
+from async_app import AsyncWorkerPool
+from metaphone3_wrapper import Metaphone3Error, Metaphone3Wrapper
+
+
+def python_worker_command():
+    return Metaphone3Wrapper(backend="python").worker_command()
+
+
+def test_request_after_timeout_starts_fresh_worker():
+    async def run():
+        pool = AsyncWorkerPool(python_worker_command(), size=1, timeout=0.5)
+        try:
+            await pool.request({"word": "warm"})
+
+            # Far more words than the worker encodes within the timeout
+            with pytest.raises(Metaphone3Error):
+                await pool.request({"words": ["schmidt"] * 200000})
+
+            return await pool.request({"word": "smith"})
+        finally:
+            await pool.close()
+
+    output = asyncio.run(run())
+    assert output["success"]
+    assert output["primary"] == "SM0"
+
+
+def call(path, body, headers=()):
+    """ASGI receive/send callables and scope of one request; sent messages land in the list."""
+    async def receive():
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {'type': 'http', 'method': 'POST', 'path': path,
+             'headers': [(b'content-type', b'application/json'), *headers]}
+    return receive, send, scope, messages
+
+
+def run_requests(requests):
+    """Run requests against a freshly initialized async app, in one event loop."""
+    async def run():
+        async_app.m3_async = None
+        assert async_app.initialize_metaphone3()
+        try:
+            responses = []
+            for path, data, headers in requests:
+                receive, send, scope, messages = call(path, json.dumps(data).encode("utf-8"), headers)
+                await async_app.app(scope, receive, send)
+                responses.append((messages[0]['status'], json.loads(messages[1]['body'])))
+            return responses
+        finally:
+            await async_app.m3_async.close()
+            async_app.m3_async = None
+
+    return asyncio.run(run())
+
+
+def test_encode_accepts_more_than_100_words():
+    words = [f"smith{i}" for i in range(500)]
+    [(status, body)] = run_requests([('/encode', {"words": words}, ())])
+    assert status == 200
+    assert body["total"] == 500
+    assert all(result["success"] for result in body["results"])
+
+
+def test_encode_rejects_oversized_body(monkeypatch):
+    monkeypatch.setattr(async_app, "MAX_REQUEST_BYTES", 1000)
+    [(status, body)] = run_requests([('/encode', {"words": ["smith"] * 1000}, ())])
+    assert status == 413
+    assert not body["success"]
+
+
+def test_encode_answers_504_past_deadline():
+    words = [f"schmidt{i}" for i in range(200000)]
+    (status, body), (next_status, _) = run_requests([
+        ('/encode', {"words": words}, ((b'x-request-timeout', b'0.05'),)),
+        ('/encode', {"word": "smith"}, ())
+    ])
+    assert status == 504
+    assert not body["success"]
+    assert next_status == 200
+
+
+def test_encode_rejects_invalid_timeout_header():
+    [(status, body)] = run_requests([('/encode', {"word": "smith"}, ((b'x-request-timeout', b'soon'),))])
+    assert status == 400
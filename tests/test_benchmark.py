@@ -0,0 +1,49 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metaphone3_benchmark as benchmark
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_check_thresholds():
+    results = {'python': {'encode': {'p99_us': 150.0}, 'cold_start_ms': 900}}
+    thresholds = {
+        'python.encode.p99_us': {'max': 100},
+        'python.cold_start_ms': {'min': 1, 'max': 2000},
+        'node.cold_start_ms': {'max': 2000}
+    }
+    assert benchmark.check_thresholds(results, thresholds) == [
+        "python.encode.p99_us: 150.0 > max 100",
+        "node.cold_start_ms: not measured"
+    ]
+    assert benchmark.check_thresholds(results, {'python.cold_start_ms': {'min': 1000}}) == [
+        "python.cold_start_ms: 900 < min 1000"
+    ]
+
+
+def test_summaries():
+    samples = [i / 1e6 for i in range(1, 101)]
+    summary = benchmark.percentiles(samples)
+    assert (summary['count'], summary['p50_us'], summary['p99_us'], summary['max_us']) == (100, 51.0, 100.0, 100.0)
+    assert benchmark.percentiles([]) == {}
+    assert benchmark.batches(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+    assert benchmark.flatten({'a': {'b': 1, 'c': {'d': 2}}, 'e': 3}) == {'a.b': 1, 'a.c.d': 2, 'e': 3}
+
+
+def test_every_threshold_is_measured(monkeypatch):
+    # The HTTP benchmark sets these; monkeypatch restores them afterwards
+    for name in ("METAPHONE3_BACKEND", "METAPHONE3_CACHE_SIZE", "METAPHONE3_DICTIONARY",
+                 "METAPHONE3_INDEX_CORPUS", "METAPHONE3_COALESCE_WINDOW_MS"):
+        monkeypatch.setenv(name, "")
+    monkeypatch.chdir(ROOT)
+
+    with open(os.path.join(ROOT, "benchmark_thresholds.json")) as thresholds_file:
+        thresholds = json.load(thresholds_file)
+    results = benchmark.run(["python"], benchmark.DEFAULT_CORPUS, 200, benchmark.DEFAULT_SEED, http=True)
+    assert [failure for failure in benchmark.check_thresholds(results, thresholds)
+            if failure.endswith("not measured")] == []
+    assert benchmark.load_corpus(benchmark.DEFAULT_CORPUS, 50) == benchmark.load_corpus(benchmark.DEFAULT_CORPUS, 50)
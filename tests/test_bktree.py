@@ -0,0 +1,30 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3_bktree import KeyTree
+from metaphone3_ranking import edit_distance
+from metaphone3_wrapper import Metaphone3Wrapper
+
+
+def test_search_matches_brute_force():
+    rng = random.Random(3)
+    keys = sorted({"".join(rng.choice("AKMNPST0X") for _ in range(rng.randint(1, 6))) for _ in range(2000)})
+    tree = KeyTree(keys + keys[:50])
+    assert len(tree) == len(keys)
+
+    for query in rng.sample(keys, 20) + ["", "SMT", "ZZZZZZZZ"]:
+        for max_distance in range(4):
+            expected = sorted((edit_distance(query, key), key) for key in keys
+                              if edit_distance(query, key) <= max_distance)
+            assert tree.search(query, max_distance) == [(key, distance) for distance, key in expected]
+
+
+def test_similar_keys_takes_the_nearer_of_both_keys():
+    wrapper = Metaphone3Wrapper(backend="python")
+    tree = KeyTree(["SM0", "XMT", "SMT", "XMTT", "JNS"])
+    assert wrapper.encode("smith") == ("SM0", "XMT")
+    assert wrapper.similar_keys("smith", tree, max_distance=1) == [("SM0", 0), ("XMT", 0), ("SMT", 1), ("XMTT", 1)]
+    assert "SMT" in tree and "SM" not in tree
@@ -0,0 +1,53 @@
+import itertools
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3_blocking import Blocker
+from metaphone3_wrapper import Metaphone3Wrapper
+
+FIRST_NAMES = ["John", "Jon", "Joan", "Steven", "Stephen", "Catherine", "Kathryn", "Mary", "Marie", ""]
+LAST_NAMES = ["Smith", "Smyth", "Schmidt", "Jones", "Johns", "Brown", "Braun", "Lee", "Li", "Nguyen"]
+
+
+def make_records(count):
+    rng = random.Random(5)
+    return [{"id": number, "first": rng.choice(FIRST_NAMES), "last": rng.choice(LAST_NAMES)}
+            for number in range(count)]
+
+
+def brute_force_pairs(wrapper, records, fields, max_block_size):
+    """Pairs of records sharing a block of at most max_block_size records, by comparing all pairs."""
+    keys = {}
+    for record in records:
+        keys[record["id"]] = {f"{field}:{key}" for field in fields for key in wrapper.encode(record[field]) if key}
+    sizes = {}
+    for record_keys in keys.values():
+        for key in record_keys:
+            sizes[key] = sizes.get(key, 0) + 1
+    return {(a["id"], b["id"]) for a, b in itertools.combinations(records, 2)
+            if any(sizes[key] <= max_block_size for key in keys[a["id"]] & keys[b["id"]])}
+
+
+def test_pairs_match_all_pairs_comparison():
+    wrapper = Metaphone3Wrapper(backend="python")
+    records = make_records(300)
+    for max_block_size in (1000, 40):
+        # Small runs and batches exercise the spill-and-merge path
+        blocker = Blocker(wrapper, ["first", "last"], max_block_size=max_block_size, batch_size=37, run_size=50)
+        pairs = list(blocker.pairs(records))
+        assert len(pairs) == len(set(pairs))
+        assert all(a < b for a, b in pairs)
+        assert set(pairs) == brute_force_pairs(wrapper, records, ["first", "last"], max_block_size)
+        assert blocker.stats()['pairs'] == len(pairs)
+        assert blocker.stats()['records'] == len(records)
+        assert (blocker.stats()['skipped_blocks'] > 0) == (max_block_size < len(records))
+
+
+def test_blocks_list_members_in_input_order():
+    wrapper = Metaphone3Wrapper(backend="python")
+    records = [{"id": "a", "name": "Smith"}, {"id": "b", "name": "Jones"}, {"id": "c", "name": "Smyth"}]
+    blocks = dict(Blocker(wrapper, ["name"]).blocks(records))
+    assert blocks == {"name:SM0": ["a", "c"], "name:XMT": ["a", "c"]}
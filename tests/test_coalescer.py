@@ -0,0 +1,63 @@
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3_coalescer import EncodeCoalescer
+from metaphone3_wrapper import EncodeOptions
+
+
+class SlowWrapper:
+    """Wrapper stand-in whose encode_list() takes a while and records its concurrency."""
+
+    pool_size = 4
+    timeout = 30
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def default_options(self):
+        return EncodeOptions()
+
+    def lookup(self, word, options):
+        return None
+
+    def current_deadline(self):
+        return None
+
+    def deadline(self, deadline):
+        return nullcontext()
+
+    def encode_list(self, words, options):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return [(word, word.upper(), "") for word in words]
+
+
+def test_batches_run_concurrently_up_to_pool_size():
+    wrapper = SlowWrapper()
+    coalescer = EncodeCoalescer(wrapper, window=0.001, max_batch=2)
+    results = {}
+
+    def encode(word):
+        results[word] = coalescer.encode(word)
+
+    threads = [threading.Thread(target=encode, args=(f"word{i}",)) for i in range(32)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    coalescer.close()
+
+    assert results == {f"word{i}": (f"WORD{i}", "") for i in range(32)}
+    assert wrapper.max_running == wrapper.pool_size
+    assert coalescer.stats()['words'] == 32
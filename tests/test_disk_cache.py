@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3_disk_cache import DiskCache
+
+
+def test_eviction_keeps_max_entries_despite_rowid_gaps(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = DiskCache(path, max_entries=3)
+    try:
+        def key(word):
+            return (word, False, False, 8)
+
+        cache.put_many([(key("A"), ("A", "")), (key("B"), ("P", "")), (key("C"), ("K", ""))])
+        # Rewriting C leaves a gap where its first row was; nothing is over the limit
+        cache.put_many([(key("C"), ("K", ""))])
+        assert cache.evictions == 0
+        cache.put_many([(key("D"), ("T", ""))])
+
+        words = [row[0] for row in sqlite3.connect(path).execute("SELECT word FROM encodings ORDER BY rowid")]
+        assert words == ["B", "C", "D"]
+        assert cache.evictions == 1
+    finally:
+        cache.close()
+
+
+def test_entry_count_follows_replacements_and_evictions(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = DiskCache(path, max_entries=100)
+    try:
+        cache.put_many([((word, False, False, 8), (word, "")) for word in "ABCDE"])
+        cache.put_many([((word, False, False, 8), (word, "")) for word in "CDEFG"])
+        assert len(cache) == 7
+        assert len(cache) == sqlite3.connect(path).execute("SELECT COUNT(*) FROM encodings").fetchone()[0]
+        cache.clear()
+        assert len(cache) == 0
+    finally:
+        cache.close()
+
+
+def test_entry_count_starts_from_existing_rows(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    # A file written before the count was kept
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE encodings (word TEXT NOT NULL, encode_vowels INTEGER NOT NULL, "
+        "encode_exact INTEGER NOT NULL, key_length INTEGER NOT NULL, primary_key TEXT NOT NULL, "
+        "alternate_key TEXT NOT NULL, PRIMARY KEY (word, encode_vowels, encode_exact, key_length))"
+    )
+    connection.executemany("INSERT INTO encodings VALUES (?, 0, 0, 8, ?, '')", [("A", "A"), ("B", "P")])
+    connection.commit()
+    connection.close()
+
+    cache = DiskCache(path, max_entries=2)
+    try:
+        assert len(cache) == 2
+        cache.put(("C", False, False, 8), ("K", ""))
+        assert len(cache) == 2
+        assert cache.evictions == 1
+    finally:
+        cache.close()
+
+
+def test_failed_write_counts_one_error(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = DiskCache(path)
+    try:
+        connection = sqlite3.connect(path)
+        connection.execute("DROP TABLE encodings")
+        connection.commit()
+        connection.close()
+
+        cache.put(("SMITH", False, False, 8), ("SM0", "XMT"))
+        assert cache.stats()['errors'] == 1
+    finally:
+        cache.close()
@@ -0,0 +1,31 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3_http import MAX_REQUEST_SECONDS, encoding_result, parse_deadline, validate_word
+
+
+def test_deadline_is_capped_by_the_limit():
+    now = time.monotonic()
+    assert parse_deadline(None) - now == pytest.approx(MAX_REQUEST_SECONDS, abs=1)
+    assert parse_deadline("0.5") - now == pytest.approx(0.5, abs=1)
+    assert parse_deadline(str(10 * MAX_REQUEST_SECONDS)) - now == pytest.approx(MAX_REQUEST_SECONDS, abs=1)
+
+
+@pytest.mark.parametrize("header", ["0", "-1", "soon", "nan"])
+def test_deadline_rejects_bad_headers(header):
+    with pytest.raises(ValueError):
+        parse_deadline(header)
+
+
+def test_results_and_validation():
+    assert encoding_result("smith", "SM0", "XMT") == {
+        "word": "smith", "primary": "SM0", "alternate": "XMT", "success": True
+    }
+    assert encoding_result("jones", "JNS", "JNS")["alternate"] is None
+    assert encoding_result("x", "", "Error: boom") == {"word": "x", "error": "boom", "success": False}
+    assert [validate_word(word) for word in ["smith", "  ", "", None, 3]] == [True, False, False, False, False]
@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3_index import PhoneticIndex
+from metaphone3_wrapper import Metaphone3Error, Metaphone3Wrapper
+
+WORDS = ["Smith", "Smyth", "Schmidt", "Jones", "Johns", "Brown", "Braun", "Catherine", "Kathryn"]
+
+
+class FailingWrapper:
+    """Encodes like the python backend, except that "BAD" fails."""
+
+    def __init__(self):
+        self.wrapper = Metaphone3Wrapper(backend="python", cache_size=0)
+
+    def encode(self, word, options=None):
+        return self.wrapper.encode(word, options)
+
+    def encode_list(self, words, options=None):
+        return [(word, "", "Error: cannot encode") if word == "BAD" else encoded
+                for word, encoded in zip(words, self.wrapper.encode_list(words, options))]
+
+
+def test_search_matches_brute_force():
+    wrapper = Metaphone3Wrapper(backend="python")
+    index = PhoneticIndex(wrapper)
+    assert index.add_many(WORDS) == len(WORDS)
+    for query in ["smith", "jonze", "katrin"]:
+        keys = {key for key in wrapper.encode(query) if key}
+        expected = sorted(word for word in WORDS if keys & {key for key in wrapper.encode(word) if key})
+        assert index.search(query)['matches'] == expected
+
+
+def test_failed_batch_leaves_index_unchanged():
+    index = PhoneticIndex(FailingWrapper())
+    index.add_many(["Smith"])
+    with pytest.raises(Metaphone3Error):
+        index.add_many(["Jones", "BAD", "Brown"])
+    assert len(index) == 1
+    assert "Jones" not in index
+
+
+def test_autosave_writes_changes_and_close_flushes(tmp_path):
+    path = str(tmp_path / "index.json")
+    wrapper = Metaphone3Wrapper(backend="python")
+    index = PhoneticIndex(wrapper)
+    index.autosave(path, interval=60)
+    index.add_many(WORDS)
+    index.remove("Braun")
+    # Still gathering changes
+    assert not os.path.exists(path)
+    index.close()
+
+    loaded = PhoneticIndex.load(wrapper, path)
+    assert sorted(loaded.search("smith")['matches']) == ["Schmidt", "Smith", "Smyth"]
+    assert len(loaded) == len(WORDS) - 1
+    assert os.listdir(str(tmp_path)) == ["index.json"]
+
+
+def test_autosave_writes_after_the_interval(tmp_path):
+    path = str(tmp_path / "index.json")
+    wrapper = Metaphone3Wrapper(backend="python")
+    index = PhoneticIndex(wrapper)
+    index.autosave(path, interval=0.05)
+    try:
+        index.add("Smith")
+        for _ in range(100):
+            if os.path.exists(path):
+                break
+            time.sleep(0.02)
+        assert "Smith" in PhoneticIndex.load(wrapper, path)
+    finally:
+        index.close()
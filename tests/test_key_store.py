@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3 import read_word_list
+from metaphone3_key_store import KeyStore
+from metaphone3_wrapper import Metaphone3Wrapper
+
+WORD_LIST = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "large_word_list_output_3_21_15_DEFAULT_ENCODING.txt")
+
+
+def test_store_matches_dict():
+    entries = list(read_word_list(WORD_LIST))[:20000]
+    random.Random(11).shuffle(entries)
+    # Duplicates in other cases; the first entry of a word wins
+    entries += [(word.lower(), "X", "Y") for word, _, _ in entries[:100]]
+    expected = {}
+    for word, primary, alternate in entries:
+        expected.setdefault(word.upper(), (primary, alternate))
+
+    store = KeyStore(entries)
+    assert len(store) == len(expected)
+    assert list(store) == sorted(expected, key=lambda word: word.encode("utf-8"))
+    assert dict(store.items()) == expected
+    for word in list(expected)[:500]:
+        assert store[word.lower()] == expected[word]
+    assert store.get("NOSUCHWORD") is None
+    assert "NOSUCHWORD" not in store and "" not in store and 3 not in store
+
+
+def test_sorted_input_is_streamed_unchanged():
+    entries = [("ALPHA", "ALF", ""), ("BETA", "PT", ""), ("ÉCOLE", "AKL", "")]
+    assert dict(KeyStore(iter(entries)).items()) == {word: (primary, alternate)
+                                                     for word, primary, alternate in entries}
+
+
+def test_lookup_answers_other_key_lengths_only_for_complete_keys():
+    store = KeyStore([("SMITH", "SM0", "XMT"), ("WASHINGTON", "ASNK", "FXNK")], key_length=4)
+    assert store.lookup("smith", key_length=8) == ("SM0", "XMT")
+    # Four characters may be cut short, so they answer only key_length 4
+    assert store.lookup("washington", key_length=8) is None
+    assert store.lookup("washington") == ("ASNK", "FXNK")
+    assert store.stats()['hits'] == 2 and store.stats()['misses'] == 1
+
+
+def test_wrapper_answers_from_the_store():
+    store = KeyStore.from_word_list(WORD_LIST)
+    wrapper = Metaphone3Wrapper(backend="python", dictionary=store, cache_size=0)
+    reference = Metaphone3Wrapper(backend="python", cache_size=0)
+    words = ["smith", "Jones", "catherine", "notawordatall"]
+    assert wrapper.encode_list(words) == reference.encode_list(words)
+    assert store.stats()['hits'] == 3
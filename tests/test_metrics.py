@@ -0,0 +1,62 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3_metrics import MetricsRegistry
+from metaphone3_wrapper import Metaphone3Wrapper
+
+
+def test_prometheus_text_output():
+    metrics = MetricsRegistry()
+    requests = metrics.counter("requests_total", "Requests served", ["route"])
+    metrics.gauge("workers", "Live workers", function=lambda: 3)
+    latency = metrics.histogram("request_seconds", 'Latency in "seconds"\nper route', ["route"], buckets=(0.1, 1))
+
+    requests.inc(route="/encode")
+    requests.inc(2, route='a"b\\c')
+    latency.observe(0.05, route="/encode")
+    latency.observe(0.5, route="/encode")
+    latency.observe(5, route="/encode")
+
+    assert metrics.render() == (
+        '# HELP requests_total Requests served\n'
+        '# TYPE requests_total counter\n'
+        'requests_total{route="/encode"} 1\n'
+        'requests_total{route="a\\"b\\\\c"} 2\n'
+        '# HELP workers Live workers\n'
+        '# TYPE workers gauge\n'
+        'workers 3\n'
+        '# HELP request_seconds Latency in "seconds"\\nper route\n'
+        '# TYPE request_seconds histogram\n'
+        'request_seconds_bucket{route="/encode",le="0.1"} 1\n'
+        'request_seconds_bucket{route="/encode",le="1"} 2\n'
+        'request_seconds_bucket{route="/encode",le="+Inf"} 3\n'
+        'request_seconds_sum{route="/encode"} 5.55\n'
+        'request_seconds_count{route="/encode"} 3\n'
+    )
+
+
+def test_labels_and_registration_are_checked():
+    metrics = MetricsRegistry()
+    requests = metrics.counter("requests_total", "Requests served", ["route"])
+    with pytest.raises(ValueError):
+        requests.inc(method="GET")
+    with pytest.raises(ValueError):
+        requests.inc(-1, route="/")
+    with pytest.raises(ValueError):
+        metrics.gauge("requests_total", "Again")
+
+
+def test_wrapper_metrics_count_engine_words_and_cache_hits():
+    wrapper = Metaphone3Wrapper(backend="python")
+    wrapper.encode_list(["smith", "jones", "smith"])
+    wrapper.encode("smith")
+    lines = wrapper.metrics.render().splitlines()
+    assert 'metaphone3_batch_size_words_sum{kind="request"} 3' in lines
+    assert "metaphone3_engine_words_total 2" in lines
+    assert 'metaphone3_cache_lookups_total{cache="cache",result="hit"} 1' in lines
+    assert 'metaphone3_cache_lookups_total{cache="cache",result="miss"} 2' in lines
+    assert 'metaphone3_stage_seconds_count{stage="engine"} 1' in lines
@@ -0,0 +1,69 @@
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from metaphone3 import read_word_list
+from metaphone3_ranking import bounded_edit_distance, edit_distance, rank
+from metaphone3_wrapper import Metaphone3Wrapper
+
+WORD_LIST = os.path.join(ROOT, "large_word_list_output_3_21_15_DEFAULT_ENCODING.txt")
+
+
+def plain_distance(a, b):
+    """Levenshtein distance by the textbook dynamic program."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+@pytest.fixture(scope="module")
+def words():
+    sample = [word for word, _, _ in read_word_list(WORD_LIST)]
+    random.Random(7).shuffle(sample)
+    return sample[:3000]
+
+
+def test_distances_match_plain_dynamic_program(words):
+    pairs = list(zip(words[:500], words[500:1000])) + [("", "abc"), ("abc", ""), ("", ""), ("kitten", "sitting")]
+    for a, b in pairs:
+        expected = plain_distance(a, b)
+        assert edit_distance(a, b) == expected
+        for bound in range(0, 6):
+            assert bounded_edit_distance(a, b, bound) == (expected if expected <= bound else None)
+
+
+def test_top_k_is_the_head_of_the_full_ranking(words):
+    wrapper = Metaphone3Wrapper(backend="python")
+    candidates = words + words[:100]
+    for query in ["steven", "catherine", "x"]:
+        full = rank(wrapper, query, candidates)
+        for top_k in (0, 1, 10, 250):
+            assert rank(wrapper, query, candidates, top_k=top_k) == full[:top_k]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js not installed")
+def test_rank_matches_result_ranking_js(words):
+    candidates = words[:1000]
+    script = (
+        "const {ResultRanking} = require('./ResultRanking/ResultRanking.js');"
+        "const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));"
+        "console.log(JSON.stringify(ResultRanking(input.query, input.candidates)"
+        ".map(item => [item.key, item.value])));"
+    )
+    for query in ["steven", "mackenzie"]:
+        output = subprocess.run(["node", "-e", script], cwd=ROOT, check=True, capture_output=True, text=True,
+                                input=json.dumps({"query": query, "candidates": candidates})).stdout
+        expected = [tuple(item) for item in json.loads(output)]
+        assert rank(Metaphone3Wrapper(backend="python"), query, candidates) == expected
@@ -0,0 +1,35 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metaphone3_wrapper import Metaphone3Wrapper, tokenize_phrase
+
+
+def test_phrase_tokens_keep_their_text():
+    wrapper = Metaphone3Wrapper(backend="python")
+    [(phrase, tokens, primary, alternate)] = wrapper.encode_phrases(["O'Brien Smith-Jones"])
+    assert tokens == [("O'Brien", "APRN", ""), ("Smith", "SM0", "XMT"), ("Jones", "JNS", "ANS")]
+    assert (primary, alternate) == ("APRN SM0 JNS", "APRN XMT ANS")
+    # Apostrophes are ignored, so both spellings share one cache entry
+    assert wrapper.encode_phrase("OBrien")[0] == [("OBrien", "APRN", "")]
+    assert wrapper.get_cache_stats()['hits'] == 1
+
+
+def test_phrase_tokens_and_combined_keys():
+    assert tokenize_phrase("  Jean–Luc   Picard ") == ["Jean", "Luc", "Picard"]
+    wrapper = Metaphone3Wrapper(backend="python")
+    results = wrapper.encode_phrases(["Jean-Luc", "Tom & Jerry", "", "   ", None])
+    # Tokens without an alternate key contribute their primary key to the combined alternate
+    assert results[0] == ("Jean-Luc", [("Jean", "JN", "AN"), ("Luc", "LK", "")], "JN LK", "AN LK")
+    # "&" has no key and is left out of the combined keys
+    assert results[1] == ("Tom & Jerry", [("Tom", "TM", ""), ("&", "", ""), ("Jerry", "JR", "")], "TM JR", "")
+    assert results[2:] == [("", [], "", ""), ("   ", [], "", ""), (None, [], "", "")]
+
+
+def test_phrase_tokens_are_encoded_once():
+    wrapper = Metaphone3Wrapper(backend="python")
+    wrapper.encode_phrases(["John Smith", "Smith John", "John-John"])
+    stats = wrapper.get_cache_stats()
+    assert stats['misses'] == 2
+    assert stats['hits'] == 0